@@ -0,0 +1,129 @@
+"""
+Throughput benchmark for subtitle language detection.
+
+Runs detect_language (utils.languages) over a few thousand realistic subtitle
+filenames and reports the cost per file, next to the per-tab implementation it
+replaced (kept below as legacy_detect_language for comparison). Then writes
+--content-files synthetic untagged SRTs to a temp dir and times the content
+tier (utils.subtitle_language), reads included.
+
+    python benchmarks/bench_lang_detection.py [--files 5000] [--rounds 5] [--content-files 300]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.languages import detect_language
+from utils.subtitle_language import detect_subtitle_language
+
+LEGACY_LANGUAGES = [
+    "eng (English)", "spa (Spanish)", "por (Portuguese)", "fra (French)",
+    "deu (German)", "ita (Italian)", "jpn (Japanese)", "chi (Chinese)",
+    "rus (Russian)", "kor (Korean)", "ara (Arabic)", "hin (Hindi)"
+]
+LEGACY_LANG_MAP = {
+    'en': 'eng', 'eng': 'eng', 'english': 'eng', 'en-us': 'eng', 'en-gb': 'eng',
+    'pt': 'por', 'por': 'por', 'portuguese': 'por', 'pt-br': 'por', 'pob': 'por',
+    'es': 'spa', 'spa': 'spa', 'spanish': 'spa', 'esp': 'spa',
+    'fr': 'fra', 'fra': 'fra', 'french': 'fra',
+    'de': 'deu', 'deu': 'deu', 'german': 'deu', 'ger': 'deu',
+    'it': 'ita', 'ita': 'ita', 'italian': 'ita',
+    'ja': 'jpn', 'jpn': 'jpn', 'japanese': 'jpn', 'jp': 'jpn',
+    'zh': 'chi', 'chi': 'chi', 'chinese': 'chi', 'chn': 'chi', 'zho': 'chi',
+    'ru': 'rus', 'rus': 'rus', 'russian': 'rus',
+    'ko': 'kor', 'kor': 'kor', 'korean': 'kor',
+    'ar': 'ara', 'ara': 'ara', 'arabic': 'ara',
+    'hi': 'hin', 'hin': 'hin', 'hindi': 'hin'
+}
+
+def legacy_detect_language(filename):
+    """MixerFrame.detect_language before the shared module."""
+    import re
+    basename = os.path.splitext(os.path.basename(filename))[0]
+    parts = re.split(r'[._\-\s]+', basename)
+    for part in reversed(parts):
+        lower_part = part.lower()
+        if lower_part in LEGACY_LANG_MAP:
+            target_code = LEGACY_LANG_MAP[lower_part]
+            for lang_str in LEGACY_LANGUAGES:
+                if lang_str.startswith(target_code + " "):
+                    return lang_str
+    return None
+
+TAGS = ["en", "eng", "English", "pt-BR", "pob", "es-419", "fr", "ger", "nl", "sv", "pl", "zh-Hant", "chs",
+        "ja", "ko", "ar", "he", "tr", "", "", "forced", "sdh"]
+SHOWS = ["The.Expanse", "Dark", "Shogun", "La.Casa.de.Papel", "Breaking Bad", "[SubsPlease] Frieren"]
+
+def synthetic_filenames(n, seed=0):
+    rng = random.Random(seed)
+    names = []
+    for i in range(n):
+        show = rng.choice(SHOWS)
+        tags = ".".join(t for t in (rng.choice(TAGS), rng.choice(["", "forced", "sdh"])) if t)
+        ep = f"S{rng.randint(1, 9):02d}E{rng.randint(1, 24):02d}"
+        release = rng.choice(["1080p.WEB-DL.x264", "720p.BluRay", "2160p.HDR.x265", ""])
+        names.append(f"/media/subs/{show}.{ep}.{release}.{tags}.srt".replace("..", "."))
+    return names
+
+DIALOGUE = {
+    "eng": "I told you, I don't know what happened here. We have to leave before the storm.",
+    "spa": "Te lo dije, no sé qué pasó aquí. Tenemos que irnos antes de la tormenta.",
+    "fra": "Je te l'ai dit, je ne sais pas ce qui s'est passé ici. Il faut partir avant l'orage.",
+    "deu": "Ich habe es dir gesagt, ich weiß nicht, was hier passiert ist. Wir müssen vor dem Sturm gehen.",
+    "rus": "Я же говорил тебе, я не знаю, что здесь случилось. Никто не поверит в эту историю. "
+           "Спасибо за всё, что ты для нас сделал.",
+}
+
+def write_subtitles(directory, n, lines=400):
+    """n untagged SRTs of `lines` cues each, cycling through DIALOGUE."""
+    paths = []
+    codes = list(DIALOGUE)
+    for i in range(n):
+        code = codes[i % len(codes)]
+        cues = (f"{c}\n00:00:{c % 60:02d},000 --> 00:00:{c % 60:02d},900\n{DIALOGUE[code]}\n" for c in range(1, lines))
+        path = os.path.join(directory, f"episode{i:04d}.srt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(cues))
+        paths.append((path, code))
+    return paths
+
+def bench(fn, names, rounds):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for name in names:
+            fn(name)
+        best = min(best, time.perf_counter() - start)
+    return best / len(names)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--content-files", type=int, default=300)
+    args = parser.parse_args()
+
+    names = synthetic_filenames(args.files)
+    detected = sum(1 for n in names if detect_language(n))
+    legacy_detected = sum(1 for n in names if legacy_detect_language(n))
+
+    shared = bench(detect_language, names, args.rounds)
+    legacy = bench(legacy_detect_language, names, args.rounds)
+    print(f"{args.files} filenames, best of {args.rounds} rounds")
+    print(f"  utils.languages:  {shared * 1e6:6.2f} us/file  ({detected} tagged)")
+    print(f"  legacy per-tab:   {legacy * 1e6:6.2f} us/file  ({legacy_detected} tagged)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        subs = write_subtitles(tmp, args.content_files)
+        correct = sum(1 for path, code in subs if detect_subtitle_language(path) == code)
+        content = bench(detect_subtitle_language, [path for path, _ in subs], args.rounds)
+    print(f"{args.content_files} untagged subtitles, best of {args.rounds} rounds")
+    print(f"  content tier:     {content * 1e3:6.2f} ms/file  ({1 / content:.0f} files/s, {correct} correct)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Reload benchmark for TrackListFrame and FileListFrame.
+
+Reloads each list hundreds of times, like stepping through a season file by
+file, and reports per-load latency, the number of live Tk objects (Tcl
+commands, which include every widget) and the number of widget-level event
+bindings. All three should stay flat once the row pools are warm.
+
+    python benchmarks/bench_list_reload.py [--reloads 300] [--tracks 80] [--files 24]
+
+Needs a display (run under xvfb-run on a headless box).
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+from modules.widgets import TrackListFrame, FileListFrame
+
+def synthetic_info(n_tracks, seed):
+    """mkvmerge -J style info with one video, a few audio and many subtitle tracks."""
+    langs = ["eng", "jpn", "por", "spa", "fra", "deu", "und"]
+    tracks = [{"id": 0, "type": "video", "codec": "AVC",
+               "properties": {"codec_id": "V_MPEG4/ISO/AVC", "language": "und"}}]
+    for tid in range(1, n_tracks):
+        ttype = "audio" if tid < 4 else "subtitles"
+        tracks.append({
+            "id": tid, "type": ttype, "codec": "AAC" if ttype == "audio" else "SubStationAlpha",
+            "properties": {
+                "codec_id": "A_AAC" if ttype == "audio" else "S_TEXT/ASS",
+                "language": langs[(tid + seed) % len(langs)],
+                "track_name": f"Signs & Songs {tid}" if ttype == "subtitles" else "",
+            },
+        })
+    return {"tracks": tracks, "container": {"properties": {"duration": 1_420_000_000_000}}}
+
+def tk_object_count(root):
+    return len(root.tk.call("info", "commands"))
+
+def binding_count(widget):
+    """Event bindings on widget and all its descendants (bind_all handlers excluded)."""
+    count = len(widget.tk.splitlist(widget.tk.call("bind", widget._w)))
+    return count + sum(binding_count(child) for child in widget.winfo_children())
+
+def report(name, latencies, objects, bindings):
+    warm = latencies[10:] or latencies
+    print(f"\n{name}")
+    print(f"  loads:            {len(latencies)}")
+    print(f"  first load:       {latencies[0] * 1000:7.2f} ms")
+    print(f"  median (warm):    {statistics.median(warm) * 1000:7.2f} ms")
+    print(f"  p95 (warm):       {sorted(warm)[int(len(warm) * 0.95) - 1] * 1000:7.2f} ms")
+    print(f"  first 10 / last 10 mean: {statistics.mean(latencies[:10]) * 1000:.2f} / "
+          f"{statistics.mean(latencies[-10:]) * 1000:.2f} ms")
+    print(f"  Tk objects after load 1 / 10 / last: {objects[0]} / {objects[min(9, len(objects) - 1)]} / {objects[-1]}")
+    print(f"  Bindings after load 1 / last:        {bindings[0]} / {bindings[-1]}")
+
+def bench_track_list(root, reloads, n_tracks):
+    frame = TrackListFrame(root, width=900, height=400)
+    frame.pack(fill="both", expand=True)
+    root.update()
+
+    latencies, objects, bindings = [], [], []
+    for i in range(reloads):
+        info = synthetic_info(n_tracks, seed=i)
+        start = time.perf_counter()
+        frame.source_filename = f"Episode {i:03d}"
+        frame.show_info(info)
+        root.update()
+        latencies.append(time.perf_counter() - start)
+        objects.append(tk_object_count(root))
+        bindings.append(binding_count(frame))
+
+    frame.destroy()
+    report(f"TrackListFrame ({n_tracks} tracks, edit mode)", latencies, objects, bindings)
+
+def bench_file_list(root, reloads, n_files):
+    frame = FileListFrame(root, width=900, height=300)
+    frame.pack(fill="both", expand=True)
+    root.update()
+
+    latencies, objects, bindings = [], [], []
+    for i in range(reloads):
+        start = time.perf_counter()
+        frame.clear()
+        for j in range(n_files):
+            frame.add_file_row(f"/media/season/Episode {i:03d}.{j}.srt", lambda var: None, on_remove=lambda row: None)
+        root.update()
+        latencies.append(time.perf_counter() - start)
+        objects.append(tk_object_count(root))
+        bindings.append(binding_count(frame))
+
+    frame.destroy()
+    report(f"FileListFrame ({n_files} rows)", latencies, objects, bindings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reloads", type=int, default=300)
+    parser.add_argument("--tracks", type=int, default=80)
+    parser.add_argument("--files", type=int, default=24)
+    args = parser.parse_args()
+
+    root = ctk.CTk()
+    root.geometry("1000x800")
+    bench_track_list(root, args.reloads, args.tracks)
+    bench_file_list(root, args.reloads, args.files)
+    root.destroy()
+
+if __name__ == "__main__":
+    main()
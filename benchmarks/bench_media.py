@@ -0,0 +1,261 @@
+"""
+End-to-end benchmark of the media operations on synthetic fixtures.
+
+Generates an MKV and an MP4 of configurable duration, size, audio and subtitle
+track count (ffmpeg lavfi test sources plus generated SRTs, muxed by mkvmerge
+with a fixed seed), then times over --rounds runs:
+
+    probe     get_mkv_info / get_ffmpeg_info, cold (cache entry dropped) and cached
+    extract   extract_tracks (mkvextract, all tracks) and extract_stream_cmd
+              (one ffmpeg run per track), MKV fixture only
+    remux     mux_mkv of the whole fixture into a new MKV
+    render    TrackListFrame.show_info with the probed tracks (needs a display)
+
+Fixtures are cached in --workdir by their parameters, so reruns time the same
+bytes. Results, with tool versions and host details, are written as JSON for
+comparison between commits:
+
+    python benchmarks/bench_media.py [--duration 60] [--size-mb 50] [--audio 2] [--subs 8]
+                                     [--rounds 5] [--workdir DIR] [--output results.json]
+
+Needs ffmpeg, ffprobe, mkvmerge and mkvextract (the same ones the app resolves).
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.dependency_manager import DependencyManager
+from utils.probe_cache import ProbeCache
+from utils.mkv_wrapper import get_mkv_info, extract_tracks, mux_mkv
+from utils.ffmpeg_wrapper import get_ffmpeg_info, extract_stream_cmd
+from utils.track_naming import track_extension
+
+TOOLS = ["ffmpeg", "ffprobe", "mkvmerge", "mkvextract"]
+SUB_LANGUAGES = ["eng", "por", "spa", "fra", "deu", "jpn", "rus", "ita"]
+MKVMERGE_SEED = 1 # --deterministic: identical parameters give identical bytes
+
+def tool_path(name):
+    path = DependencyManager().get_binary_path(name)
+    if not path or not os.path.isfile(path):
+        sys.exit(f"{name} not found; the media benchmark needs real tools")
+    return path
+
+def run(cmd):
+    result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    if result.returncode != 0:
+        sys.exit(f"Fixture generation failed: {' '.join(cmd)}\n{result.stderr.strip()}")
+
+def _srt_time(seconds, ms):
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d},{ms:03d}"
+
+def write_srt(path, duration, lang):
+    """One cue every two seconds over duration."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(int(duration // 2)):
+            f.write(f"{i + 1}\n{_srt_time(i * 2, 0)} --> {_srt_time(i * 2 + 1, 500)}\n"
+                    f"[{lang}] Line {i + 1} of the synthetic fixture.\n\n")
+
+def make_fixtures(workdir, duration, size_mb, n_audio, n_subs):
+    """
+    Returns {"mkv": path, "mp4": path}, generating whatever is missing.
+    Video is MPEG-4 Part 2 and audio AAC, both built into every ffmpeg.
+    """
+    name = f"synthetic_{duration}s_{size_mb}mb_a{n_audio}_s{n_subs}"
+    mkv_path = os.path.join(workdir, name + ".mkv")
+    mp4_path = os.path.join(workdir, name + ".mp4")
+    if os.path.exists(mkv_path) and os.path.exists(mp4_path):
+        return {"mkv": mkv_path, "mp4": mp4_path}
+
+    # Nearly all the bytes are video; audio is 128 kb/s per track
+    video_kbps = max(100, int(size_mb * 8 * 1024 / duration) - 128 * n_audio)
+    subs = []
+    for i in range(n_subs):
+        lang = SUB_LANGUAGES[i % len(SUB_LANGUAGES)]
+        path = os.path.join(workdir, f"{name}.{i}.{lang}.srt")
+        write_srt(path, duration, lang)
+        subs.append((path, lang))
+
+    cmd = [tool_path("ffmpeg"), "-y", "-v", "error",
+           "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate=25:duration={duration}"]
+    for i in range(n_audio):
+        cmd += ["-f", "lavfi", "-i", f"sine=frequency={220 * (i + 2)}:sample_rate=48000:duration={duration}"]
+    for path, _ in subs:
+        cmd += ["-i", path]
+    for i in range(1 + n_audio + n_subs):
+        cmd += ["-map", f"{i}:0"]
+    cmd += ["-c:v", "mpeg4", "-b:v", f"{video_kbps}k", "-g", "250",
+            "-c:a", "aac", "-b:a", "128k", "-c:s", "mov_text"]
+    for i, (_, lang) in enumerate(subs):
+        cmd += [f"-metadata:s:s:{i}", f"language={lang}"]
+    cmd += ["-map_metadata", "-1", "-fflags", "+bitexact", "-flags", "+bitexact", mp4_path]
+    run(cmd)
+
+    # The MKV takes video and audio from the MP4 and the subtitles as SRT, like a typical release
+    cmd = [tool_path("mkvmerge"), "--deterministic", str(MKVMERGE_SEED), "-o", mkv_path, "--no-subtitles", mp4_path]
+    for path, lang in subs:
+        cmd += ["--language", f"0:{lang}", path]
+    run(cmd)
+    return {"mkv": mkv_path, "mp4": mp4_path}
+
+def stats(samples):
+    return {"runs": [round(s, 6) for s in samples], "min": round(min(samples), 6),
+            "median": round(statistics.median(samples), 6), "mean": round(statistics.mean(samples), 6)}
+
+def timed(fn, rounds, setup=None):
+    samples = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return stats(samples)
+
+def check(ok_msg):
+    ok, msg = ok_msg
+    if not ok:
+        raise RuntimeError(msg)
+
+def bench_probe(path, rounds):
+    cache = ProbeCache()
+    results = {}
+    for label, probe in (("get_mkv_info", get_mkv_info), ("get_ffmpeg_info", get_ffmpeg_info)):
+        results[f"probe_{label}_cold"] = timed(lambda: probe(path), rounds, setup=lambda: cache.invalidate(path))
+        results[f"probe_{label}_cached"] = timed(lambda: probe(path), rounds)
+    return results
+
+def bench_extract(path, info, out_dir, rounds):
+    mkv_plan = {t["id"]: os.path.join(out_dir, f"track{t['id']}{track_extension(t['properties'].get('codec_id', ''))}")
+                for t in info["tracks"]}
+    # ffmpeg picks the muxer from the extension; Matroska takes every codec as it is
+    ffmpeg_plan = {tid: os.path.join(out_dir, f"track{tid}.mkv") for tid in mkv_plan}
+
+    def ffmpeg_extract():
+        for tid, out in ffmpeg_plan.items():
+            cmd = extract_stream_cmd(path, tid, out)
+            cmd[1:1] = ["-y", "-v", "error"] # Overwrite the previous round's output
+            result = subprocess.run(cmd, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip())
+
+    return {
+        "extract_tracks": timed(lambda: check(extract_tracks(path, mkv_plan)), rounds),
+        "extract_stream_cmd": timed(ffmpeg_extract, rounds),
+    }
+
+def bench_remux(path, out_dir, rounds):
+    out = os.path.join(out_dir, "remux.mkv")
+    return {"mux_mkv": timed(lambda: check(mux_mkv(out, [path])), rounds)}
+
+def bench_render(infos, rounds):
+    """Times TrackListFrame.show_info plus the Tk update that draws it; None without a display."""
+    try:
+        import tkinter
+        import customtkinter as ctk
+        from modules.widgets import TrackListFrame
+    except ImportError as e:
+        print(f"Skipping render timings: {e}")
+        return None
+    try:
+        root = ctk.CTk()
+    except tkinter.TclError as e:
+        print(f"Skipping render timings (no display?): {e}")
+        return None
+
+    results = {}
+    try:
+        root.geometry("1000x700")
+        for fmt, info in infos.items():
+            frame = TrackListFrame(root, extract_mode=True, width=900, height=500)
+            frame.pack(fill="both", expand=True)
+            root.update()
+
+            def render():
+                frame.show_info(info)
+                root.update()
+            results[fmt] = {"track_list_render": timed(render, rounds)}
+            frame.destroy()
+    finally:
+        root.destroy()
+    return results
+
+def print_results(results):
+    for fmt, ops in results.items():
+        print(f"\n{fmt}")
+        for op, s in ops.items():
+            print(f"  {op:32} median {s['median'] * 1000:9.2f} ms   min {s['min'] * 1000:9.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--duration", type=int, default=60, help="fixture length in seconds")
+    parser.add_argument("--size-mb", type=int, default=50, help="approximate fixture size")
+    parser.add_argument("--audio", type=int, default=2, help="audio tracks")
+    parser.add_argument("--subs", type=int, default=8, help="subtitle tracks")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workdir", help="fixture cache (default: a temp dir, removed afterwards)")
+    parser.add_argument("--output", help="JSON results path (default: bench_media-<host>-<time>.json)")
+    parser.add_argument("--no-render", action="store_true", help="skip the Tk render timings")
+    args = parser.parse_args()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_media_")
+    os.makedirs(workdir, exist_ok=True)
+    out_dir = tempfile.mkdtemp(prefix="out_", dir=workdir)
+    # Keep the benchmark's probes out of the user's probe cache
+    ProbeCache().db_path = os.path.join(workdir, "probe_cache.sqlite")
+
+    try:
+        print(f"Generating fixtures in {workdir}...")
+        fixtures = make_fixtures(workdir, args.duration, args.size_mb, args.audio, args.subs)
+
+        results, infos = {}, {}
+        for fmt, path in fixtures.items():
+            print(f"Timing {fmt} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)...")
+            results[fmt] = bench_probe(path, args.rounds)
+            infos[fmt] = get_mkv_info(path)
+            if fmt == "mkv":
+                results[fmt].update(bench_extract(path, infos[fmt], out_dir, args.rounds))
+            results[fmt].update(bench_remux(path, out_dir, args.rounds))
+
+        render = None if args.no_render else bench_render(infos, args.rounds)
+        for fmt, ops in (render or {}).items():
+            results[fmt].update(ops)
+
+        report = {
+            "benchmark": "media",
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "host": socket.gethostname(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "tools": {name: DependencyManager().tool_version(name) for name in TOOLS},
+            "params": {"duration": args.duration, "size_mb": args.size_mb, "audio": args.audio,
+                       "subs": args.subs, "rounds": args.rounds},
+            "fixtures": {fmt: {"bytes": os.path.getsize(path), "tracks": len(infos[fmt]["tracks"])}
+                         for fmt, path in fixtures.items()},
+            "render_skipped": render is None,
+            "results": results,
+        }
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results)
+    output = args.output or f"bench_media-{report['host']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+"""
+Headless command line interface: python -m cli <command> ...
+
+Runs the same wrappers as the GUI without importing Tk or customtkinter, so it
+works over SSH and from cron. Tool wrappers are imported inside each command to
+keep start-up (and --help) fast.
+
+    python -m cli info movie.mkv
+    python -m cli extract movie.mkv --type subtitles --lang eng -o subs/
+    python -m cli edit movie.mkv --set 2:language=por --set 2:default=1
+    python -m cli add-subs movie.mkv movie.pt.srt --lang por -o movie.subbed.mkv
+    python -m cli create clip.mp4 clip.en.srt -o clip.mkv
+    python -m cli tools
+    python -m cli watch incoming/ add-subs --default-lang por -o done/
+"""
+import os
+import sys
+import json
+import argparse
+from utils.process_runner import DEFAULT_STALL_TIMEOUT
+
+# CLI property name -> mkvpropedit property name
+EDIT_PROPERTIES = {
+    "language": "language",
+    "name": "name",
+    "default": "flag-default",
+    "forced": "flag-forced",
+}
+
+class CLIError(Exception):
+    pass
+
+def _progress_printer(args):
+    """on_progress callback drawing a one-line percentage on stderr (interactive only)."""
+    if args.quiet or not sys.stderr.isatty():
+        return None
+
+    def on_progress(progress):
+        if progress.percent is not None:
+            sys.stderr.write(f"\r  {progress.percent:5.1f}%")
+            if progress.percent >= 100:
+                sys.stderr.write("\n")
+            sys.stderr.flush()
+    return on_progress
+
+def _limits(args):
+    """process_runner.Limits from --timeout/--stall-timeout (0 disables); Ctrl+C cancels."""
+    from utils.process_runner import Limits
+    return Limits(None, args.timeout or None, args.stall_timeout or None)
+
+def _log(args, message):
+    if not args.quiet:
+        print(message)
+
+def _probe(path):
+    from utils.probe import probe_file
+    if not os.path.isfile(path):
+        raise CLIError(f"File not found: {path}")
+    try:
+        return probe_file(path)
+    except Exception as e:
+        raise CLIError(f"Could not read {path}: {e}")
+
+def cmd_info(args):
+    info = _probe(args.file)
+    if args.json:
+        json.dump(info, sys.stdout, indent=2)
+        print()
+        return 0
+
+    for track in info.get("tracks", []):
+        props = track.get("properties", {})
+        flags = [f for f, key in (("default", "default_track"), ("forced", "forced_track")) if props.get(key)]
+        name = props.get("track_name", "")
+        line = (f"{track['id']:>3}  {track.get('type', ''):<10} {props.get('language', 'und'):<4} "
+                f"{track.get('codec', ''):<20} {name}{'  [' + ', '.join(flags) + ']' if flags else ''}")
+        print(line.rstrip())
+    return 0
+
+def cmd_tools(args):
+    from utils.dependency_manager import DependencyManager
+    dm = DependencyManager()
+    missing = 0
+    for tool in dm.tools + ["mkvpropedit"]:
+        info = dm.tool_info(tool)
+        if info is None:
+            print(f"{tool:<12} not found")
+            missing += 1
+            continue
+        lacking = [cap for cap, ok in info["capabilities"].items() if not ok]
+        print(f"{tool:<12} {info['version'] or 'unknown version'}")
+        print(f"{'':<12} {info['path']}" + (f"  (too old for: {', '.join(lacking)})" if lacking else ""))
+    return 1 if missing else 0
+
+def cmd_extract(args):
+    from utils.batch_extract import TrackRule, collect_sources, plan_extraction
+    from utils.mkv_wrapper import extract_tracks
+    from utils.ffmpeg_wrapper import extract_streams
+    from utils.atomic_output import InsufficientSpaceError, check_free_space, estimate_output_size
+    from utils.process_runner import ProcessAborted
+
+    sources = collect_sources(args.files, recursive=args.recursive)
+    if not sources:
+        raise CLIError("No video files found.")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    try:
+        track_ids = {int(t) for t in args.tracks.split(",")} if args.tracks else None
+    except ValueError:
+        raise CLIError(f"Bad --tracks value '{args.tracks}', expected comma-separated track IDs")
+    rule = TrackRule(types=args.type, languages=args.lang, codecs=args.codec)
+
+    failures = 0
+    for video_path in sources:
+        info = _probe(video_path)
+        plan = plan_extraction(video_path, info, rule, args.output_dir)
+        if track_ids is not None:
+            plan = {tid: path for tid, path in plan.items() if tid in track_ids}
+        if not plan:
+            _log(args, f"{video_path}: no matching tracks")
+            continue
+
+        try:
+            check_free_space(next(iter(plan.values())), estimate_output_size(video_path, info, plan))
+        except InsufficientSpaceError as e:
+            failures += 1
+            print(f"{video_path}: {e}", file=sys.stderr)
+            continue
+
+        _log(args, f"{video_path}: extracting {len(plan)} track(s)")
+        on_progress = _progress_printer(args)
+        if video_path.lower().endswith('.mkv'):
+            success, msg = extract_tracks(video_path, plan, on_progress=on_progress, limits=_limits(args))
+            errors = {} if success else {"all": msg.strip()}
+        else:
+            duration_ns = info.get("container", {}).get("properties", {}).get("duration")
+            try:
+                errors = extract_streams(video_path, plan, on_progress=on_progress, duration_ns=duration_ns,
+                                         limits=_limits(args))
+            except ProcessAborted as e:
+                errors = {"all": str(e)}
+
+        if errors:
+            failures += 1
+            for tid, err in errors.items():
+                print(f"{video_path}: track {tid} failed: {err}", file=sys.stderr)
+        else:
+            for path in plan.values():
+                _log(args, f"  {path}")
+
+    return 1 if failures else 0
+
+def _parse_edits(specs):
+    """["2:language=por", "2:default=1"] -> {2: {"language": "por", "flag-default": "1"}}"""
+    edits = {}
+    for spec in specs:
+        try:
+            tid, assignment = spec.split(":", 1)
+            key, value = assignment.split("=", 1)
+            tid = int(tid)
+        except ValueError:
+            raise CLIError(f"Bad --set value '{spec}', expected TRACK_ID:PROPERTY=VALUE")
+        if key not in EDIT_PROPERTIES:
+            raise CLIError(f"Unknown property '{key}', expected one of: {', '.join(EDIT_PROPERTIES)}")
+        if key in ("default", "forced"):
+            value = "1" if value.lower() in ("1", "yes", "true", "on") else "0"
+        edits.setdefault(tid, {})[EDIT_PROPERTIES[key]] = value
+    return edits
+
+def cmd_edit(args):
+    from utils.mkv_wrapper import edit_properties
+
+    if not args.file.lower().endswith('.mkv'):
+        raise CLIError("In-place editing needs an MKV file.")
+    edits = _parse_edits(args.set)
+
+    info = _probe(args.file)
+    known = {t["id"] for t in info.get("tracks", [])}
+    unknown = sorted(set(edits) - known)
+    if unknown:
+        raise CLIError(f"No track with ID {', '.join(map(str, unknown))} in {args.file}")
+
+    success, msg = edit_properties(args.file, edits, info=info)
+    if not success:
+        raise CLIError(f"mkvpropedit failed:\n{msg.strip()}")
+    _log(args, f"Updated {args.file}")
+    return 0
+
+def _mux_subtitles(args, subtitle_paths):
+    from utils.mkv_wrapper import mux_mkv
+    from utils.ffmpeg_wrapper import mux_subtitles
+    from utils.languages import normalize
+    from utils.atomic_output import InsufficientSpaceError, check_free_space, estimate_output_size
+
+    for path in [args.video] + subtitle_paths:
+        if not os.path.isfile(path):
+            raise CLIError(f"File not found: {path}")
+
+    languages = [normalize(lang) or lang for lang in args.lang or []]
+    if len(languages) > len(subtitle_paths):
+        raise CLIError("More --lang values than subtitle files.")
+    languages += ["und"] * (len(subtitle_paths) - len(languages))
+
+    output_path = args.output
+    try:
+        check_free_space(output_path, estimate_output_size(args.video, extra_paths=subtitle_paths))
+    except InsufficientSpaceError as e:
+        raise CLIError(str(e))
+    on_progress = _progress_printer(args)
+    if output_path.lower().endswith('.mp4'):
+        info = _probe(args.video)
+        existing_subs = sum(1 for t in info.get("tracks", []) if t.get("type") == "subtitles")
+        duration_ns = info.get("container", {}).get("properties", {}).get("duration")
+        success, msg = mux_subtitles(output_path, args.video, subtitle_paths, languages, existing_subs,
+                                     on_progress=on_progress, duration_ns=duration_ns, limits=_limits(args))
+    else:
+        inputs = [args.video]
+        for sub_path, lang in zip(subtitle_paths, languages):
+            inputs.extend(["--language", f"0:{lang}", sub_path])
+        success, msg = mux_mkv(output_path, inputs, on_progress=on_progress, limits=_limits(args))
+
+    if not success:
+        raise CLIError(f"Muxing failed:\n{msg.strip()}")
+    _log(args, f"File saved to {output_path}")
+    return 0
+
+def cmd_add_subs(args):
+    return _mux_subtitles(args, args.subtitles)
+
+def cmd_create(args):
+    return _mux_subtitles(args, args.subtitles or [])
+
+def cmd_watch(args):
+    from utils.watch_folder import FolderWatcher, WatchOperation
+    from utils.batch_extract import STATUS_FAILED, STATUS_CANCELLED
+    from utils.job_scheduler import JobScheduler
+
+    if not os.path.isdir(args.folder):
+        raise CLIError(f"Folder not found: {args.folder}")
+    try:
+        if args.load:
+            operation = WatchOperation.load(args.load)
+        elif args.operation:
+            operation = WatchOperation(args.operation, output_dir=args.output_dir, types=args.type,
+                                       languages=args.lang, codecs=args.codec, default_language=args.default_lang,
+                                       detect_content=not args.no_detect, suffix=args.suffix)
+        else:
+            raise CLIError("Give an operation or --load a saved one.")
+    except (OSError, ValueError) as e:
+        raise CLIError(f"Bad operation: {e}")
+    if args.save:
+        operation.save(args.save)
+        _log(args, f"Operation saved to {args.save}")
+
+    def on_status(path, status, detail):
+        line = f"{path}: {status}" + (f" ({detail})" if detail else "")
+        if status in (STATUS_FAILED, STATUS_CANCELLED):
+            print(line, file=sys.stderr)
+        else:
+            _log(args, line)
+
+    JobScheduler().set_stall_timeout(args.stall_timeout or None)
+    watcher = FolderWatcher(args.folder, operation, on_status=on_status, settle=args.settle,
+                            interval=args.interval, max_queued=args.max_queued,
+                            process_existing=not args.skip_existing, use_inotify=not args.poll,
+                            timeout=args.timeout or None)
+    _log(args, f"Watching {watcher.folder} ({operation.operation}), Ctrl+C to stop")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.cancel_jobs() # Kills running tools so their temp outputs are removed
+        raise
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="MKV Tool Suite, headless.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print errors")
+    parser.add_argument("--timeout", type=float, default=0, metavar="SECONDS",
+                        help="kill a tool that runs longer than this (default: no limit)")
+    parser.add_argument("--stall-timeout", type=float, default=DEFAULT_STALL_TIMEOUT, metavar="SECONDS",
+                        help=f"kill a tool that reports no progress for this long, 0 to disable "
+                             f"(default: {DEFAULT_STALL_TIMEOUT})")
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+    sub.required = True
+
+    p = sub.add_parser("info", help="list the tracks of a file")
+    p.add_argument("file")
+    p.add_argument("--json", action="store_true", help="print the full probe result as JSON")
+    p.set_defaults(func=cmd_info)
+
+    p = sub.add_parser("extract", help="extract tracks from one or more files")
+    p.add_argument("files", nargs="+", help="video files and/or folders")
+    p.add_argument("--tracks", help="comma-separated track IDs (default: all matching tracks)")
+    p.add_argument("--type", action="append", choices=["video", "audio", "subtitles"], help="track type (repeatable)")
+    p.add_argument("--lang", action="append", help="track language code (repeatable)")
+    p.add_argument("--codec", action="append", help="codec substring, e.g. UTF8, PGS (repeatable)")
+    p.add_argument("-o", "--output-dir", help="output folder (default: next to each source)")
+    p.add_argument("-r", "--recursive", action="store_true", help="descend into sub-folders")
+    p.set_defaults(func=cmd_extract)
+
+    p = sub.add_parser("edit", help="change track properties in place (mkvpropedit, no remux)")
+    p.add_argument("file")
+    p.add_argument("--set", action="append", required=True, metavar="ID:PROP=VALUE",
+                   help=f"property to set, PROP one of {', '.join(EDIT_PROPERTIES)}; empty VALUE clears it (repeatable)")
+    p.set_defaults(func=cmd_edit)
+
+    p = sub.add_parser("add-subs", help="add subtitle files to a video")
+    p.add_argument("video")
+    p.add_argument("subtitles", nargs="+")
+    p.add_argument("--lang", action="append", help="language of each subtitle, in order (repeatable)")
+    p.add_argument("-o", "--output", required=True, help="output file (.mkv or .mp4)")
+    p.set_defaults(func=cmd_add_subs)
+
+    p = sub.add_parser("create", help="create an MKV/MP4 from a video and optional subtitles")
+    p.add_argument("video")
+    p.add_argument("subtitles", nargs="*")
+    p.add_argument("--lang", action="append", help="language of each subtitle, in order (repeatable)")
+    p.add_argument("-o", "--output", required=True, help="output file (.mkv or .mp4)")
+    p.set_defaults(func=cmd_create)
+
+    p = sub.add_parser("tools", help="show the external tools found, their versions and paths")
+    p.set_defaults(func=cmd_tools)
+
+    p = sub.add_parser("watch", help="process new files in a folder as they arrive, until Ctrl+C")
+    p.add_argument("folder")
+    p.add_argument("operation", nargs="?", choices=["extract", "add-subs"],
+                   help="extract: tracks picked by --type/--lang/--codec; add-subs: mux in the matching subtitles")
+    p.add_argument("--load", metavar="FILE", help="run an operation saved with --save")
+    p.add_argument("--save", metavar="FILE", help="save the operation to FILE (JSON) before watching")
+    p.add_argument("--type", action="append", choices=["video", "audio", "subtitles"], help="extract: track type (repeatable)")
+    p.add_argument("--lang", action="append", help="extract: track language code (repeatable)")
+    p.add_argument("--codec", action="append", help="extract: codec substring (repeatable)")
+    p.add_argument("--default-lang", help="add-subs: language whose subtitle becomes the default track, e.g. por")
+    p.add_argument("--no-detect", action="store_true",
+                   help="add-subs: do not read untagged subtitles to detect their language")
+    p.add_argument("--suffix", default="_muxed", help="add-subs: output name suffix (default: _muxed)")
+    p.add_argument("-o", "--output-dir", help="output folder (default: the watched folder)")
+    p.add_argument("--settle", type=float, default=5.0, metavar="SECONDS",
+                   help="wait until a file has not changed for this long (default: 5)")
+    p.add_argument("--interval", type=float, default=2.0, metavar="SECONDS", help="poll interval (default: 2)")
+    p.add_argument("--max-queued", type=int, default=4, metavar="N", help="jobs queued at once (default: 4)")
+    p.add_argument("--poll", action="store_true", help="poll instead of inotify (needed for network shares)")
+    p.add_argument("--skip-existing", action="store_true", help="ignore files already in the folder at start")
+    p.set_defaults(func=cmd_watch)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except CLIError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except FileNotFoundError as e:
+        # Missing tool binary
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        # The running tool has been killed and its temp output removed
+        print("Cancelled.", file=sys.stderr)
+        return 130
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+import sys
+
+import pytest
+
+from utils.dependency_manager import DependencyManager
+
+@pytest.fixture
+def fake_tool(tmp_path, monkeypatch):
+    """
+    Factory for stand-in tools: fake_tool(body, name="mkvmerge", install=False)
+    writes an executable Python script running body (with sys, time and
+    args = sys.argv[1:] at hand) and returns its path. Named mkvmerge by default,
+    so --gui-mode progress lines are parsed. install=True makes
+    DependencyManager return it for every tool. Unix only (shebang script).
+    """
+    def make(body, name="mkvmerge", install=False):
+        tool = tmp_path / name
+        tool.write_text(f"#!{sys.executable}\nimport sys, time\nargs = sys.argv[1:]\n{body}\n")
+        tool.chmod(0o755)
+        if install:
+            monkeypatch.setattr(DependencyManager(), "get_binary_path", lambda tool_name: str(tool))
+        return str(tool)
+    return make
@@ -5,7 +5,10 @@ import tkinter as tk
 import threading
 from typing import TYPE_CHECKING
 from utils import theme
+from utils import file_dialogs
 from utils.dependency_manager import DependencyManager
+from utils.job_metrics import JobMetrics
+from modules.queue_view import JobQueueFrame
 
 if TYPE_CHECKING:
     from modules.extractor import ExtractorFrame
@@ -37,7 +40,7 @@ class MKVToolSuite(ctk.CTk):
         self.sidebar_frame = ctk.CTkFrame(self, width=220, corner_radius=0, 
                                            fg_color=theme.COLOR_BG_SIDEBAR, border_width=0)
         self.sidebar_frame.grid(row=0, column=0, sticky="nsew")
-        self.sidebar_frame.grid_rowconfigure(5, weight=1)
+        self.sidebar_frame.grid_rowconfigure(6, weight=1)
 
         self.logo_label = ctk.CTkLabel(self.sidebar_frame, text="MKV Tool Suite", 
                                         font=ctk.CTkFont(size=22, weight="bold"))
@@ -64,9 +67,20 @@ class MKVToolSuite(ctk.CTk):
                                                      command=self.sidebar_button_event_creator, **btn_opts)
         self.sidebar_button_creator.grid(row=4, column=0, padx=15, pady=5, sticky="ew")
 
+        self.sidebar_button_metrics = ctk.CTkButton(self.sidebar_frame, text="  Metrics",
+                                                     command=self.sidebar_button_event_metrics, **btn_opts)
+        self.sidebar_button_metrics.grid(row=5, column=0, padx=15, pady=5, sticky="ew")
+
+        # Job metrics are recorded from the start, the panel loads on demand
+        JobMetrics()
+
+        # Job Queue
+        self.queue_frame = JobQueueFrame(self.sidebar_frame)
+        self.queue_frame.grid(row=6, column=0, padx=15, pady=(20, 0), sticky="nsew")
+
         # Appearance Mode
         self.appearance_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
-        self.appearance_frame.grid(row=6, column=0, padx=20, pady=(10, 30), sticky="ew")
+        self.appearance_frame.grid(row=7, column=0, padx=20, pady=(10, 30), sticky="ew")
         
         self.appearance_mode_optionemenu = ctk.CTkOptionMenu(self.appearance_frame, values=["Light", "Dark", "System"],
                                                                command=self.change_appearance_mode_event,
@@ -84,8 +98,18 @@ class MKVToolSuite(ctk.CTk):
         # Select default frame
         self.select_frame_by_name("extractor")
 
-        # Check dependencies
-        self.check_dependencies_on_startup()
+        # Dependency and dialog-tool probing waits until the first frame is on screen
+        self.after_idle(lambda: self.after(0, self.start_background_checks))
+
+    def start_background_checks(self):
+        """Resolves tools and dialog binaries on a worker thread, off the start-up path."""
+        def task():
+            file_dialogs.preload()
+            missing = DependencyManager().check_missing_dependencies()
+            if missing:
+                self.after(0, self.check_dependencies_on_startup)
+
+        threading.Thread(target=task, daemon=True).start()
 
     def check_dependencies_on_startup(self):
         dm = DependencyManager()
@@ -156,7 +180,8 @@ class MKVToolSuite(ctk.CTk):
         for btn, n in [(self.sidebar_button_extractor, "extractor"), 
                       (self.sidebar_button_mixer, "mixer"), 
                       (self.sidebar_button_editor, "editor"), 
-                      (self.sidebar_button_creator, "creator")]:
+                      (self.sidebar_button_creator, "creator"),
+                      (self.sidebar_button_metrics, "metrics")]:
             if n == name:
                 btn.configure(fg_color=theme.COLOR_ACCENT, text_color="white", hover_color=theme.COLOR_HOVER)
             else:
@@ -176,6 +201,9 @@ class MKVToolSuite(ctk.CTk):
             elif name == "creator":
                 from modules.creator import CreatorFrame
                 self.frames[name] = CreatorFrame(self)
+            elif name == "metrics":
+                from modules.metrics_view import MetricsFrame
+                self.frames[name] = MetricsFrame(self)
 
             # Configure frame to be transparent
             if name in self.frames:
@@ -188,6 +216,10 @@ class MKVToolSuite(ctk.CTk):
             else:
                 frame.grid_forget()
 
+        # The file tabs share one media session: show its file and edits (no probe if already loaded)
+        if hasattr(self.frames.get(name), "sync_session"):
+            self.frames[name].sync_session()
+
     def sidebar_button_event_extractor(self):
         self.select_frame_by_name("extractor")
 
@@ -200,6 +232,9 @@ class MKVToolSuite(ctk.CTk):
     def sidebar_button_event_creator(self):
         self.select_frame_by_name("creator")
 
+    def sidebar_button_event_metrics(self):
+        self.select_frame_by_name("metrics")
+
     def change_appearance_mode_event(self, new_appearance_mode: str):
         ctk.set_appearance_mode(new_appearance_mode)
 
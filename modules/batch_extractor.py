@@ -0,0 +1,195 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from utils import file_dialogs
+import os
+import threading
+from utils import batch_extract
+from utils.batch_extract import TrackRule
+from utils import theme
+
+STATUS_COLORS = {
+    batch_extract.STATUS_QUEUED: "gray",
+    batch_extract.STATUS_PROBING: theme.COLOR_ACCENT,
+    batch_extract.STATUS_EXTRACTING: theme.COLOR_ACCENT,
+    batch_extract.STATUS_DONE: "green",
+    batch_extract.STATUS_SKIPPED: "orange",
+    batch_extract.STATUS_FAILED: "red",
+    batch_extract.STATUS_CANCELLED: "gray",
+}
+
+class BatchExtractWindow(ctk.CTkToplevel):
+    """
+    Extract tracks matching a rule (type / language / codec) from many files at once.
+    Each file is a job on the shared scheduler (see the sidebar queue); each row shows its own status.
+    """
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Batch Extract")
+        self.geometry("820x600")
+        self.transient(master)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Source Controls
+        self.src_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.src_frame.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="ew")
+
+        ctk.CTkButton(self.src_frame, text="Add Folder", command=self.add_folder, height=35).pack(side="left", padx=(0, 10))
+        ctk.CTkButton(self.src_frame, text="Add Files", command=self.add_files, height=35).pack(side="left", padx=(0, 10))
+        ctk.CTkButton(self.src_frame, text="Clear List", command=self.clear_sources,
+                      fg_color="transparent", border_width=1, hover_color=theme.COLOR_BTN_CLEAR_HOVER,
+                      text_color=theme.COLOR_BTN_CLEAR_TEXT, height=35).pack(side="left")
+        self.count_var = ctk.StringVar(value="0 files")
+        ctk.CTkLabel(self.src_frame, textvariable=self.count_var, text_color="gray").pack(side="right")
+
+        # File List
+        self.file_list = ctk.CTkScrollableFrame(self, corner_radius=6, border_width=1, fg_color=theme.COLOR_BG_LIST)
+        self.file_list.grid(row=1, column=0, padx=15, pady=5, sticky="nsew")
+        self.file_list.grid_columnconfigure(0, weight=1)
+
+        # Track Rule
+        self.rule_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rule_frame.grid(row=2, column=0, padx=15, pady=5, sticky="ew")
+
+        ctk.CTkLabel(self.rule_frame, text="Tracks:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=(0, 5))
+        self.type_vars = {}
+        for ttype, label, checked in [("video", "Video", False), ("audio", "Audio", False), ("subtitles", "Subtitles", True)]:
+            var = ctk.BooleanVar(value=checked)
+            ctk.CTkCheckBox(self.rule_frame, text=label, variable=var, width=70).pack(side="left", padx=5)
+            self.type_vars[ttype] = var
+
+        ctk.CTkLabel(self.rule_frame, text="Languages:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=(15, 5))
+        self.lang_entry = ctk.CTkEntry(self.rule_frame, width=110, placeholder_text="eng, por")
+        self.lang_entry.pack(side="left", padx=5)
+
+        ctk.CTkLabel(self.rule_frame, text="Codecs:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=(15, 5))
+        self.codec_entry = ctk.CTkEntry(self.rule_frame, width=110, placeholder_text="UTF8, PGS")
+        self.codec_entry.pack(side="left", padx=5)
+
+        # Output
+        self.out_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.out_frame.grid(row=3, column=0, padx=15, pady=5, sticky="ew")
+
+        ctk.CTkButton(self.out_frame, text="Select Output Directory", command=self.select_out_dir, width=160).pack(side="left", padx=(0, 10))
+        self.out_dir_var = ctk.StringVar(value="Same as Source")
+        ctk.CTkLabel(self.out_frame, textvariable=self.out_dir_var, text_color="gray").pack(side="left", padx=5)
+
+        # Action Buttons
+        self.action_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.action_frame.grid(row=4, column=0, padx=15, pady=(10, 15), sticky="ew")
+
+        self.start_btn = ctk.CTkButton(self.action_frame, text="Extract All", command=self.start,
+                                       state="disabled", height=45, font=ctk.CTkFont(size=14, weight="bold"))
+        self.start_btn.pack(side="right")
+        self.cancel_btn = ctk.CTkButton(self.action_frame, text="Cancel", command=self.cancel, state="disabled",
+                                        fg_color="transparent", border_width=1, height=45)
+        self.cancel_btn.pack(side="right", padx=10)
+        self.summary_var = ctk.StringVar(value="")
+        ctk.CTkLabel(self.action_frame, textvariable=self.summary_var, text_color="gray").pack(side="left")
+
+        self.sources = []
+        self.rows = {} # path -> status label
+        self.selected_out_dir = None
+        self.cancel_event = None
+
+    def add_folder(self):
+        d = file_dialogs.select_directory("Select Folder with Videos")
+        if d:
+            self._add_sources(batch_extract.collect_sources([d]))
+
+    def add_files(self):
+        paths = file_dialogs.select_files("Select Video Files", filetypes=file_dialogs.VIDEO_FILE_TYPES)
+        if paths:
+            self._add_sources(batch_extract.collect_sources(paths))
+
+    def _add_sources(self, paths):
+        for path in paths:
+            if path in self.rows:
+                continue
+            i = len(self.sources)
+            stripe_color = theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
+            row = ctk.CTkFrame(self.file_list, fg_color=stripe_color, corner_radius=4)
+            row.pack(fill="x", padx=5, pady=2)
+            ctk.CTkLabel(row, text=os.path.basename(path), anchor="w").pack(side="left", padx=10, fill="x", expand=True)
+            status_lbl = ctk.CTkLabel(row, text="", anchor="e", text_color="gray", width=260)
+            status_lbl.pack(side="right", padx=10)
+
+            self.sources.append(path)
+            self.rows[path] = status_lbl
+
+        self.count_var.set(f"{len(self.sources)} files")
+        self.start_btn.configure(state="normal" if self.sources else "disabled")
+
+    def clear_sources(self):
+        if self.cancel_event is not None:
+            return # Don't pull the list from under a running batch
+        for child in self.file_list.winfo_children():
+            child.destroy()
+        self.sources = []
+        self.rows = {}
+        self.count_var.set("0 files")
+        self.summary_var.set("")
+        self.start_btn.configure(state="disabled")
+
+    def select_out_dir(self):
+        d = file_dialogs.select_directory("Select Output Directory")
+        if d:
+            self.selected_out_dir = d
+            self.out_dir_var.set(d)
+
+    def _build_rule(self):
+        types = [t for t, var in self.type_vars.items() if var.get()]
+        languages = [l.strip() for l in self.lang_entry.get().split(",") if l.strip()]
+        codecs = [c.strip() for c in self.codec_entry.get().split(",") if c.strip()]
+        return TrackRule(types=types, languages=languages, codecs=codecs)
+
+    def start(self):
+        if not self.sources:
+            return
+        rule = self._build_rule()
+        if not rule.types:
+            messagebox.showwarning("Warning", "Select at least one track type.", parent=self)
+            return
+
+        self.cancel_event = threading.Event()
+        self.start_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.summary_var.set("Running...")
+
+        sources = list(self.sources)
+        output_dir = self.selected_out_dir
+        cancel_event = self.cancel_event
+
+        def on_status(path, status, detail):
+            self.after(0, lambda: self._set_status(path, status, detail))
+
+        def task():
+            results = batch_extract.batch_extract(sources, rule, output_dir=output_dir,
+                                                  on_status=on_status, cancel_event=cancel_event)
+            self.after(0, lambda: self._on_done(results))
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_btn.configure(state="disabled")
+            self.summary_var.set("Cancelling...")
+
+    def _set_status(self, path, status, detail):
+        lbl = self.rows.get(path)
+        if lbl is None or not lbl.winfo_exists():
+            return
+        text = status.capitalize() + (f": {detail}" if detail else "")
+        lbl.configure(text=text[:60], text_color=STATUS_COLORS.get(status, "gray"))
+
+    def _on_done(self, results):
+        self.cancel_event = None
+        self.cancel_btn.configure(state="disabled")
+        self.start_btn.configure(state="normal")
+
+        counts = {}
+        for status, _ in results.values():
+            counts[status] = counts.get(status, 0) + 1
+        self.summary_var.set(", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
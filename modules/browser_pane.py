@@ -0,0 +1,216 @@
+import customtkinter as ctk
+import os
+import threading
+from utils import file_dialogs
+from utils import theme
+from utils.media_browser import (list_directory, filter_and_sort, ProbePrefetcher,
+                                 SORT_NAME, SORT_SIZE, SORT_DATE)
+
+SORT_CHOICES = {"Name": (SORT_NAME, False), "Newest": (SORT_DATE, True), "Largest": (SORT_SIZE, True)}
+
+def _size_text(nbytes):
+    if nbytes >= 1024 ** 3:
+        return f"{nbytes / 1024 ** 3:.1f} GB"
+    return f"{nbytes / 1024 ** 2:.0f} MB"
+
+class MediaBrowserPane(ctk.CTkFrame):
+    """
+    Built-in file browser for a tab: lists a folder's sub-folders and videos,
+    filters and sorts them in memory and probes the files in view (and the
+    next few after the selection) ahead of time.
+    on_select(path, probe_future) is called when a video is picked; Up/Down
+    step through the videos like a file manager.
+    """
+    ROW_HEIGHT = 28 # Unscaled px, rows are uniform so the visible range follows from the scroll position
+    PREFETCH_AHEAD = 4 # Files after the selection probed besides the ones in view
+
+    def __init__(self, master, on_select, start_dir=None, **kwargs):
+        super().__init__(master, width=300, **kwargs)
+        self.on_select = on_select
+        self.prefetcher = ProbePrefetcher()
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # Location
+        self.path_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.path_frame.grid(row=0, column=0, padx=8, pady=(8, 4), sticky="ew")
+        self.path_frame.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkButton(self.path_frame, text="↑", width=30, command=self.go_up).grid(row=0, column=0, padx=(0, 5))
+        self.path_entry = ctk.CTkEntry(self.path_frame)
+        self.path_entry.grid(row=0, column=1, sticky="ew")
+        self.path_entry.bind("<Return>", lambda e: self.open_dir(self.path_entry.get()))
+        ctk.CTkButton(self.path_frame, text="...", width=30, command=self.choose_dir).grid(row=0, column=2, padx=(5, 0))
+
+        # Filter and Sort
+        self.filter_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.filter_frame.grid(row=1, column=0, padx=8, pady=4, sticky="ew")
+        self.filter_frame.grid_columnconfigure(0, weight=1)
+
+        self.filter_var = ctk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.refresh())
+        self.filter_entry = ctk.CTkEntry(self.filter_frame, textvariable=self.filter_var, placeholder_text="Filter")
+        self.filter_entry.grid(row=0, column=0, sticky="ew")
+        self.sort_menu = ctk.CTkOptionMenu(self.filter_frame, values=list(SORT_CHOICES), width=90,
+                                           command=lambda value: self.refresh())
+        self.sort_menu.grid(row=0, column=1, padx=(5, 0))
+
+        # Entries
+        self.list_frame = ctk.CTkScrollableFrame(self, corner_radius=6, fg_color=theme.COLOR_BG_LIST)
+        self.list_frame.grid(row=2, column=0, padx=8, pady=4, sticky="nsew")
+        self.list_frame.grid_columnconfigure(0, weight=1)
+        self._canvas = self.list_frame._parent_canvas
+        self._scrollbar_set = self.list_frame._scrollbar.set
+        self._canvas.configure(yscrollcommand=self._on_yscroll)
+        self._canvas.bind("<Up>", lambda e: self.step(-1))
+        self._canvas.bind("<Down>", lambda e: self.step(1))
+        self.filter_entry.bind("<Up>", lambda e: self.step(-1))
+        self.filter_entry.bind("<Down>", lambda e: self.step(1))
+
+        self.status_var = ctk.StringVar(value="")
+        ctk.CTkLabel(self, textvariable=self.status_var, text_color="gray", anchor="w",
+                     font=ctk.CTkFont(size=11)).grid(row=3, column=0, padx=10, pady=(0, 6), sticky="ew")
+
+        self.current_dir = None
+        self.entries = [] # Whole listing
+        self.shown = [] # After filter and sort, in row order
+        self.selected_path = None
+        self._rows = [] # Row pool, one button per shown entry
+        self._list_token = 0
+        self._prefetch_pending = False
+
+        self.open_dir(start_dir or os.path.expanduser("~"))
+
+    def choose_dir(self):
+        d = file_dialogs.select_directory("Select Folder")
+        if d:
+            self.open_dir(d)
+
+    def go_up(self):
+        if self.current_dir:
+            self.open_dir(os.path.dirname(self.current_dir.rstrip(os.sep)) or os.sep)
+
+    def open_dir(self, path):
+        """Lists path on a worker thread (a slow share must not freeze the window)."""
+        path = os.path.abspath(os.path.expanduser(path))
+        self._list_token += 1
+        token = self._list_token
+        self.status_var.set("Reading folder...")
+
+        def task():
+            try:
+                entries, error = list_directory(path), None
+            except OSError as e:
+                entries, error = [], e
+            self.after(0, lambda: self._on_listed(token, path, entries, error))
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def _on_listed(self, token, path, entries, error):
+        if token != self._list_token or not self.winfo_exists():
+            return # A newer folder was opened meanwhile
+        if error is not None:
+            self.status_var.set(f"Cannot open folder: {error.strerror or error}")
+            return
+        self.current_dir = path
+        self.entries = entries
+        self.path_entry.delete(0, "end")
+        self.path_entry.insert(0, path)
+        self._canvas.yview_moveto(0)
+        self.refresh()
+
+    def refresh(self):
+        """Re-applies filter and sort to the listing already in memory."""
+        sort, reverse = SORT_CHOICES.get(self.sort_menu.get(), (SORT_NAME, False))
+        self.shown = filter_and_sort(self.entries, self.filter_var.get(), sort, reverse)
+
+        while len(self._rows) < len(self.shown):
+            btn = ctk.CTkButton(self.list_frame, anchor="w", height=self.ROW_HEIGHT - 2, corner_radius=4,
+                                text_color=theme.COLOR_BTN_TEXT, hover_color=theme.COLOR_BTN_HOVER)
+            self._rows.append(btn)
+        for i, btn in enumerate(self._rows):
+            if i < len(self.shown):
+                self._bind_row(btn, i)
+                btn.grid(row=i, column=0, padx=2, pady=1, sticky="ew")
+            else:
+                btn.grid_remove()
+
+        n_files = sum(1 for e in self.shown if not e.is_dir)
+        self.status_var.set(f"{n_files} videos" + (f" of {sum(1 for e in self.entries if not e.is_dir)}"
+                                                      if self.filter_var.get().strip() else ""))
+        self._schedule_prefetch()
+
+    def _bind_row(self, btn, index):
+        entry = self.shown[index]
+        if entry.is_dir:
+            text = f"▸  {entry.name}/"
+        else:
+            text = f"{entry.name}   ({_size_text(entry.size)})"
+        selected = entry.path == self.selected_path
+        stripe = theme.COLOR_LIST_STRIPE_EVEN if index % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
+        btn.configure(text=text, fg_color=theme.COLOR_ACCENT if selected else stripe,
+                      text_color="white" if selected else theme.COLOR_BTN_TEXT,
+                      command=lambda e=entry: self._on_click(e))
+
+    def _on_click(self, entry):
+        if entry.is_dir:
+            self.open_dir(entry.path)
+        else:
+            self.select(entry.path)
+        self._canvas.focus_set() # Up/Down keep stepping from here
+
+    def select(self, path):
+        self.selected_path = path
+        for i, btn in enumerate(self._rows[:len(self.shown)]):
+            self._bind_row(btn, i)
+        self.on_select(path, self.prefetcher.get(path))
+        self._schedule_prefetch()
+
+    def step(self, delta):
+        """Selects the previous/next video in the shown order and scrolls it into view."""
+        files = [i for i, e in enumerate(self.shown) if not e.is_dir]
+        if not files:
+            return "break"
+        positions = [i for i in files if self.shown[i].path == self.selected_path]
+        if positions:
+            index = files[max(0, min(len(files) - 1, files.index(positions[0]) + delta))]
+        else:
+            index = files[0] if delta > 0 else files[-1]
+        self.select(self.shown[index].path)
+
+        first, last = self._visible_range()
+        if not first <= index < last and self.shown:
+            self._canvas.yview_moveto(max(0, index - 2) / len(self.shown))
+        return "break"
+
+    def _visible_range(self):
+        if not self.shown:
+            return 0, 0
+        top, bottom = self._canvas.yview()
+        n = len(self.shown)
+        return int(top * n), min(n, int(bottom * n) + 1)
+
+    def _on_yscroll(self, first, last):
+        self._scrollbar_set(first, last)
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        # Coalesces scroll events: one prefetch per idle loop
+        if not self._prefetch_pending:
+            self._prefetch_pending = True
+            self.after_idle(self._prefetch)
+
+    def _prefetch(self):
+        self._prefetch_pending = False
+        if not self.shown:
+            return
+        first, last = self._visible_range()
+        wanted = []
+        # The selection (its probe may still be queued) and its neighbours first: the likely next picks
+        paths = [e.path for e in self.shown if not e.is_dir]
+        if self.selected_path in paths:
+            at = paths.index(self.selected_path)
+            wanted.extend(paths[at:at + 1 + self.PREFETCH_AHEAD])
+        wanted.extend(e.path for e in self.shown[first:last] if not e.is_dir and e.path not in wanted)
+        self.prefetcher.prefetch(wanted)
@@ -3,12 +3,15 @@ from tkinter import messagebox
 from utils import file_dialogs
 import os
 import shutil
-import subprocess
-from utils.mkv_wrapper import get_mkv_info
+from utils.mkv_wrapper import get_mkv_info, edit_properties
 from utils.ffmpeg_wrapper import get_ffmpeg_info
 from utils.dependency_manager import DependencyManager
-from modules.widgets import TrackListFrame
+from modules.widgets import JobProgressFrame, TrackListFrame, ToolTip
 from utils import theme
+from utils.process_runner import run_streaming
+from utils.atomic_output import AtomicOutput, check_free_space, estimate_output_size
+from utils.job_scheduler import JobScheduler, CANCELLED, pool_for_tool
+from utils.media_session import MediaSession
 
 class EditorFrame(ctk.CTkFrame):
     def __init__(self, master):
@@ -32,13 +35,17 @@ class EditorFrame(ctk.CTkFrame):
         self.file_entry = ctk.CTkEntry(self.file_frame, placeholder_text="Select video file...", height=40)
         self.file_entry.grid(row=0, column=1, sticky="ew")
         ctk.CTkButton(self.file_frame, text="Browse", command=self.browse_file, width=100, height=40).grid(row=0, column=2, padx=(10, 0))
+        self.browser_btn = ctk.CTkButton(self.file_frame, text="Browser", command=self.toggle_browser, width=100, height=40,
+                                         fg_color="transparent", border_width=1, text_color=theme.COLOR_BTN_TEXT)
+        self.browser_btn.grid(row=0, column=3, padx=(10, 0))
 
         # Tracks Label (External)
         self.tracks_label = ctk.CTkLabel(self, text="Existing Tracks", font=ctk.CTkFont(weight="bold"))
         self.tracks_label.grid(row=2, column=0, padx=10, pady=(10, 5), sticky="w")
 
         # Track List
-        self.track_list = TrackListFrame(self, on_open=self.browse_file)
+        self.session = MediaSession()
+        self.track_list = TrackListFrame(self, on_open=self.browse_file, session=self.session)
         self.track_list.grid(row=3, column=0, padx=10, pady=(0, 10), sticky="nsew")
 
         # Output Options Frame
@@ -54,6 +61,12 @@ class EditorFrame(ctk.CTkFrame):
         self.rb_mp4 = ctk.CTkRadioButton(self.out_frame, text="MP4", variable=self.out_fmt_var, value="mp4", width=60)
         self.rb_mp4.pack(side="left", padx=5)
 
+        # In-place editing (header-only changes via mkvpropedit)
+        self.in_place_var = ctk.BooleanVar(value=False)
+        self.in_place_chk = ctk.CTkCheckBox(self.out_frame, text="In place", variable=self.in_place_var, width=70)
+        self.in_place_chk.pack(side="left", padx=(10, 5))
+        ToolTip(self.in_place_chk, "Apply language/name/flag changes directly to the source MKV without remuxing")
+
         # Output Filename & Dir
         self.out_name_var = ctk.StringVar()
         self.out_dir_var = ctk.StringVar()
@@ -74,27 +87,68 @@ class EditorFrame(ctk.CTkFrame):
                                        state="disabled", height=45, font=ctk.CTkFont(size=14, weight="bold"))
         self.save_btn.pack(side="right")
 
+        self.progress = JobProgressFrame(self.action_frame)
+        self.progress.pack(side="left", fill="x", expand=True, padx=(0, 20))
+
         self.video_path = None
+        self.browser = None # MediaBrowserPane, built on first toggle
+        self.session.add_listener(self._on_session_event)
+
+    def destroy(self):
+        self.session.remove_listener(self._on_session_event)
+        super().destroy()
 
     def browse_file(self):
         file_path = file_dialogs.select_file("Select Video File", filetypes=[("Video Files", "*.mkv *.mp4 *.avi *.mov"), ("All Files", "*.*")])
         if file_path:
-            self.video_path = file_path
-            self.file_entry.delete(0, "end")
-            self.file_entry.insert(0, file_path)
-            self.track_list.load_tracks(file_path)
+            self.open_file(file_path)
+
+    def toggle_browser(self):
+        """Shows/hides the built-in browser pane next to the tab (created on first use)."""
+        if self.browser is None:
+            from modules.browser_pane import MediaBrowserPane
+            start_dir = os.path.dirname(self.video_path) if self.video_path else None
+            self.browser = MediaBrowserPane(self, on_select=self.open_file, start_dir=start_dir)
+        if self.browser.winfo_manager():
+            self.browser.grid_remove()
+        else:
+            self.browser.grid(row=0, column=1, rowspan=6, padx=(0, 10), pady=10, sticky="nsew")
+
+    def open_file(self, file_path, probe=None):
+        """Makes file_path the session's file; probe: a probe Future already under way (from the browser)."""
+        self.session.open(file_path, probe=probe, source=self)
+        self.sync_session()
+
+    def _on_session_event(self, event, source):
+        # A hidden tab catches up in sync_session() when shown; its own changes are already on screen
+        if self.winfo_manager() and source not in (self, self.track_list):
+            self.sync_session()
+
+    def sync_session(self):
+        """Shows the session's file and track edits; nothing is probed or rebuilt if it is already loaded."""
+        path = self.session.path
+        if path is None:
+            return
+        if path != self.video_path:
+            self._show_source(path)
+        self.track_list.load_tracks(path, probe=self.session.open(path, source=self))
 
-            dirname = os.path.dirname(file_path)
-            basename = os.path.splitext(os.path.basename(file_path))[0]
-            self.out_dir_var.set(dirname)
-            self.out_name_var.set(basename + "_edited")
+    def _show_source(self, file_path):
+        self.video_path = file_path
+        self.file_entry.delete(0, "end")
+        self.file_entry.insert(0, file_path)
 
-            # Auto-select format based on input
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext == ".mp4": self.out_fmt_var.set("mp4")
-            else: self.out_fmt_var.set("mkv")
+        dirname = os.path.dirname(file_path)
+        basename = os.path.splitext(os.path.basename(file_path))[0]
+        self.out_dir_var.set(dirname)
+        self.out_name_var.set(basename + "_edited")
 
-            self.save_btn.configure(state="normal")
+        # Auto-select format based on input
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".mp4": self.out_fmt_var.set("mp4")
+        else: self.out_fmt_var.set("mkv")
+
+        self.save_btn.configure(state="normal")
 
     def select_out_dir(self):
         d = file_dialogs.select_directory("Select Output Directory")
@@ -108,6 +162,10 @@ class EditorFrame(ctk.CTkFrame):
         out_name = self.out_name_var.get()
         out_dir = self.out_dir_var.get()
 
+        if out_fmt == "mkv" and self.in_place_var.get() and self._can_edit_in_place():
+            self._save_in_place() # Writes to the source; the output fields do not apply
+            return
+
         if not out_name or not out_dir:
             messagebox.showwarning("Warning", "Please specify output directory and filename.")
             return
@@ -122,6 +180,45 @@ class EditorFrame(ctk.CTkFrame):
         else:
             self._save_mp4(output_path)
 
+    def _can_edit_in_place(self):
+        """Header-only edits are possible for MKV sources when no track is dropped."""
+        if not self.video_path.lower().endswith(".mkv"):
+            return False
+        if self.track_list.has_dropped_tracks():
+            return False
+        return DependencyManager().get_binary_path("mkvpropedit") != "mkvpropedit"
+
+    def _save_in_place(self):
+        edits = self.track_list.get_property_edits()
+        if not edits:
+            messagebox.showinfo("No Changes", "The file already has these track properties.")
+            return
+
+        video_path = self.video_path
+        info = self.track_list.info
+        job = JobScheduler().submit(f"mkvpropedit: {os.path.basename(video_path)}",
+                                    lambda job: edit_properties(video_path, edits, info=info),
+                                    pool=pool_for_tool("mkvpropedit"), kind="edit", interruptible=False,
+                                    inputs=[video_path])
+        self.progress.follow(job)
+        job.future.add_done_callback(lambda f: self.after(0, lambda: self._on_in_place_done(job, video_path)))
+
+    def _on_in_place_done(self, job, video_path):
+        if job.future.cancelled() or job.state == CANCELLED:
+            self.progress.job_finished(job, "Cancelled")
+            return
+        # edit_properties raises when mkvpropedit is missing or the probe for the track UIDs fails
+        success, msg = (False, str(job.error)) if job.error is not None else job.future.result()
+        if success:
+            self.progress.job_finished(job, f"Updated {os.path.basename(video_path)}")
+            # Re-read the header so further edits are diffed against the new state (in every tab)
+            if video_path == self.session.path:
+                self.session.reload(source=self)
+                self.sync_session()
+        else:
+            self.progress.job_finished(job)
+            messagebox.showerror("Error", f"mkvpropedit failed:\n{msg}")
+
     def _save_mkv(self, output_path):
         mkvmerge = DependencyManager().get_binary_path("mkvmerge")
         if not mkvmerge:
@@ -165,18 +262,47 @@ class EditorFrame(ctk.CTkFrame):
         self._run_cmd(cmd, "ffmpeg")
 
     def _run_cmd(self, cmd, tool_name):
-        try:
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            result = subprocess.run(cmd, capture_output=True, text=True, startupinfo=startupinfo)
-            if result.returncode == 0:
-                messagebox.showinfo("Success", f"File saved to:\n{cmd[-1] if tool_name == 'ffmpeg' else cmd[2]}")
-            elif tool_name == "mkvmerge" and result.returncode == 1:
-                messagebox.showwarning("Success with Warnings", f"Warnings:\n{result.stdout}")
-            else:
-                messagebox.showerror("Error", f"{tool_name} failed:\n{result.stderr}\n{result.stdout}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Exception: {e}")
+        """Queue the tool on the job scheduler; self.progress follows the job."""
+        output_index = len(cmd) - 1 if tool_name == 'ffmpeg' else 2
+        output_path = cmd[output_index]
+        duration_ns = self.track_list.get_duration_ns()
+        keep_map, _ = self.track_list.get_options()
+        estimated_size = estimate_output_size(self.video_path, self.track_list.info,
+                                              [tid for ids in keep_map.values() for tid in ids])
+
+        def work(job):
+            check_free_space(output_path, estimated_size)
+            # The tool writes to a temp file that only replaces output_path on success
+            with AtomicOutput(output_path) as out:
+                tool_cmd = list(cmd)
+                tool_cmd[output_index] = out.path
+                result = run_streaming(tool_cmd, on_progress=job.report_progress, duration_ns=duration_ns,
+                                       output_path=out.path, limits=job.limits)
+                # mkvmerge exits with 1 on warnings; the file is still written
+                if result.returncode != 0 and not (tool_name == "mkvmerge" and result.returncode == 1):
+                    raise RuntimeError(f"{tool_name} failed:\n{result.stderr}\n{result.stdout}")
+                out.commit()
+            return result
+
+        job = JobScheduler().submit(f"{tool_name}: {os.path.basename(output_path)}", work,
+                                    pool=pool_for_tool(tool_name), kind="mux",
+                                    inputs=[self.video_path], outputs=[output_path])
+        self.progress.follow(job)
+        job.future.add_done_callback(lambda f: self.after(0, lambda: self._on_cmd_done(job, tool_name, output_path)))
+
+    def _on_cmd_done(self, job, tool_name, output_path):
+        if job.state == CANCELLED:
+            self.progress.job_finished(job, "Cancelled")
+            return
+        if job.error is not None:
+            self.progress.job_finished(job)
+            messagebox.showerror("Error", str(job.error))
+            return
+
+        result = job.future.result()
+        if result.returncode == 0:
+            # No dialog, so a long queue can run unattended; the sidebar queue lists it as done
+            self.progress.job_finished(job, f"Saved {os.path.basename(output_path)}")
+        else:
+            self.progress.job_finished(job, f"Saved {os.path.basename(output_path)} (with warnings)")
+            messagebox.showwarning("Success with Warnings", f"Warnings:\n{result.stdout}")
@@ -2,10 +2,13 @@ import customtkinter as ctk
 from tkinter import messagebox
 from utils import file_dialogs
 import os
-import subprocess
 from utils.mkv_wrapper import get_mkv_info, extract_tracks
-from utils.ffmpeg_wrapper import get_ffmpeg_info, extract_stream_cmd
-from modules.widgets import TrackListFrame
+from utils.ffmpeg_wrapper import get_ffmpeg_info, extract_streams
+from modules.widgets import TrackListFrame, JobProgressFrame
+from modules.batch_extractor import BatchExtractWindow
+from utils.job_scheduler import JobScheduler, POOL_IO, CANCELLED
+from utils.atomic_output import check_free_space, estimate_output_size
+from utils.media_session import MediaSession
 from utils import theme
 
 class ExtractorFrame(ctk.CTkFrame):
@@ -30,12 +33,18 @@ class ExtractorFrame(ctk.CTkFrame):
         self.file_entry = ctk.CTkEntry(self.file_frame, placeholder_text="Select video file...", height=40)
         self.file_entry.grid(row=0, column=1, sticky="ew")
         ctk.CTkButton(self.file_frame, text="Browse", command=self.browse_file, width=100, height=40).grid(row=0, column=2, padx=(10, 0))
+        ctk.CTkButton(self.file_frame, text="Batch...", command=self.open_batch, width=100, height=40,
+                      fg_color="transparent", border_width=1, text_color=theme.COLOR_BTN_TEXT).grid(row=0, column=3, padx=(10, 0))
+        self.browser_btn = ctk.CTkButton(self.file_frame, text="Browser", command=self.toggle_browser, width=100, height=40,
+                                         fg_color="transparent", border_width=1, text_color=theme.COLOR_BTN_TEXT)
+        self.browser_btn.grid(row=0, column=4, padx=(10, 0))
 
         # Tracks Label (External)
         self.tracks_label = ctk.CTkLabel(self, text="Available Tracks (Edit output filename in list)", font=ctk.CTkFont(weight="bold"))
         self.tracks_label.grid(row=2, column=0, padx=10, pady=(10, 5), sticky="w")
 
         # Track List
+        self.session = MediaSession()
         self.track_list = TrackListFrame(self, extract_mode=True, default_checked=False, on_open=self.browse_file)
         self.track_list.grid(row=3, column=0, padx=10, pady=(0, 10), sticky="nsew")
         
@@ -65,22 +74,69 @@ class ExtractorFrame(ctk.CTkFrame):
                                           state="disabled", height=45, font=ctk.CTkFont(size=14, weight="bold"))
         self.extract_btn.pack(side="right")
 
+        self.progress = JobProgressFrame(self.action_frame)
+        self.progress.pack(side="left", fill="x", expand=True, padx=(0, 20))
+
         self.video_path = None
+        self.browser = None # MediaBrowserPane, built on first toggle
         self.selected_out_dir = None
+        self.batch_window = None
+        self.session.add_listener(self._on_session_event)
+
+    def destroy(self):
+        self.session.remove_listener(self._on_session_event)
+        super().destroy()
+
+    def open_batch(self):
+        if self.batch_window is None or not self.batch_window.winfo_exists():
+            self.batch_window = BatchExtractWindow(self)
+        self.batch_window.focus()
 
     def browse_file(self):
         file_path = file_dialogs.select_file("Select Video File", filetypes=file_dialogs.VIDEO_FILE_TYPES)
         if file_path:
-            self.video_path = file_path
-            self.file_entry.delete(0, "end")
-            self.file_entry.insert(0, file_path)
-            self.track_list.load_tracks(file_path)
+            self.open_file(file_path)
+
+    def toggle_browser(self):
+        """Shows/hides the built-in browser pane next to the tab (created on first use)."""
+        if self.browser is None:
+            from modules.browser_pane import MediaBrowserPane
+            start_dir = os.path.dirname(self.video_path) if self.video_path else None
+            self.browser = MediaBrowserPane(self, on_select=self.open_file, start_dir=start_dir)
+        if self.browser.winfo_manager():
+            self.browser.grid_remove()
+        else:
+            self.browser.grid(row=0, column=1, rowspan=7, padx=(0, 10), pady=10, sticky="nsew")
+
+    def open_file(self, file_path, probe=None):
+        """Makes file_path the session's file; probe: a probe Future already under way (from the browser)."""
+        self.session.open(file_path, probe=probe, source=self)
+        self.sync_session()
+
+    def _on_session_event(self, event, source):
+        # A hidden tab catches up in sync_session() when shown; its own changes are already on screen
+        if self.winfo_manager() and source not in (self, self.track_list):
+            self.sync_session()
+
+    def sync_session(self):
+        """Shows the session's file; nothing is probed or rebuilt if it is already loaded."""
+        path = self.session.path
+        if path is None:
+            return
+        if path != self.video_path:
+            self._show_source(path)
+        self.track_list.load_tracks(path, probe=self.session.open(path, source=self))
+
+    def _show_source(self, file_path):
+        self.video_path = file_path
+        self.file_entry.delete(0, "end")
+        self.file_entry.insert(0, file_path)
 
-            # Reset output dir
-            self.selected_out_dir = None
-            self.out_dir_var.set(os.path.dirname(file_path))
+        # Reset output dir
+        self.selected_out_dir = None
+        self.out_dir_var.set(os.path.dirname(file_path))
 
-            self.extract_btn.configure(state="normal")
+        self.extract_btn.configure(state="normal")
 
     def select_out_dir(self):
         d = file_dialogs.select_directory("Select Output Directory")
@@ -106,25 +162,46 @@ class ExtractorFrame(ctk.CTkFrame):
                 return
             final_track_map[tid] = os.path.join(output_dir, filename)
 
-        if self.video_path.lower().endswith('.mkv'):
-            success, msg = extract_tracks(self.video_path, final_track_map)
-            if success:
-                messagebox.showinfo("Success", f"Tracks extracted to:\n{output_dir}")
-            else:
-                messagebox.showerror("Error", f"Extraction failed:\n{msg}")
-        else:
-            # Non-MKV extraction using ffmpeg
-            errors = []
-            for tid, output_path in final_track_map.items():
-                cmd = extract_stream_cmd(self.video_path, tid, output_path)
-                try:
-                    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-                    if result.returncode != 0:
-                        errors.append(f"Track {tid}: {result.stderr}")
-                except Exception as e:
-                    errors.append(f"Track {tid}: {str(e)}")
-
-            if not errors:
-                messagebox.showinfo("Success", f"Tracks extracted to:\n{output_dir}")
-            else:
-                messagebox.showerror("Error", f"Extraction failed for some tracks:\n" + "\n".join(errors))
+        video_path = self.video_path
+        duration_ns = self.track_list.get_duration_ns()
+        estimated_size = estimate_output_size(video_path, self.track_list.info, final_track_map)
+
+        def work(job):
+            check_free_space(next(iter(final_track_map.values())), estimated_size)
+            # Stream copies are bound by disk throughput, even through ffmpeg
+            if video_path.lower().endswith('.mkv'):
+                success, msg = extract_tracks(video_path, final_track_map, on_progress=job.report_progress,
+                                              limits=job.limits)
+                if not success:
+                    raise RuntimeError(f"Extraction failed:\n{msg}")
+                return
+            errors = self._extract_with_ffmpeg(video_path, final_track_map, duration_ns, job.report_progress,
+                                               job.limits)
+            if errors:
+                raise RuntimeError("Extraction failed for some tracks:\n" + "\n".join(errors))
+
+        job = JobScheduler().submit(f"Extract from {os.path.basename(video_path)}", work, pool=POOL_IO, kind="extract",
+                                    inputs=[video_path], outputs=list(final_track_map.values()))
+        self.progress.follow(job)
+        job.future.add_done_callback(lambda f: self.after(0, lambda: self._on_extract_done(job, output_dir)))
+
+    def _extract_with_ffmpeg(self, video_path, track_map, duration_ns, on_progress, limits=None):
+        """Non-MKV extraction using one multi-output ffmpeg pass. Returns a list of errors."""
+        try:
+            track_errors = extract_streams(video_path, track_map, on_progress=on_progress, duration_ns=duration_ns,
+                                           limits=limits)
+        except Exception as e:
+            return [str(e)]
+        return [f"Track {tid}: {err}" for tid, err in track_errors.items()]
+
+    def _on_extract_done(self, job, output_dir):
+        if job.state == CANCELLED:
+            self.progress.job_finished(job, "Cancelled")
+            return
+        if job.error is not None:
+            self.progress.job_finished(job)
+            messagebox.showerror("Error", str(job.error))
+            return
+
+        # No dialog, so a long queue can run unattended; the sidebar queue lists it as done
+        self.progress.job_finished(job, f"Extracted to {output_dir}")
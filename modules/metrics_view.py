@@ -0,0 +1,129 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from utils import file_dialogs
+from utils import theme
+from utils.job_metrics import JobMetrics
+from utils.job_scheduler import DONE, FAILED, CANCELLED
+
+STATE_COLORS = {
+    DONE: "green",
+    FAILED: "red",
+    CANCELLED: "gray",
+}
+
+def _mb(nbytes):
+    return f"{nbytes / (1024 * 1024):.1f} MB" if nbytes else "-"
+
+def _or_dash(fmt):
+    return lambda value: fmt.format(value) if value is not None else "-"
+
+# (header, record key, formatter, width); width 0 stretches
+COLUMNS = [
+    ("Job", "title", lambda title: title[:50], 0),
+    ("State", "state", str.capitalize, 75),
+    ("Wall", "wall_s", _or_dash("{:.1f} s"), 70),
+    ("In", "input_bytes", _mb, 85),
+    ("Out", "output_bytes", _mb, 85),
+    ("MB/s", "mb_per_s", _or_dash("{:.1f}"), 60),
+    ("CPU", "cpu_s", _or_dash("{:.1f} s"), 70),
+    ("CPU%", "cpu_percent", _or_dash("{:.0f}%"), 60),
+    ("Peak RSS", "peak_rss_bytes", _mb, 85),
+]
+
+class MetricsFrame(ctk.CTkFrame):
+    """
+    Wall time, throughput, CPU and peak memory of every finished job, newest first.
+    The same records are appended to job_metrics.jsonl in the cache directory.
+    """
+    def __init__(self, master):
+        super().__init__(master, corner_radius=10, fg_color="transparent")
+        self.metrics = JobMetrics()
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        # Header
+        self.header = ctk.CTkLabel(self, text="Job Metrics", font=ctk.CTkFont(size=24, weight="bold"))
+        self.header.grid(row=0, column=0, padx=10, pady=(10, 15), sticky="w")
+
+        # Column Headers
+        self.head_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.head_frame.grid(row=1, column=0, padx=15, sticky="ew")
+        self._grid_cells(self.head_frame, [ctk.CTkLabel(self.head_frame, text=title, anchor="w",
+                                                        font=ctk.CTkFont(weight="bold"), width=width)
+                                           for title, _, _, width in COLUMNS])
+
+        # Records
+        self.list_frame = ctk.CTkScrollableFrame(self, corner_radius=6, border_width=1, fg_color=theme.COLOR_BG_LIST)
+        self.list_frame.grid(row=2, column=0, padx=10, pady=5, sticky="nsew")
+        self.list_frame.grid_columnconfigure(0, weight=1)
+
+        # Action Buttons
+        self.action_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.action_frame.grid(row=3, column=0, padx=10, pady=(5, 10), sticky="ew")
+
+        ctk.CTkButton(self.action_frame, text="Export JSONL...", command=self.export, width=130).pack(side="right")
+        ctk.CTkButton(self.action_frame, text="Clear", command=self.clear, width=90,
+                      fg_color="transparent", border_width=1, hover_color=theme.COLOR_BTN_CLEAR_HOVER,
+                      text_color=theme.COLOR_BTN_CLEAR_TEXT).pack(side="right", padx=10)
+        self.summary_var = ctk.StringVar(value="")
+        ctk.CTkLabel(self.action_frame, textvariable=self.summary_var, text_color="gray").pack(side="left")
+
+        self._refresh_pending = False
+        self.metrics.add_listener(self._on_record)
+        self.refresh()
+
+    def destroy(self):
+        self.metrics.remove_listener(self._on_record)
+        super().destroy()
+
+    @staticmethod
+    def _grid_cells(frame, cells):
+        frame.grid_columnconfigure(0, weight=1)
+        for col, cell in enumerate(cells):
+            cell.grid(row=0, column=col, padx=(10 if col == 0 else 4, 4), sticky="ew")
+
+    def _on_record(self, record):
+        # Called from the thread that finished the job
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after(0, self.refresh)
+
+    def refresh(self):
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+        for child in self.list_frame.winfo_children():
+            child.destroy()
+
+        records = self.metrics.records()
+        for i, record in enumerate(reversed(records)):
+            stripe_color = theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
+            row = ctk.CTkFrame(self.list_frame, fg_color=stripe_color, corner_radius=4)
+            row.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+            cells = []
+            for _, key, fmt, width in COLUMNS:
+                value = record.get(key)
+                lbl = ctk.CTkLabel(row, text=fmt(value) if value is not None else "-", anchor="w", width=width)
+                if key == "state":
+                    lbl.configure(text_color=STATE_COLORS.get(value, "gray"))
+                cells.append(lbl)
+            self._grid_cells(row, cells)
+
+        total_wall = sum(r["wall_s"] or 0 for r in records)
+        self.summary_var.set(f"{len(records)} jobs, {total_wall:.1f} s total" if records else "No finished jobs yet")
+
+    def clear(self):
+        self.metrics.clear()
+        self.refresh()
+
+    def export(self):
+        path = file_dialogs.save_file(title="Export Job Metrics", initialfile="job_metrics.jsonl",
+                                      filetypes=[("JSON Lines", "*.jsonl"), ("All files", "*.*")],
+                                      defaultextension=".jsonl")
+        if not path:
+            return
+        try:
+            self.metrics.export(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export metrics:\n{e}")
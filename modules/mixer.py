@@ -2,13 +2,18 @@ import customtkinter as ctk
 from tkinter import messagebox
 from utils import file_dialogs
 import os
-import shutil
 import tempfile
-import subprocess
 from tkinter import PanedWindow
-from modules.widgets import TrackListFrame, FileListFrame
+from modules.widgets import JobProgressFrame, TrackListFrame, FileListFrame
+from modules.season_mixer import SeasonMixWindow
 from utils import theme
+from utils.languages import menu_entry, menu_entries, detect_language
+from utils.subtitle_language import detect_subtitle_language_async
+from utils.process_runner import run_streaming
+from utils.atomic_output import AtomicOutput, check_free_space, estimate_output_size
+from utils.job_scheduler import JobScheduler, CANCELLED, pool_for_tool
 from utils.dependency_manager import DependencyManager
+from utils.media_session import MediaSession
 
 class MixerFrame(ctk.CTkFrame):
     def __init__(self, master):
@@ -31,6 +36,8 @@ class MixerFrame(ctk.CTkFrame):
         self.video_entry = ctk.CTkEntry(self.video_frame, height=40)
         self.video_entry.grid(row=0, column=1, padx=0, sticky="ew")
         ctk.CTkButton(self.video_frame, text="Browse", command=self.browse_video, width=100, height=40).grid(row=0, column=2, padx=(10, 0))
+        ctk.CTkButton(self.video_frame, text="Season...", command=self.open_season, width=100, height=40,
+                      fg_color="transparent", border_width=1, text_color=theme.COLOR_BTN_TEXT).grid(row=0, column=3, padx=(10, 0))
  
         # Main content area with PanedWindow for resizability
         self.pane = ctk.CTkFrame(self, fg_color="transparent")
@@ -52,7 +59,8 @@ class MixerFrame(ctk.CTkFrame):
         self.base_tracks_title = ctk.CTkLabel(self.top_wrapper, text="Original Video Tracks", font=ctk.CTkFont(weight="bold"))
         self.base_tracks_title.pack(padx=10, pady=(5, 5), anchor="w")
         
-        self.base_track_list = TrackListFrame(self.top_wrapper, on_open=self.browse_video)
+        self.session = MediaSession()
+        self.base_track_list = TrackListFrame(self.top_wrapper, on_open=self.browse_video, session=self.session)
         self.base_track_list.pack(fill="both", expand=True, padx=5, pady=(0, 5))
 
         # Bottom Section Wrapper
@@ -73,6 +81,9 @@ class MixerFrame(ctk.CTkFrame):
         ctk.CTkButton(self.sub_controls, text="Clear List", command=self.clear_subs,
                       fg_color="transparent", border_width=1, hover_color=theme.COLOR_BTN_CLEAR_HOVER,
                       text_color=theme.COLOR_BTN_CLEAR_TEXT, height=35).pack(side="left")
+        self.detect_content_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(self.sub_controls, text="Detect untagged languages from the text",
+                        variable=self.detect_content_var).pack(side="right")
 
         # Subtitle Title
         self.sub_title = ctk.CTkLabel(self.sub_container, text="Subtitles to Add", font=ctk.CTkFont(weight="bold"))
@@ -115,45 +126,61 @@ class MixerFrame(ctk.CTkFrame):
                                           state="disabled", height=45, font=ctk.CTkFont(size=14, weight="bold"))
         self.process_btn.pack(side="right")
 
+        self.progress = JobProgressFrame(self.action_frame)
+        self.progress.pack(side="left", fill="x", expand=True, padx=(0, 20))
+
         self.video_path = None
         self.sub_files = []
         
-        self.languages = [
-            "eng (English)", "spa (Spanish)", "por (Portuguese)", "fra (French)", 
-            "deu (German)", "ita (Italian)", "jpn (Japanese)", "chi (Chinese)", 
-            "rus (Russian)", "kor (Korean)", "ara (Arabic)", "hin (Hindi)"
-        ]
-
-        self.LANG_MAP = {
-            'en': 'eng', 'eng': 'eng', 'english': 'eng', 'en-us': 'eng', 'en-gb': 'eng',
-            'pt': 'por', 'por': 'por', 'portuguese': 'por', 'pt-br': 'por', 'pob': 'por',
-            'es': 'spa', 'spa': 'spa', 'spanish': 'spa', 'esp': 'spa',
-            'fr': 'fra', 'fra': 'fra', 'french': 'fra',
-            'de': 'deu', 'deu': 'deu', 'german': 'deu', 'ger': 'deu',
-            'it': 'ita', 'ita': 'ita', 'italian': 'ita',
-            'ja': 'jpn', 'jpn': 'jpn', 'japanese': 'jpn', 'jp': 'jpn',
-            'zh': 'chi', 'chi': 'chi', 'chinese': 'chi', 'chn': 'chi', 'zho': 'chi',
-            'ru': 'rus', 'rus': 'rus', 'russian': 'rus',
-            'ko': 'kor', 'kor': 'kor', 'korean': 'kor',
-            'ar': 'ara', 'ara': 'ara', 'arabic': 'ara',
-            'hi': 'hin', 'hin': 'hin', 'hindi': 'hin'
-        }
+        self.languages = menu_entries()
+        self.season_window = None
+        self.session.add_listener(self._on_session_event)
+
+    def destroy(self):
+        self.session.remove_listener(self._on_session_event)
+        super().destroy()
+
+    def open_season(self):
+        if self.season_window is None or not self.season_window.winfo_exists():
+            self.season_window = SeasonMixWindow(self, self.languages)
+        self.season_window.focus()
 
     def browse_video(self):
         file_path = file_dialogs.select_file("Select Video File", filetypes=[("Video Files", "*.mkv *.mp4 *.avi"), ("All Files", "*.*")])
         if file_path:
-            self.video_path = file_path
-            self.video_entry.delete(0, "end")
-            self.video_entry.insert(0, file_path)
-            self.base_track_list.load_tracks(file_path)
+            self.open_file(file_path)
+
+    def open_file(self, file_path):
+        """Makes file_path the session's file (shared with the other tabs)."""
+        self.session.open(file_path, source=self)
+        self.sync_session()
+
+    def _on_session_event(self, event, source):
+        # A hidden tab catches up in sync_session() when shown; its own changes are already on screen
+        if self.winfo_manager() and source not in (self, self.base_track_list):
+            self.sync_session()
+
+    def sync_session(self):
+        """Shows the session's file and track edits; nothing is probed or rebuilt if it is already loaded."""
+        path = self.session.path
+        if path is None:
+            return
+        if path != self.video_path:
+            self._show_source(path)
+        self.base_track_list.load_tracks(path, probe=self.session.open(path, source=self))
 
-            # Default Output defaults
-            dirname = os.path.dirname(file_path)
-            basename = os.path.splitext(os.path.basename(file_path))[0]
-            self.out_dir_var.set(dirname)
-            self.out_name_var.set(basename + "_muxed")
+    def _show_source(self, file_path):
+        self.video_path = file_path
+        self.video_entry.delete(0, "end")
+        self.video_entry.insert(0, file_path)
 
-            self.check_ready()
+        # Default Output defaults
+        dirname = os.path.dirname(file_path)
+        basename = os.path.splitext(os.path.basename(file_path))[0]
+        self.out_dir_var.set(dirname)
+        self.out_name_var.set(basename + "_muxed")
+
+        self.check_ready()
 
     def select_out_dir(self):
         d = file_dialogs.select_directory("Select Output Directory")
@@ -167,20 +194,6 @@ class MixerFrame(ctk.CTkFrame):
                 self.add_sub_row(p)
             self.check_ready()
 
-    def detect_language(self, filename):
-        import re
-        basename = os.path.splitext(os.path.basename(filename))[0]
-        parts = re.split(r'[._\-\s]+', basename)
-        
-        for part in reversed(parts):
-            lower_part = part.lower()
-            if lower_part in self.LANG_MAP:
-                target_code = self.LANG_MAP[lower_part]
-                for lang_str in self.languages:
-                    if lang_str.startswith(target_code + " "):
-                        return lang_str
-        return None
-
     def add_sub_row(self, path):
         def on_default_click(var):
             if var.get():
@@ -195,7 +208,7 @@ class MixerFrame(ctk.CTkFrame):
 
         row_data = self.sub_list_frame.add_file_row(path, on_default_click, on_remove=on_remove)
         
-        detected_lang = self.detect_language(path)
+        detected_lang = detect_language(path)
         initial_lang = detected_lang if detected_lang else self.languages[0]
         row_data["lang_var"].set(initial_lang)
         
@@ -212,6 +225,26 @@ class MixerFrame(ctk.CTkFrame):
         
         self.sub_files.append(row_data)
 
+        if detected_lang is None and self.detect_content_var.get():
+            self._detect_from_content(row_data, initial_lang)
+
+    def _detect_from_content(self, row_data, guessed_lang):
+        """
+        Second tier for files without a language tag: classify the subtitle text on
+        the probe pool. The result is dropped if the row was removed or edited meanwhile.
+        """
+        def apply(code):
+            if code is None or row_data not in self.sub_files or row_data["lang_var"].get() != guessed_lang:
+                return
+            lang = menu_entry(code)
+            row_data["lang_var"].set(lang)
+            row_data["name_var"].set(lang.split("(")[1].replace(")", ""))
+            row_data["default_var"].set(code == "eng")
+
+        future = detect_subtitle_language_async(row_data["path"])
+        future.add_done_callback(lambda f: self.after(0, lambda: apply(
+            None if f.cancelled() or f.exception() else f.result())))
+
     def clear_subs(self):
         self.sub_list_frame.clear()
         self.sub_files = []
@@ -245,7 +278,7 @@ class MixerFrame(ctk.CTkFrame):
             self._process_mp4(output_path)
 
     def _process_mkv(self, output_path):
-        mkvmerge = shutil.which("mkvmerge")
+        mkvmerge = DependencyManager().get_binary_path("mkvmerge")
         if not mkvmerge:
             messagebox.showerror("Error", "mkvmerge not found.")
             return
@@ -310,18 +343,48 @@ class MixerFrame(ctk.CTkFrame):
         self._run_cmd(cmd, "ffmpeg")
 
     def _run_cmd(self, cmd, tool_name):
-        try:
-            startupinfo = None
-            if os.name == 'nt':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-            result = subprocess.run(cmd, capture_output=True, text=True, startupinfo=startupinfo)
-            if result.returncode == 0:
-                messagebox.showinfo("Success", f"File saved to:\n{cmd[-1] if tool_name == 'ffmpeg' else cmd[2]}")
-            elif tool_name == "mkvmerge" and result.returncode == 1:
-                messagebox.showwarning("Success with Warnings", f"Warnings:\n{result.stdout}")
-            else:
-                messagebox.showerror("Error", f"{tool_name} failed:\n{result.stderr}\n{result.stdout}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Exception: {e}")
+        """Queue the tool on the job scheduler; self.progress follows the job."""
+        output_index = len(cmd) - 1 if tool_name == 'ffmpeg' else 2
+        output_path = cmd[output_index]
+        duration_ns = self.base_track_list.get_duration_ns()
+        keep_map, _ = self.base_track_list.get_options()
+        estimated_size = estimate_output_size(self.video_path, self.base_track_list.info,
+                                              [tid for ids in keep_map.values() for tid in ids],
+                                              [item["path"] for item in self.sub_files])
+
+        def work(job):
+            check_free_space(output_path, estimated_size)
+            # The tool writes to a temp file that only replaces output_path on success
+            with AtomicOutput(output_path) as out:
+                tool_cmd = list(cmd)
+                tool_cmd[output_index] = out.path
+                result = run_streaming(tool_cmd, on_progress=job.report_progress, duration_ns=duration_ns,
+                                       output_path=out.path, limits=job.limits)
+                # mkvmerge exits with 1 on warnings; the file is still written
+                if result.returncode != 0 and not (tool_name == "mkvmerge" and result.returncode == 1):
+                    raise RuntimeError(f"{tool_name} failed:\n{result.stderr}\n{result.stdout}")
+                out.commit()
+            return result
+
+        job = JobScheduler().submit(f"{tool_name}: {os.path.basename(output_path)}", work,
+                                    pool=pool_for_tool(tool_name), kind="mux",
+                                    inputs=[self.video_path] + [item["path"] for item in self.sub_files], outputs=[output_path])
+        self.progress.follow(job)
+        job.future.add_done_callback(lambda f: self.after(0, lambda: self._on_cmd_done(job, tool_name, output_path)))
+
+    def _on_cmd_done(self, job, tool_name, output_path):
+        if job.state == CANCELLED:
+            self.progress.job_finished(job, "Cancelled")
+            return
+        if job.error is not None:
+            self.progress.job_finished(job)
+            messagebox.showerror("Error", str(job.error))
+            return
+
+        result = job.future.result()
+        if result.returncode == 0:
+            # No dialog, so a long queue can run unattended; the sidebar queue lists it as done
+            self.progress.job_finished(job, f"Saved {os.path.basename(output_path)}")
+        else:
+            self.progress.job_finished(job, f"Saved {os.path.basename(output_path)} (with warnings)")
+            messagebox.showwarning("Success with Warnings", f"Warnings:\n{result.stdout}")
@@ -0,0 +1,129 @@
+import customtkinter as ctk
+from utils import theme
+from utils.job_scheduler import (JobScheduler, POOL_CPU, POOL_IO,
+                                 QUEUED, RUNNING, DONE, FAILED, CANCELLED)
+
+# Stall timeout menu: label -> seconds without progress before a tool is killed
+STALL_CHOICES = {"Off": None, "1 min": 60, "5 min": 300, "15 min": 900, "60 min": 3600}
+
+STATE_COLORS = {
+    QUEUED: "gray",
+    RUNNING: theme.COLOR_ACCENT,
+    DONE: "green",
+    FAILED: "red",
+    CANCELLED: "gray",
+}
+
+class JobQueueFrame(ctk.CTkFrame):
+    """
+    Sidebar view of the job scheduler: every queued/running/finished job,
+    cancel for waiting and running jobs, pool sizes, the stall timeout and a clear button.
+    """
+    REFRESH_MS = 200
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.scheduler = JobScheduler()
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.header_var = ctk.StringVar(value="Queue")
+        ctk.CTkLabel(self, textvariable=self.header_var, font=ctk.CTkFont(size=13, weight="bold"),
+                     anchor="w").grid(row=0, column=0, sticky="ew")
+
+        self.list_frame = ctk.CTkScrollableFrame(self, corner_radius=6, fg_color=theme.COLOR_BG_LIST, height=120)
+        self.list_frame.grid(row=1, column=0, pady=5, sticky="nsew")
+        self.list_frame.grid_columnconfigure(0, weight=1)
+
+        # Pool sizes
+        self.pool_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.pool_frame.grid(row=2, column=0, sticky="ew")
+        for pool, label in [(POOL_CPU, "CPU"), (POOL_IO, "I/O")]:
+            ctk.CTkLabel(self.pool_frame, text=label, text_color="gray").pack(side="left", padx=(0, 4))
+            menu = ctk.CTkOptionMenu(self.pool_frame, values=[str(n) for n in range(1, 9)], width=55,
+                                     command=lambda value, p=pool: self.scheduler.set_pool_size(p, value))
+            menu.set(str(self.scheduler.pool_size(pool)))
+            menu.pack(side="left", padx=(0, 10))
+
+        # Stall watchdog: kill tools that report no progress for this long
+        self.stall_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.stall_frame.grid(row=3, column=0, pady=(5, 0), sticky="ew")
+        ctk.CTkLabel(self.stall_frame, text="Kill if stalled", text_color="gray").pack(side="left", padx=(0, 4))
+        stall_menu = ctk.CTkOptionMenu(self.stall_frame, values=list(STALL_CHOICES), width=80,
+                                       command=lambda label: self.scheduler.set_stall_timeout(STALL_CHOICES[label]))
+        current = self.scheduler.stall_timeout()
+        stall_menu.set(next((label for label, secs in STALL_CHOICES.items() if secs == current), "5 min"))
+        stall_menu.pack(side="left")
+
+        ctk.CTkButton(self, text="Clear Finished", command=self.scheduler.clear_finished, height=26,
+                      fg_color="transparent", border_width=1, text_color=theme.COLOR_BTN_TEXT,
+                      hover_color=theme.COLOR_BTN_HOVER).grid(row=4, column=0, pady=(5, 0), sticky="ew")
+
+        self.rows = {} # job id -> {"frame", "status_var", "status_lbl", "cancel_btn"}
+        self._refresh_pending = False
+        self.scheduler.add_listener(self._on_job_event)
+
+    def _on_job_event(self, job):
+        # Called from scheduler threads; coalesce bursts of progress events into one refresh
+        if job is not None and job.kind == "probe":
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after(self.REFRESH_MS, self.refresh)
+
+    def refresh(self):
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+
+        jobs = self.scheduler.jobs()
+        live = {job.id for job in jobs}
+        for job_id in list(self.rows):
+            if job_id not in live:
+                self.rows.pop(job_id)["frame"].destroy()
+
+        # Newest first, rows are created on first sight
+        for i, job in enumerate(reversed(jobs)):
+            row = self.rows.get(job.id)
+            if row is None:
+                row = self._create_row(job)
+                self.rows[job.id] = row
+            row["frame"].grid(row=i, column=0, padx=3, pady=2, sticky="ew")
+            self._update_row(row, job)
+
+        running = sum(1 for j in jobs if j.state == RUNNING)
+        waiting = sum(1 for j in jobs if j.state == QUEUED)
+        self.header_var.set(f"Queue ({running} running, {waiting} waiting)" if running or waiting else "Queue")
+
+    def _create_row(self, job):
+        frame = ctk.CTkFrame(self.list_frame, fg_color=theme.COLOR_LIST_STRIPE_EVEN, corner_radius=4)
+        frame.grid_columnconfigure(0, weight=1)
+
+        ctk.CTkLabel(frame, text=job.title, anchor="w", font=ctk.CTkFont(size=11),
+                     width=10).grid(row=0, column=0, padx=(6, 0), sticky="ew")
+        cancel_btn = ctk.CTkButton(frame, text="✕", width=22, height=22, fg_color="transparent",
+                                   text_color=theme.COLOR_BTN_CLEAR_TEXT, hover_color=theme.COLOR_BTN_CLEAR_HOVER,
+                                   command=job.cancel)
+        cancel_btn.grid(row=0, column=1, rowspan=2, padx=2)
+
+        status_var = ctk.StringVar()
+        status_lbl = ctk.CTkLabel(frame, textvariable=status_var, anchor="w", font=ctk.CTkFont(size=10), height=14)
+        status_lbl.grid(row=1, column=0, padx=(6, 0), pady=(0, 3), sticky="ew")
+
+        return {"frame": frame, "status_var": status_var, "status_lbl": status_lbl, "cancel_btn": cancel_btn}
+
+    def _update_row(self, row, job):
+        text = job.state.capitalize()
+        if job.state == RUNNING and job.cancel_event.is_set():
+            text = "Cancelling..."
+        elif job.state == RUNNING and job.progress is not None and job.progress.percent is not None:
+            text += f" {job.progress.percent:.0f}%"
+        elif job.state == FAILED and str(job.error).strip():
+            text += ": " + str(job.error).strip().splitlines()[0]
+        row["status_var"].set(text[:40])
+        row["status_lbl"].configure(text_color=STATE_COLORS.get(job.state, "gray"))
+
+        # Waiting jobs are dropped, running ones have their tool killed (unless that could damage a file)
+        if job.state not in (QUEUED, RUNNING) or (job.state == RUNNING and not job.interruptible):
+            row["cancel_btn"].grid_remove()
@@ -0,0 +1,240 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from utils import file_dialogs
+import os
+import threading
+from utils import batch_extract, episode_match, season_mux
+from utils import theme
+
+STATUS_COLORS = {
+    batch_extract.STATUS_QUEUED: "gray",
+    season_mux.STATUS_MUXING: theme.COLOR_ACCENT,
+    batch_extract.STATUS_DONE: "green",
+    batch_extract.STATUS_SKIPPED: "orange",
+    batch_extract.STATUS_FAILED: "red",
+    batch_extract.STATUS_CANCELLED: "gray",
+}
+
+# Weaker matches are highlighted so they get a second look before muxing
+METHOD_COLORS = {
+    episode_match.MATCH_SEASON_EPISODE: "gray",
+    episode_match.MATCH_EPISODE: "gray",
+    episode_match.MATCH_NAME: "orange",
+}
+
+class SeasonMixWindow(ctk.CTkToplevel):
+    """
+    Add subtitles to a whole season: pick a folder of episodes and a folder of
+    subtitles, review the automatic matches (SxxEyy, episode number or similar
+    name) and mux every checked episode to MKV as jobs on the shared scheduler.
+    """
+    def __init__(self, master, languages):
+        super().__init__(master)
+        self.title("Add Subtitles to Season")
+        self.geometry("900x620")
+        self.transient(master)
+
+        self.languages = languages
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Source Folders
+        self.src_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.src_frame.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="ew")
+        self.src_frame.grid_columnconfigure(1, weight=1)
+
+        self.video_dir_var = ctk.StringVar(value="No folder selected")
+        self.sub_dir_var = ctk.StringVar(value="No folder selected")
+        ctk.CTkButton(self.src_frame, text="Episodes Folder", command=self.select_video_dir, width=140,
+                      height=35).grid(row=0, column=0, padx=(0, 10), pady=2)
+        ctk.CTkLabel(self.src_frame, textvariable=self.video_dir_var, text_color="gray",
+                     anchor="w").grid(row=0, column=1, sticky="ew")
+        ctk.CTkButton(self.src_frame, text="Subtitles Folder", command=self.select_sub_dir, width=140,
+                      height=35).grid(row=1, column=0, padx=(0, 10), pady=2)
+        ctk.CTkLabel(self.src_frame, textvariable=self.sub_dir_var, text_color="gray",
+                     anchor="w").grid(row=1, column=1, sticky="ew")
+
+        # Match Table
+        self.match_list = ctk.CTkScrollableFrame(self, corner_radius=6, border_width=1, fg_color=theme.COLOR_BG_LIST)
+        self.match_list.grid(row=1, column=0, padx=15, pady=5, sticky="nsew")
+        self.match_list.grid_columnconfigure(0, weight=1)
+
+        # Output
+        self.out_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.out_frame.grid(row=2, column=0, padx=15, pady=5, sticky="ew")
+
+        ctk.CTkButton(self.out_frame, text="Select Output Directory", command=self.select_out_dir, width=160).pack(side="left", padx=(0, 10))
+        self.out_dir_var = ctk.StringVar(value="Same as Source")
+        ctk.CTkLabel(self.out_frame, textvariable=self.out_dir_var, text_color="gray").pack(side="left", padx=5)
+
+        ctk.CTkLabel(self.out_frame, text="Default:", font=ctk.CTkFont(weight="bold")).pack(side="right", padx=(5, 0))
+        self.default_lang_menu = ctk.CTkOptionMenu(self.out_frame, values=["None"] + self.languages, width=150)
+        self.default_lang_menu.set(self.languages[0])
+        self.default_lang_menu.pack(side="right", padx=5)
+
+        self.detect_content_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(self.out_frame, text="Detect untagged languages from the text",
+                        variable=self.detect_content_var).pack(side="right", padx=(5, 15))
+
+        self.suffix_var = ctk.StringVar(value="_muxed")
+        ctk.CTkEntry(self.out_frame, textvariable=self.suffix_var, width=90).pack(side="right", padx=(5, 15))
+        ctk.CTkLabel(self.out_frame, text="Suffix:", font=ctk.CTkFont(weight="bold")).pack(side="right")
+
+        # Action Buttons
+        self.action_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.action_frame.grid(row=3, column=0, padx=15, pady=(10, 15), sticky="ew")
+
+        self.start_btn = ctk.CTkButton(self.action_frame, text="Mux All", command=self.start,
+                                       state="disabled", height=45, font=ctk.CTkFont(size=14, weight="bold"))
+        self.start_btn.pack(side="right")
+        self.cancel_btn = ctk.CTkButton(self.action_frame, text="Cancel", command=self.cancel, state="disabled",
+                                        fg_color="transparent", border_width=1, height=45)
+        self.cancel_btn.pack(side="right", padx=10)
+        self.summary_var = ctk.StringVar(value="")
+        ctk.CTkLabel(self.action_frame, textvariable=self.summary_var, text_color="gray").pack(side="left")
+
+        self.video_dir = None
+        self.sub_dir = None
+        self.selected_out_dir = None
+        self.matches = []
+        self.rows = {} # video path -> {"include_var", "status_lbl"}
+        self.cancel_event = None
+
+    def select_video_dir(self):
+        d = file_dialogs.select_directory("Select Folder with Episodes")
+        if d:
+            self.video_dir = d
+            self.video_dir_var.set(d)
+            if not self.sub_dir:
+                # Subtitles usually sit next to the episodes
+                self.sub_dir = d
+                self.sub_dir_var.set(d)
+            self.refresh_matches()
+
+    def select_sub_dir(self):
+        d = file_dialogs.select_directory("Select Folder with Subtitles")
+        if d:
+            self.sub_dir = d
+            self.sub_dir_var.set(d)
+            self.refresh_matches()
+
+    def select_out_dir(self):
+        d = file_dialogs.select_directory("Select Output Directory")
+        if d:
+            self.selected_out_dir = d
+            self.out_dir_var.set(d)
+
+    def refresh_matches(self):
+        if self.cancel_event is not None or not self.video_dir or not self.sub_dir:
+            return
+
+        videos = batch_extract.collect_sources([self.video_dir])
+        subs = episode_match.collect_subtitles([self.sub_dir])
+        self.matches, unmatched = episode_match.match_episodes(videos, subs)
+
+        for child in self.match_list.winfo_children():
+            child.destroy()
+        self.rows = {}
+        for i, match in enumerate(self.matches):
+            self._add_row(i, match)
+
+        matched = sum(1 for m in self.matches if m["subs"])
+        summary = f"{matched} of {len(videos)} episodes matched"
+        if unmatched:
+            summary += f", {len(unmatched)} subtitle(s) unused"
+        self.summary_var.set(summary)
+        self.start_btn.configure(state="normal" if matched else "disabled")
+
+    def _add_row(self, i, match):
+        stripe_color = theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
+        row = ctk.CTkFrame(self.match_list, fg_color=stripe_color, corner_radius=4)
+        row.grid(row=i, column=0, padx=5, pady=2, sticky="ew")
+        row.grid_columnconfigure(1, weight=1)
+
+        include_var = ctk.BooleanVar(value=bool(match["subs"]))
+        ctk.CTkCheckBox(row, text=os.path.basename(match["video"]), variable=include_var, width=300,
+                        state="normal" if match["subs"] else "disabled").grid(row=0, column=0, padx=10, pady=4, sticky="w")
+
+        if match["subs"]:
+            sub_text = "\n".join(os.path.basename(p) for p in match["subs"])
+            method_text = f"by {match['method']}"
+        else:
+            sub_text, method_text = "No subtitles found", ""
+        ctk.CTkLabel(row, text=sub_text, anchor="w", justify="left",
+                     text_color=None if match["subs"] else "gray").grid(row=0, column=1, padx=5, sticky="ew")
+        ctk.CTkLabel(row, text=method_text, width=80,
+                     text_color=METHOD_COLORS.get(match["method"], "gray")).grid(row=0, column=2, padx=5)
+
+        status_lbl = ctk.CTkLabel(row, text="", anchor="e", text_color="gray", width=180)
+        status_lbl.grid(row=0, column=3, padx=10)
+        self.rows[match["video"]] = {"include_var": include_var, "status_lbl": status_lbl}
+
+    def _subtitle_options(self, sub_paths, default_code, detect_content):
+        """Runs on the worker thread: reading the subtitle text is the slow part."""
+        return season_mux.subtitle_options(sub_paths, default_code, detect_content,
+                                           fallback_code=self.languages[0].split(" ")[0])
+
+    def start(self):
+        default_code = self.default_lang_menu.get().split(" ")[0]
+        detect_content = self.detect_content_var.get()
+        selected = [m for m in self.matches if m["subs"] and self.rows[m["video"]]["include_var"].get()]
+        if not selected:
+            messagebox.showwarning("Warning", "No episodes selected.", parent=self)
+            return
+
+        self.cancel_event = threading.Event()
+        self.start_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self.summary_var.set("Running...")
+
+        output_dir = self.selected_out_dir
+        suffix = self.suffix_var.get()
+        cancel_event = self.cancel_event
+
+        def on_status(path, status, detail):
+            self.after(0, lambda: self._set_status(path, status, detail))
+
+        def task():
+            try:
+                episodes = [{"video": m["video"], "subs": self._subtitle_options(m["subs"], default_code, detect_content)}
+                            for m in selected]
+                results = season_mux.batch_mux(episodes, output_dir=output_dir, suffix=suffix,
+                                               on_status=on_status, cancel_event=cancel_event)
+            except Exception as e:
+                msg = str(e) # e is unbound once the except block ends
+                self.after(0, lambda: self._on_error(msg))
+                return
+            self.after(0, lambda: self._on_done(results))
+
+        threading.Thread(target=task, daemon=True).start()
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_btn.configure(state="disabled")
+            self.summary_var.set("Cancelling...")
+
+    def _set_status(self, path, status, detail):
+        row = self.rows.get(path)
+        if row is None or not row["status_lbl"].winfo_exists():
+            return
+        text = status.capitalize() + (f": {detail}" if detail else "")
+        row["status_lbl"].configure(text=text[:40], text_color=STATUS_COLORS.get(status, "gray"))
+
+    def _on_error(self, message):
+        self.cancel_event = None
+        self.cancel_btn.configure(state="disabled")
+        self.start_btn.configure(state="normal")
+        self.summary_var.set("")
+        messagebox.showerror("Error", message, parent=self)
+
+    def _on_done(self, results):
+        self.cancel_event = None
+        self.cancel_btn.configure(state="disabled")
+        self.start_btn.configure(state="normal")
+
+        counts = {}
+        for status, _ in results.values():
+            counts[status] = counts.get(status, 0) + 1
+        self.summary_var.set(", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
@@ -1,7 +1,9 @@
 import customtkinter as ctk
-from utils.mkv_wrapper import get_mkv_info
-from utils.ffmpeg_wrapper import get_ffmpeg_info
+from utils.probe import probe_file_async
+from utils.track_naming import track_output_filename
+from utils.job_scheduler import JobScheduler, QUEUED, RUNNING, FINISHED_STATES
 from utils import theme
+from utils.languages import menu_entry, menu_entries
 import os
 import tkinter as tk
 
@@ -66,7 +68,13 @@ class ToolTip:
             self.tip_window = None
 
 class TrackListFrame(ctk.CTkScrollableFrame):
-    def __init__(self, master, languages=None, extract_mode=False, default_checked=True, on_open=None, **kwargs):
+    # Rows are fixed height so the list can be virtualized (unscaled px)
+    ROW_HEIGHT = 40
+    ROW_PITCH = 44 # ROW_HEIGHT + 2px above and below
+    OVERSCAN_ROWS = 2
+
+    def __init__(self, master, languages=None, extract_mode=False, default_checked=True, on_open=None,
+                 session=None, **kwargs):
         # Remove label_text from kwargs to move it outside
         kwargs.pop("label_text", None)
         kwargs.pop("label_font", None)
@@ -74,6 +82,9 @@ class TrackListFrame(ctk.CTkScrollableFrame):
         self.extract_mode = extract_mode
         self.default_checked = default_checked
         self.on_open = on_open
+        # utils.media_session.MediaSession: edit-mode changes are recorded there and
+        # picked up by the other tabs' lists
+        self.session = session
 
         # Material Design Polish: Give it a surface look
         # Use a slightly lighter/distinct gray for the list background to create "depth"
@@ -81,18 +92,33 @@ class TrackListFrame(ctk.CTkScrollableFrame):
         
         super().__init__(master, label_text="", corner_radius=6, border_width=1, 
                          fg_color=theme.COLOR_BG_LIST, **kwargs)
-        self.languages = languages or [
-             "eng (English)", "spa (Spanish)", "por (Portuguese)", "fra (French)", 
-             "deu (German)", "ita (Italian)", "jpn (Japanese)", "chi (Chinese)", 
-             "rus (Russian)", "kor (Korean)", "ara (Arabic)", "hin (Hindi)", "und (Undefined)"
-        ]
+        self.languages = languages or menu_entries(include_undefined=True)
         self.tracks = []
         self.track_widgets = {} # map tid -> dict of widgets/vars
+        self.info = None # Last probe result
+        self.file_path = None
         self.source_filename = "video" # Default base name for extraction
         self.generated_filenames = set()
 
-        # Bind scroll events
-        self._bind_mouse_wheel(self)
+        # Async loading state: each load bumps the token so stale results are dropped
+        self._load_token = 0
+        self._pending_probe = None
+        self._shown_probe = None # The probe Future self.info came from
+        self._applying_edits = False
+
+        # Virtualized rows (see _populate); the spacer, rows and status widgets are
+        # pooled across loads (see _clear_content)
+        self._row_data = [] # list index -> (track id, info text)
+        self._spacer = None
+        self._rows = [] # Row pool
+        self._visible_rows = {} # list index -> row
+        self._status_lbl = None
+        self._status_btn = None
+        self._render_pending = False
+        self._parent_canvas.configure(yscrollcommand=self._on_yscroll)
+
+        # Mouse wheel: CTkScrollableFrame binds one handler on the "all" tag that
+        # scrolls whichever list is under the pointer, so rows need no bindings.
 
         # Show empty state initially
         self._show_empty_state()
@@ -118,48 +144,69 @@ class TrackListFrame(ctk.CTkScrollableFrame):
         return frame
 
     def _clear_content(self):
-        """Safely clears user content from the internal scrollable frame."""
+        """
+        Hides the current content. The status widgets, the spacer and the row
+        pool are kept and reconfigured by the next load instead of rebuilt.
+        """
         content_frame = self._get_content_frame()
+        pooled = (self._status_lbl, self._status_btn, self._spacer)
         for widget in content_frame.winfo_children():
-            widget.destroy()
+            if widget in pooled:
+                widget.pack_forget()
+            else:
+                widget.destroy()
 
-    def _show_empty_state(self):
-        """Displays a placeholder message when no file is loaded."""
+        for row in self._visible_rows.values():
+            row["frame"].place_forget()
+        self._visible_rows = {}
+        self._row_data = []
+
+    def _show_status(self, text, text_color="gray", button_text=None, button_command=None):
+        """Shows a message (and optionally a button) in place of the track rows."""
         self._clear_content()
 
-        msg = "No video loaded. Select a source file to view tracks."
-        lbl = ctk.CTkLabel(self, text=msg, text_color="gray", wraplength=400)
-        lbl.pack(padx=20, pady=(50, 10))
+        if self._status_lbl is None:
+            self._status_lbl = ctk.CTkLabel(self, wraplength=400)
+            self._status_btn = ctk.CTkButton(self, width=100)
+
+        self._status_lbl.configure(text=text, text_color=text_color)
+        if button_text:
+            self._status_lbl.pack(padx=20, pady=(40, 10))
+            self._status_btn.configure(text=button_text, command=button_command)
+            self._status_btn.pack(padx=20, pady=(0, 40))
+        else:
+            self._status_lbl.pack(padx=20, pady=40)
 
+    def _show_empty_state(self):
+        """Displays a placeholder message when no file is loaded."""
+        msg = "No video loaded. Select a source file to view tracks."
         if self.on_open:
-            btn = ctk.CTkButton(self, text="Select Video File", command=self.on_open)
-            btn.pack(padx=20, pady=(0, 50))
+            self._show_status(msg, button_text="Select Video File", button_command=self.on_open)
         else:
-            # Add extra padding if no button
-            lbl.pack(padx=20, pady=50)
-
-    def _bind_mouse_wheel(self, widget):
-        """Recursively bind mouse wheel events to a widget and all its children."""
-        widget.bind("<MouseWheel>", self._on_mouse_wheel)
-        widget.bind("<Button-4>", self._on_mouse_wheel)
-        widget.bind("<Button-5>", self._on_mouse_wheel)
-        
-        for child in widget.winfo_children():
-            self._bind_mouse_wheel(child)
-
-    def _on_mouse_wheel(self, event):
-        """Propagate mouse wheel events to the canvas."""
-        if event.num == 4: # Linux scroll up
-            self._parent_canvas.yview_scroll(-1, "units")
-        elif event.num == 5: # Linux scroll down
-            self._parent_canvas.yview_scroll(1, "units")
-        else: # Windows/macOS
-            self._parent_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            
-    def load_tracks(self, file_path):
+            self._show_status(msg)
+
+    def load_tracks(self, file_path, probe=None):
+        """
+        Probe file_path on the worker pool and fill the list when the result arrives.
+        A newer call (or cancel_load) supersedes any probe still in flight.
+        probe: an already submitted probe Future (e.g. from the browser's prefetch);
+        if it has finished the tracks are shown right away. Passing the probe the
+        list already shows (or is waiting for) keeps the list as it is.
+        """
+        if probe is not None and file_path == self.file_path:
+            if probe is self._pending_probe:
+                return
+            if probe is self._shown_probe and self.info is not None:
+                self.apply_session_edits()
+                return
+
+        self._cancel_pending_probe()
+        self.file_path = file_path
+        self._shown_probe = None
+
         # Clear existing
-        self._clear_content()
         self.track_widgets = {}
+        self.info = None
         self.tracks = []
         self.generated_filenames = set()
 
@@ -167,180 +214,267 @@ class TrackListFrame(ctk.CTkScrollableFrame):
             self._show_empty_state()
             return
 
+        self.source_filename = os.path.splitext(os.path.basename(file_path))[0]
+
+        token = self._load_token
+        future = probe or probe_file_async(file_path)
+        self._pending_probe = future
+        if future.done():
+            self._on_probe_done(token, future)
+            return
+
         # Show Loading State
-        loading_lbl = ctk.CTkLabel(self, text="Loading tracks...", text_color="gray")
-        loading_lbl.pack(pady=40)
-        self.update() # Force UI update before heavy operation
+        self._show_status("Loading tracks...", button_text="Cancel", button_command=self.cancel_load)
 
-        self.source_filename = os.path.splitext(os.path.basename(file_path))[0]
+        def on_done(f):
+            # Runs on the worker thread, hand the result back to the Tk loop
+            try:
+                self.after(0, lambda: self._on_probe_done(token, f))
+            except Exception:
+                pass # Widget destroyed while probing
+
+        future.add_done_callback(on_done)
+
+    def cancel_load(self):
+        """Abandons the in-flight probe (if any) and returns to the empty state."""
+        self._cancel_pending_probe()
+        self._show_empty_state()
+
+    def _cancel_pending_probe(self):
+        self._load_token += 1
+        if self._pending_probe is not None:
+            self._pending_probe.cancel()
+            self._pending_probe = None
+
+    def _on_probe_done(self, token, future):
+        if token != self._load_token or future.cancelled():
+            return # Superseded by a newer selection or cancelled
+        self._pending_probe = None
 
         info = None
         error_msg = None
-
         try:
-            if file_path.lower().endswith('.mkv'):
-                info = get_mkv_info(file_path)
-            else:
-                info = get_ffmpeg_info(file_path)
-                # ffmpeg_wrapper might return None on failure currently,
-                # or we might want to standardize it later.
-                if info is None:
-                     error_msg = "Could not read file info (FFmpeg)."
+            info = future.result()
         except Exception as e:
             error_msg = str(e)
 
-        # Clear loading indicator
-        self._clear_content()
-
         if error_msg:
-            # Display Error
-            err_lbl = ctk.CTkLabel(self, text=f"Error: {error_msg}", text_color="red", wraplength=400)
-            err_lbl.pack(padx=10, pady=20)
+            self._show_status(f"Error: {error_msg}", text_color="red")
             return
 
         if not info:
-            # If info is None but no exception (shouldn't happen with updated mkv_wrapper but possible with ffmpeg)
-            err_lbl = ctk.CTkLabel(self, text="No track information found.", text_color="orange")
-            err_lbl.pack(padx=10, pady=20)
+            self._show_status("No track information found.", text_color="orange")
             return
 
+        self.show_info(info)
+        self._shown_probe = future
+
+    def show_info(self, info):
+        """Fills the list from an already probed info dict (mkvmerge -J structure)."""
+        self.track_widgets = {}
+        self.generated_filenames = set()
+        self._clear_content()
+        self._populate(info)
+
+    def _populate(self, info):
+        self.info = info
         self.tracks = info.get("tracks", [])
         
         if not self.tracks:
-            ctk.CTkLabel(self, text="No tracks found in this file.", text_color="gray").pack(padx=10, pady=20)
+            self._show_status("No tracks found in this file.")
             return
 
-        for i, track in enumerate(self.tracks):
+        # Per-track state lives in Tk variables; row widgets are only built for the
+        # visible part of the list and rebound to these as the user scrolls.
+        self._row_data = []
+        for track in self.tracks:
             tid = track.get("id")
             ttype = track.get("type", "unknown")
             props = track.get("properties", {})
             codec = props.get("codec_id", "Unknown")
             lang = props.get("language", "und")
             name = props.get("track_name", "")
-            
-            # Row Frame - cleaner look with subtle background
-            # Alternating colors: lighter/darker stripes
-            stripe_color = theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
-            
-            row = ctk.CTkFrame(self, fg_color=stripe_color, corner_radius=4)
-            row.pack(fill="x", padx=5, pady=2)
-            
-            # Keep Checkbox
+
             keep_var = ctk.BooleanVar(value=self.default_checked)
-            chk = ctk.CTkCheckBox(row, text="", variable=keep_var, width=20)
-            chk.pack(side="left", padx=(10, 5))
-            
+
             if self.extract_mode:
-                # -- EXTRACT MODE: Info + Output Filename --
                 # Format: [TYPE] ID:x | Codec | Lang | Name -> Output Name Entry
-
                 info_text = f"[{ttype.upper()}] ID:{tid} | {codec} | {lang}"
                 if name:
                     info_text += f" | {name}"
-                    
-                ctk.CTkLabel(row, text=info_text, anchor="w", font=ctk.CTkFont(size=12), width=250).pack(side="left", padx=5)
 
                 # Generate default output filename with duplicate handling
-                default_out_name = self._generate_default_filename(track)
-                out_name_var = ctk.StringVar(value=default_out_name)
-                
-                ctk.CTkLabel(row, text="Output:", font=ctk.CTkFont(size=12, weight="bold")).pack(side="left", padx=5)
-                out_name_entry = ctk.CTkEntry(row, textvariable=out_name_var, height=28, placeholder_text="Output Filename")
-                out_name_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), pady=2)
+                out_name_var = ctk.StringVar(value=self._generate_default_filename(track))
 
-                # Store minimal data
                 self.track_widgets[tid] = {
                     "keep_var": keep_var,
                     "type": ttype,
                     "out_name_var": out_name_var
                 }
             else:
-                # -- EDIT MODE: Full controls --
-                
-                # Info Label (Compact)
                 info_text = f"[{ttype.upper()}] ID:{tid} ({lang})"
-                ctk.CTkLabel(row, text=info_text, width=160, anchor="w", font=ctk.CTkFont(size=12)).pack(side="left", padx=5)
 
-                # Default Checkbox
-                is_default = (lang == "eng")
-                default_var = ctk.BooleanVar(value=is_default)
-                
-                def on_default_click(var=default_var, type_chk=ttype):
-                    if var.get():
-                         for t_id, t_data in self.track_widgets.items():
-                             if t_data.get("type") == type_chk and t_data.get("default_var") != var:
-                                 t_data["default_var"].set(False)
-
-                def_chk = ctk.CTkCheckBox(row, text="Default", variable=default_var, command=on_default_click, width=70)
-                def_chk.pack(side="left", padx=10)
-                ToolTip(def_chk, "Set as Default Track")
-                
-                # Language Dropdown
-                current_lang_str = self.languages[-1]
-                for l in self.languages:
-                    code = l.split(" ")[0]
-                    if code == lang:
-                        current_lang_str = l
-                        break
-                
-                lang_var = ctk.StringVar(value=current_lang_str)
-                lang_menu = ctk.CTkOptionMenu(row, values=self.languages, variable=lang_var, width=140, height=28)
-                lang_menu.pack(side="left", padx=10)
-                
-                # Name Entry
-                name_var = ctk.StringVar(value=name)
-                name_entry = ctk.CTkEntry(row, textvariable=name_var, height=28, placeholder_text="Track Title")
-                name_entry.pack(side="left", fill="x", expand=True, padx=(10, 15), pady=5)
-                
+                # mkvmerge reports bibliographic codes ("ger", "chi"); the menus use ISO 639-2/T
+                current_lang_str = menu_entry(lang)
+
                 self.track_widgets[tid] = {
                     "keep_var": keep_var,
-                    "lang_var": lang_var,
-                    "name_var": name_var,
-                    "default_var": default_var,
-                    "type": ttype
+                    "lang_var": ctk.StringVar(value=current_lang_str),
+                    "name_var": ctk.StringVar(value=name),
+                    "default_var": ctk.BooleanVar(value=(lang == "eng")),
+                    "type": ttype,
+                    "props": props
                 }
-            
-            # Ensure new widgets are scrollable
-            self._bind_mouse_wheel(row)
+                if self.session is not None:
+                    for key in ("keep_var", "lang_var", "name_var", "default_var"):
+                        self.track_widgets[tid][key].trace_add("write", lambda *args, tid=tid: self._push_edits(tid))
+
+            self._row_data.append((tid, info_text))
+
+        self.apply_session_edits()
+
+        # One spacer as tall as the whole list gives the scrollbar its range;
+        # rows are placed inside it at their list position.
+        if self._spacer is None:
+            self._spacer = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self._spacer.configure(height=len(self.tracks) * self.ROW_PITCH)
+        self._spacer.pack(fill="x", padx=5)
+        self._parent_canvas.yview_moveto(0)
+        self._render_visible()
+
+    def _on_yscroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_visible)
+
+    def _render_visible(self):
+        """Binds row widgets to the tracks currently in view (plus a small overscan)."""
+        self._render_pending = False
+        if not self._row_data:
+            return
+
+        pitch = self._apply_widget_scaling(self.ROW_PITCH)
+        top = self._parent_canvas.canvasy(0) - self._spacer.winfo_y()
+        height = max(self._parent_canvas.winfo_height(), pitch)
+        first = max(0, int(top // pitch) - self.OVERSCAN_ROWS)
+        last = min(len(self._row_data), int((top + height) // pitch) + 1 + self.OVERSCAN_ROWS)
+        wanted = range(first, last)
+
+        # Release rows that scrolled out, then hand them to the rows that scrolled in
+        self._visible_rows = {index: row for index, row in self._visible_rows.items() if index in wanted}
+        in_use = {id(row) for row in self._visible_rows.values()}
+        free = [row for row in self._rows if id(row) not in in_use]
+
+        for index in wanted:
+            if index in self._visible_rows:
+                continue
+            row = free.pop() if free else self._create_row()
+            self._bind_row(row, index)
+            row["frame"].place(x=0, y=index * self.ROW_PITCH + 2, relwidth=1)
+            self._visible_rows[index] = row
+
+        for row in free:
+            row["frame"].place_forget()
+
+    def _create_row(self):
+        """Builds one row's widgets; which track it shows is set by _bind_row."""
+        frame = ctk.CTkFrame(self._spacer, corner_radius=4, height=self.ROW_HEIGHT)
+        frame.pack_propagate(False) # Fixed height, whatever the children ask for
+        row = {"frame": frame}
+
+        # Keep Checkbox
+        row["chk"] = ctk.CTkCheckBox(frame, text="", width=20)
+        row["chk"].pack(side="left", padx=(10, 5))
+
+        if self.extract_mode:
+            # -- EXTRACT MODE: Info + Output Filename --
+            row["info_lbl"] = ctk.CTkLabel(frame, anchor="w", font=ctk.CTkFont(size=12), width=250)
+            row["info_lbl"].pack(side="left", padx=5)
+
+            ctk.CTkLabel(frame, text="Output:", font=ctk.CTkFont(size=12, weight="bold")).pack(side="left", padx=5)
+            row["out_name_entry"] = ctk.CTkEntry(frame, height=28, placeholder_text="Output Filename")
+            row["out_name_entry"].pack(side="left", fill="x", expand=True, padx=(0, 10), pady=2)
+        else:
+            # -- EDIT MODE: Full controls --
+            row["info_lbl"] = ctk.CTkLabel(frame, width=160, anchor="w", font=ctk.CTkFont(size=12))
+            row["info_lbl"].pack(side="left", padx=5)
+
+            # Default Checkbox
+            row["def_chk"] = ctk.CTkCheckBox(frame, text="Default", width=70)
+            row["def_chk"].pack(side="left", padx=10)
+            ToolTip(row["def_chk"], "Set as Default Track")
+
+            # Language Dropdown
+            row["lang_menu"] = ctk.CTkOptionMenu(frame, values=self.languages, width=140, height=28)
+            row["lang_menu"].pack(side="left", padx=10)
+
+            # Name Entry
+            row["name_entry"] = ctk.CTkEntry(frame, height=28, placeholder_text="Track Title")
+            row["name_entry"].pack(side="left", fill="x", expand=True, padx=(10, 15), pady=5)
+
+        self._rows.append(row)
+        return row
+
+    def _bind_row(self, row, index):
+        tid, info_text = self._row_data[index]
+        data = self.track_widgets[tid]
+
+        # Alternating colors: lighter/darker stripes
+        stripe_color = theme.COLOR_LIST_STRIPE_EVEN if index % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
+        row["frame"].configure(fg_color=stripe_color)
+        row["chk"].configure(variable=data["keep_var"])
+        row["info_lbl"].configure(text=info_text)
+
+        if self.extract_mode:
+            row["out_name_entry"].configure(textvariable=data["out_name_var"])
+        else:
+            row["def_chk"].configure(variable=data["default_var"], command=lambda: self._on_default_click(tid))
+            row["lang_menu"].configure(variable=data["lang_var"])
+            row["name_entry"].configure(textvariable=data["name_var"])
+
+    def _on_default_click(self, tid):
+        """Only one default track per type."""
+        data = self.track_widgets[tid]
+        if data["default_var"].get():
+            for t_id, t_data in self.track_widgets.items():
+                if t_id != tid and t_data.get("type") == data["type"]:
+                    t_data["default_var"].set(False)
+
+    def _push_edits(self, tid):
+        """Records the (edit mode) values of track tid in the session."""
+        if self._applying_edits:
+            return
+        data = self.track_widgets[tid]
+        self.session.set_edits(tid, source=self, keep=data["keep_var"].get(),
+                               language=data["lang_var"].get().split(" ")[0], name=data["name_var"].get(),
+                               default=data["default_var"].get())
+
+    def apply_session_edits(self):
+        """Sets the edit-mode values to the edits the session holds (made here or in another tab)."""
+        if self.session is None or self.extract_mode:
+            return
+        self._applying_edits = True
+        try:
+            for tid, data in self.track_widgets.items():
+                edits = self.session.track_edits(tid)
+                values = {"keep_var": edits.get("keep"), "name_var": edits.get("name"),
+                          "default_var": edits.get("default"),
+                          "lang_var": menu_entry(edits["language"]) if "language" in edits else None}
+                for key, value in values.items():
+                    if value is not None and data[key].get() != value:
+                        data[key].set(value)
+        finally:
+            self._applying_edits = False
 
     def _generate_default_filename(self, track):
-        props = track.get("properties", {})
-        codec = props.get("codec_id", "")
-        lang = props.get("language", "und")
-        name = props.get("track_name", "")
-
-        # Determine extension
-        ext = ".dat"
-        if "SSA" in codec or "ASS" in codec: ext = ".ass"
-        elif "SRT" in codec or "UTF8" in codec: ext = ".srt"
-        elif "PGS" in codec: ext = ".sup"
-        elif "VOBSUB" in codec: ext = ".sub"
-        elif "AAC" in codec: ext = ".aac"
-        elif "AC3" in codec: ext = ".ac3"
-        elif "AVC" in codec or "H264" in codec: ext = ".h264"
-        elif "HEVC" in codec or "H265" in codec: ext = ".h265"
-
-        parts = [self.source_filename]
-
-        if lang and lang != "und":
-            parts.append(lang)
-
-        if name:
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '.', '_', '-')).strip()
-            if safe_name:
-                parts.append(safe_name)
-
-        base_name = ".".join(parts)
-        out_name = base_name + ext
-
-        # Unique handling
-        counter = 1
-        while out_name in self.generated_filenames:
-            out_name = f"{base_name}_{counter}{ext}"
-            counter += 1
-
-        self.generated_filenames.add(out_name)
-        return out_name
+        return track_output_filename(self.source_filename, track, self.generated_filenames)
+
+    def get_duration_ns(self):
+        """Container duration of the loaded file in ns, or None if unknown."""
+        if not self.info:
+            return None
+        return self.info.get("container", {}).get("properties", {}).get("duration")
 
     def select_all(self):
         for data in self.track_widgets.values():
@@ -409,6 +543,41 @@ class TrackListFrame(ctk.CTkScrollableFrame):
                 
         return keep_map, opts
 
+    def has_dropped_tracks(self):
+        """True if any track is unchecked (i.e. saving requires a remux)."""
+        return any(not data["keep_var"].get() for data in self.track_widgets.values())
+
+    def get_property_edits(self):
+        """
+        Returns the header-only changes get_options would apply, relative to the file.
+        Dict: {track_id: {mkvpropedit property: value}}; unchanged tracks are omitted.
+        """
+        edits = {}
+        for tid, data in self.track_widgets.items():
+            if not data["keep_var"].get() or "lang_var" not in data:
+                continue
+            props = data.get("props", {})
+            changes = {}
+
+            code = data["lang_var"].get().split(" ")[0]
+            if code != menu_entry(props.get("language", "und")).split(" ")[0]: # "ger" is unchanged "deu"
+                changes["language"] = code
+
+            name = data["name_var"].get()
+            if name != props.get("track_name", ""):
+                changes["name"] = name
+
+            is_def = data["default_var"].get()
+            if is_def != bool(props.get("default_track", False)):
+                changes["flag-default"] = "1" if is_def else "0"
+
+            if props.get("forced_track", False):
+                changes["flag-forced"] = "0"
+
+            if changes:
+                edits[tid] = changes
+        return edits
+
 class FileListFrame(ctk.CTkScrollableFrame):
     """
     A unified list for adding external files (subtitles, etc.)
@@ -420,25 +589,40 @@ class FileListFrame(ctk.CTkScrollableFrame):
         super().__init__(master, label_text="", corner_radius=6, border_width=1, 
                          fg_color=theme.COLOR_BG_LIST, **kwargs)
         
-        self.languages = languages or [
-             "eng (English)", "spa (Spanish)", "por (Portuguese)", "fra (French)", 
-             "deu (German)", "ita (Italian)", "jpn (Japanese)", "chi (Chinese)", 
-             "rus (Russian)", "kor (Korean)", "ara (Arabic)", "hin (Hindi)", "und (Undefined)"
-        ]
+        self.languages = languages or menu_entries(include_undefined=True)
         self.rows = []
-        self._bind_mouse_wheel(self)
+        self._pool = [] # Released row widgets, reused by add_file_row
+        # Mouse wheel is routed by CTkScrollableFrame's "all"-tag handler (see TrackListFrame)
 
-    def _bind_mouse_wheel(self, widget):
-        widget.bind("<MouseWheel>", self._on_mouse_wheel)
-        widget.bind("<Button-4>", self._on_mouse_wheel)
-        widget.bind("<Button-5>", self._on_mouse_wheel)
-        for child in widget.winfo_children():
-            self._bind_mouse_wheel(child)
+    def _create_row(self):
+        """Builds the widgets of one row; add_file_row (re)configures them."""
+        row = ctk.CTkFrame(self, corner_radius=4)
 
-    def _on_mouse_wheel(self, event):
-        if event.num == 4: self._parent_canvas.yview_scroll(-1, "units")
-        elif event.num == 5: self._parent_canvas.yview_scroll(1, "units")
-        else: self._parent_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Filename label
+        lbl = ctk.CTkLabel(row, width=200, anchor="w")
+        lbl.pack(side="left", padx=5)
+        
+        lang_menu = ctk.CTkOptionMenu(row, values=self.languages, width=150)
+        lang_menu.pack(side="left", padx=5)
+        
+        # Track Name Entry
+        name_entry = ctk.CTkEntry(row, width=150)
+        name_entry.pack(side="left", padx=5)
+
+        # Default Checkbox
+        def_chk = ctk.CTkCheckBox(row, text="Def.", width=50)
+        def_chk.pack(side="left", padx=5)
+        ToolTip(def_chk, "Set as Default Track")
+
+        # Remove Button (packed only when the caller handles removal)
+        btn_remove = ctk.CTkButton(row, text="✕", width=25, height=25,
+                                   fg_color="transparent",
+                                   text_color=theme.COLOR_BTN_CLEAR_TEXT,
+                                   hover_color=theme.COLOR_BTN_CLEAR_HOVER)
+        ToolTip(btn_remove, "Remove File")
+
+        return {"frame": row, "label": lbl, "lang_menu": lang_menu, "name_entry": name_entry,
+                "def_chk": def_chk, "btn_remove": btn_remove}
 
     def add_file_row(self, path, on_default_click_msg, on_remove=None):
         """
@@ -447,38 +631,28 @@ class FileListFrame(ctk.CTkScrollableFrame):
         on_remove: callback when remove button is clicked.
         Returns a dict of widget variables.
         """
-        import os
-        
+        # Reuse a row released by clear()/removal if there is one
+        widgets = self._pool.pop() if self._pool else self._create_row()
+        row = widgets["frame"]
+
         i = len(self.rows)
         stripe_color = theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD
-        
-        row = ctk.CTkFrame(self, fg_color=stripe_color, corner_radius=4)
+        row.configure(fg_color=stripe_color)
         row.pack(fill="x", padx=5, pady=2)
-        
-        self._bind_mouse_wheel(row)
-        
-        # Filename label
-        lbl = ctk.CTkLabel(row, text=os.path.basename(path), width=200, anchor="w")
-        lbl.pack(side="left", padx=5)
+
+        widgets["label"].configure(text=os.path.basename(path))
         
         # Language detection (simple)
         initial_lang = self.languages[0]
         
         lang_var = ctk.StringVar(value=initial_lang)
-        lang_menu = ctk.CTkOptionMenu(row, values=self.languages, variable=lang_var, width=150)
-        lang_menu.pack(side="left", padx=5)
+        widgets["lang_menu"].configure(variable=lang_var, command=None)
         
-        # Track Name Entry
         name_var = ctk.StringVar(value="")
-        name_entry = ctk.CTkEntry(row, textvariable=name_var, width=150)
-        name_entry.pack(side="left", padx=5)
+        widgets["name_entry"].configure(textvariable=name_var)
 
-        # Default Checkbox
         default_var = ctk.BooleanVar(value=False)
-        def_chk = ctk.CTkCheckBox(row, text="Def.", variable=default_var, 
-                                  command=lambda: on_default_click_msg(default_var), width=50)
-        def_chk.pack(side="left", padx=5)
-        ToolTip(def_chk, "Set as Default Track")
+        widgets["def_chk"].configure(variable=default_var, command=lambda: on_default_click_msg(default_var))
         
         row_data = {
             "path": path,
@@ -486,35 +660,131 @@ class FileListFrame(ctk.CTkScrollableFrame):
             "name_var": name_var,
             "default_var": default_var,
             "widget": row,
-            "lang_menu": lang_menu
+            "lang_menu": widgets["lang_menu"],
+            "_widgets": widgets
         }
 
-        # Remove Button
         if on_remove:
-            btn_remove = ctk.CTkButton(row, text="✕", width=25, height=25,
-                                       fg_color="transparent",
-                                       text_color=theme.COLOR_BTN_CLEAR_TEXT,
-                                       hover_color=theme.COLOR_BTN_CLEAR_HOVER,
-                                       command=lambda: self._remove_row(row_data, on_remove))
-            btn_remove.pack(side="left", padx=5)
-            ToolTip(btn_remove, "Remove File")
+            widgets["btn_remove"].configure(command=lambda: self._remove_row(row_data, on_remove))
+            widgets["btn_remove"].pack(side="left", padx=5)
+        else:
+            widgets["btn_remove"].pack_forget()
 
         self.rows.append(row_data)
         return row_data
 
+    def _release_row(self, row_data):
+        """Hides a row and returns its widgets to the pool."""
+        row_data["widget"].pack_forget()
+        self._pool.append(row_data["_widgets"])
+
     def _remove_row(self, row_data, callback):
         """Internal method to handle row removal."""
         if callback:
             callback(row_data)
 
-        # Destroy widget
-        row_data["widget"].destroy()
+        self._release_row(row_data)
 
         # Remove from internal list
         if row_data in self.rows:
             self.rows.remove(row_data)
 
+        # Keep the stripes alternating
+        for i, item in enumerate(self.rows):
+            item["widget"].configure(fg_color=theme.COLOR_LIST_STRIPE_EVEN if i % 2 == 0 else theme.COLOR_LIST_STRIPE_ODD)
+
     def clear(self):
         for item in self.rows:
-            item["widget"].destroy()
+            self._release_row(item)
         self.rows = []
+
+class JobProgressFrame(ctk.CTkFrame):
+    """
+    Progress bar + status line for a running external tool.
+    Hidden until start() or follow() is called; fed with process_runner.Progress events.
+    """
+    def __init__(self, master, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+
+        self.bar = ctk.CTkProgressBar(self, width=220)
+        self.bar.set(0)
+        self.status_var = ctk.StringVar(value="")
+        self.status_lbl = ctk.CTkLabel(self, textvariable=self.status_var, text_color="gray", anchor="w")
+        self.cancel_btn = ctk.CTkButton(self, text="Cancel", width=70, height=24, command=self.cancel_job,
+                                        fg_color="transparent", border_width=1, hover_color=theme.COLOR_BTN_CLEAR_HOVER,
+                                        text_color=theme.COLOR_BTN_CLEAR_TEXT)
+        self._job = None
+
+    def start(self, text):
+        self.bar.set(0)
+        self.bar.pack(side="left", padx=(0, 10))
+        self.status_lbl.pack(side="left", fill="x", expand=True)
+        self.status_var.set(text)
+
+    def update_progress(self, progress):
+        parts = []
+        if progress.percent is not None:
+            self.bar.set(progress.percent / 100)
+            parts.append(f"{progress.percent:.0f}%")
+        if progress.bytes is not None:
+            parts.append(f"{progress.bytes / (1024 * 1024):.1f} MB")
+        if progress.eta is not None and progress.percent != 100:
+            minutes, seconds = divmod(int(progress.eta), 60)
+            parts.append(f"ETA {minutes}:{seconds:02d}")
+        if parts:
+            self.status_var.set("  |  ".join(parts))
+
+    def finish(self, text=None):
+        """Hides the bar; text (if given) stays on the status line."""
+        self._job = None
+        self.bar.pack_forget()
+        self.cancel_btn.pack_forget()
+        if text:
+            self.status_var.set(text)
+        else:
+            self.status_lbl.pack_forget()
+            self.status_var.set("")
+
+    def job_finished(self, job, text=None):
+        """finish(text), unless a newer job has been followed since."""
+        if job is self._job:
+            self.finish(text)
+
+    def follow(self, job):
+        """
+        Tracks a scheduler job: queued / running / progress, until it finishes.
+        Only the most recently followed job is shown.
+        """
+        self._job = job
+        self.start("Queued..." if job.state == QUEUED else "Running...")
+        if job.interruptible:
+            self.cancel_btn.configure(state="normal")
+            self.cancel_btn.pack(side="right", before=self.bar)
+        else:
+            self.cancel_btn.pack_forget()
+        JobScheduler().add_listener(self._on_job_event)
+
+    def cancel_job(self):
+        """Cancels the followed job; its owner reports "Cancelled" once the tool has exited."""
+        if self._job is not None:
+            self._job.cancel()
+            self.cancel_btn.configure(state="disabled")
+            self.status_var.set("Cancelling...")
+
+    def _on_job_event(self, job):
+        # Called from scheduler threads
+        if job is None or job is not self._job:
+            return
+        if job.state in FINISHED_STATES:
+            JobScheduler().remove_listener(self._on_job_event)
+            return # The owner reports the outcome via finish()
+        state, progress = job.state, job.progress
+        self.after(0, lambda: self._show_job(job, state, progress))
+
+    def _show_job(self, job, state, progress):
+        if job is not self._job or not self.winfo_exists() or job.cancel_event.is_set():
+            return
+        if progress is not None:
+            self.update_progress(progress)
+        elif state == RUNNING:
+            self.status_var.set("Running...")
@@ -0,0 +1,109 @@
+import os
+import sys
+import pytest
+
+from utils import atomic_output
+from utils.atomic_output import (AtomicOutput, InsufficientSpaceError, check_free_space,
+                                 estimate_output_size, SIZE_MARGIN, SIZE_MARGIN_BYTES)
+from utils.dependency_manager import DependencyManager
+from utils.mkv_wrapper import mux_mkv, extract_tracks
+
+def test_commit_replaces_output(tmp_path):
+    final = tmp_path / "movie.mkv"
+    final.write_bytes(b"old")
+    with AtomicOutput(str(final)) as out:
+        assert os.path.dirname(out.path) == str(tmp_path) and out.path.endswith(".mkv")
+        with open(out.path, "wb") as f:
+            f.write(b"new")
+        assert final.read_bytes() == b"old"
+        out.commit()
+    assert final.read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["movie.mkv"]
+
+def test_uncommitted_output_is_discarded(tmp_path):
+    final = tmp_path / "movie.mkv"
+    with pytest.raises(RuntimeError):
+        with AtomicOutput(str(final)) as out:
+            with open(out.path, "wb") as f:
+                f.write(b"partial")
+            raise RuntimeError("tool failed")
+    assert os.listdir(tmp_path) == []
+
+def test_estimate_output_size(tmp_path):
+    source = tmp_path / "movie.mkv"
+    source.write_bytes(b"\0" * 100000)
+    sub = tmp_path / "movie.srt"
+    sub.write_bytes(b"\0" * 1000)
+    info = {"tracks": [
+        {"id": 0, "type": "video", "properties": {"tag_number_of_bytes": "60000"}},
+        {"id": 1, "type": "audio", "properties": {"tag_number_of_bytes": "30000"}},
+        {"id": 2, "type": "subtitles", "properties": {}},
+        {"id": 3, "type": "audio", "properties": {}},
+    ]}
+    margin = lambda n: int(n * SIZE_MARGIN) + SIZE_MARGIN_BYTES
+    assert estimate_output_size(str(source), info, ["0", "2"]) == margin(60000)
+    assert estimate_output_size(str(source), info, [1], [str(sub)]) == margin(31000)
+    # An audio track of unknown size: fall back to the whole source
+    assert estimate_output_size(str(source), info, [0, 3]) == margin(100000)
+    assert estimate_output_size(str(source)) == margin(100000)
+
+def test_check_free_space(tmp_path, monkeypatch):
+    monkeypatch.setattr(atomic_output, "free_space", lambda directory: 10 * 1024 * 1024)
+    check_free_space(str(tmp_path / "out.mkv"), 1024)
+    with pytest.raises(InsufficientSpaceError, match="Not enough disk space"):
+        check_free_space(str(tmp_path / "out.mkv"), 20 * 1024 * 1024)
+
+@pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+@pytest.mark.parametrize("exit_code, kept", [(0, True), (1, True), (2, False)])
+def test_mux_mkv_leaves_no_partial_output(tmp_path, monkeypatch, exit_code, kept):
+    # Writes some bytes to the -o path, then exits like a crashed or successful mkvmerge
+    tool = tmp_path / "mkvmerge"
+    tool.write_text(f"#!{sys.executable}\n"
+                    "import sys\n"
+                    "args = sys.argv[1:]\n"
+                    "open(args[args.index('-o') + 1], 'wb').write(b'partial')\n"
+                    f"sys.exit({exit_code})\n")
+    tool.chmod(0o755)
+    monkeypatch.setattr(DependencyManager(), "get_binary_path", lambda name: str(tool))
+
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    success, _ = mux_mkv(str(out_dir / "movie.mkv"), [str(tmp_path / "in.mkv")])
+    assert success == kept
+    assert os.listdir(out_dir) == (["movie.mkv"] if kept else [])
+
+@pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+def test_extract_tracks_keeps_output_on_warnings(tmp_path, monkeypatch):
+    # mkvextract exits with 1 on warnings, after writing the tracks
+    tool = tmp_path / "mkvextract"
+    tool.write_text(f"#!{sys.executable}\n"
+                    "import sys\n"
+                    "for spec in sys.argv[3:]:\n"
+                    "    open(spec.split(':', 1)[1], 'wb').write(b'track')\n"
+                    "print('Warning: the track 2 has an unknown codec')\n"
+                    "sys.exit(1)\n")
+    tool.chmod(0o755)
+    monkeypatch.setattr(DependencyManager(), "get_binary_path", lambda name: str(tool))
+
+    out_path = tmp_path / "track2.srt"
+    success, msg = extract_tracks(str(tmp_path / "in.mkv"), {2: str(out_path)})
+    assert success
+    assert "Warning" in msg
+    assert out_path.read_bytes() == b"track"
+
+@pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+@pytest.mark.parametrize("exit_code, kept", [(0, True), (2, False)])
+def test_extract_vobsub_commits_its_index(tmp_path, fake_tool, exit_code, kept):
+    # mkvextract writes a VobSub track as <name>.sub and <name>.idx
+    fake_tool("import os\n"
+              "for spec in args[2:]:\n"
+              "    stem = os.path.splitext(spec.split(':', 1)[1])[0]\n"
+              "    open(stem + '.sub', 'wb').write(b'sub')\n"
+              "    open(stem + '.idx', 'wb').write(b'idx')\n"
+              f"sys.exit({exit_code})", name="mkvextract", install=True)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    success, _ = extract_tracks(str(tmp_path / "in.mkv"), {3: str(out_dir / "movie.sub")})
+    assert success == kept
+    assert sorted(os.listdir(out_dir)) == (["movie.idx", "movie.sub"] if kept else [])
@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+import shutil
+import threading
+import pytest
+
+from utils.dependency_manager import DependencyManager, parse_version
+from utils.mkv_wrapper import get_mkv_info
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tools are shell scripts")
+
+@pytest.fixture
+def dm(tmp_path, monkeypatch):
+    """The DependencyManager with empty caches, its tools.json in tmp_path and tmp_path/bin on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ.get("PATH", ""))
+    dm = DependencyManager()
+    monkeypatch.setattr(dm, "_binary_cache", {})
+    monkeypatch.setattr(dm, "_tool_store", None)
+    monkeypatch.setattr(dm, "_store_path", lambda: str(tmp_path / "tools.json"))
+    return dm
+
+def fake_tool(tmp_path, name, version_line):
+    """A tool printing version_line and counting its runs in <name>.runs."""
+    tool = tmp_path / "bin" / name
+    runs = tmp_path / f"{name}.runs"
+    tool.write_text(f"#!{sys.executable}\nopen({str(runs)!r}, 'a').write('x')\nprint({version_line!r})\n")
+    tool.chmod(0o755)
+    return tool, runs
+
+def new_process(dm, monkeypatch):
+    """Drops the in-memory state, as if the app was started again."""
+    monkeypatch.setattr(dm, "_binary_cache", {})
+    monkeypatch.setattr(dm, "_tool_store", None)
+
+def test_parse_version():
+    assert parse_version("mkvmerge v88.0 ('All I Know') 64-bit") == (88, 0, 0)
+    assert parse_version("ffmpeg version 6.1.1-static https://johnvansickle.com") == (6, 1, 1)
+    assert parse_version("ffmpeg version N-112233-gabcdef") is None
+
+def test_version_and_capabilities_are_persisted(dm, tmp_path, monkeypatch):
+    tool, runs = fake_tool(tmp_path, "mkvmerge", "mkvmerge v8.2.0 ('Old') 64-bit")
+    info = dm.tool_info("mkvmerge")
+    assert info["path"] == str(tool)
+    assert info["version"].startswith("mkvmerge v8.2.0")
+    assert info["capabilities"] == {"identify_json": False, "json_option_files": False, "gui_mode": True}
+    assert not dm.has_capability("mkvmerge", "identify_json")
+
+    # A new start neither searches PATH nor runs the tool again
+    new_process(dm, monkeypatch)
+    monkeypatch.setattr(shutil, "which", lambda name: pytest.fail("PATH searched again"))
+    assert dm.tool_info("mkvmerge")["version"] == info["version"]
+    assert runs.read_text() == "x"
+
+def test_changed_binary_is_probed_again(dm, tmp_path, monkeypatch):
+    tool, runs = fake_tool(tmp_path, "mkvmerge", "mkvmerge v8.2.0 ('Old') 64-bit")
+    dm.tool_info("mkvmerge")
+
+    new_process(dm, monkeypatch)
+    fake_tool(tmp_path, "mkvmerge", "mkvmerge v88.0 ('New') 64-bit") # Upgrade: new size and mtime
+    info = dm.tool_info("mkvmerge")
+    assert info["version"].startswith("mkvmerge v88.0")
+    assert info["capabilities"]["identify_json"]
+    assert runs.read_text() == "xx"
+
+def test_misses_are_cached_and_lookups_thread_safe(dm, tmp_path, monkeypatch):
+    fake_tool(tmp_path, "mkvextract", "mkvextract v88.0")
+    searches = []
+    real_which = shutil.which
+    monkeypatch.setattr(shutil, "which", lambda name: searches.append(name) or real_which(name))
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append((dm.get_binary_path("no-such-tool"),
+                                                               dm.get_binary_path("mkvextract"))))
+               for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert set(results) == {("no-such-tool", str(tmp_path / "bin" / "mkvextract"))}
+    assert sorted(searches) == ["mkvextract", "no-such-tool"] # One search each, misses included
+
+def test_too_old_mkvmerge_is_reported(dm, tmp_path):
+    fake_tool(tmp_path, "mkvmerge", "mkvmerge v8.2.0 ('Old') 64-bit")
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0" * 64)
+    with pytest.raises(RuntimeError, match="9.0 or newer"):
+        get_mkv_info(str(clip))
+
+def test_tool_on_path_replaces_managed_copy(dm, tmp_path, monkeypatch):
+    managed = tmp_path / "managed"
+    managed.mkdir()
+    monkeypatch.setattr(dm, "bin_dir", str(managed))
+    (managed / "mkvmerge").write_text("#!/bin/sh\n")
+    (managed / "mkvmerge").chmod(0o755)
+    assert dm.get_binary_path("mkvmerge") == str(managed / "mkvmerge")
+
+    # Installed system-wide later (the PATH string is unchanged)
+    new_process(dm, monkeypatch)
+    tool, _ = fake_tool(tmp_path, "mkvmerge", "mkvmerge v88.0")
+    assert dm.get_binary_path("mkvmerge") == str(tool)
+
+def test_version_probe_does_not_block_lookups(dm, tmp_path):
+    slow = tmp_path / "bin" / "mkvmerge"
+    slow.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(1)\nprint('mkvmerge v88.0')\n")
+    slow.chmod(0o755)
+    fake_tool(tmp_path, "mkvextract", "mkvextract v88.0")
+    dm.get_binary_path("mkvmerge")
+
+    probe = threading.Thread(target=dm.tool_info, args=("mkvmerge",))
+    probe.start()
+    time.sleep(0.2) # mkvmerge --version is running
+    started = time.monotonic()
+    assert dm.get_binary_path("mkvextract") == str(tmp_path / "bin" / "mkvextract")
+    assert time.monotonic() - started < 0.5
+    probe.join()
+    assert dm.tool_info("mkvmerge")["version"] == "mkvmerge v88.0"
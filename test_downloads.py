@@ -0,0 +1,240 @@
+import io
+import os
+import time
+import hashlib
+import tarfile
+import zipfile
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from utils import downloader
+from utils.downloader import download, fetch_checksum, ChecksumError
+from utils.dependency_manager import DependencyManager
+
+PAYLOAD = bytes(range(256)) * 4096 # 1 MB
+
+class FakeServer:
+    """
+    Local stand-in for the download hosts. Serves files by path with Range
+    support; per-path options simulate slow links, dropped connections and
+    servers that ignore Range.
+    """
+    def __init__(self):
+        self.files = {}
+        self.etags = {} # path -> ETag sent with the file
+        self.requests = [] # (path, Range header)
+        self.delay = 0.0
+        self.drop_first_after = None # Bytes sent before the first response is cut off
+        self.ignore_range = False
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("Range")))
+                data = server.files.get(self.path)
+                if data is None:
+                    self.send_error(404)
+                    return
+                time.sleep(server.delay)
+
+                start = 0
+                range_header = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                if if_range is not None and if_range != server.etags.get(self.path):
+                    range_header = None # Changed since: send the whole file
+                if range_header and not server.ignore_range:
+                    start = int(range_header.split("=")[1].rstrip("-"))
+                    if start >= len(data):
+                        self.send_error(416)
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+                else:
+                    self.send_response(200)
+                body = data[start:]
+                self.send_header("Content-Length", str(len(body)))
+                if self.path in server.etags:
+                    self.send_header("ETag", server.etags[self.path])
+                self.end_headers()
+
+                if server.drop_first_after is not None:
+                    cut, server.drop_first_after = server.drop_first_after, None
+                    self.wfile.write(body[:cut])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+@pytest.fixture
+def server():
+    srv = FakeServer()
+    yield srv
+    srv.close()
+
+def test_download_verifies_and_reports_progress(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    dest = str(tmp_path / "pack.bin")
+    seen = []
+    download(server.url + "/pack.bin", dest, checksum=hashlib.sha256(PAYLOAD).hexdigest(),
+             on_progress=lambda done, total: seen.append((done, total)))
+
+    assert open(dest, "rb").read() == PAYLOAD
+    assert not os.path.exists(dest + downloader.PARTIAL_SUFFIX)
+    assert seen[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert len(seen) > 2 # Byte-level, not one event per file
+
+def test_download_resumes_partial_file(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    dest = str(tmp_path / "pack.bin")
+    with open(dest + downloader.PARTIAL_SUFFIX, "wb") as f:
+        f.write(PAYLOAD[:300_000])
+
+    download(server.url + "/pack.bin", dest, checksum=hashlib.sha256(PAYLOAD).hexdigest())
+    assert open(dest, "rb").read() == PAYLOAD
+    assert server.requests == [("/pack.bin", "bytes=300000-")]
+
+def test_download_retries_dropped_connection_from_where_it_stopped(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader, "CHUNK_SIZE", 64 * 1024)
+    server.files["/pack.bin"] = PAYLOAD
+    server.drop_first_after = 400_000
+    dest = str(tmp_path / "pack.bin")
+
+    download(server.url + "/pack.bin", dest, checksum=hashlib.sha256(PAYLOAD).hexdigest())
+    assert open(dest, "rb").read() == PAYLOAD
+    assert len(server.requests) == 2
+    assert server.requests[1][1] is not None and server.requests[1][1] != "bytes=0-"
+
+def test_download_restarts_when_release_changed(server, tmp_path):
+    # No checksum: only If-Range keeps the old partial file from being spliced onto the new release
+    new_release = bytes(reversed(PAYLOAD))
+    server.files["/pack.bin"] = new_release
+    server.etags["/pack.bin"] = '"v2"'
+    dest = str(tmp_path / "pack.bin")
+    with open(dest + downloader.PARTIAL_SUFFIX, "wb") as f:
+        f.write(PAYLOAD[:300_000])
+    with open(dest + downloader.VALIDATOR_SUFFIX, "w") as f:
+        f.write('"v1"')
+
+    download(server.url + "/pack.bin", dest)
+    assert open(dest, "rb").read() == new_release
+    assert not os.path.exists(dest + downloader.VALIDATOR_SUFFIX)
+
+def test_download_resumes_with_saved_validator(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    server.etags["/pack.bin"] = '"v1"'
+    server.drop_first_after = 400_000
+    dest = str(tmp_path / "pack.bin")
+    with pytest.raises(Exception):
+        download(server.url + "/pack.bin", dest, retries=0)
+    assert open(dest + downloader.VALIDATOR_SUFFIX).read() == '"v1"'
+
+    download(server.url + "/pack.bin", dest)
+    assert open(dest, "rb").read() == PAYLOAD
+    assert server.requests[-1][1] not in (None, "bytes=0-")
+
+def test_unverifiable_partial_file_is_not_resumed(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    dest = str(tmp_path / "pack.bin")
+    with open(dest + downloader.PARTIAL_SUFFIX, "wb") as f:
+        f.write(b"from an older release")
+
+    download(server.url + "/pack.bin", dest)
+    assert open(dest, "rb").read() == PAYLOAD
+    assert server.requests == [("/pack.bin", None)]
+
+def test_download_restarts_when_range_is_ignored(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    server.ignore_range = True
+    dest = str(tmp_path / "pack.bin")
+    with open(dest + downloader.PARTIAL_SUFFIX, "wb") as f:
+        f.write(b"stale bytes")
+
+    download(server.url + "/pack.bin", dest, checksum=hashlib.sha256(PAYLOAD).hexdigest())
+    assert open(dest, "rb").read() == PAYLOAD
+
+def test_checksum_mismatch_leaves_nothing_behind(server, tmp_path):
+    server.files["/pack.bin"] = PAYLOAD
+    server.files["/pack.bin.sha256"] = (hashlib.sha256(b"other").hexdigest() + "  pack.bin\n").encode()
+    dest = str(tmp_path / "pack.bin")
+
+    checksum = fetch_checksum(server.url + "/pack.bin.sha256")
+    with pytest.raises(ChecksumError):
+        download(server.url + "/pack.bin", dest, checksum=checksum)
+    assert os.listdir(tmp_path) == []
+
+def _tar_with(name):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:xz") as tar:
+        content = b"#!/bin/sh\n" + b"#" * 200_000
+        info = tarfile.TarInfo(f"pack/{name}")
+        info.size = len(content)
+        tar.addfile(info, io.BytesIO(content))
+    return buf.getvalue()
+
+def test_download_dependencies_fetches_packs_concurrently(server, tmp_path, monkeypatch):
+    server.delay = 0.6
+    urls = {}
+    for pack, tool in (("ffmpeg_pack", "ffmpeg"), ("mkvtoolnix_pack", "mkvmerge")):
+        archive = _tar_with(tool)
+        server.files[f"/{tool}.tar.xz"] = archive
+        urls[pack] = {"url": f"{server.url}/{tool}.tar.xz", "sha256": hashlib.sha256(archive).hexdigest(),
+                      "type": "tar", "contains": [tool]}
+
+    dm = DependencyManager()
+    monkeypatch.setattr(dm, "bin_dir", str(tmp_path))
+    monkeypatch.setattr(dm, "urls", urls)
+    monkeypatch.setattr(dm, "check_missing_dependencies", lambda: ["ffmpeg", "mkvmerge"])
+    events = []
+
+    started = time.monotonic()
+    dm.download_dependencies(lambda current, total, message: events.append((current, total, message)))
+    elapsed = time.monotonic() - started
+
+    assert sorted(os.listdir(tmp_path)) == ["ffmpeg", "mkvmerge"] # Archives removed after extraction
+    assert os.access(tmp_path / "ffmpeg", os.X_OK)
+    assert elapsed < 2 * server.delay # Sequential downloads would take at least the sum
+    total = sum(len(data) for data in server.files.values())
+    assert events[-1][:2] == (total, total)
+    assert any("Downloading" in message for _, _, message in events)
+
+def _zip_with(name):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr(name, b"#!/bin/sh\n" + name.encode() * 50_000)
+    return buf.getvalue()
+
+def test_packs_sharing_a_url_basename_do_not_collide(server, tmp_path, monkeypatch):
+    # Like the macOS ffmpeg and ffprobe packs, both served from URLs ending in /zip
+    server.delay = 0.3
+    urls = {}
+    for pack, path in (("ffmpeg", "/getrelease/zip"), ("ffprobe", "/getrelease/ffprobe/zip")):
+        server.files[path] = _zip_with(pack)
+        urls[pack] = {"url": server.url + path, "type": "zip", "contains": [pack]}
+
+    dm = DependencyManager()
+    monkeypatch.setattr(dm, "bin_dir", str(tmp_path))
+    monkeypatch.setattr(dm, "urls", urls)
+    monkeypatch.setattr(dm, "check_missing_dependencies", lambda: ["ffmpeg", "ffprobe"])
+    dests = []
+    real_download = downloader.download
+    monkeypatch.setattr(downloader, "download", lambda url, dest, **kwargs: (dests.append(dest),
+                                                                            real_download(url, dest, **kwargs)))
+    dm.download_dependencies()
+
+    assert len(set(dests)) == 2 # Each pack has an archive (and partial file) of its own
+    assert sorted(os.listdir(tmp_path)) == ["ffmpeg", "ffprobe"]
+    for tool in ("ffmpeg", "ffprobe"):
+        assert (tmp_path / tool).read_bytes().endswith(tool.encode() * 10)
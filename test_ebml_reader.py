@@ -0,0 +1,125 @@
+import os
+import json
+import struct
+
+import pytest
+
+from utils import ebml_reader as E
+from utils.ebml_reader import read_mkv_info, EBMLError
+from utils.dependency_manager import DependencyManager
+from utils.probe_cache import ProbeCache
+from utils.mkv_wrapper import get_mkv_info
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+# Handcrafted EBML: every size is written as an 8 byte vint, so offsets can be computed up front
+
+def el(eid, payload=b"", unknown_size=False):
+    size = UNKNOWN_SIZE if unknown_size else b"\x01" + len(payload).to_bytes(7, "big")
+    return eid.to_bytes((eid.bit_length() + 7) // 8, "big") + size + payload
+
+def uint(eid, value, width=None):
+    return el(eid, value.to_bytes(width or max(1, (value.bit_length() + 7) // 8), "big"))
+
+def string(eid, text):
+    return el(eid, text.encode("utf-8"))
+
+def double(eid, value):
+    return el(eid, struct.pack(">d", value))
+
+EBML = el(E.EBML_HEADER, string(E.DOC_TYPE, "matroska") + uint(E.DOC_TYPE_READ_VERSION, 2))
+
+INFO = el(E.INFO, uint(E.TIMESTAMP_SCALE, 1000000) + double(E.DURATION, 1500.0) + string(E.TITLE, "Pilot")
+          + string(E.MUXING_APP, "test"))
+
+def track(number, track_type, codec, uid, *extra):
+    return el(E.TRACK_ENTRY, uint(E.TRACK_NUMBER, number) + uint(E.TRACK_UID, uid) + uint(E.TRACK_TYPE, track_type)
+              + string(E.CODEC_ID, codec) + b"".join(extra))
+
+TRACKS = el(E.TRACKS,
+            track(1, 1, "V_MPEG4/ISO/AVC", 11,
+                  el(E.VIDEO, uint(E.PIXEL_WIDTH, 1920) + uint(E.PIXEL_HEIGHT, 1080)))
+            + track(2, 2, "A_TRUEHD", 22, string(E.LANGUAGE, "jpn"),
+                    el(E.AUDIO, double(E.SAMPLING_FREQUENCY, 48000.0) + uint(E.CHANNELS, 8)))
+            + track(3, 17, "S_TEXT/UTF8", 33, string(E.LANGUAGE, "por"), string(E.NAME, "Full"),
+                    uint(E.FLAG_DEFAULT, 0), uint(E.FLAG_FORCED, 1)))
+
+TAGS = el(E.TAGS, el(E.TAG, el(E.TARGETS, uint(E.TAG_TRACK_UID, 22))
+                            + el(E.SIMPLE_TAG, string(E.TAG_NAME, "BPS") + string(E.TAG_STRING, "4800000"))))
+
+CLUSTER = el(E.CLUSTER, b"\0" * 4096)
+
+def seek_head(entries):
+    """entries: [(element id, position in the segment)]"""
+    return el(E.SEEK_HEAD, b"".join(
+        el(E.SEEK, uint(E.SEEK_ID, eid) + uint(E.SEEK_POSITION, pos, width=8)) for eid, pos in entries))
+
+def segment(children, unknown_size=False):
+    return el(E.SEGMENT, b"".join(children), unknown_size=unknown_size)
+
+def indexed_segment(children):
+    """A Segment starting with a SeekHead that points at each (id, bytes) child."""
+    head_len = len(seek_head([(eid, 0) for eid, _ in children]))
+    entries, pos = [], head_len
+    for eid, data in children:
+        entries.append((eid, pos))
+        pos += len(data)
+    return segment([seek_head(entries)] + [data for _, data in children])
+
+def write(tmp_path, data, name="test.mkv"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def test_reads_info_and_tracks(tmp_path):
+    info = read_mkv_info(write(tmp_path, EBML + segment([INFO, TRACKS])))
+
+    props = info["container"]["properties"]
+    assert props["title"] == "Pilot"
+    assert props["duration"] == 1500 * 1000000
+    video, audio, subs = info["tracks"]
+    assert (video["type"], video["codec"]) == ("video", "AVC/H.264/MPEG-4p10")
+    assert video["properties"]["pixel_dimensions"] == "1920x1080"
+    assert (audio["codec"], audio["properties"]["language"], audio["properties"]["audio_channels"]) == ("TrueHD", "jpn", 8)
+    assert subs["properties"]["track_name"] == "Full"
+    assert subs["properties"]["default_track"] is False
+    assert subs["properties"]["forced_track"] is True
+    assert [t["id"] for t in info["tracks"]] == [0, 1, 2]
+
+def test_seek_head_reaches_tags_past_the_clusters(tmp_path, monkeypatch):
+    # Tags are written after the media; only the SeekHead says where
+    monkeypatch.setattr(E, "HEAD_WINDOW", 256) # Tags lie outside the mapped head, read with a positioned read
+    data = EBML + indexed_segment([(E.INFO, INFO), (E.TRACKS, TRACKS), (E.CLUSTER, CLUSTER), (E.TAGS, TAGS)])
+    info = read_mkv_info(write(tmp_path, data))
+    assert info["tracks"][1]["properties"]["tag_bps"] == "4800000"
+    assert "tag_bps" not in info["tracks"][0]["properties"]
+
+def test_unknown_size_segment_and_cluster(tmp_path):
+    # As written by live muxers: sizes are never filled in, and no SeekHead
+    data = EBML + segment([INFO, TRACKS, el(E.CLUSTER, b"\0" * 64, unknown_size=True)], unknown_size=True)
+    info = read_mkv_info(write(tmp_path, data))
+    assert len(info["tracks"]) == 3
+
+def test_truncated_file_raises_ebml_error(tmp_path):
+    data = EBML + segment([INFO, TRACKS])
+    tracks_start = len(data) - len(TRACKS)
+    for cut in [1, 4, len(EBML) - 1, len(EBML) + 6, tracks_start + 20, len(data) - 1]:
+        with pytest.raises(EBMLError):
+            read_mkv_info(write(tmp_path, data[:cut]))
+    with pytest.raises(EBMLError):
+        read_mkv_info(write(tmp_path, b""))
+
+@pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+def test_unsupported_file_falls_back_to_mkvmerge(tmp_path, monkeypatch, fake_tool):
+    # A track type the reader does not handle (complex = 3) sends get_mkv_info to mkvmerge -J
+    odd_tracks = el(E.TRACKS, track(1, 3, "V_UNCOMMON", 44))
+    path = write(tmp_path, EBML + segment([INFO, odd_tracks]))
+    with pytest.raises(EBMLError):
+        read_mkv_info(path)
+
+    identify = {"container": {"type": "Matroska"}, "tracks": [{"id": 0, "type": "video", "codec": "Uncommon"}]}
+    fake_tool(f"print({json.dumps(json.dumps(identify))})", install=True)
+    monkeypatch.setattr(DependencyManager(), "has_capability", lambda name, capability: True)
+    monkeypatch.setattr(ProbeCache(), "_conn", None)
+    monkeypatch.setattr(ProbeCache(), "_disabled", True) # Neither served from nor written to the user's cache
+    assert get_mkv_info(path) == identify
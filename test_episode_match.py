@@ -0,0 +1,45 @@
+import pytest
+
+from utils.episode_match import (parse_episode, match_episodes,
+                                 MATCH_SEASON_EPISODE, MATCH_EPISODE, MATCH_NAME)
+
+@pytest.mark.parametrize("filename, expected", [
+    ("Show.S01E05.1080p.WEB.x264.mkv", (1, 5)),
+    ("show.s2e10.srt", (2, 10)),
+    ("Show 1x05 - Pilot.en.srt", (1, 5)),
+    ("Show.Name.2019.E07.720p.mkv", (None, 7)),
+    ("Show Name Episode 3.mkv", (None, 3)),
+    ("[Group] Show - 05 [1080p].mkv", (None, 5)),
+    ("[Group] Show - 12 (BD 1080p h.264 AAC5.1).mkv", (None, 12)),
+    ("Show - 05v2.mkv", (None, 5)),
+    ("Movie.mkv", None),
+])
+def test_parse_episode(filename, expected):
+    assert parse_episode(filename) == expected
+
+def test_season_with_several_languages_per_episode():
+    videos = [f"/v/Show.S01E{i:02d}.1080p.mkv" for i in range(1, 25)]
+    subs = [f"/s/Show.S01E{i:02d}.{lang}.srt" for i in range(24, 0, -1) for lang in ("en", "pt-br")]
+    matches, unmatched = match_episodes(videos, subs + ["/s/notes.srt"])
+
+    assert unmatched == ["/s/notes.srt"]
+    for i, match in enumerate(matches, start=1):
+        assert match["method"] == MATCH_SEASON_EPISODE
+        assert sorted(match["subs"]) == [f"/s/Show.S01E{i:02d}.en.srt", f"/s/Show.S01E{i:02d}.pt-br.srt"]
+
+def test_episode_number_and_name_fallbacks():
+    videos = ["/v/[Group] Show - 03 [720p].mkv", "/v/Show.S01E04.mkv", "/v/Special Pilot.mkv", "/v/Show - 09.mkv"]
+    subs = ["/s/Show 03.srt", "/s/Show 04.srt", "/s/Special Pilot.eng.srt", "/s/Show 08.srt"]
+    matches, unmatched = match_episodes(videos, subs)
+
+    assert [(m["subs"], m["method"]) for m in matches] == [
+        (["/s/Show 03.srt"], MATCH_EPISODE),
+        (["/s/Show 04.srt"], MATCH_EPISODE),
+        (["/s/Special Pilot.eng.srt"], MATCH_NAME),
+        ([], None), # "Show 08" looks alike but is another episode
+    ]
+    assert unmatched == ["/s/Show 08.srt"]
+
+def test_episode_numbers_are_not_matched_across_seasons():
+    matches, _ = match_episodes(["/v/Show - 05.mkv"], ["/s/Show.S01E05.srt", "/s/Show.S02E05.srt"])
+    assert matches[0]["subs"] == []
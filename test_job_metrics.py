@@ -0,0 +1,67 @@
+import os
+import json
+import pytest
+
+from utils.job_scheduler import JobScheduler, DONE
+from utils.job_metrics import JobMetrics, job_record
+from utils.mkv_wrapper import mux_mkv
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tools are shell scripts")
+
+# Burns some CPU, touches ~20 MB of memory and writes a 1 MB output, with mkvmerge progress lines
+BUSY_MKVMERGE = """
+out = args[args.index('-o') + 1]
+block = bytearray(20 * 1024 * 1024)
+total = sum(range(2_000_000))
+for p in (0, 50, 100):
+    print(f'#GUI#progress {p}%', flush=True)
+open(out, 'wb').write(b'x' * 1024 * 1024)
+"""
+
+@pytest.fixture
+def fake_mkvmerge(fake_tool):
+    return fake_tool(BUSY_MKVMERGE, install=True)
+
+@pytest.fixture
+def metrics(tmp_path, monkeypatch):
+    metrics = JobMetrics()
+    metrics.clear()
+    monkeypatch.setattr(metrics, "log_path", str(tmp_path / "metrics" / "job_metrics.jsonl"))
+    return metrics
+
+def _run_mux_job(tmp_path):
+    source = tmp_path / "in.mkv"
+    source.write_bytes(b"\0" * 2 * 1024 * 1024)
+    output = tmp_path / "out.mkv"
+    job = JobScheduler().submit("mux", lambda job: mux_mkv(str(output), [str(source)], limits=job.limits),
+                                inputs=[str(source)], outputs=[str(output)])
+    success, msg = job.future.result(timeout=10)
+    assert success, msg
+    return job
+
+def test_job_record_reports_tool_usage_and_bytes(tmp_path, fake_mkvmerge, metrics):
+    job = _run_mux_job(tmp_path)
+    record = job_record(job)
+
+    assert record["state"] == DONE
+    assert record["input_bytes"] == 2 * 1024 * 1024
+    assert record["output_bytes"] == 1024 * 1024
+    assert record["tool_runs"] == 1
+    assert record["wall_s"] > 0
+    assert record["mb_per_s"] > 0
+    assert record["cpu_s"] > 0
+    assert record["peak_rss_bytes"] > 20 * 1024 * 1024
+
+def test_records_are_logged_and_exported(tmp_path, fake_mkvmerge, metrics):
+    job = _run_mux_job(tmp_path)
+    assert job.finished is not None # Set, and the record written, before the future resolves
+
+    with open(metrics.log_path, encoding="utf-8") as f:
+        logged = [json.loads(line) for line in f]
+    assert [r["job_id"] for r in logged] == [job.id]
+
+    export_path = tmp_path / "export.jsonl"
+    metrics.export(str(export_path))
+    exported = [json.loads(line) for line in export_path.read_text().splitlines()]
+    assert exported == metrics.records()
+    assert exported[0]["input_bytes"] == 2 * 1024 * 1024
@@ -1,65 +1,123 @@
-import re
-import os
+import pytest
 
-languages = [
-    "eng (English)", "spa (Spanish)", "por (Portuguese)", "fra (French)", 
-    "deu (German)", "ita (Italian)", "jpn (Japanese)", "chi (Chinese)", 
-    "rus (Russian)", "kor (Korean)", "ara (Arabic)", "hin (Hindi)"
-]
+from utils.languages import detect_language, detect_language_code, normalize, menu_entry, menu_entries
 
-# Map common codes to our list keys
-LANG_MAP = {
-    'en': 'eng', 'eng': 'eng', 'english': 'eng', 'en-us': 'eng', 'en-gb': 'eng',
-    'pt': 'por', 'por': 'por', 'portuguese': 'por', 'pt-br': 'por', 'pob': 'por',
-    'es': 'spa', 'spa': 'spa', 'spanish': 'spa', 'esp': 'spa',
-    'fr': 'fra', 'fra': 'fra', 'french': 'fra',
-    'de': 'deu', 'deu': 'deu', 'german': 'deu', 'ger': 'deu',
-    'it': 'ita', 'ita': 'ita', 'italian': 'ita',
-    'ja': 'jpn', 'jpn': 'jpn', 'japanese': 'jpn', 'jp': 'jpn',
-    'zh': 'chi', 'chi': 'chi', 'chinese': 'chi', 'chn': 'chi', 'zho': 'chi',
-    'ru': 'rus', 'rus': 'rus', 'russian': 'rus',
-    'ko': 'kor', 'kor': 'kor', 'korean': 'kor',
-    'ar': 'ara', 'ara': 'ara', 'arabic': 'ara',
-    'hi': 'hin', 'hin': 'hin', 'hindi': 'hin'
+@pytest.mark.parametrize("filename, expected", [
+    ("subtitle.zh.srt", "zho (Chinese)"),
+    ("subtitlename.pt.srt", "por (Portuguese)"),
+    ("movie.pob.srt", "por (Portuguese)"),
+    ("film.pt-BR.srt", "por (Portuguese)"),
+    ("show.en-us.srt", "eng (English)"),
+    ("episode.ara.srt", "ara (Arabic)"),
+    ("title.hin.ass", "hin (Hindi)"),
+    ("random_movie_spa.sub", "spa (Spanish)"),
+    ("mixed.case.CHI.srt", "zho (Chinese)"),
+    ("delimited_by_underscore_eng.srt", "eng (English)"),
+    ("no_lang.srt", None),
+    # Beyond the original twelve languages
+    ("Movie.2019.nl.srt", "nld (Dutch)"),
+    ("Movie.Svenska.srt", "swe (Swedish)"),
+    ("Show.S01E01.pt_BR.forced.srt", "por (Portuguese)"),
+    ("anime.zh-Hant.ass", "zho (Chinese)"),
+    ("peli.es-419.srt", "spa (Spanish)"),
+    ("Film.Français.srt", "fra (French)"),
+    ("movie.sdh.en.srt", "eng (English)"),
+    # Codes that are also words only count as the last tag
+    ("It.Follows.2014.srt", None),
+    ("Movie_it.srt", "ita (Italian)"),
+    ("movie.und.srt", None),
+])
+def test_detect_language(filename, expected):
+    assert detect_language(filename) == expected
+
+def test_detect_language_ignores_directories():
+    assert detect_language_code("/media/en/Movie.srt") is None
+
+@pytest.mark.parametrize("code, expected", [
+    ("ger", "deu"), ("fre", "fra"), ("chi", "zho"), ("de", "deu"),
+    ("pt-BR", "por"), ("zh_Hant", "zho"), ("English", "eng"), ("xx", None), ("", None),
+])
+def test_normalize(code, expected):
+    assert normalize(code) == expected
+
+def test_menu_entries():
+    assert menu_entry("ger") == "deu (German)"
+    assert menu_entry("bogus") == "und (Undefined)"
+    entries = menu_entries(include_undefined=True)
+    assert entries[0] == "eng (English)" and entries[-1] == "und (Undefined)"
+    # Names are used as "name (code)" splits throughout the tabs
+    assert all(e.count("(") == 1 for e in menu_entries(["ell", "grc", "nob", "sot", "ton"]))
+
+# Content-based detection (second tier) for files without a language tag
+
+from utils.subtitle_language import detect_subtitle_language, classify_text, read_subtitle_text
+
+SRT_LINES = {
+    "eng": ["Where are you going?", "I told you, I don't know what happened.",
+            "We have to leave before the storm arrives.", "Nobody is going to believe this story.",
+            "Thank you for everything you have done for us."],
+    "por": ["Aonde você vai?", "Eu já te disse, não sei o que aconteceu.",
+            "Precisamos sair antes que a tempestade chegue.", "Ninguém vai acreditar nessa história.",
+            "Obrigado por tudo o que você fez por nós."],
+    "rus": ["Куда ты идёшь?", "Я же говорил тебе, я не знаю, что случилось.",
+            "Нам нужно уйти до того, как начнётся буря.", "Никто не поверит в эту историю.",
+            "Спасибо за всё, что ты для нас сделал."],
+    "jpn": ["どこへ行くの？", "言ったでしょう、何が起きたのか分からない。",
+            "嵐が来る前に出発しなければならない。", "誰もこの話を信じないだろう。",
+            "私たちのためにしてくれたこと、本当にありがとう。"],
+}
+
+def make_srt(lines, repeat=3):
+    blocks = []
+    for i, line in enumerate(lines * repeat, 1):
+        blocks.append(f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},900\n<i>{line}</i>\n")
+    return "\n".join(blocks)
+
+@pytest.mark.parametrize("code, encoding", [("eng", "utf-8"), ("por", "utf-8-sig"), ("rus", "cp1251"),
+                                            ("jpn", "utf-16"), ("por", "cp1252")])
+def test_detect_subtitle_language(tmp_path, code, encoding):
+    path = tmp_path / "untagged.srt"
+    path.write_bytes(make_srt(SRT_LINES[code]).encode(encoding))
+    assert detect_subtitle_language(str(path)) == code
+
+def test_detect_subtitle_language_ass(tmp_path):
+    events = [r"Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,{\i1}Wohin gehst du?{\i0}",
+              r"Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Ich habe dir gesagt,\Nich weiß nicht, was passiert ist.",
+              r"Dialogue: 0,0:00:05.00,0:00:06.00,Default,,0,0,0,,Wir müssen gehen, bevor der Sturm kommt.",
+              r"Dialogue: 0,0:00:07.00,0:00:08.00,Default,,0,0,0,,Niemand wird uns diese Geschichte glauben.",
+              r"Dialogue: 0,0:00:09.00,0:00:10.00,Default,,0,0,0,,Danke für alles, was du für uns getan hast."]
+    path = tmp_path / "untagged.ass"
+    path.write_text("[Script Info]\nTitle: Default Aegisub file\n\n[Events]\n"
+                    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+                    + "\n".join(events * 2), encoding="utf-8")
+    assert "Default" not in read_subtitle_text(str(path))
+    assert detect_subtitle_language(str(path)) == "deu"
+
+# A couple of lines of plain dialogue, the least a subtitle file gives to go on
+DIALOGUE = {
+    "eng": "Where were you last night? I waited for hours and you never called.",
+    "por": "Onde você estava ontem à noite? Eu esperei por horas e você nunca ligou.",
+    "spa": "¿Dónde estabas anoche? Te esperé durante horas y nunca llamaste.",
+    "deu": "Wo warst du gestern Abend? Ich habe stundenlang gewartet und du hast nie angerufen.",
+    "pol": "Gdzie byłeś wczoraj wieczorem? Czekałam na ciebie godzinami, a ty nigdy nie zadzwoniłeś.",
+    "rus": "Я не понимаю, о чём ты говоришь. Оставь меня в покое.",
+    "ukr": "Де ти був учора ввечері? Я чекала на тебе кілька годин, а ти так і не подзвонив.",
+    "bul": "Трябва да тръгвам. Обади ми се утре сутринта, става ли? Ще чакам.",
+    "srp": "Морам да идем. Позови ме сутра ујутру, важи? Чекаћу.",
 }
 
-def detect_language(filename):
-    # Remove extension first (.srt, .ass, etc)
-    basename = os.path.splitext(filename)[0]
-    
-    # Strategy 1: Look for language code at the end of the filename (e.g. movie.en, movie.pt-br)
-    # We split by '.' or '_' or '-' or ' '
-    parts = re.split(r'[._\-\s]+', basename)
-    
-    # Iterate backwards through parts to find a match
-    for part in reversed(parts):
-        lower_part = part.lower()
-        if lower_part in LANG_MAP:
-            target_code = LANG_MAP[lower_part]
-            # Find the full string in languages list
-            for lang_str in languages:
-                if lang_str.startswith(target_code + " "):
-                    return lang_str
-    
-    return None
+@pytest.mark.parametrize("code", sorted(DIALOGUE))
+def test_classify_short_dialogue(code):
+    assert classify_text(DIALOGUE[code])[0] == code
 
-# Test cases
-test_files = [
-    "subtitle.zh.srt",
-    "subtitlename.pt.srt",
-    "movie.pob.srt",
-    "film.pt-BR.srt",
-    "show.en-us.srt",
-    "episode.ara.srt",
-    "title.hin.ass",
-    "random_movie_spa.sub",
-    "mixed.case.CHI.srt",
-    "delimited_by_underscore_eng.srt",
-    "no_lang.srt"
-]
+def test_detect_subtitle_language_unsure(tmp_path):
+    assert classify_text("Yes.")[0] is None
+    assert classify_text("00:01 12345 !!")[0] is None
+    assert detect_subtitle_language(str(tmp_path / "missing.srt")) is None
 
-print(f"{'Filename':<30} | {'Detected':<20}")
-print("-" * 55)
-for f in test_files:
-    res = detect_language(f)
-    print(f"{f:<30} | {res if res else 'None'}")
+def test_detect_subtitle_language_reads_only_the_head(tmp_path):
+    head = make_srt(SRT_LINES["eng"], repeat=2).encode("utf-8")
+    tail = make_srt(["C'est une très longue histoire que personne ne croira jamais."], repeat=2000)
+    path = tmp_path / "untagged.srt"
+    path.write_bytes(head + b"\n" + tail.encode("utf-8"))
+    assert detect_subtitle_language(str(path), max_bytes=len(head)) == "eng"
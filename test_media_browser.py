@@ -0,0 +1,79 @@
+from concurrent.futures import Future
+
+from utils.media_browser import (list_directory, filter_and_sort, natural_key, ProbePrefetcher,
+                                 SORT_SIZE)
+
+def make_tree(tmp_path):
+    (tmp_path / "Extras").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    for name, size in [("Show - 10.mkv", 30), ("Show - 2.mkv", 10), ("Show - 1.mp4", 20), ("notes.txt", 5)]:
+        (tmp_path / name).write_bytes(b"\0" * size)
+
+def test_list_directory_keeps_folders_and_videos(tmp_path):
+    make_tree(tmp_path)
+    names = sorted(e.name for e in list_directory(str(tmp_path)))
+    assert names == ["Extras", "Show - 1.mp4", "Show - 10.mkv", "Show - 2.mkv"]
+    assert ".hidden" in [e.name for e in list_directory(str(tmp_path), show_hidden=True)]
+
+def test_filter_and_sort(tmp_path):
+    make_tree(tmp_path)
+    entries = list_directory(str(tmp_path))
+
+    assert [e.name for e in filter_and_sort(entries)] == ["Extras", "Show - 1.mp4", "Show - 2.mkv", "Show - 10.mkv"]
+    assert [e.name for e in filter_and_sort(entries, sort=SORT_SIZE, reverse=True)] == \
+        ["Extras", "Show - 10.mkv", "Show - 1.mp4", "Show - 2.mkv"]
+    assert [e.name for e in filter_and_sort(entries, text="MKV")] == ["Show - 2.mkv", "Show - 10.mkv"]
+    assert natural_key("E9") < natural_key("e10")
+
+class FakeProbe:
+    """Stands in for probe_file_async: records calls, futures are resolved by the test."""
+    def __init__(self):
+        self.calls = []
+        self.futures = {}
+
+    def __call__(self, path):
+        self.calls.append(path)
+        future = Future()
+        self.futures[path] = future
+        return future
+
+def test_prefetch_reuses_and_drops_probes(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"ep{i}.mkv"
+        path.write_bytes(b"x")
+        paths.append(str(path))
+    probe = FakeProbe()
+    prefetcher = ProbePrefetcher(probe=probe)
+
+    prefetcher.prefetch(paths[:3])
+    probe.futures[paths[0]].set_running_or_notify_cancel()
+    probe.futures[paths[0]].set_result({"tracks": []})
+    assert prefetcher.cached(paths[0]) == {"tracks": []}
+
+    # Selecting a prefetched file hands out the same, finished future
+    assert prefetcher.get(paths[0]) is probe.futures[paths[0]]
+
+    # The view moved on: queued probes out of view are cancelled, finished ones kept
+    prefetcher.prefetch(paths[3:])
+    assert probe.futures[paths[1]].cancelled() and probe.futures[paths[2]].cancelled()
+    assert prefetcher.cached(paths[0]) == {"tracks": []}
+    assert probe.calls == paths[:3] + paths[3:]
+
+def test_changed_or_failed_files_are_probed_again(tmp_path):
+    path = tmp_path / "ep1.mkv"
+    path.write_bytes(b"x")
+    probe = FakeProbe()
+    prefetcher = ProbePrefetcher(probe=probe)
+
+    first = prefetcher.get(str(path))
+    first.set_running_or_notify_cancel()
+    first.set_exception(RuntimeError("still copying"))
+    second = prefetcher.get(str(path))
+    assert second is not first
+
+    second.set_running_or_notify_cancel()
+    second.set_result({"tracks": []})
+    path.write_bytes(b"xy") # Rewritten: new size
+    assert prefetcher.get(str(path)) is not second
+    assert len(probe.calls) == 3
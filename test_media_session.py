@@ -0,0 +1,77 @@
+from concurrent.futures import Future
+
+import pytest
+
+from utils.media_session import MediaSession, EVENT_FILE, EVENT_EDITS
+
+@pytest.fixture
+def session(monkeypatch):
+    """The MediaSession, emptied, with a probe that records its calls instead of running a tool."""
+    session = MediaSession()
+    probes = []
+
+    def fake_probe(path):
+        future = Future()
+        future.set_result({"tracks": [{"id": 0, "type": "video"}], "path": path})
+        probes.append(path)
+        return future
+
+    monkeypatch.setattr(session, "_probe", fake_probe)
+    monkeypatch.setattr(session, "_listeners", [])
+    session.clear()
+    session.probes = probes
+    yield session
+    session.clear()
+    del session.probes
+
+def test_reopening_the_same_file_reuses_probe_and_edits(session):
+    events = []
+    session.add_listener(lambda event, source: events.append((event, source)))
+
+    first = session.open("/media/a.mkv", source="extract")
+    session.set_edits(2, source="edit", language="por", default=True)
+    again = session.open("/media/a.mkv", source="mixer") # Another tab on the same file
+
+    assert again is first
+    assert session.probes == ["/media/a.mkv"]
+    assert session.track_edits(2) == {"language": "por", "default": True}
+    assert events == [(EVENT_FILE, "extract"), (EVENT_EDITS, "edit")]
+
+def test_unchanged_edits_are_not_announced(session):
+    session.open("/media/a.mkv")
+    events = []
+    session.add_listener(lambda event, source: events.append(event))
+    session.set_edits(1, name="Commentary")
+    session.set_edits(1, name="Commentary")
+    assert events == [EVENT_EDITS]
+
+def test_other_file_drops_edits_and_failed_probe_is_repeated(session):
+    session.open("/media/a.mkv")
+    session.set_edits(1, keep=False)
+    session.open("/media/b.mkv")
+    assert session.track_edits(1) == {}
+
+    failed = Future()
+    failed.set_exception(RuntimeError("unreadable"))
+    session.open("/media/c.mkv", probe=failed) # e.g. the browser's prefetch failed
+    assert session.probe is not failed
+    session.open("/media/c.mkv")
+    assert session.probes == ["/media/a.mkv", "/media/b.mkv", "/media/c.mkv"]
+
+def test_reload_probes_again_after_in_place_edit(session):
+    first = session.open("/media/a.mkv")
+    session.set_edits(1, language="eng")
+    assert session.reload() is not first
+    assert session.track_edits(1) == {}
+    assert session.probes == ["/media/a.mkv", "/media/a.mkv"]
+
+def test_file_rewritten_on_disk_is_probed_again(session, tmp_path):
+    video = tmp_path / "a.mkv"
+    video.write_bytes(b"\0" * 1024)
+    first = session.open(str(video))
+    session.set_edits(1, language="eng")
+
+    video.write_bytes(b"\0" * 2048) # Remuxed by another tab or program
+    assert session.open(str(video)) is not first
+    assert session.track_edits(1) == {}
+    assert session.probes == [str(video), str(video)]
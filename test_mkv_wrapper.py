@@ -0,0 +1,23 @@
+import os
+import json
+
+import pytest
+
+from utils.mkv_wrapper import edit_properties
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+
+def test_edit_properties_selects_tracks_by_uid(tmp_path, fake_tool):
+    log = tmp_path / "args.json"
+    fake_tool(f"open({str(log)!r}, 'w').write(__import__('json').dumps(args))", name="mkvpropedit", install=True)
+    # mkvmerge IDs need not follow the order of the tracks in the file
+    info = {"tracks": [{"id": 0, "properties": {"uid": 9001}}, {"id": 1, "properties": {"uid": 42}},
+                       {"id": 2, "properties": {}}]}
+
+    success, _ = edit_properties("movie.mkv", {1: {"language": "jpn", "name": ""}}, info=info)
+    assert success
+    assert json.loads(log.read_text()) == ["movie.mkv", "--edit", "track:=42", "--set", "language=jpn",
+                                           "--delete", "name"]
+
+    success, msg = edit_properties("movie.mkv", {2: {"language": "jpn"}}, info=info)
+    assert not success and "UID" in msg
@@ -0,0 +1,107 @@
+import os
+import json
+import itertools
+import types
+import sqlite3
+
+import pytest
+
+from utils import probe_cache
+from utils.probe_cache import ProbeCache
+from utils.dependency_manager import DependencyManager
+from utils.mkv_wrapper import get_mkv_info
+
+INFO = {"tracks": [{"id": 0, "type": "video"}]}
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """The ProbeCache on a database of its own, with an in-process tool "fake" at version 1."""
+    cache = ProbeCache()
+    monkeypatch.setattr(cache, "db_path", str(tmp_path / "cache" / "probe_cache.sqlite"))
+    monkeypatch.setattr(cache, "_conn", None)
+    monkeypatch.setattr(cache, "_disabled", False)
+    monkeypatch.setattr(cache, "_tool_stamps", {})
+    monkeypatch.setattr(cache, "_builtin_stamps", {})
+    cache.register_builtin_tool("fake", "1")
+    yield cache
+    if cache._conn is not None:
+        cache._conn.close()
+
+def media(tmp_path, name="a.mkv", data=b"\0" * 100):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+def test_hit_until_file_or_tool_changes(cache, tmp_path):
+    path = media(tmp_path)
+    cache.put(path, "fake", INFO)
+    assert cache.get(path, "fake") == INFO
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+    assert cache.get(path, "fake") is None # mtime_ns
+
+    cache.put(path, "fake", INFO)
+    with open(path, "ab") as f:
+        f.write(b"\0")
+    st = os.stat(path)
+    assert cache.get(path, "fake") is None # size
+
+    cache.put(path, "fake", INFO)
+    # Replaced by another file with the same size and mtime: only the inode tells them apart
+    replacement = media(tmp_path, "a.tmp", b"\1" * st.st_size)
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(replacement, path)
+    assert os.stat(path).st_ino != st.st_ino
+    assert cache.get(path, "fake") is None # inode
+
+    cache.put(path, "fake", INFO)
+    cache.register_builtin_tool("fake", "2") # Upgraded prober
+    assert cache.get(path, "fake") is None
+
+def test_lru_eviction_respects_entry_limit(cache, tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr(probe_cache, "time", types.SimpleNamespace(time=lambda: next(clock)))
+    monkeypatch.setattr(cache, "max_entries", 2)
+    a, b, c = (media(tmp_path, name) for name in ("a.mkv", "b.mkv", "c.mkv"))
+
+    cache.put(a, "fake", INFO)
+    cache.put(b, "fake", INFO)
+    assert cache.get(a, "fake") == INFO # a is now the most recently used
+    cache.put(c, "fake", INFO)
+
+    assert cache.get(b, "fake") is None
+    assert cache.get(a, "fake") == INFO
+    assert cache.get(c, "fake") == INFO
+
+def test_byte_limit_evicts_too(cache, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "max_bytes", len(json.dumps(INFO)) + 10)
+    a, b = media(tmp_path, "a.mkv"), media(tmp_path, "b.mkv")
+    cache.put(a, "fake", INFO)
+    cache.put(b, "fake", INFO)
+    assert cache.get(a, "fake") is None
+    assert cache.get(b, "fake") == INFO
+
+@pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+@pytest.mark.parametrize("broken", ["corrupt", "locked"])
+def test_broken_database_falls_back_to_live_probe(cache, tmp_path, monkeypatch, fake_tool, broken):
+    os.makedirs(os.path.dirname(cache.db_path))
+    if broken == "corrupt":
+        with open(cache.db_path, "wb") as f:
+            f.write(b"not a database" * 100)
+    else:
+        # Another process holds an exclusive lock on a valid database
+        other = sqlite3.connect(cache.db_path, isolation_level=None)
+        other.execute("CREATE TABLE t (x)")
+        other.execute("BEGIN EXCLUSIVE")
+        connect = sqlite3.connect
+        monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: connect(*args, **{**kwargs, "timeout": 0.1}))
+
+    path = media(tmp_path, "movie.avi") # Not Matroska: probed by mkvmerge -J
+    fake_tool(f"print({json.dumps(json.dumps(INFO))})", install=True)
+    monkeypatch.setattr(DependencyManager(), "has_capability", lambda name, capability: True)
+    assert get_mkv_info(path) == INFO
+    assert get_mkv_info(path) == INFO # Still probed live, not an error
+    assert cache._disabled
+    if broken == "locked":
+        other.close()
@@ -0,0 +1,52 @@
+import os
+import time
+import threading
+import pytest
+
+from utils.process_runner import run_streaming, Limits, ProcessAborted
+from utils.job_scheduler import JobScheduler, CANCELLED
+from utils.mkv_wrapper import mux_mkv
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tools are shell scripts")
+
+HANG = "time.sleep(30)"
+PROGRESS_THEN_HANG = "print('#GUI#progress 10%', flush=True)\ntime.sleep(30)"
+STEADY_PROGRESS = "for p in range(0, 101, 5):\n    print(f'#GUI#progress {p}%', flush=True)\n    time.sleep(0.05)"
+
+def test_cancel_event_kills_tool(fake_tool):
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    started = time.monotonic()
+    with pytest.raises(ProcessAborted) as e:
+        run_streaming([fake_tool(HANG)], limits=Limits(cancel_event, None, None))
+    assert e.value.reason == "cancelled"
+    assert time.monotonic() - started < 5
+
+def test_timeout_kills_tool(fake_tool):
+    with pytest.raises(ProcessAborted) as e:
+        run_streaming([fake_tool(HANG)], limits=Limits(None, 0.3, None))
+    assert e.value.reason == "timeout"
+
+def test_stall_watchdog(fake_tool):
+    with pytest.raises(ProcessAborted) as e:
+        run_streaming([fake_tool(PROGRESS_THEN_HANG)], limits=Limits(None, None, 0.4))
+    assert e.value.reason == "stalled"
+
+    # Steady progress keeps a tool alive well past the stall interval
+    result = run_streaming([fake_tool(STEADY_PROGRESS)], limits=Limits(None, None, 0.4))
+    assert result.returncode == 0
+
+def test_cancelled_job_frees_slot_and_removes_temp_output(tmp_path, fake_tool):
+    fake_tool("open(args[args.index('-o') + 1], 'wb').write(b'partial')\n" + PROGRESS_THEN_HANG, install=True)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    job = JobScheduler().submit("mux", lambda job: mux_mkv(str(out_dir / "movie.mkv"), ["in.mkv"], limits=job.limits))
+    deadline = time.monotonic() + 5
+    while not os.listdir(out_dir) and time.monotonic() < deadline:
+        time.sleep(0.02) # Wait for the tool to start writing
+    job.cancel()
+    success, msg = job.future.result(timeout=5)
+    assert not success and msg == "Cancelled"
+    assert job.state == CANCELLED
+    assert os.listdir(out_dir) == []
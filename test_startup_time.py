@@ -0,0 +1,68 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Everything imported before the first frame paints: the app shell and the default tab.
+STARTUP_MODULES = ["main", "modules.extractor"]
+
+# Cumulative import time allowed for STARTUP_MODULES, in microseconds.
+# customtkinter alone is ~100 ms on a desktop; Crostini runs ~2-3x slower.
+IMPORT_BUDGET_US = 400_000
+
+def _importtime(code):
+    """Runs code in a fresh interpreter with -X importtime; returns {module: cumulative_us}."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            pass # Header line
+    return times
+
+def test_cold_start_import_budget():
+    times = _importtime("; ".join(f"import {m}" for m in STARTUP_MODULES))
+    total = sum(times[m] for m in STARTUP_MODULES)
+    slowest = sorted(times.items(), key=lambda kv: kv[1], reverse=True)[:10]
+    assert total <= IMPORT_BUDGET_US, (
+        f"Cold start imports took {total / 1000:.0f} ms (budget {IMPORT_BUDGET_US / 1000:.0f} ms). "
+        f"Slowest: {slowest}")
+
+def test_startup_imports_do_no_probing():
+    code = (
+        "import shutil\n"
+        "calls = []\n"
+        "real_which = shutil.which\n"
+        "shutil.which = lambda *a, **k: calls.append(a) or real_which(*a, **k)\n"
+        "import main\n"
+        "from utils import file_dialogs\n"
+        "assert file_dialogs._dialog_paths is None, 'dialog tools resolved at import'\n"
+        "assert not calls, f'shutil.which called at import: {calls}'\n"
+        "import sys\n"
+        "lazy = [m for m in ('modules.mixer', 'modules.editor', 'modules.creator') if m in sys.modules]\n"
+        "assert not lazy, f'tabs imported before they are opened: {lazy}'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+def test_cli_never_imports_tk():
+    code = (
+        "import sys, cli\n"
+        "cli.build_parser()\n"
+        "tk = [m for m in sys.modules if m.split('.')[0] in ('tkinter', '_tkinter', 'customtkinter')]\n"
+        "assert not tk, tk\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,151 @@
+import os
+import sys
+import json
+import time
+import threading
+import pytest
+
+from utils.dependency_manager import DependencyManager
+from utils.batch_extract import STATUS_QUEUED, STATUS_DONE
+from utils.watch_folder import (FolderWatcher, WatchOperation, StabilityTracker, OP_ADD_SUBS,
+                                STATUS_WAITING)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake tool is a shell script")
+
+SUBTITLE = "1\n00:00:01,000 --> 00:00:02,000\nOlá, tudo bem?\n"
+
+@pytest.fixture
+def fake_mkvmerge(tmp_path, monkeypatch):
+    """mkvmerge logging its arguments and the size of the episode it read to mkvmerge.log."""
+    log = tmp_path / "mkvmerge.log"
+    tool = tmp_path / "mkvmerge"
+    tool.write_text(f"#!{sys.executable}\n"
+                    "import os, sys, json, time\n"
+                    "args = sys.argv[1:]\n"
+                    "out = args[args.index('-o') + 1]\n"
+                    "video = args[args.index('-o') + 2]\n"
+                    f"open({str(log)!r}, 'a').write(json.dumps([args, os.path.getsize(video)]) + '\\n')\n"
+                    "time.sleep(float(os.environ.get('FAKE_MKVMERGE_DELAY', '0')))\n"
+                    "open(out, 'wb').write(b'muxed')\n")
+    tool.chmod(0o755)
+    monkeypatch.setattr(DependencyManager(), "get_binary_path", lambda name: str(tool))
+    return log
+
+class Events:
+    def __init__(self):
+        self.items = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path, status, detail):
+        with self.lock:
+            self.items.append((os.path.basename(path), status))
+
+    def wait_for(self, count, status=STATUS_DONE, timeout=15):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.lock:
+                if sum(1 for _, s in self.items if s == status) >= count:
+                    return
+            time.sleep(0.05)
+        pytest.fail(f"timed out waiting for {count} '{status}': {self.items}")
+
+def start(watcher):
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    return thread
+
+def test_stability_tracker_waits_for_settled_files():
+    now = [0.0]
+    tracker = StabilityTracker(settle=5, clock=lambda: now[0])
+    tracker.observe("a.mkv", 100, 1)
+    tracker.observe("empty.mkv", 0, 1)
+    now[0] = 4
+    tracker.observe("a.mkv", 200, 2) # Still growing
+    now[0] = 8
+    assert tracker.pop_ready() == [("empty.mkv", 0, 1)] # Settled too; the watcher skips empty files
+    now[0] = 9
+    assert tracker.pop_ready() == [("a.mkv", 200, 2)]
+    assert tracker.pending() == []
+
+def test_operation_round_trips_through_json(tmp_path):
+    op = WatchOperation(OP_ADD_SUBS, output_dir="out", default_language="pt-BR")
+    op.save(str(tmp_path / "op.json"))
+    loaded = WatchOperation.load(str(tmp_path / "op.json"))
+    assert loaded.to_dict() == op.to_dict()
+    assert loaded.default_language == "por"
+    with pytest.raises(ValueError):
+        WatchOperation.from_dict({"operation": "extract", "colour": "red"})
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_new_episode_is_muxed_once_written(tmp_path, fake_mkvmerge, use_inotify):
+    folder = tmp_path / "hot"
+    folder.mkdir()
+    events = Events()
+    watcher = FolderWatcher(str(folder), WatchOperation(OP_ADD_SUBS, default_language="por"), on_status=events,
+                            settle=0.4, interval=0.05, use_inotify=use_inotify)
+    thread = start(watcher)
+
+    # A slow copy: the episode grows for a while before its subtitle arrives
+    video = folder / "Show.S01E01.mkv"
+    with open(video, "wb") as f:
+        for _ in range(6):
+            f.write(b"\0" * 4096)
+            f.flush()
+            time.sleep(0.1)
+    (folder / "Show.S01E01.pt.srt").write_text(SUBTITLE, encoding="utf-8")
+
+    events.wait_for(1)
+    watcher.stop()
+    thread.join(timeout=5)
+    if use_inotify and sys.platform.startswith("linux"):
+        assert watcher.mode == "inotify"
+
+    runs = [json.loads(line) for line in fake_mkvmerge.read_text().splitlines()]
+    assert len(runs) == 1
+    args, size_read = runs[0]
+    assert size_read == 6 * 4096 # Not started before the copy was complete
+    assert args[args.index("--language") + 1] == "0:por"
+    assert args[args.index("--default-track-flag") + 1] == "0:1"
+    assert (folder / "Show.S01E01_muxed.mkv").read_bytes() == b"muxed"
+    statuses = [s for name, s in events.items if name == "Show.S01E01.mkv"]
+    assert statuses[0] == STATUS_WAITING
+
+def test_empty_subtitle_does_not_block_the_folder(tmp_path, fake_mkvmerge):
+    folder = tmp_path / "hot"
+    folder.mkdir()
+    (folder / "Other.S01E01.en.srt").write_bytes(b"") # Placeholder that is never written
+    events = Events()
+    watcher = FolderWatcher(str(folder), WatchOperation(OP_ADD_SUBS), on_status=events,
+                            settle=0.2, interval=0.05, use_inotify=False)
+    thread = start(watcher)
+
+    (folder / "Show.S01E01.mkv").write_bytes(b"\0" * 1024)
+    (folder / "Show.S01E01.en.srt").write_text(SUBTITLE, encoding="utf-8")
+    events.wait_for(1)
+    watcher.stop()
+    thread.join(timeout=5)
+    assert watcher._tracker.pending() == []
+
+def test_job_queue_is_bounded(tmp_path, fake_mkvmerge, monkeypatch):
+    monkeypatch.setenv("FAKE_MKVMERGE_DELAY", "0.2")
+    folder = tmp_path / "hot"
+    folder.mkdir()
+    for n in range(1, 7):
+        (folder / f"Show.S01E{n:02}.mkv").write_bytes(b"\0" * 1024)
+        (folder / f"Show.S01E{n:02}.en.srt").write_text(SUBTITLE, encoding="utf-8")
+
+    events = Events()
+    watcher = FolderWatcher(str(folder), WatchOperation(OP_ADD_SUBS), on_status=events,
+                            settle=0.1, interval=0.05, max_queued=2, use_inotify=False)
+    thread = start(watcher)
+    events.wait_for(6)
+    watcher.stop()
+    thread.join(timeout=5)
+
+    in_flight = peak = 0
+    for _, status in events.items:
+        in_flight += {STATUS_QUEUED: 1, STATUS_DONE: -1}.get(status, 0)
+        peak = max(peak, in_flight)
+    assert peak == 2
+    # Results are not picked up as new episodes
+    assert len(fake_mkvmerge.read_text().splitlines()) == 6
@@ -0,0 +1,140 @@
+"""
+Atomic output files and a free-space preflight for jobs that write media.
+
+Tools write to a hidden temp file next to the destination (same directory, so
+same filesystem) which only replaces the final path once the tool succeeded:
+a failed, cancelled or killed job never leaves a truncated file that looks
+valid in a directory listing. Jobs check the free space for their estimated
+output before starting, so a full disk fails in milliseconds instead of after
+minutes of writing.
+"""
+import os
+import uuid
+import shutil
+
+# Temp files are "." + name + TEMP_MARKER + random + original extension; the
+# extension is kept because ffmpeg picks the output format from it
+TEMP_MARKER = ".part-"
+# Files a tool writes next to an output of this extension, named after it:
+# mkvextract writes a VobSub track as <name>.sub plus its index <name>.idx
+COMPANION_EXTENSIONS = {".sub": (".idx",)}
+# Container overhead on top of the track payloads (headers, cues, block framing)
+SIZE_MARGIN = 1.02
+SIZE_MARGIN_BYTES = 4 * 1024 * 1024
+
+class InsufficientSpaceError(RuntimeError):
+    pass
+
+def temp_path_for(output_path):
+    """Hidden, unique temp path in the directory of output_path."""
+    directory, name = os.path.split(os.path.abspath(output_path))
+    stem, ext = os.path.splitext(name)
+    return os.path.join(directory, f".{stem}{TEMP_MARKER}{uuid.uuid4().hex[:8]}{ext}")
+
+class AtomicOutput:
+    """
+    A temp file standing in for output_path until commit().
+    Used as a context manager, an output that was not committed is removed on exit:
+
+        with AtomicOutput(output_path) as out:
+            run_tool(..., out.path)
+            out.commit()
+    """
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.path = temp_path_for(output_path)
+        self.committed = False
+
+    def _companions(self):
+        """[(temp path, final path)] of the files the tool may write next to the output."""
+        temp_stem = os.path.splitext(self.path)[0]
+        stem, ext = os.path.splitext(self.output_path)
+        return [(temp_stem + extra, stem + extra) for extra in COMPANION_EXTENSIONS.get(ext.lower(), ())]
+
+    def commit(self):
+        """Rename the temp file (and its companions) over output_path (atomic on the same filesystem)."""
+        for temp, final in self._companions() + [(self.path, self.output_path)]:
+            if os.path.exists(temp):
+                os.replace(temp, final)
+        self.committed = True
+
+    def discard(self):
+        for temp, _ in [(self.path, None)] + self._companions():
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.committed:
+            self.discard()
+        return False
+
+def free_space(directory):
+    """Bytes available to this user on the filesystem holding directory."""
+    if hasattr(os, "statvfs"):
+        st = os.statvfs(directory)
+        return st.f_bavail * st.f_frsize
+    return shutil.disk_usage(directory).free
+
+def _track_bytes(track):
+    """Payload size from the track statistics tags (mkvmerge/MKVToolNix write them), or None."""
+    value = track.get("properties", {}).get("tag_number_of_bytes")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def estimate_output_size(source_path, info=None, track_ids=None, extra_paths=()):
+    """
+    Estimated bytes written when copying tracks of source_path plus extra_paths
+    (e.g. subtitles being added) into new files.
+
+    info: probe result of source_path; track_ids: the tracks copied (None for all).
+    Tracks of known size count their size. If any copied video/audio track has no
+    size tag, the whole source file counts instead, which is an upper bound.
+    Subtitles without a size are small enough to ignore.
+    """
+    try:
+        source_size = os.path.getsize(source_path)
+    except OSError:
+        source_size = 0
+
+    tracks = (info or {}).get("tracks", [])
+    if track_ids is not None:
+        wanted = {int(t) for t in track_ids}
+        tracks = [t for t in tracks if t.get("id") in wanted]
+
+    total = 0
+    for track in tracks:
+        size = _track_bytes(track)
+        if size is not None:
+            total += size
+        elif track.get("type") != "subtitles":
+            total = source_size
+            break
+    if not tracks:
+        total = source_size # Not probed
+    total = min(total, source_size) if source_size else total
+
+    for path in extra_paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return int(total * SIZE_MARGIN) + SIZE_MARGIN_BYTES
+
+def check_free_space(output_path, needed_bytes):
+    """Raise InsufficientSpaceError if the directory of output_path has less than needed_bytes free."""
+    directory = os.path.dirname(os.path.abspath(output_path))
+    try:
+        available = free_space(directory)
+    except OSError:
+        return # Missing directory or unsupported filesystem: let the tool report it
+    if available < needed_bytes:
+        raise InsufficientSpaceError(
+            f"Not enough disk space in {directory}: about {needed_bytes / (1024 * 1024):.0f} MB needed, "
+            f"{available / (1024 * 1024):.0f} MB free.")
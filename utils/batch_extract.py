@@ -0,0 +1,173 @@
+import os
+import threading
+from concurrent.futures import CancelledError, TimeoutError
+from utils.probe import probe_file
+from utils.job_scheduler import JobScheduler, POOL_IO, FINISHED_STATES
+from utils.process_runner import ProcessAborted
+from utils.mkv_wrapper import extract_tracks
+from utils.ffmpeg_wrapper import extract_streams
+from utils.track_naming import track_output_filename
+from utils.languages import normalize
+from utils.atomic_output import check_free_space, estimate_output_size
+
+VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.avi', '.mov', '.m4v')
+
+# Per-file statuses reported through on_status
+STATUS_QUEUED = "queued"
+STATUS_PROBING = "probing"
+STATUS_EXTRACTING = "extracting"
+STATUS_DONE = "done"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+class TrackRule:
+    """
+    Track selection rule for batch extraction.
+    Each criterion is a collection of values; an empty one matches everything.
+    types: "video", "audio", "subtitles"
+    languages: track language codes or names, e.g. "eng", "pt-BR", "German" (matched as ISO 639-2)
+    codecs: case-insensitive substrings of the codec ID/name, e.g. "UTF8", "PGS"
+    """
+    def __init__(self, types=None, languages=None, codecs=None):
+        self.types = {t.lower() for t in (types or [])}
+        self.languages = {normalize(l) or l.lower() for l in (languages or [])}
+        self.codecs = [c.upper() for c in (codecs or [])]
+
+    def matches(self, track):
+        props = track.get("properties", {})
+        if self.types and track.get("type", "").lower() not in self.types:
+            return False
+        lang = props.get("language", "und")
+        if self.languages and (normalize(lang) or lang.lower()) not in self.languages:
+            return False
+        if self.codecs:
+            codec = f"{props.get('codec_id', '')} {track.get('codec', '')}".upper()
+            if not any(c in codec for c in self.codecs):
+                return False
+        return True
+
+def collect_sources(paths, recursive=False):
+    """Expand a mix of files and directories into a sorted list of video files."""
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            if recursive:
+                for root, _, files in os.walk(path):
+                    sources.extend(os.path.join(root, f) for f in files if f.lower().endswith(VIDEO_EXTENSIONS))
+            else:
+                with os.scandir(path) as it:
+                    sources.extend(e.path for e in it if e.is_file() and e.name.lower().endswith(VIDEO_EXTENSIONS))
+        elif os.path.isfile(path):
+            sources.append(path)
+    return sorted(set(sources))
+
+def plan_extraction(video_path, info, rule, output_dir=None):
+    """Returns {track_id: output_path} for the tracks of video_path matching rule."""
+    out_dir = output_dir or os.path.dirname(video_path)
+    source_name = os.path.splitext(os.path.basename(video_path))[0]
+    taken = set()
+
+    plan = {}
+    for track in info.get("tracks", []):
+        if rule.matches(track):
+            filename = track_output_filename(source_name, track, taken)
+            plan[track["id"]] = os.path.join(out_dir, filename)
+    return plan
+
+def extract_file(video_path, rule, output_dir=None, on_status=None, on_progress=None, limits=None, outputs=None):
+    """
+    Probe one file, pick its tracks by rule and extract them.
+    limits: optional process_runner.Limits for the extraction tool.
+    outputs: optional list, extended with the planned output paths.
+    Returns (status, detail).
+    """
+    def report(status, detail=""):
+        if on_status:
+            on_status(video_path, status, detail)
+        return status, detail
+
+    report(STATUS_PROBING)
+    try:
+        info = probe_file(video_path)
+    except Exception as e:
+        return report(STATUS_FAILED, str(e))
+
+    plan = plan_extraction(video_path, info, rule, output_dir)
+    if not plan:
+        return report(STATUS_SKIPPED, "No matching tracks")
+    if outputs is not None:
+        outputs.extend(plan.values())
+
+    try:
+        check_free_space(next(iter(plan.values())), estimate_output_size(video_path, info, plan))
+    except RuntimeError as e:
+        return report(STATUS_FAILED, str(e))
+
+    report(STATUS_EXTRACTING, f"{len(plan)} track(s)")
+    if video_path.lower().endswith('.mkv'):
+        success, msg = extract_tracks(video_path, plan, on_progress=on_progress, limits=limits)
+        if not success:
+            if limits and limits.cancel_event and limits.cancel_event.is_set():
+                return report(STATUS_CANCELLED)
+            return report(STATUS_FAILED, msg.strip())
+    else:
+        duration_ns = info.get("container", {}).get("properties", {}).get("duration")
+        try:
+            errors = extract_streams(video_path, plan, on_progress=on_progress, duration_ns=duration_ns, limits=limits)
+        except ProcessAborted as e:
+            return report(STATUS_CANCELLED) if e.reason == "cancelled" else report(STATUS_FAILED, str(e))
+        if errors:
+            return report(STATUS_FAILED, "; ".join(f"Track {tid}: {err}" for tid, err in errors.items()))
+
+    return report(STATUS_DONE, f"{len(plan)} track(s) extracted")
+
+def _extract_job(job, video_path, rule, output_dir, on_status):
+    status, detail = extract_file(video_path, rule, output_dir, on_status, job.report_progress, job.limits,
+                                  job.output_paths)
+    if status == STATUS_FAILED:
+        raise RuntimeError(detail) # Marks the job failed in the queue
+    return status, detail
+
+def batch_extract(sources, rule, output_dir=None, on_status=None, cancel_event=None):
+    """
+    Extract matching tracks from many files, one scheduler job per file.
+    The I/O pool size bounds how many mkvextract/ffmpeg children run at once.
+
+    sources: video file paths (see collect_sources)
+    on_status: callback(path, status, detail), called from worker threads
+    cancel_event: threading.Event; once set, waiting files are dropped and running tools killed
+    Returns {path: (status, detail)}.
+    """
+    cancel_event = cancel_event or threading.Event()
+    scheduler = JobScheduler()
+    results = {}
+
+    jobs = {}
+    for path in sources:
+        if on_status:
+            on_status(path, STATUS_QUEUED, "")
+        jobs[path] = scheduler.submit(f"Extract from {os.path.basename(path)}",
+                                      lambda job, p=path: _extract_job(job, p, rule, output_dir, on_status),
+                                      pool=POOL_IO, kind="extract", inputs=[path])
+
+    for path, job in jobs.items():
+        while True:
+            if cancel_event.is_set():
+                for pending in jobs.values():
+                    if pending.state not in FINISHED_STATES:
+                        pending.cancel()
+            try:
+                results[path] = job.future.result(timeout=0.25)
+                break
+            except TimeoutError:
+                continue
+            except CancelledError:
+                results[path] = (STATUS_CANCELLED, "")
+            except Exception as e:
+                results[path] = (STATUS_CANCELLED, "") if job.cancel_event.is_set() else (STATUS_FAILED, str(e))
+            if on_status:
+                on_status(path, *results[path])
+            break
+
+    return results
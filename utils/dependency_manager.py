@@ -1,21 +1,129 @@
 import os
+import re
 import sys
+import json
 import platform
 import shutil
-import urllib.request
-import zipfile
-import tarfile
 import subprocess
 import stat
+import time
+import threading
 from pathlib import Path
 
+TOOL_CACHE_NAME = "tools.json"
+TOOL_CACHE_FORMAT = 1
+# Seconds allowed for `tool --version`
+VERSION_TIMEOUT = 10
+
+# Features the suite relies on, by tool: capability -> first version that has it.
+# Versions that cannot be parsed (git builds such as "ffmpeg version N-112233-g...")
+# are taken to be recent and have everything.
+TOOL_CAPABILITIES = {
+    "mkvmerge": {"identify_json": (9, 0), "json_option_files": (9, 7), "gui_mode": (5, 0)},
+    "mkvextract": {"gui_mode": (5, 0)},
+    "mkvpropedit": {"gui_mode": (5, 0)},
+    "ffmpeg": {"progress_pipe": (1, 0)},
+    "ffprobe": {"json_output": (1, 0)},
+}
+
+_VERSION_RE = re.compile(r"\bv?(\d+)\.(\d+)(?:\.(\d+))?")
+
+def parse_version(version_line):
+    """(major, minor, patch) from a `--version` line, or None."""
+    m = _VERSION_RE.search(version_line or "")
+    if not m:
+        return None
+    return tuple(int(g or 0) for g in m.groups())
+
+def _capabilities(tool_name, version_line):
+    version = parse_version(version_line)
+    return {cap: version is None or version[:2] >= minimum
+            for cap, minimum in TOOL_CAPABILITIES.get(tool_name, {}).items()}
+
+class _SetupProgress:
+    """
+    Aggregates the byte counts of concurrent pack downloads into the
+    progress_callback(current, total, message) of download_dependencies:
+    current/total are bytes downloaded so far / expected across all packs.
+    Called from the download and extraction threads; callbacks are rate limited.
+    """
+    MIN_INTERVAL = 0.1
+
+    def __init__(self, callback, packs):
+        self.callback = callback
+        self.packs = packs
+        self.bytes = {name: (0, None) for name in packs} # name -> (done, total)
+        self.states = {name: "downloading" for name in packs}
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+
+    def update(self, pack_name, done, total):
+        with self._lock:
+            self.bytes[pack_name] = (done, total)
+            self._emit(force=total is not None and done >= total)
+
+    def failed(self, pack_name):
+        self._set_state(pack_name, "failed")
+
+    def extracting(self, pack_name):
+        self._set_state(pack_name, "extracting")
+
+    def installed(self, pack_name):
+        self._set_state(pack_name, "installed")
+
+    def finished(self):
+        with self._lock:
+            if self.callback:
+                total = self._totals()[1]
+                self.callback(total, total, "Setup finished.")
+
+    def _set_state(self, pack_name, state):
+        with self._lock:
+            self.states[pack_name] = state
+            self._emit(force=True)
+
+    def _totals(self):
+        done = sum(d for d, _ in self.bytes.values())
+        # Packs whose size is not known yet count as what they have so far
+        total = sum(t if t is not None else d for d, t in self.bytes.values())
+        return done, total
+
+    def _emit(self, force=False):
+        # Called with self._lock held
+        now = time.monotonic()
+        if not self.callback or (not force and now - self._last_emit < self.MIN_INTERVAL):
+            return
+        self._last_emit = now
+        done, total = self._totals()
+        parts = []
+        downloading = [n for n in self.packs if self.states[n] == "downloading"]
+        if downloading:
+            parts.append(f"Downloading {len(downloading)} of {len(self.packs)} packs "
+                         f"({done / (1024 * 1024):.1f} / {total / (1024 * 1024):.1f} MB)")
+        extracting = [n for n in self.packs if self.states[n] == "extracting"]
+        if extracting:
+            parts.append("extracting " + ", ".join(extracting))
+        message = "; ".join(parts) or "Installing..."
+        self.callback(done, total, message[:1].upper() + message[1:] + "...")
+
 class DependencyManager:
+    """
+    Finds the external tools (system PATH first, then the managed bin_dir) and
+    installs missing ones.
+
+    Lookups, misses included, are cached for the process; found tools are also
+    persisted to tools.json in the cache directory with their size, mtime,
+    `--version` line and capability flags, so a later start only stats each
+    binary instead of searching PATH and running it. Safe to call from any thread.
+    """
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DependencyManager, cls).__new__(cls)
-            cls._instance._initialized = False
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(DependencyManager, cls).__new__(cls)
+                cls._instance._initialized = False
         return cls._instance
 
     def __init__(self):
@@ -25,7 +133,9 @@ class DependencyManager:
         self.os_name = platform.system()
         self.arch = platform.machine().lower()
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self._binary_cache = {}
+        self._lock = threading.RLock()
+        self._binary_cache = {} # tool name -> path (the bare name when missing)
+        self._tool_store = None # Persisted tool records, loaded on first use
 
         # Determine installation directory
         # Windows: Keep internal bin to avoid permission issues or polluting system
@@ -53,6 +163,8 @@ class DependencyManager:
             return False
 
     def _get_urls(self):
+        # Optional per pack: 'sha256' (pinned digest) or 'checksum_url' (published
+        # digest file, 'checksum_algo' defaults to sha256) to verify the download
         urls = {}
 
         # Windows
@@ -60,6 +172,7 @@ class DependencyManager:
             # FFmpeg & FFprobe (Essentials build contains both)
             urls['ffmpeg_pack'] = {
                 'url': 'https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip',
+                'checksum_url': 'https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip.sha256',
                 'type': 'zip',
                 'contains': ['ffmpeg', 'ffprobe']
             }
@@ -67,7 +180,7 @@ class DependencyManager:
             urls['mkvtoolnix_pack'] = {
                 'url': 'https://mkvtoolnix.download/windows/releases/88.0/mkvtoolnix-64-bit-88.0.7z',
                 'type': '7z',
-                'contains': ['mkvmerge', 'mkvextract']
+                'contains': ['mkvmerge', 'mkvextract', 'mkvpropedit']
             }
 
         # Linux
@@ -79,6 +192,8 @@ class DependencyManager:
             if is_arm:
                 urls['ffmpeg_pack'] = {
                     'url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-arm64-static.tar.xz',
+                    'checksum_url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-arm64-static.tar.xz.md5',
+                    'checksum_algo': 'md5',
                     'type': 'tar',
                     'contains': ['ffmpeg', 'ffprobe']
                 }
@@ -89,6 +204,8 @@ class DependencyManager:
             elif is_64:
                 urls['ffmpeg_pack'] = {
                     'url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz',
+                    'checksum_url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-amd64-static.tar.xz.md5',
+                    'checksum_algo': 'md5',
                     'type': 'tar',
                     'contains': ['ffmpeg', 'ffprobe']
                 }
@@ -96,7 +213,7 @@ class DependencyManager:
                 urls['mkvtoolnix_pack'] = {
                     'url': 'https://mkvtoolnix.download/appimage/MKVToolNix_GUI-x86_64.AppImage',
                     'type': 'appimage',
-                    'contains': ['mkvmerge', 'mkvextract']
+                    'contains': ['mkvmerge', 'mkvextract', 'mkvpropedit']
                 }
 
             else:
@@ -105,6 +222,8 @@ class DependencyManager:
                 # We could try to provide 32-bit ffmpeg:
                 urls['ffmpeg_pack'] = {
                     'url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-i686-static.tar.xz',
+                    'checksum_url': 'https://johnvansickle.com/ffmpeg/releases/ffmpeg-release-i686-static.tar.xz.md5',
+                    'checksum_algo': 'md5',
                     'type': 'tar',
                     'contains': ['ffmpeg', 'ffprobe']
                 }
@@ -130,7 +249,7 @@ class DependencyManager:
             urls['mkvtoolnix_pack'] = {
                 'url': 'https://mkvtoolnix.download/macos/MKVToolNix-88.0.dmg',
                 'type': 'dmg',
-                'contains': ['mkvmerge', 'mkvextract']
+                'contains': ['mkvmerge', 'mkvextract', 'mkvpropedit']
             }
 
         return urls
@@ -153,36 +272,157 @@ class DependencyManager:
         return missing
 
     def get_binary_path(self, tool_name):
-        """Returns absolute path to tool, prioritizing system PATH"""
-        # Check cache first
-        if tool_name in self._binary_cache:
-            return self._binary_cache[tool_name]
+        """
+        Returns absolute path to tool, prioritizing system PATH.
+        Returns the bare tool name if it is not found (subprocess then fails naturally).
+        """
+        with self._lock:
+            path = self._binary_cache.get(tool_name)
+            if path is None:
+                path = self._resolve(tool_name)
+                self._binary_cache[tool_name] = path
+            return path
+
+    def tool_info(self, tool_name):
+        """
+        {"path", "size", "mtime_ns", "version", "capabilities"} for an installed
+        tool, or None if it is missing. `tool --version` only runs the first time
+        a given binary (path, size, mtime) is seen, on any start.
+        """
+        with self._lock:
+            path = self.get_binary_path(tool_name)
+            record = self._load_store()["tools"].get(tool_name)
+            if record is None or record["path"] != path:
+                return None
+            if "version" in record:
+                return dict(record)
+            record = dict(record)
+
+        # Run without the lock: it may take seconds and every tool lookup waits on the lock
+        record["version"] = self._probe_version(tool_name, path)
+        record["capabilities"] = _capabilities(tool_name, record["version"])
+        with self._lock:
+            stored = self._load_store()["tools"].get(tool_name)
+            # Only kept if the binary was not looked up again meanwhile
+            if stored is not None and all(stored[k] == record[k] for k in ("path", "size", "mtime_ns")):
+                stored.update(version=record["version"], capabilities=record["capabilities"])
+                self._save_store()
+        return record
+
+    def tool_version(self, tool_name):
+        """First line of the tool's version output, or None."""
+        info = self.tool_info(tool_name)
+        return info["version"] if info else None
+
+    def has_capability(self, tool_name, capability):
+        """
+        Whether the installed tool supports capability (see TOOL_CAPABILITIES).
+        Unknown tools or versions count as capable, so this only ever rules out tools known to be too old.
+        """
+        info = self.tool_info(tool_name)
+        return info is None or info["capabilities"].get(capability, True)
+
+    def refresh(self):
+        """Forgets every lookup, e.g. after installing tools."""
+        with self._lock:
+            self._binary_cache.clear()
+
+    def _search_key(self):
+        # Persisted paths are only trusted while the places searched are the same
+        return os.pathsep.join([os.environ.get("PATH", ""), self.bin_dir])
+
+    def _resolve(self, tool_name):
+        # Called with self._lock held
+        store = self._load_store()
+        record = store["tools"].get(tool_name)
+        system_path = None
+        if record is not None:
+            try:
+                st = os.stat(record["path"])
+                unchanged = (st.st_size, st.st_mtime_ns) == (record["size"], record["mtime_ns"])
+            except OSError:
+                unchanged = False
+            if unchanged and os.path.dirname(record["path"]) != self.bin_dir:
+                return record["path"]
+            if unchanged:
+                # A managed copy: one installed on PATH since takes priority
+                system_path = shutil.which(tool_name)
+                if not system_path or system_path == record["path"]:
+                    return record["path"]
 
         # 1. Check System PATH
-        system_path = shutil.which(tool_name)
-        if system_path:
-            self._binary_cache[tool_name] = system_path
-            return system_path
+        path = system_path or shutil.which(tool_name)
 
         # 2. Check managed bin directory
-        exe_name = tool_name
-        if self.os_name == 'Windows':
-            exe_name += '.exe'
+        if not path:
+            exe_name = tool_name
+            if self.os_name == 'Windows':
+                exe_name += '.exe'
+            local_path = os.path.join(self.bin_dir, exe_name)
+            if os.path.exists(local_path):
+                path = local_path
+
+        if not path:
+            if store["tools"].pop(tool_name, None) is not None:
+                self._save_store()
+            return tool_name
 
-        local_path = os.path.join(self.bin_dir, exe_name)
-        if os.path.exists(local_path):
-            self._binary_cache[tool_name] = local_path
-            return local_path
-
-        # Return None or just the tool name to let subprocess fail naturally if not found
-        # Do not cache failed lookups in case the user installs it later without restart (though unlikely)
-        # Actually, for consistency with optimization, we could cache failure too, but let's be safe.
-        return tool_name
+        try:
+            st = os.stat(path)
+        except OSError:
+            return path
+        # A new or changed binary: its version is probed again on demand (tool_info)
+        store["tools"][tool_name] = {"path": path, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self._save_store()
+        return path
+
+    def _probe_version(self, tool_name, path):
+        flag = "-version" if tool_name in ("ffmpeg", "ffprobe") else "--version"
+        try:
+            result = subprocess.run([path, flag], capture_output=True, text=True, timeout=VERSION_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"Warning: could not get the {tool_name} version: {e}")
+            return None
+        lines = (result.stdout or result.stderr).strip().splitlines()
+        return lines[0].strip() if lines else None
+
+    def _store_path(self):
+        from utils.probe_cache import get_cache_dir
+        return os.path.join(get_cache_dir(), TOOL_CACHE_NAME)
+
+    def _load_store(self):
+        # Called with self._lock held
+        if self._tool_store is None:
+            store = None
+            try:
+                with open(self._store_path(), "r", encoding="utf-8") as f:
+                    store = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if (not isinstance(store, dict) or store.get("format") != TOOL_CACHE_FORMAT
+                    or store.get("search") != self._search_key()):
+                store = {"format": TOOL_CACHE_FORMAT, "search": self._search_key(), "tools": {}}
+            self._tool_store = store
+        return self._tool_store
+
+    def _save_store(self):
+        # Called with self._lock held. Written to a temp file and renamed, so another
+        # process reading it never sees half a file (the last writer wins).
+        path = self._store_path()
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._tool_store, f, indent=1)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not save the tool cache: {e}")
 
     def download_dependencies(self, progress_callback=None):
         """
         Downloads missing dependencies.
-        progress_callback: function(current_step, total_steps, message)
+        progress_callback: function(current, total, message), current/total in bytes
+        across all packs; called from the download threads.
         """
         if not os.path.exists(self.bin_dir):
             try:
@@ -211,54 +451,71 @@ class DependencyManager:
              print(f"Warning: Missing tools {missing} but no download URL configured.")
              return
 
-        total_steps = len(packs_to_download) * 2 # Download + Extract
-        current_step = 0
+        # Every pack downloads at once; each is extracted as soon as it is complete,
+        # while the others are still downloading. Extractions run one at a time
+        # since they share bin_dir (and its squashfs-root).
+        from concurrent.futures import ThreadPoolExecutor
 
-        for pack_name in packs_to_download:
-            pack_info = self.urls[pack_name]
-            url = pack_info['url']
+        packs = sorted(packs_to_download)
+        progress = _SetupProgress(progress_callback, packs)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract") as extract_pool:
+            def fetch(pack_name):
+                archive_path = self._download_pack(pack_name, progress)
+                if archive_path is not None:
+                    extract_pool.submit(self._install_pack, pack_name, archive_path, progress)
 
-            # Download
-            filename = url.split('/')[-1]
-            filepath = os.path.join(self.bin_dir, filename)
+            with ThreadPoolExecutor(max_workers=len(packs), thread_name_prefix="download") as download_pool:
+                list(download_pool.map(fetch, packs))
+        # Both pools are drained here: every pack is downloaded and extracted
 
-            current_step += 1
-            if progress_callback:
-                progress_callback(current_step, total_steps, f"Downloading {filename}...")
-
-            try:
-                # Basic download with progress
-                # Using urllib for portability
-                def report(block_num, block_size, total_size):
-                    # Optional: Could update progress within the step
-                    pass
+        progress.finished()
+        # Look the tools up again after potential installation
+        self.refresh()
 
-                urllib.request.urlretrieve(url, filepath, report)
-            except Exception as e:
-                print(f"Error downloading {url}: {e}")
-                continue
+    def _download_pack(self, pack_name, progress):
+        """
+        Downloads one pack into bin_dir, verified against its checksum if one is
+        published. Returns the archive path, or None if the download failed
+        (a partial file is kept and resumed next time, unless it was corrupt).
+        """
+        from utils import downloader
 
-            # Extract
-            current_step += 1
-            if progress_callback:
-                progress_callback(current_step, total_steps, f"Extracting {filename}...")
+        pack_info = self.urls[pack_name]
+        url = pack_info['url']
+        # Prefixed with the pack: packs downloading at once may share a basename (evermeet's .../zip)
+        filepath = os.path.join(self.bin_dir, f"{pack_name}-{url.split('/')[-1]}")
+        try:
+            checksum, algo = pack_info.get('sha256'), 'sha256'
+            if 'checksum_url' in pack_info:
+                checksum = downloader.fetch_checksum(pack_info['checksum_url'])
+                algo = pack_info.get('checksum_algo', 'sha256')
+            downloader.download(url, filepath, checksum=checksum, algo=algo,
+                                on_progress=lambda done, total: progress.update(pack_name, done, total))
+            return filepath
+        except Exception as e:
+            print(f"Error downloading {url}: {e}")
+            progress.failed(pack_name)
+            return None
+
+    def _install_pack(self, pack_name, archive_path, progress):
+        progress.extracting(pack_name)
+        try:
+            self._extract_and_install(archive_path, self.urls[pack_name])
+        except Exception as e:
+            print(f"Error extracting {os.path.basename(archive_path)}: {e}")
 
+        # Cleanup downloaded archive
+        if os.path.exists(archive_path):
             try:
-                self._extract_and_install(filepath, pack_info)
-            except Exception as e:
-                print(f"Error extracting {filename}: {e}")
-
-            # Cleanup downloaded archive
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                except:
-                    pass
-
-        # Clear cache after potential installation
-        self._binary_cache.clear()
+                os.remove(archive_path)
+            except OSError:
+                pass
+        progress.installed(pack_name)
 
     def _extract_and_install(self, archive_path, pack_info):
+        import zipfile
+        import tarfile
+
         extract_type = pack_info['type']
         targets = pack_info['contains']
 
@@ -0,0 +1,138 @@
+"""
+Resumable, checksum-verified HTTP downloads for the first-run tool setup.
+
+Imported on demand only (urllib is slow to import and only needed here).
+"""
+import os
+import hashlib
+import http.client
+import urllib.error
+import urllib.request
+
+CHUNK_SIZE = 256 * 1024
+# Dropped connections are retried from where the partial file stopped
+RETRIES = 4
+TIMEOUT = 30
+PARTIAL_SUFFIX = ".partial"
+# Next to the partial file: the ETag or Last-Modified of the response it came from
+VALIDATOR_SUFFIX = ".partial.validator"
+
+class ChecksumError(RuntimeError):
+    """The downloaded file does not match its published checksum."""
+
+def fetch_checksum(url, timeout=TIMEOUT):
+    """Reads a published checksum file (`<hex digest>  <filename>` or just the digest)."""
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        words = resp.read(4096).decode("ascii", errors="replace").split()
+    if not words or any(c not in "0123456789abcdefABCDEF" for c in words[0]):
+        raise ChecksumError(f"No checksum found at {url}")
+    return words[0].lower()
+
+def _hash_file(path, algo):
+    hasher = hashlib.new(algo)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher
+
+def download(url, dest, checksum=None, algo="sha256", on_progress=None, timeout=TIMEOUT, retries=RETRIES):
+    """
+    Downloads url to dest.
+
+    Bytes go to dest + ".partial" first. A partial file left by an earlier run
+    or a dropped connection is resumed with an HTTP Range request, sent with
+    If-Range and the ETag/Last-Modified saved with the partial file, so a
+    release that changed in between is downloaded again in full (as is a
+    server ignoring Range). Without a saved validator a partial file is only
+    resumed when a checksum will catch a splice of two releases.
+    The digest is computed while streaming and checked against checksum
+    (hex, algo); on a mismatch the partial file is deleted and ChecksumError
+    raised. dest only appears once complete and verified.
+
+    on_progress: called with (bytes_done, bytes_total or None) as chunks arrive.
+    """
+    partial = dest + PARTIAL_SUFFIX
+    validator_path = dest + VALIDATOR_SUFFIX
+    if os.path.exists(partial) and not checksum and _read_validator(validator_path) is None:
+        os.remove(partial)
+    failures = 0
+    while True:
+        offset = os.path.getsize(partial) if os.path.exists(partial) else 0
+        try:
+            total, hasher = _fetch(url, partial, offset, algo, on_progress, timeout, validator_path)
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                _remove_partial(partial, validator_path) # Range past the end: a stale partial file, start over
+            elif e.code < 500 or failures >= retries:
+                raise
+            failures += 1
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            if failures >= retries:
+                raise
+            failures += 1
+
+    if checksum and hasher.hexdigest() != checksum.lower():
+        _remove_partial(partial, validator_path)
+        raise ChecksumError(f"{os.path.basename(dest)}: {algo} mismatch, the download is corrupt")
+    os.replace(partial, dest)
+    _remove_partial(partial, validator_path)
+
+def _read_validator(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def _response_validator(resp):
+    """A strong ETag or Last-Modified, usable in If-Range (weak ETags are not)."""
+    etag = resp.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.headers.get("Last-Modified")
+
+def _remove_partial(partial, validator_path):
+    for path in (partial, validator_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+def _fetch(url, partial, offset, algo, on_progress, timeout, validator_path):
+    """
+    One request appending to partial from offset.
+    Returns (full size or None, hasher over the whole partial file).
+    """
+    headers = {}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        validator = _read_validator(validator_path)
+        if validator:
+            headers["If-Range"] = validator
+    with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout) as resp:
+        if offset and resp.status != 206:
+            offset = 0 # Range ignored or the file changed (If-Range): the body is the whole file again
+        if not offset:
+            validator = _response_validator(resp)
+            if validator:
+                with open(validator_path, "w", encoding="utf-8") as f:
+                    f.write(validator)
+            elif os.path.exists(validator_path):
+                os.remove(validator_path)
+        hasher = _hash_file(partial, algo) if offset else hashlib.new(algo)
+        length = resp.headers.get("Content-Length")
+        total = offset + int(length) if length and length.isdigit() else None
+
+        done = offset
+        if on_progress:
+            on_progress(done, total)
+        with open(partial, "ab" if offset else "wb") as f:
+            for chunk in iter(lambda: resp.read(CHUNK_SIZE), b""):
+                f.write(chunk)
+                hasher.update(chunk)
+                done += len(chunk)
+                if on_progress:
+                    on_progress(done, total)
+    if total is not None and done < total:
+        # read() just ends when the connection drops; retry from here
+        raise http.client.IncompleteRead(b"", total - done)
+    return total, hasher
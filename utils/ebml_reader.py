@@ -0,0 +1,571 @@
+"""
+In-process Matroska header reader.
+
+Walks EBML header -> Segment -> SeekHead -> Info/Tracks (and optionally
+Chapters/Attachments) without starting mkvmerge, returning the same structure
+as `mkvmerge -J` for the fields the app uses. Only the start of the file is
+memory-mapped; elements that the SeekHead places further in (e.g. Tags at the
+end) are fetched with a single positioned read.
+
+Anything the reader does not fully understand raises EBMLError so the caller
+can fall back to mkvmerge.
+"""
+import os
+import mmap
+import struct
+
+# Bump when the output structure changes so cached results are invalidated
+READER_VERSION = "1"
+
+# Bytes mapped from the start of the file; Info and Tracks live well inside this
+HEAD_WINDOW = 1024 * 1024
+# Largest master element we are willing to pull into memory in one read
+MAX_ELEMENT_READ = 16 * 1024 * 1024
+
+MATROSKA_EXTENSIONS = ('.mkv', '.mka', '.mks', '.mk3d', '.webm')
+
+# Element IDs (with length marker, as they appear in the file)
+EBML_HEADER = 0x1A45DFA3
+EBML_MAX_ID_LENGTH = 0x42F2
+EBML_MAX_SIZE_LENGTH = 0x42F3
+DOC_TYPE = 0x4282
+DOC_TYPE_READ_VERSION = 0x4285
+SEGMENT = 0x18538067
+SEEK_HEAD = 0x114D9B74
+SEEK = 0x4DBB
+SEEK_ID = 0x53AB
+SEEK_POSITION = 0x53AC
+INFO = 0x1549A966
+TIMESTAMP_SCALE = 0x2AD7B1
+DURATION = 0x4489
+TITLE = 0x7BA9
+MUXING_APP = 0x4D80
+WRITING_APP = 0x5741
+SEGMENT_UID = 0x73A4
+TRACKS = 0x1654AE6B
+TRACK_ENTRY = 0xAE
+TRACK_NUMBER = 0xD7
+TRACK_UID = 0x73C5
+TRACK_TYPE = 0x83
+FLAG_ENABLED = 0xB9
+FLAG_DEFAULT = 0x88
+FLAG_FORCED = 0x55AA
+FLAG_HEARING_IMPAIRED = 0x55AB
+FLAG_VISUAL_IMPAIRED = 0x55AC
+FLAG_TEXT_DESCRIPTIONS = 0x55AD
+FLAG_ORIGINAL = 0x55AE
+FLAG_COMMENTARY = 0x55AF
+DEFAULT_DURATION = 0x23E383
+NAME = 0x536E
+LANGUAGE = 0x22B59C
+LANGUAGE_IETF = 0x22B59D
+CODEC_ID = 0x86
+CODEC_PRIVATE = 0x63A2
+VIDEO = 0xE0
+PIXEL_WIDTH = 0xB0
+PIXEL_HEIGHT = 0xBA
+DISPLAY_WIDTH = 0x54B0
+DISPLAY_HEIGHT = 0x54BA
+AUDIO = 0xE1
+SAMPLING_FREQUENCY = 0xB5
+CHANNELS = 0x9F
+BIT_DEPTH = 0x6264
+CHAPTERS = 0x1043A770
+EDITION_ENTRY = 0x45B9
+CHAPTER_ATOM = 0xB6
+ATTACHMENTS = 0x1941A469
+ATTACHED_FILE = 0x61A7
+FILE_DESCRIPTION = 0x467E
+FILE_NAME = 0x466E
+FILE_MIME_TYPE = 0x4660
+FILE_DATA = 0x465C
+FILE_UID = 0x46AE
+TAGS = 0x1254C367
+TAG = 0x7373
+TARGETS = 0x63C0
+TAG_TRACK_UID = 0x63C5
+SIMPLE_TAG = 0x67C8
+TAG_NAME = 0x45A3
+TAG_STRING = 0x4487
+CLUSTER = 0x1F43B675
+VOID = 0xEC
+CRC32 = 0xBF
+
+TRACK_TYPES = {1: "video", 2: "audio", 17: "subtitles"}
+
+# mkvmerge's human readable codec names for the common codec IDs
+CODEC_NAMES = {
+    "V_MPEG4/ISO/AVC": "AVC/H.264/MPEG-4p10",
+    "V_MPEGH/ISO/HEVC": "HEVC/H.265/MPEG-H",
+    "V_AV1": "AV1",
+    "V_VP8": "VP8",
+    "V_VP9": "VP9",
+    "V_MPEG2": "MPEG-1/2",
+    "V_MS/VFW/FOURCC": "VfW",
+    "A_AAC": "AAC",
+    "A_AC3": "AC-3",
+    "A_EAC3": "E-AC-3",
+    "A_DTS": "DTS",
+    "A_TRUEHD": "TrueHD",
+    "A_FLAC": "FLAC",
+    "A_OPUS": "Opus",
+    "A_VORBIS": "Vorbis",
+    "A_MPEG/L3": "MP3",
+    "A_MPEG/L2": "MP2",
+    "A_PCM/INT/LIT": "PCM",
+    "S_TEXT/UTF8": "SubRip/SRT",
+    "S_TEXT/ASS": "SubStationAlpha",
+    "S_TEXT/SSA": "SubStationAlpha",
+    "S_TEXT/WEBVTT": "WebVTT",
+    "S_HDMV/PGS": "HDMV PGS",
+    "S_VOBSUB": "VobSub",
+}
+
+class EBMLError(Exception):
+    """Raised when the file is not a Matroska file this reader can handle."""
+    pass
+
+def _read_vint(buf, pos, keep_marker=False):
+    """
+    Decode an EBML variable length integer at buf[pos].
+    Returns (value, length, is_unknown_size).
+    """
+    if pos >= len(buf):
+        raise EBMLError("Truncated element header")
+    first = buf[pos]
+    if first == 0:
+        raise EBMLError("Invalid variable length integer")
+
+    length = 1
+    mask = 0x80
+    while not first & mask:
+        mask >>= 1
+        length += 1
+
+    if pos + length > len(buf):
+        raise EBMLError("Truncated element header")
+
+    value = first if keep_marker else first & (mask - 1)
+    for b in buf[pos + 1:pos + length]:
+        value = (value << 8) | b
+
+    unknown = not keep_marker and value == (1 << (7 * length)) - 1
+    return value, length, unknown
+
+def _read_header(buf, pos):
+    """Returns (element_id, data_start, data_size) for the element at buf[pos]."""
+    eid, id_len, _ = _read_vint(buf, pos, keep_marker=True)
+    if id_len > 4:
+        raise EBMLError("Element ID too long")
+    size, size_len, unknown = _read_vint(buf, pos + id_len)
+    return eid, pos + id_len + size_len, None if unknown else size
+
+def _children(buf, start, end):
+    """Iterate (id, data_start, data_size) of the elements in buf[start:end]."""
+    pos = start
+    while pos < end:
+        eid, data_start, size = _read_header(buf, pos)
+        if size is None:
+            raise EBMLError("Unknown-size element inside a master element")
+        if data_start + size > end:
+            raise EBMLError("Element overruns its parent")
+        yield eid, data_start, size
+        pos = data_start + size
+
+def _uint(buf, start, size):
+    if size > 8:
+        raise EBMLError("Integer element too large")
+    value = 0
+    for b in buf[start:start + size]:
+        value = (value << 8) | b
+    return value
+
+def _float(buf, start, size):
+    if size == 4:
+        return struct.unpack(">f", buf[start:start + 4])[0]
+    if size == 8:
+        return struct.unpack(">d", buf[start:start + 8])[0]
+    if size == 0:
+        return 0.0
+    raise EBMLError("Invalid float element size")
+
+def _string(buf, start, size):
+    return bytes(buf[start:start + size]).rstrip(b"\x00").decode("utf-8", errors="replace")
+
+class _Source:
+    """Random access over the file: mmap for the head window, positioned reads past it."""
+    def __init__(self, f):
+        self.f = f
+        self.size = os.fstat(f.fileno()).st_size
+        if self.size == 0:
+            raise EBMLError("Empty file")
+        self.head_len = min(self.size, HEAD_WINDOW)
+        self.head = mmap.mmap(f.fileno(), self.head_len, access=mmap.ACCESS_READ)
+
+    def read(self, offset, length):
+        end = min(offset + length, self.size)
+        if end <= self.head_len:
+            return self.head[offset:end]
+        self.f.seek(offset)
+        return self.f.read(end - offset)
+
+    def header_at(self, offset):
+        """Element header at an absolute file offset (absolute data start)."""
+        buf = self.read(offset, 12)
+        eid, data_start, size = _read_header(buf, 0)
+        return eid, offset + data_start, size
+
+    def element(self, offset):
+        """Reads a whole element; returns (id, payload_bytes)."""
+        eid, data_start, size = self.header_at(offset)
+        if size is None:
+            raise EBMLError("Unknown-size top level element")
+        if size > MAX_ELEMENT_READ:
+            raise EBMLError("Element too large for header read")
+        if data_start + size > self.size:
+            raise EBMLError("Element extends past end of file")
+        return eid, self.read(data_start, size)
+
+    def close(self):
+        self.head.close()
+
+def is_matroska_path(path):
+    return path.lower().endswith(MATROSKA_EXTENSIONS)
+
+def read_mkv_info(path, chapters=False, attachments=False):
+    """
+    Read track information from a Matroska/WebM file without mkvmerge.
+    Returns a dict shaped like `mkvmerge -J` output.
+    Chapters/attachments summaries are only included when requested.
+    Raises EBMLError for anything unusual, OSError if the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        src = _Source(f)
+        try:
+            return _parse(path, src, chapters, attachments)
+        except (IndexError, ValueError, struct.error) as e:
+            raise EBMLError(f"Malformed element: {e}")
+        finally:
+            src.close()
+
+def _parse(path, src, want_chapters, want_attachments):
+    # EBML header
+    eid, header = src.element(0)
+    if eid != EBML_HEADER:
+        raise EBMLError("Not an EBML file")
+    doc_type = None
+    for cid, start, size in _children(header, 0, len(header)):
+        if cid == DOC_TYPE:
+            doc_type = _string(header, start, size)
+        elif cid == DOC_TYPE_READ_VERSION and _uint(header, start, size) > 4:
+            raise EBMLError("Unsupported DocTypeReadVersion")
+        elif cid == EBML_MAX_ID_LENGTH and _uint(header, start, size) > 4:
+            raise EBMLError("Unsupported EBMLMaxIDLength")
+        elif cid == EBML_MAX_SIZE_LENGTH and _uint(header, start, size) > 8:
+            raise EBMLError("Unsupported EBMLMaxSizeLength")
+    if doc_type not in ("matroska", "webm"):
+        raise EBMLError(f"Unsupported DocType: {doc_type}")
+
+    # Segment (skip any Void/CRC between header and segment)
+    _, pos, _ = src.header_at(0)
+    pos += len(header)
+    while True:
+        eid, seg_data, seg_size = src.header_at(pos)
+        if eid == SEGMENT:
+            break
+        if eid not in (VOID, CRC32) or seg_size is None:
+            raise EBMLError("Segment not found")
+        pos = seg_data + seg_size
+    seg_end = src.size if seg_size is None else min(src.size, seg_data + seg_size)
+
+    wanted = {INFO, TRACKS, TAGS}
+    if want_chapters:
+        wanted.add(CHAPTERS)
+    if want_attachments:
+        wanted.add(ATTACHMENTS)
+
+    positions = _locate_top_level(src, seg_data, seg_end, wanted)
+    if INFO not in positions or TRACKS not in positions:
+        raise EBMLError("Info/Tracks not found in file header")
+
+    _, info_buf = src.element(positions[INFO])
+    container = _parse_info(info_buf)
+
+    _, tracks_buf = src.element(positions[TRACKS])
+    tracks = _parse_tracks(tracks_buf)
+
+    if TAGS in positions:
+        try:
+            _, tags_buf = src.element(positions[TAGS])
+            _apply_track_tags(tags_buf, tracks)
+        except EBMLError:
+            pass # Statistics tags are informational only
+
+    result = {
+        "container": {
+            "properties": container,
+            "recognized": True,
+            "supported": True,
+            "type": "Matroska"
+        },
+        "errors": [],
+        "warnings": [],
+        "file_name": path,
+        "tracks": tracks
+    }
+
+    if want_chapters:
+        result["chapters"] = []
+        if CHAPTERS in positions:
+            _, chap_buf = src.element(positions[CHAPTERS])
+            result["chapters"] = _parse_chapters(chap_buf)
+
+    if want_attachments:
+        result["attachments"] = []
+        if ATTACHMENTS in positions:
+            result["attachments"] = _parse_attachments(src, positions[ATTACHMENTS])
+
+    return result
+
+def _locate_top_level(src, seg_data, seg_end, wanted):
+    """
+    Find absolute offsets of the wanted top level elements.
+    Uses the SeekHead(s) and a linear scan of the elements before the first Cluster.
+    """
+    positions = {}
+    seek_heads = []
+    pos = seg_data
+    while pos < seg_end and not wanted.issubset(positions):
+        eid, data_start, size = src.header_at(pos)
+        if eid == CLUSTER:
+            break
+        if size is None:
+            raise EBMLError("Unknown-size element before first Cluster")
+        if eid == SEEK_HEAD:
+            seek_heads.append(pos)
+            for target_id, target_pos in _parse_seek_head(src, pos, seg_data):
+                if target_id == SEEK_HEAD and target_pos not in seek_heads:
+                    # A secondary SeekHead (usually at the end of the file)
+                    seek_heads.append(target_pos)
+                    for sub_id, sub_pos in _parse_seek_head(src, target_pos, seg_data):
+                        positions.setdefault(sub_id, sub_pos)
+                else:
+                    positions.setdefault(target_id, target_pos)
+        elif eid in wanted:
+            positions.setdefault(eid, pos)
+        pos = data_start + size
+
+    return {eid: p for eid, p in positions.items() if eid in wanted and p < seg_end}
+
+def _parse_seek_head(src, offset, seg_data):
+    eid, buf = src.element(offset)
+    if eid != SEEK_HEAD:
+        raise EBMLError("SeekHead entry does not point at a SeekHead")
+    entries = []
+    for cid, start, size in _children(buf, 0, len(buf)):
+        if cid != SEEK:
+            continue
+        target_id = None
+        target_pos = None
+        for sid, s_start, s_size in _children(buf, start, start + size):
+            if sid == SEEK_ID:
+                target_id = _uint(buf, s_start, s_size)
+            elif sid == SEEK_POSITION:
+                target_pos = seg_data + _uint(buf, s_start, s_size)
+        if target_id is not None and target_pos is not None:
+            entries.append((target_id, target_pos))
+    return entries
+
+def _parse_info(buf):
+    props = {}
+    scale = 1000000
+    duration = None
+    for cid, start, size in _children(buf, 0, len(buf)):
+        if cid == TIMESTAMP_SCALE:
+            scale = _uint(buf, start, size)
+        elif cid == DURATION:
+            duration = _float(buf, start, size)
+        elif cid == TITLE:
+            props["title"] = _string(buf, start, size)
+        elif cid == MUXING_APP:
+            props["muxing_application"] = _string(buf, start, size)
+        elif cid == WRITING_APP:
+            props["writing_application"] = _string(buf, start, size)
+        elif cid == SEGMENT_UID:
+            props["segment_uid"] = bytes(buf[start:start + size]).hex()
+
+    props["timestamp_scale"] = scale
+    if duration is not None:
+        props["duration"] = int(duration * scale)
+    props["is_providing_timestamps"] = True
+    return props
+
+def _parse_tracks(buf):
+    tracks = []
+    for cid, start, size in _children(buf, 0, len(buf)):
+        if cid != TRACK_ENTRY:
+            continue
+        tracks.append(_parse_track_entry(buf, start, start + size, len(tracks)))
+    if not tracks:
+        raise EBMLError("No track entries")
+    return tracks
+
+def _parse_track_entry(buf, start, end, track_id):
+    # Matroska defaults for elements that are absent
+    props = {
+        "default_track": True,
+        "enabled_track": True,
+        "forced_track": False,
+        "language": "eng"
+    }
+    track_type = None
+    codec_id = None
+
+    for cid, s, size in _children(buf, start, end):
+        if cid == TRACK_NUMBER:
+            props["number"] = _uint(buf, s, size)
+        elif cid == TRACK_UID:
+            props["uid"] = _uint(buf, s, size)
+        elif cid == TRACK_TYPE:
+            track_type = _uint(buf, s, size)
+        elif cid == FLAG_ENABLED:
+            props["enabled_track"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_DEFAULT:
+            props["default_track"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_FORCED:
+            props["forced_track"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_HEARING_IMPAIRED:
+            props["flag_hearing_impaired"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_VISUAL_IMPAIRED:
+            props["flag_visual_impaired"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_TEXT_DESCRIPTIONS:
+            props["flag_text_descriptions"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_ORIGINAL:
+            props["flag_original"] = bool(_uint(buf, s, size))
+        elif cid == FLAG_COMMENTARY:
+            props["flag_commentary"] = bool(_uint(buf, s, size))
+        elif cid == DEFAULT_DURATION:
+            props["default_duration"] = _uint(buf, s, size)
+        elif cid == NAME:
+            props["track_name"] = _string(buf, s, size)
+        elif cid == LANGUAGE:
+            props["language"] = _string(buf, s, size)
+        elif cid == LANGUAGE_IETF:
+            props["language_ietf"] = _string(buf, s, size)
+        elif cid == CODEC_ID:
+            codec_id = _string(buf, s, size)
+        elif cid == CODEC_PRIVATE:
+            props["codec_private_length"] = size
+        elif cid == VIDEO:
+            _parse_video(buf, s, s + size, props)
+        elif cid == AUDIO:
+            _parse_audio(buf, s, s + size, props)
+
+    if track_type not in TRACK_TYPES:
+        raise EBMLError(f"Unsupported track type: {track_type}")
+    if not codec_id:
+        raise EBMLError("Track without CodecID")
+
+    props["codec_id"] = codec_id
+    return {
+        "codec": CODEC_NAMES.get(codec_id, codec_id),
+        "id": track_id,
+        "type": TRACK_TYPES[track_type],
+        "properties": props
+    }
+
+def _parse_video(buf, start, end, props):
+    pw = ph = dw = dh = None
+    for cid, s, size in _children(buf, start, end):
+        if cid == PIXEL_WIDTH:
+            pw = _uint(buf, s, size)
+        elif cid == PIXEL_HEIGHT:
+            ph = _uint(buf, s, size)
+        elif cid == DISPLAY_WIDTH:
+            dw = _uint(buf, s, size)
+        elif cid == DISPLAY_HEIGHT:
+            dh = _uint(buf, s, size)
+    if pw and ph:
+        props["pixel_dimensions"] = f"{pw}x{ph}"
+        props["display_dimensions"] = f"{dw or pw}x{dh or ph}"
+
+def _parse_audio(buf, start, end, props):
+    for cid, s, size in _children(buf, start, end):
+        if cid == SAMPLING_FREQUENCY:
+            props["audio_sampling_frequency"] = int(_float(buf, s, size))
+        elif cid == CHANNELS:
+            props["audio_channels"] = _uint(buf, s, size)
+        elif cid == BIT_DEPTH:
+            props["audio_bits_per_sample"] = _uint(buf, s, size)
+
+def _apply_track_tags(buf, tracks):
+    """Copy per-track SimpleTags (e.g. statistics) into properties as tag_<name>."""
+    by_uid = {t["properties"].get("uid"): t["properties"] for t in tracks}
+    for cid, start, size in _children(buf, 0, len(buf)):
+        if cid != TAG:
+            continue
+        uids = []
+        simple = {}
+        for tid, s, sz in _children(buf, start, start + size):
+            if tid == TARGETS:
+                for gid, gs, gsz in _children(buf, s, s + sz):
+                    if gid == TAG_TRACK_UID:
+                        uids.append(_uint(buf, gs, gsz))
+            elif tid == SIMPLE_TAG:
+                name = value = None
+                for nid, ns, nsz in _children(buf, s, s + sz):
+                    if nid == TAG_NAME:
+                        name = _string(buf, ns, nsz)
+                    elif nid == TAG_STRING:
+                        value = _string(buf, ns, nsz)
+                if name and value is not None:
+                    simple["tag_" + name.lower()] = value
+        for uid in uids:
+            if uid in by_uid:
+                by_uid[uid].update(simple)
+
+def _parse_chapters(buf):
+    editions = []
+    for cid, start, size in _children(buf, 0, len(buf)):
+        if cid != EDITION_ENTRY:
+            continue
+        count = sum(1 for aid, _, _ in _children(buf, start, start + size) if aid == CHAPTER_ATOM)
+        editions.append({"num_entries": count})
+    return editions
+
+def _parse_attachments(src, offset):
+    # Walk headers only so FileData is never read
+    eid, data_start, size = src.header_at(offset)
+    if eid != ATTACHMENTS or size is None:
+        raise EBMLError("Invalid Attachments element")
+    end = data_start + size
+
+    result = []
+    pos = data_start
+    while pos < end:
+        fid, f_start, f_size = src.header_at(pos)
+        if f_size is None:
+            raise EBMLError("Unknown-size attachment")
+        if fid == ATTACHED_FILE:
+            entry = {"id": len(result) + 1, "description": "", "properties": {}}
+            p = f_start
+            while p < f_start + f_size:
+                cid, c_start, c_size = src.header_at(p)
+                if c_size is None:
+                    raise EBMLError("Unknown-size attachment child")
+                if cid == FILE_DATA:
+                    entry["size"] = c_size
+                elif cid in (FILE_NAME, FILE_MIME_TYPE, FILE_DESCRIPTION, FILE_UID):
+                    value = src.read(c_start, c_size)
+                    if cid == FILE_NAME:
+                        entry["file_name"] = _string(value, 0, c_size)
+                    elif cid == FILE_MIME_TYPE:
+                        entry["content_type"] = _string(value, 0, c_size)
+                    elif cid == FILE_DESCRIPTION:
+                        entry["description"] = _string(value, 0, c_size)
+                    else:
+                        entry["properties"]["uid"] = _uint(value, 0, c_size)
+                p = c_start + c_size
+            result.append(entry)
+        pos = f_start + f_size
+    return result
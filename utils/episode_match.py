@@ -0,0 +1,122 @@
+import os
+import re
+import difflib
+
+SUBTITLE_EXTENSIONS = ('.srt', '.ass', '.ssa', '.sub', '.vtt')
+
+# How a subtitle was paired with an episode, strongest first
+MATCH_SEASON_EPISODE = "SxxEyy"
+MATCH_EPISODE = "episode"
+MATCH_NAME = "name"
+
+# Minimum difflib ratio between normalized names for a name match
+NAME_MATCH_CUTOFF = 0.6
+
+_SEASON_EPISODE_RE = re.compile(r'(?<![a-z0-9])s(\d{1,2})[ ._-]*e(\d{1,3})(?!\d)|(?<!\d)(\d{1,2})x(\d{2,3})(?!\d)', re.I)
+_EPISODE_WORD_RE = re.compile(r'(?<![a-z])(?:e|ep|episode)[ ._-]*(\d{1,3})(?!\d)', re.I)
+_BARE_NUMBER_RE = re.compile(r'(?<![a-z0-9])(\d{1,3})(?![0-9])(?!(?!v\d)[a-z])', re.I) # "05v2" is episode 5
+# Tags, resolutions, codecs, audio channels and bit depths: numbers that are never the episode
+_NOISE_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)|\b(?:480|576|720|1080|2160)[pi]\b|\b[hx]\.?26[45]\b'
+                       r'|(?<![\d.])\d\.\d(?:ch)?(?![\d.])|\b\d+bit\b', re.I)
+
+def parse_episode(filename):
+    """
+    Returns (season, episode) parsed from a file name; season is None when only
+    an episode number is present, and the result is None when neither is.
+    "Show.S01E05.mkv" -> (1, 5), "Show 1x05.srt" -> (1, 5), "Show - 05 [1080p].mkv" -> (None, 5)
+    """
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    m = _SEASON_EPISODE_RE.search(stem)
+    if m:
+        season, episode = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+        return int(season), int(episode)
+
+    m = _EPISODE_WORD_RE.search(stem)
+    if m:
+        return None, int(m.group(1))
+
+    # Group tags, release info and resolutions carry numbers too; the last bare number is the episode
+    numbers = _BARE_NUMBER_RE.findall(_NOISE_RE.sub(" ", stem))
+    if numbers:
+        return None, int(numbers[-1])
+    return None
+
+def normalize_name(filename):
+    """Lower-case alphanumeric words of a file name, without extension, tags or resolution."""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return " ".join(re.findall(r'[a-z0-9]+', _NOISE_RE.sub(" ", stem).lower()))
+
+def collect_subtitles(paths):
+    """Expand a mix of subtitle files and directories into a sorted list of subtitle files."""
+    subs = []
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                subs.extend(e.path for e in it if e.is_file() and e.name.lower().endswith(SUBTITLE_EXTENSIONS))
+        elif os.path.isfile(path):
+            subs.append(path)
+    return sorted(set(subs))
+
+class SubtitleIndex:
+    """
+    Subtitles indexed by (season, episode), by episode number and by normalized
+    name, built once so matching a whole season is a dict lookup per episode.
+    """
+    def __init__(self, subtitle_paths):
+        self.by_season_episode = {}
+        self.by_episode = {}
+        self.seasons = set()
+        self.names = {} # normalized name -> [paths]
+
+        for path in subtitle_paths:
+            parsed = parse_episode(path)
+            if parsed is not None:
+                season, episode = parsed
+                if season is not None:
+                    self.by_season_episode.setdefault((season, episode), []).append(path)
+                    self.seasons.add(season)
+                self.by_episode.setdefault(episode, []).append(path)
+            self.names.setdefault(normalize_name(path), []).append(path)
+
+    def lookup(self, video_path):
+        """Returns (subtitle paths, match method) for one episode; ([], None) when nothing matches."""
+        parsed = parse_episode(video_path)
+        if parsed is not None:
+            season, episode = parsed
+            if season is not None and (season, episode) in self.by_season_episode:
+                return list(self.by_season_episode[(season, episode)]), MATCH_SEASON_EPISODE
+            # Episode numbers alone are only unambiguous within a single season
+            if len(self.seasons) <= 1 and episode in self.by_episode:
+                candidates = [p for p in self.by_episode[episode]
+                              if season is None or parse_episode(p)[0] in (None, season)]
+                if candidates:
+                    return candidates, MATCH_EPISODE
+            if episode in self.by_episode:
+                return [], None # Numbered, but only in other seasons (or ambiguous across them)
+
+        # Similar names with a different episode number are other episodes of the same show
+        episode = parsed[1] if parsed is not None else None
+        for name in difflib.get_close_matches(normalize_name(video_path), self.names, n=5, cutoff=NAME_MATCH_CUTOFF):
+            paths = [p for p in self.names[name] if episode is None or (parse_episode(p) or (None, episode))[1] == episode]
+            if paths:
+                return paths, MATCH_NAME
+        return [], None
+
+def match_episodes(video_paths, subtitle_paths):
+    """
+    Pair each episode with its subtitles (several languages per episode are kept together).
+    Returns (matches, unmatched_subs) where matches is a list of
+    {"video": path, "subs": [paths], "method": MATCH_* or None} in video order.
+    A subtitle is given to at most one episode.
+    """
+    index = SubtitleIndex(subtitle_paths)
+    used = set()
+    matches = []
+    for video in video_paths:
+        subs, method = index.lookup(video)
+        subs = [s for s in subs if s not in used]
+        used.update(subs)
+        matches.append({"video": video, "subs": subs, "method": method if subs else None})
+
+    unmatched = [s for s in subtitle_paths if s not in used]
+    return matches, unmatched
@@ -3,6 +3,9 @@ import json
 import shutil
 import os
 from utils.dependency_manager import DependencyManager
+from utils.probe_cache import ProbeCache
+from utils.process_runner import run_streaming, ProcessAborted, PROBE_TIMEOUT
+from utils.atomic_output import AtomicOutput
 
 def check_ffmpeg():
     """
@@ -17,11 +20,17 @@ def get_ffmpeg_info(file_path):
     """
     Use ffprobe to get info about a video file and return it in a format
     compatible with the app's existing MKV structure.
+    Results are served from the probe cache when the file and ffprobe are unchanged.
     """
     ffprobe_exe = DependencyManager().get_binary_path("ffprobe")
     if not ffprobe_exe:
         raise FileNotFoundError("ffprobe not found")
 
+    cache = ProbeCache()
+    cached = cache.get(file_path, "ffprobe")
+    if cached is not None:
+        return cached
+
     cmd = [
         ffprobe_exe,
         "-v", "quiet",
@@ -32,7 +41,8 @@ def get_ffmpeg_info(file_path):
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # subprocess.run kills ffprobe and raises TimeoutExpired if it hangs
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=PROBE_TIMEOUT)
         if result.returncode != 0:
             print(f"Error running ffprobe: {result.stderr}")
             return None
@@ -88,9 +98,23 @@ def get_ffmpeg_info(file_path):
                         "track_name": track_name
                     }
                 }
+                # MKVToolNix statistics tags, used to estimate output sizes
+                number_of_bytes = tags.get("NUMBER_OF_BYTES") or tags.get("NUMBER_OF_BYTES-eng")
+                if number_of_bytes:
+                    track_entry["properties"]["tag_number_of_bytes"] = number_of_bytes
                 tracks.append(track_entry)
 
-        return {"tracks": tracks}
+        info = {"tracks": tracks}
+
+        # Container duration in ns (mkvmerge -J convention), used for progress percentages
+        try:
+            duration = float(data.get("format", {}).get("duration"))
+            info["container"] = {"properties": {"duration": int(duration * 1000000000)}}
+        except (TypeError, ValueError):
+            pass
+
+        cache.put(file_path, "ffprobe", info)
+        return info
 
     except Exception as e:
         print(f"Exception running ffprobe: {e}")
@@ -112,3 +136,103 @@ def extract_stream_cmd(input_path, track_id, output_path):
         "-c", "copy",
         output_path
     ]
+
+def extract_streams_cmd(input_path, track_id_path_map):
+    """
+    Return a single ffmpeg command extracting several tracks in one pass,
+    so the source is read and demuxed once:
+    ffmpeg -i input_path -map 0:<id1> -c copy out1 -map 0:<id2> -c copy out2 ...
+    """
+    ffmpeg_exe = DependencyManager().get_binary_path("ffmpeg")
+    if not ffmpeg_exe:
+        raise FileNotFoundError("ffmpeg not found")
+
+    cmd = [ffmpeg_exe, "-i", input_path]
+    for tid, output_path in track_id_path_map.items():
+        cmd.extend(["-map", f"0:{tid}", "-c", "copy", output_path])
+    return cmd
+
+def mux_subtitles_cmd(output_path, video_path, subtitle_paths, languages=None, first_sub_index=0):
+    """
+    Return an ffmpeg command copying every stream of video_path into an MP4
+    and adding the external subtitles as mov_text tracks.
+    languages: codes matching subtitle_paths (None/"und" entries are left unset)
+    first_sub_index: number of subtitle streams already in video_path, so the
+    language metadata lands on the added tracks.
+    """
+    ffmpeg_exe = DependencyManager().get_binary_path("ffmpeg")
+    if not ffmpeg_exe:
+        raise FileNotFoundError("ffmpeg not found")
+
+    cmd = [ffmpeg_exe, "-y", "-i", video_path]
+    for sub_path in subtitle_paths:
+        cmd.extend(["-i", sub_path])
+
+    cmd.extend(["-map", "0"])
+    for i in range(len(subtitle_paths)):
+        cmd.extend(["-map", f"{i + 1}:0"]) # One stream per subtitle file
+
+    for i, lang in enumerate(languages or []):
+        if lang and lang != "und":
+            cmd.extend([f"-metadata:s:s:{first_sub_index + i}", f"language={lang}"])
+
+    cmd.extend(["-c:v", "copy", "-c:a", "copy", "-c:s", "mov_text", output_path])
+    return cmd
+
+def mux_subtitles(output_path, video_path, subtitle_paths, languages=None, first_sub_index=0,
+                  on_progress=None, duration_ns=None, limits=None):
+    """
+    Run mux_subtitles_cmd. Returns (success, message) like mkv_wrapper.mux_mkv,
+    which it also follows in writing to a temp file renamed into place on success.
+    """
+    with AtomicOutput(output_path) as out:
+        cmd = mux_subtitles_cmd(out.path, video_path, subtitle_paths, languages, first_sub_index)
+        try:
+            result = run_streaming(cmd, on_progress=on_progress, duration_ns=duration_ns, output_path=out.path,
+                                   limits=limits)
+            if result.returncode == 0:
+                out.commit()
+            return result.returncode == 0, result.stderr or result.stdout
+        except Exception as e:
+            return False, str(e)
+
+def extract_streams(input_path, track_id_path_map, on_progress=None, duration_ns=None, limits=None):
+    """
+    Extract tracks with a single multi-output ffmpeg run.
+    If that run fails, its outputs are discarded and each track is retried
+    on its own so failures can be attributed to individual tracks.
+    A run stopped by limits (process_runner.Limits) is not retried; ProcessAborted propagates.
+    Tracks are written to temp files and renamed into place once complete.
+    Returns a dict track_id -> error message (empty on success).
+    """
+    outputs = {tid: AtomicOutput(path) for tid, path in track_id_path_map.items()}
+    try:
+        cmd = extract_streams_cmd(input_path, {tid: out.path for tid, out in outputs.items()})
+        result = run_streaming(cmd, on_progress=on_progress, duration_ns=duration_ns, limits=limits)
+        if result.returncode == 0:
+            for out in outputs.values():
+                out.commit()
+            return {}
+    except (FileNotFoundError, ProcessAborted):
+        raise
+    except Exception:
+        pass
+    finally:
+        for out in outputs.values():
+            if not out.committed:
+                out.discard()
+
+    errors = {}
+    for tid, output_path in track_id_path_map.items():
+        with AtomicOutput(output_path) as out:
+            try:
+                result = run_streaming(extract_stream_cmd(input_path, tid, out.path), limits=limits)
+                if result.returncode != 0:
+                    errors[tid] = result.stderr.strip()
+                else:
+                    out.commit()
+            except ProcessAborted:
+                raise
+            except Exception as e:
+                errors[tid] = str(e)
+    return errors
@@ -2,6 +2,7 @@ import os
 import sys
 import shutil
 import subprocess
+import threading
 import tkinter as tk
 from tkinter import filedialog
 from contextlib import contextmanager
@@ -34,9 +35,23 @@ def _find_system_binary(name):
     
     return None
 
-# Detect Linux Tools (with fallback for bundled apps)
-_ZENITY_PATH = _find_system_binary("zenity")
-_KDIALOG_PATH = _find_system_binary("kdialog")
+# Linux dialog tools (with fallback for bundled apps), resolved on first use
+# instead of at import so they stay off the start-up path
+_dialog_paths = None
+_dialog_paths_lock = threading.Lock()
+
+def _get_dialog_paths():
+    """Returns (zenity_path, kdialog_path); either may be None."""
+    global _dialog_paths
+    with _dialog_paths_lock:
+        if _dialog_paths is None:
+            _dialog_paths = (_find_system_binary("zenity"), _find_system_binary("kdialog"))
+        return _dialog_paths
+
+def preload():
+    """Resolves the dialog tools ahead of the first dialog. Safe to call from a worker thread."""
+    if sys.platform.startswith("linux"):
+        _get_dialog_paths()
 
 @contextmanager
 def _tk_context():
@@ -98,9 +113,10 @@ def select_file(title="Select File", filetypes=None):
     Returns absolute path string or None.
     """
     if sys.platform.startswith("linux"):
+        zenity_path, kdialog_path = _get_dialog_paths()
         try:
-            if _ZENITY_PATH:
-                cmd = [_ZENITY_PATH, "--file-selection", f"--title={title}"]
+            if zenity_path:
+                cmd = [zenity_path, "--file-selection", f"--title={title}"]
                 if filetypes:
                     for name, pattern in filetypes:
                         # Zenity 4.x format: "Name | Pattern1 Pattern2"
@@ -110,8 +126,8 @@ def select_file(title="Select File", filetypes=None):
                 if path: return os.path.abspath(path)
                 if path is None: return None # Cancelled
 
-            elif _KDIALOG_PATH:
-                cmd = [_KDIALOG_PATH, "--getopenfilename", os.getcwd()]
+            elif kdialog_path:
+                cmd = [kdialog_path, "--getopenfilename", os.getcwd()]
                 if filetypes:
                     # KDialog filter: "*.mkv *.mp4|Video Files"
                     filters = []
@@ -143,10 +159,11 @@ def select_files(title="Select Files", filetypes=None):
     Returns list of strings or empty list.
     """
     if sys.platform.startswith("linux"):
+        zenity_path, kdialog_path = _get_dialog_paths()
         try:
-            if _ZENITY_PATH:
+            if zenity_path:
                 # Zenity multiple returns paths separated by | by default
-                cmd = [_ZENITY_PATH, "--file-selection", "--multiple", f"--title={title}"]
+                cmd = [zenity_path, "--file-selection", "--multiple", f"--title={title}"]
                 if filetypes:
                     for name, pattern in filetypes:
                         # Zenity 4.x format: "Name | Pattern1 Pattern2"
@@ -159,9 +176,9 @@ def select_files(title="Select Files", filetypes=None):
                     return [os.path.abspath(p) for p in paths if p]
                 if out is None: return [] # Cancelled
 
-            elif _KDIALOG_PATH:
+            elif kdialog_path:
                 # KDialog multiple
-                cmd = [_KDIALOG_PATH, "--getopenfilename", os.getcwd(), "--multiple", "--separate-output"]
+                cmd = [kdialog_path, "--getopenfilename", os.getcwd(), "--multiple", "--separate-output"]
                 if filetypes:
                     filters = []
                     for name, pattern in filetypes:
@@ -193,10 +210,11 @@ def save_file(title="Save As", initialfile=None, filetypes=None, defaultextensio
     Returns absolute path string or None.
     """
     if sys.platform.startswith("linux"):
+        zenity_path, kdialog_path = _get_dialog_paths()
         try:
-            if _ZENITY_PATH:
+            if zenity_path:
                 # Note: --confirm-overwrite is deprecated in zenity 4.x but harmless
-                cmd = [_ZENITY_PATH, "--file-selection", "--save", f"--title={title}"]
+                cmd = [zenity_path, "--file-selection", "--save", f"--title={title}"]
                 if initialfile:
                     cmd.append(f"--filename={initialfile}")
                 if filetypes:
@@ -208,8 +226,8 @@ def save_file(title="Save As", initialfile=None, filetypes=None, defaultextensio
                 if path: return os.path.abspath(path)
                 if path is None: return None
 
-            elif _KDIALOG_PATH:
-                cmd = [_KDIALOG_PATH, "--getsavefilename", os.getcwd()]
+            elif kdialog_path:
+                cmd = [kdialog_path, "--getsavefilename", os.getcwd()]
                 if filetypes:
                      filters = []
                      for name, pattern in filetypes:
@@ -244,15 +262,16 @@ def select_directory(title="Select Directory"):
     Returns absolute path string or None.
     """
     if sys.platform.startswith("linux"):
+        zenity_path, kdialog_path = _get_dialog_paths()
         try:
-            if _ZENITY_PATH:
-                cmd = [_ZENITY_PATH, "--file-selection", "--directory", f"--title={title}"]
+            if zenity_path:
+                cmd = [zenity_path, "--file-selection", "--directory", f"--title={title}"]
                 path = _run_linux_cmd(cmd)
                 if path: return os.path.abspath(path)
                 if path is None: return None
 
-            elif _KDIALOG_PATH:
-                cmd = [_KDIALOG_PATH, "--getexistingdirectory", os.getcwd()]
+            elif kdialog_path:
+                cmd = [kdialog_path, "--getexistingdirectory", os.getcwd()]
                 path = _run_linux_cmd(cmd)
                 if path: return os.path.abspath(path)
                 if path is None: return None
@@ -0,0 +1,144 @@
+"""
+Per-job performance metrics: wall time, bytes in and out, throughput, CPU time
+and peak memory of the external tools, one record per finished job.
+
+Records are kept in memory for the metrics panel and appended as JSON lines to
+job_metrics.jsonl in the cache directory, so runs can be compared across
+machines and settings (pool sizes, source on a NAS or a local disk, ...).
+"""
+import os
+import json
+import socket
+import threading
+from collections import deque
+from datetime import datetime
+from utils.job_scheduler import JobScheduler, FINISHED_STATES
+from utils.probe_cache import get_cache_dir
+
+LOG_NAME = "job_metrics.jsonl"
+# The log is rotated to job_metrics.jsonl.1 beyond this size
+MAX_LOG_BYTES = 5 * 1024 * 1024
+
+def _total_size(paths):
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+def job_record(job):
+    """
+    Metrics of a finished scheduler Job as a JSON-ready dict.
+    mb_per_s is input MB (1024 * 1024 bytes) per wall-clock second, or output MB
+    for jobs without known inputs; cpu_percent is tool CPU time over wall time
+    (above 100 for tools using several cores). Unknown values are None.
+    """
+    wall = (job.finished - job.started) if job.started and job.finished else None
+    input_bytes = _total_size(job.input_paths)
+    output_bytes = _total_size(job.output_paths)
+    moved = input_bytes or output_bytes
+
+    cpu_times = [u.cpu_seconds for u in job.tool_usage if u.cpu_seconds is not None]
+    peaks = [u.max_rss for u in job.tool_usage if u.max_rss is not None]
+    cpu = sum(cpu_times) if cpu_times else None
+
+    return {
+        "job_id": job.id,
+        "title": job.title,
+        "kind": job.kind,
+        "state": job.state,
+        "pool": job.pool,
+        "pool_size": JobScheduler().pool_size(job.pool),
+        "started": datetime.fromtimestamp(job.started).isoformat(timespec="seconds") if job.started else None,
+        "wall_s": round(wall, 3) if wall is not None else None,
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes,
+        "mb_per_s": round(moved / (1024 * 1024) / wall, 2) if wall and moved else None,
+        "cpu_s": round(cpu, 3) if cpu is not None else None,
+        "cpu_percent": round(100 * cpu / wall, 1) if cpu is not None and wall else None,
+        "peak_rss_bytes": max(peaks) if peaks else None,
+        "tool_runs": len(job.tool_usage),
+        "host": socket.gethostname(),
+    }
+
+class JobMetrics:
+    """
+    Records metrics for every listed job the scheduler finishes (probes excluded).
+    Listeners are called with each new record, from the thread that finished the job.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_RECORDS = 200 # Kept in memory for the panel, like JobScheduler.MAX_FINISHED
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(JobMetrics, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=self.MAX_RECORDS)
+        self._recorded = deque(maxlen=self.MAX_RECORDS) # Recent job ids, a finished job is notified more than once
+        self._listeners = []
+        self.log_path = os.path.join(get_cache_dir(), LOG_NAME)
+        JobScheduler().add_listener(self._on_job_event)
+        self._initialized = True
+
+    def records(self):
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def export(self, path):
+        """Write the records in memory to path as JSON lines."""
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.records():
+                f.write(json.dumps(record) + "\n")
+
+    def _on_job_event(self, job):
+        if job is None or job.kind == "probe" or job.state not in FINISHED_STATES or job.started is None:
+            return # Probes and jobs cancelled before they started have nothing to measure
+        with self._lock:
+            if job.id in self._recorded:
+                return
+            self._recorded.append(job.id)
+
+        record = job_record(job)
+        with self._lock:
+            self._records.append(record)
+            self._append_to_log(record)
+        for callback in list(self._listeners):
+            try:
+                callback(record)
+            except Exception as e:
+                print(f"Warning: metrics listener failed: {e}")
+
+    def _append_to_log(self, record):
+        # Called with self._lock held, so concurrent jobs never interleave lines
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            if os.path.exists(self.log_path) and os.path.getsize(self.log_path) > MAX_LOG_BYTES:
+                os.replace(self.log_path, self.log_path + ".1")
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"Warning: could not write job metrics: {e}")
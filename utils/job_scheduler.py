@@ -0,0 +1,254 @@
+import os
+import time
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future
+from utils.process_runner import Limits, DEFAULT_STALL_TIMEOUT, set_usage_sink
+
+# Pools: "cpu" for tools that burn cores (ffmpeg), "io" for tools that mostly
+# copy bytes (mkvmerge remux, mkvextract, mkvpropedit) and "probe" for the short
+# header reads behind the track lists, which must never wait behind a long job.
+POOL_CPU = "cpu"
+POOL_IO = "io"
+POOL_PROBE = "probe"
+
+DEFAULT_POOL_SIZES = {
+    POOL_CPU: 1, # ffmpeg already spreads one job over all cores
+    POOL_IO: 2,
+    POOL_PROBE: 2,
+}
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+_CPU_TOOLS = ("ffmpeg",)
+
+def pool_for_tool(tool_name):
+    """Picks the pool for an external tool by name."""
+    name = os.path.basename(tool_name).lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    return POOL_CPU if name in _CPU_TOOLS else POOL_IO
+
+class Job:
+    """
+    One unit of work on the scheduler.
+
+    fn(job) runs on a pool thread; it can call job.report_progress(progress)
+    and should check job.cancel_event if it can stop early. External tools get
+    job.limits, so cancel() kills a running tool and the timeouts apply.
+    job.future resolves to fn's return value (or raises its exception).
+
+    input_paths/output_paths name the files the job reads and writes (fn may add
+    to them once it knows); tool_usage collects a process_runner.ToolUsage per
+    tool run. utils.job_metrics turns these into per-job metrics.
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, title, fn, pool, kind, timeout=None, stall_timeout=None, interruptible=True):
+        self.id = next(self._ids)
+        self.title = title
+        self.fn = fn
+        self.pool = pool
+        self.kind = kind
+        self.state = QUEUED
+        self.progress = None # Last process_runner.Progress
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.future = Future()
+        self.cancel_event = threading.Event()
+        self.timeout = timeout
+        self.stall_timeout = stall_timeout
+        self.interruptible = interruptible
+        self.input_paths = []
+        self.output_paths = []
+        self.tool_usage = []
+        self._scheduler = None
+
+    @property
+    def limits(self):
+        """process_runner.Limits for the tools this job runs."""
+        return Limits(self.cancel_event, self.timeout, self.stall_timeout)
+
+    def report_progress(self, progress):
+        self.progress = progress
+        self._scheduler._notify(self)
+
+    def cancel(self):
+        """Drops a queued job; stops a running one via cancel_event (killing its tool)."""
+        self._scheduler.cancel(self)
+
+class JobScheduler:
+    """
+    Central queue for every external tool invocation.
+
+    Jobs wait in a FIFO per pool and at most pool size of them run at once.
+    Listeners are called with the Job on every state or progress change,
+    from whichever thread made the change (marshal to Tk with after()).
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_FINISHED = 200 # Finished jobs kept for the queue view
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(JobScheduler, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.Lock()
+        self._pool_sizes = dict(DEFAULT_POOL_SIZES)
+        self._stall_timeout = DEFAULT_STALL_TIMEOUT
+        self._pending = {pool: deque() for pool in self._pool_sizes}
+        self._running = {pool: 0 for pool in self._pool_sizes}
+        self._jobs = [] # Listed jobs, oldest first
+        self._listeners = []
+        self._initialized = True
+
+    def submit(self, title, fn, pool=POOL_IO, kind="job", listed=True, timeout=None, interruptible=True,
+               inputs=(), outputs=()):
+        """
+        Queues fn(job) on the given pool and returns the Job.
+        listed=False keeps it out of jobs() (used for the background probes).
+        timeout: wall-clock seconds for each tool the job runs (see Job.limits).
+        interruptible=False: once running, cancel() is ignored (in-place edits that must not stop halfway).
+        inputs/outputs: file paths read and written, for the job metrics.
+        """
+        if pool not in self._pool_sizes:
+            raise ValueError(f"Unknown pool: {pool}")
+
+        job = Job(title, fn, pool, kind, timeout, self._stall_timeout, interruptible)
+        job.input_paths.extend(inputs)
+        job.output_paths.extend(outputs)
+        job._scheduler = self
+        with self._lock:
+            self._pending[pool].append(job)
+            if listed:
+                self._jobs.append(job)
+                self._trim_finished()
+        self._notify(job)
+        self._dispatch(pool)
+        return job
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs)
+
+    def pool_size(self, pool):
+        return self._pool_sizes[pool]
+
+    def set_pool_size(self, pool, size):
+        """Resizes a pool; extra queued jobs start right away, excess running ones finish normally."""
+        with self._lock:
+            self._pool_sizes[pool] = max(1, int(size))
+        self._dispatch(pool)
+
+    def stall_timeout(self):
+        return self._stall_timeout
+
+    def set_stall_timeout(self, seconds):
+        """Seconds without progress before a tool is killed, for jobs submitted from now on; None disables."""
+        self._stall_timeout = seconds
+
+    def cancel(self, job):
+        with self._lock:
+            if job.state == QUEUED:
+                try:
+                    self._pending[job.pool].remove(job)
+                except ValueError:
+                    pass
+                job.state = CANCELLED
+                job.finished = time.time()
+                job.future.cancel()
+            elif job.state == RUNNING and job.interruptible:
+                job.cancel_event.set()
+            else:
+                return
+        self._notify(job)
+
+    def clear_finished(self):
+        with self._lock:
+            self._jobs = [j for j in self._jobs if j.state not in FINISHED_STATES]
+        self._notify(None)
+
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, job):
+        for callback in list(self._listeners):
+            try:
+                callback(job)
+            except Exception as e:
+                print(f"Warning: job listener failed: {e}")
+
+    def _trim_finished(self):
+        # Called with self._lock held
+        finished = [j for j in self._jobs if j.state in FINISHED_STATES]
+        if len(finished) > self.MAX_FINISHED:
+            doomed = set(id(j) for j in finished[:len(finished) - self.MAX_FINISHED])
+            self._jobs = [j for j in self._jobs if id(j) not in doomed]
+
+    def _dispatch(self, pool):
+        started = []
+        with self._lock:
+            while self._pending[pool] and self._running[pool] < self._pool_sizes[pool]:
+                job = self._pending[pool].popleft()
+                if not job.future.set_running_or_notify_cancel():
+                    # Cancelled through the Future directly
+                    job.state = CANCELLED
+                    job.finished = time.time()
+                    continue
+                job.state = RUNNING
+                job.started = time.time()
+                self._running[pool] += 1
+                started.append(job)
+
+        for job in started:
+            threading.Thread(target=self._run, args=(job,), daemon=True,
+                             name=f"{pool}-job-{job.id}").start()
+            self._notify(job)
+
+    def _run(self, job):
+        set_usage_sink(job.tool_usage)
+        result = None
+        try:
+            result = job.fn(job)
+        except BaseException as e:
+            job.error = e
+            job.state = CANCELLED if job.cancel_event.is_set() else FAILED
+        else:
+            job.state = CANCELLED if job.cancel_event.is_set() else DONE
+        finally:
+            set_usage_sink(None)
+            job.finished = time.time()
+            with self._lock:
+                self._running[job.pool] -= 1
+                self._trim_finished()
+
+        # Listeners (metrics) first, so whoever waits on the future sees the job fully finished
+        self._notify(job)
+        if job.error is not None:
+            job.future.set_exception(job.error)
+        else:
+            job.future.set_result(result)
+        self._dispatch(job.pool)
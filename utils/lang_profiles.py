@@ -0,0 +1,52 @@
+"""
+Character-trigram language profiles for utils.subtitle_language.
+
+For each language, its PROFILE_SIZE most frequent trigrams, most frequent first,
+separated by spaces ("_" stands for a word boundary). Built from the translated
+message catalogs (gettext .mo files) of a Linux desktop, with English taken from
+the untranslated source strings. Kept as plain strings so importing is cheap.
+"""
+
+PROFILE_SIZE = 400
+
+PROFILES = {
+    "ara": "_ال ية_ الم ات_ رة_ مست _صو ير_ _مس ند_ مة_ الأ نية _في ملف لف_ الت اني اتي الي دة_ تند الب ستن غير _غي _مف في_ الإ _لا لمس صور _مع لى_ يح_ فات يل_ _عل مفت لا_ لية ورة الر الك _مل دية صوت _خط اح_ فتا _مي تاح لات الح الو تيح مفا لة_ ار_ سية الف الع تة_ ستو على _لل لما ون_ ول_ اء_ _بد _تع _فش الق فشل ميت يتة ين_ توى وى_ يف_ _أر _ما زية مع_ حدة يني _تر خطأ طأ_ لإن الث ام_ فل_ لمل رشي شيف قفل يات يزي يو_ _من أرش رية مان ني_ يدي _با حة_ حزم رك_ ليز ماك إنج الس تحد جلي روف نجل وت_ _اس _كا ان_ روس شل_ ليم مسا وف_ _بر كية لمت الن دون من_ ندي يان ert _إل _قا بير رف_ لب_ متح alt الا الخ كبي وسي يا_ يم_ ype _al _قف _مح تعذ طة_ _su pe_ لمف مية وتي _عن typ _مت _مص سار وم_ _أو _بي حرو فية لند ليس ألم انا تي_ در_ شفر لأو لاي لرو نات lt_ rty sun ty_ wer ايا بدو بية تين ربي صدر _qw _ty _wi _خا _دو qwe un_ الد مصد ولا يرة _جد _سل _مج الل فرة لول _وا in_ win بة_ ديو لأل _عا _يو اسم بان بيا لكب مكن _قر _مر الص سم_ عة_ نتو نسي يد_ _شف ctr rl_ trl ال_ فرن فيد لثا لعر مين وز_ _سي er_ امة ديل عذر عمل لحر لفر لم_ وني _فا ft_ إلى رنس زمة عال قرص لحز لخا وي_ يمي _مض _يم توش حرف خام رص_ روم ضغو غال غوط فة_ قرا كنت مضغ وفر يمة يمك _بو _مو اكن دوف رض_ لام ور_ وش_ وين يسا يق_ _ap _ct _تح _صف _نق اك_ الج علا فرك كن_ لمي مات ندو _sh _أن _وي أو_ ائم دم_ ذر_ قال محر وب_ ود_ يت_ _رو انت بري توق زم_ صال لأر لبي لمج لي_ ها_ _ان _حا _دي hif ift shi بول حتو ركي رمز عرض عند كرو لبر مجر وط_ وقع يون _كو _لم ml_ ئمة ادة اصل الة امي بت_ تية ثنا راء سلي سوي قائ للا لوص مل_ اري افي اله ترك تم_ ثال دول ري_ سي_ عرب متو وع_ ولن _حز _مد _و_ ءة_ اد_ است برا تاب توي جري دعم روي سكر صر_ لقر مكت ناء يكي _أم _بع _تم _مش ip_ اءة",
+    "bul": "на_ _на не_ _за _пр ане _не _из та_ _по то_ ван те_ за_ да_ _да ите но_ _от ия_ _се ка_ ва_ _е_ ата се_ _ко пре ен_ _фа айл фай ени _съ ран про _мо мен оже ред мож ни_ ира раз _в_ ето от_ _с_ ият же_ при под ден ция ава ове _оп пра _ра ния ост ани ние _ст _об ри_ _ре ста _и_ _им ие_ име ави анд ли_ ска ект ат_ кат изв _до ът_ пол рав пци опц ежд ент ест ото зва йл_ нат лен дав ята или ма_ неп тел изп ход _гр нит ств дан ори нет ете жда тор _ин зна нда _са са_ ки_ сле сто ти_ реш лед _бе аци ме_ ком ена _сл дър зве зад _то рек ез_ вър _кл вил аде it_ ят_ _па ато тан гре ома ада _ар _ди оме ве_ ате епр лов ман веж каз _gi git ява нос нов ива ода де_ ват пис лон _ка _ил _си ешк ука без _ук во_ _ни аза дир олз лзв пъл сти йло _въ дел ст_ ова шка ире мат мес зап спе чен _къ од_ ед_ _бъ орм рма ълн кто усп дад ко_ ъм_ _но яне ква рем тов ром фор ети _вр ист бъд ено към ичн тва изт уме ърж стр гра ржа нен рой екс ла_ арт еус еме кет вер обе _зн дат мер нти ешн _вс ене рес зпо изх али ел_ _пъ неу три бек ъде лно тно еде зхо сва ика едн клю люч лни рен ра_ ърв зат айт ема ви_ _ве рия ако ина зпъ _та _ак тек нот _re нал вен зда по_ раб _сп арг _дъ пеш еле мо_ або мет реж зи_ шно съз ъзд дар чет кло лна нт_ бот вет има рат той ан_ ати он_ _ма _ви гум ргу аст бро ече пак ции ващ кон кти ана едо ртн ано тир _ли йно поз ойн аке рси сте апи _те вре еди пос азд алн бра ой_ че_ аме иет _фо ача лив _бр тен зде дек тво ува обр иле сам акв тро рит ще_ ии_ илн дни ди_ амо дре ели инд код але жа_ _де _ня фик нас ито със огр отв нде дов нак _ба същ ер_ лне тич чис тре реб лав рам общ чно _тр _вх",
+    "cat": "_de de_ _no es_ _el el_ _es no_ er_ _co ió_ la_ _s_ _la _a_ _un per ent _ha at_ _en _pe que _re _l_ nt_ ar_ est _ca ció _fi ha_ en_ _po _d_ da_ _se és_ al_ _in fit ls_ xer txe itx un_ con com des ra_ sta _pr re_ aci men na_ or_ ts_ ect ta_ del tra ica les _di nom els ut_ _al ion ia_ _és eix pro _si res om_ ada _ex _pa ns_ _qu gut ers esp ix_ tor it_ _am ter aqu cte rs_ ist ir_ str _le amb rec eu_ ri_ ot_ ons for tat _ma ina mb_ _i_ _ll _ar _tr ida et_ tre una esc sió ont _mo ant nci ori _fo lit ue_ pot _op car era pre stà cio ogu orm spe pog _su err rma ntr int omp te_ ssi ca_ dir _ac _o_ ifi nte uet ble fic rro pci tro se_ ver _er ari ten tà_ ade _ob sen ura itz opc lla ost lid tes act git _so ran àli eta an_ tza egu ror ues ona bre _or vàl cap ma_ rad all paq _ve le_ ire dre ort emp ual cto _va _us cad ord can ste _gi fer id_ cri ali us_ os_ mat _và cia par scr ame abl _te iu_ den ita met mpr min eci is_ val més nti ctu nvi lic egi ess pec _lí rea arà dor mis tar pos _fa one seg nar mos íni ènc nal _aq _mi nat nca anc ser ies efe ssa ll_ loc si_ ode lín iss anv ign ge_ nts _me als ref sa_ tur cam ici cac ria tua ume imi pri rsi cci erm inc arg cif odu rti lor st_ rdr ins mer tal cat _ta _da _to _cr ap_ ema rob ass rod ecu rre tem _fe va_ alt inf lat nta lli cre onf tab _em ere tip _ap mpl _ad ado nfo via alo reg man tan tge ure ara nia _hi lle ili _an cor ret ime tin cla atg rac _gr _ti ome sig _lo ats ol_ rim nde ora fal duï lis til _fu sti igu oba obr ase fin té_ _cl ert ple ït_ _he por exe gur uït _st ete leg _im nse ens ors rat dif nst def omi orr rt_ jec hi_ ic_ omé",
+    "ces": "_ne ní_ _po _př _pr je_ sou _na _so pro _se oub ení bor ubo na_ _je _vy sta pře ze_ ová _za ný_ ván né_ se_ ova _ch ání at_ chy hyb _od ce_ ch_ uje or_ rov no_ it_ _do vat pou zna _st při ro_ _v_ ho_ uži ou_ pod neb ost _kl lze pří lo_ _a_ ent nel kon ru_ elz stu _ná oru _ko _ve ké_ líč res te_ le_ lat _s_ ná_ ouž _vý to_ ba_ cí_ nep men em_ _ba klí kaz nač nen ky_ en_ atn tel ast _ad ých ate tav pla ku_ adr ový ebo _ar _zn slo tup yba dre řep bo_ _re odp _ro _ob ny_ vyp vol pis ři_ zen _in str ína _sp ské tu_ pín ého _zá epí byl ové ter prá hod nak nov st_ dno ver van _ja ka_ et_ lov vý_ ek_ bal řen _sy nam če_ odn dat tí_ ty_ for ako _al ím_ měn sti řád jak ta_ sel íka řík ist oče _li _pa _da esá pov alí _řá por čís epl ak_ raz ume lož náz áze orm led mu_ nas án_ _no _už ace ick iva ko_ sář _ce dpo ící _ma živ ově ně_ pra az_ zad tov _sk nt_ ry_ eno _by la_ _čí alo ezn li_ ráv poč ale že_ ran ten áno roz íst oku _ho nos _fo dov not řed _de ti_ dní kov _zp lic vyt ač_ lík mén aný arg žit _si _to _u_ ech do_ edn tný pos de_ _z_ jíc ytv vé_ čen id_ elh čas ven pol ísl sah sle še_ _jm tra by_ ign zí_ _o_ vá_ ont ave ci_ lha hal _ta ele tní ali žád ev_ nou oro cho nez íč_ _mo _te _zm _n_ ovo ifi len čet změ jmé odk am_ ádk obr ují ert _k_ ací eze nýc oto mi_ íče _sl rac ače _bu est _žá er_ dán bud zev žad _me klá tor lik poz bra spo ího lní fik gum rgu _op jed _he pok tvo ádn obs ích _vo ena es_ ění _co yst _ka ít_ tif sku ste áln up_ ve_ kte voř zná ces ins tuj ec_ tů_ kód su_ výs lu_ poj _ak _ty výc akt jso nám vní ním pin sys _lo oli sto íše cké ktu kát nte onč typ píš yl_",
+    "dan": "er_ et_ en_ kke ke_ for ikk _fo _ik ing ere til nde il_ _ti _de de_ _in ter or_ fil _af der ler _fi _er lle ed_ es_ _me ver re_ ind _st ng_ ne_ end _en _i_ ent _ud ste te_ _ka _ko sta den af_ and ret ive ion ger se_ tte nte nge at_ bru ede _br rug an_ gen med kan ang _re els ers men _sk om_ dig und tal skr al_ lse _ve og_ le_ rin nin ell lin det mme ejl fej tio eri _so ker lig _an ata _fe kri _op sk_ _at _un on_ ig_ nne del ile ati yld _li _og dat el_ kun kom _el ldi gyl _ma gt_ _ad avn nav _ku ren str _pr tet som gle jl_ _på ge_ _sy vær _pa ern uge all _vi på_ rer st_ ken ndt ngs giv _fr _ug eks pro _ar dt_ ugy _et res riv vis ven ser _se isk mat _si ort ved man des _al kal pe_ _fl ill igt ska iv_ val kon lde len nd_ _væ _be var nt_ mer ove ett nøg orm øgl rel _læ vet ngi _ta egn is_ lag nst dre _nø age _te stø fra ner unn ige omm kat tan afs jer vn_ _hv sti teg sel ens int ist ar_ _bl rma tre _mi kti pak ug_ _x_ fin id_ red akk dsk rst rt_ log ske ra_ inj nje lok ppe _ge lt_ sym ode alg ert typ lem ype _da _he ve_ hed rne ont sse amm sni rdi rsk ign _sa gn_ _ha ndr one _na ark fla lut ag_ ekt ble rse bol mbo mma sæt ume dst ymb sen slu pre ess ide ude elt ærd _gr tat tem let _nu ore get nta ram _ov læs eli gra ift me_ ons ndo _di opr rki rsi sam ars _om tor ins sio _ek dva tiv _bi uds ta_ old _lo rte cer reg kod _uk est met tid omp tek nsk it_ lad ard adv nda _no ate hol læn _kr fik vne ils før ns_ æng em_ eme gan rre _ty ast uke mel ifi alo dar fte erv gru un_ ér_ nke tes nds arg ten ære _sl _n_ min alt _po kiv tør elo _mo oke ænd ndl por rog hvi kst _du _fu rd_ _va sko",
+    "deu": "en_ er_ ich ein _de sch der cht ung den te_ _be ht_ ver _da _au che _ni nic nde ie_ es_ _un _di ate in_ _ei dat die _ve on_ gen ert ben ten ier ch_ zei _in _we ist nte rde tei ter ng_ it_ rt_ _an ine ion ers _vo wer ere ste _si eic _ge end nge st_ _zu ehl ent feh ren nen _ko ige _er _fe aus hen tio sse ne_ ei_ _is _re eit nd_ erd le_ _fü mit chl men sie ber _pa für ür_ et_ auf bei und ann _wi hle tig von ell _sc sta ebe nn_ rei _ke des abe kan ese kei ges len _st _ze de_ ge_ rte nnt kon geb _mi ler sen im_ ern ang _al erz _se lle sel lti isc run erw wen ame hre and _en rze ült gül _ka rd_ _pr ode for lte ind üss nam ati her uf_ wir chn lis nis zu_ em_ _na eru _ar _op nt_ lüs _co hlü das tze se_ as_ ege pti el_ ird _ab ite chr gab ls_ um_ ile all ies ngü tel _le esc opt usg rst eil re_ us_ _od eim alt unt vor ket one war ach lic lt_ me_ ur_ ger rwe _me ass onn he_ tzt _nu hni ing enn nut utz fer is_ ort omm _gi ner pro orm mat zen akt ign übe at_ ien efe _bi etz enu age _fo als hal _üb art tet hl_ _um be_ ens set _ak spe mer ser mme ene nst eig git wei tie lge rma geg ess anz its _so gt_ rie _ha änd tte ete ekt kom tes gef _im fun ngs lie int rch uch ake les _ma zt_ _gr ts_ ll_ wur _wu zer nze _ta ume rsc urd _li _no _sy ins res pak gel tat era erh est _sp chi erf ali _wa sge com sig sio tor eib ktu ran ck_ rbe al_ rsi det eie erl nac _ex erg ig_ itt _ne ele ss_ ahl kti ech tra lag ühr atu rge fen füh kt_ sti str oll lau mmi rha nne _es dar ori eld rti ede wor ord rn_ isi arg _hi _he nun zah bef tan mod zie pas rne uel neu nfo sin tiv ini onf ifi dem nur an_ arb tem hla or_",
+    "ell": "_το ου_ το_ ση_ αι_ _απ ης_ _δε ος_ να_ _κα _αρ του _αν ει_ δεν εν_ _στ μα_ ρχε _πρ ικό ία_ ων_ αρχ _δι στο ια_ _επ _με _τη κό_ χεί ας_ _συ μέν ματ _η_ _να τικ σης γρα _εί _υπ στη _πα τε_ ίνα είν ής_ κατ ναι είο ηση για τα_ _γι οπο προ δια ται επι ιστ τη_ _χρ απο ην_ _εν χει υπο την ραφ εί_ λογ ανα νο_ ετα ρισ _μη ού_ με_ μη_ ές_ αν_ υνα δυν _κλ ίο_ _αδ ατο από τος μεν σε_ ών_ αλλ ένο ατά ός_ ες_ _έγ αρα ναμ πό_ ισμ ποι _σε ωση της _αλ παρ ομα κυρ των στα περ όνο ίου και στε _πο ατα λει πιλ _πλ ικο τή_ ηκε _πε ειδ ερι _τα ένα νομ νατ συν _σφ κε_ γή_ λμα σφά φάλ άλμ ακέ κέτ θηκ μετ αυτ ετε ρήσ κλε ρακ έχε αση εργ ιο_ χρή δικ αφή μία πακ τυχ ατι λλα τερ _αυ αμί εση ις_ ρησ στή σιμ it_ ιλο ραμ ποτ που _εγ _εκ νικ γκυ έγκ τον ορι _ή_ αμμ ον_ ική τασ τρο γγρ ίας ουρ σία μή_ _gi _έχ _σύ αδυ _γρ γνω αρι ιμο ντο ακτ τήρ αφο ήστ ρο_ σμέ φορ σει git νωσ βολ ολο _ο_ ολή _μπ ανά ογή συμ _δη ημα ποί φή_ άστ _όν κτρ _ει ασί ιση _ορ ρα_ καν _έν _δυ κού λαγ _re αντ χρη δημ οίη _τι ίησ κή_ πορ τά_ εκτ _τω υργ εντ ταν τεί ργα ενό θεί ροσ πει άγν υρο _εξ είτ τολ λή_ ογρ τησ πισ ως_ _χα er_ γασ ρά_ τάσ τοπ έτο ενο οδο ρέπ ίνε έπε πάρ νει ντα ποσ χαρ μός οι_ ησι _κε κά_ μοπ τρέ ιου κτή λεί μπο _μέ ορί πολ γκα εδο ικά πλή γές υση _τε ους ριθ υς_ ίστ ιδι ήμα ακο ιθμ υτό ημε λικ ημι ορε πλη χία τό_ γία υχί διε ομέ ημέ ντι άρχ μιο ρη_ ρου ήση διο σμα _έκ νου υπά νη_ _co οτυ σύν εγκ _λε ρικ ροε ρος πρό ρεί μισ όμε _βρ δύν ύνα οιη σμό _μι οστ στι τύπ νων ουν συγ λου τηρ λόγ νδε εισ δο_ εις μερ ργί σετ _τρ αδύ ατη δεσ _ακ ιών γρά τελ υν_ ανο απα αστ υρη αμε δος ρίσ γίν ενε _γί νόμ τοι χωρ ήκτ εφα λήκ",
+    "eng": "ed_ _in _re _th ing ng_ on_ ion _co le_ the _to _no or_ tio ile to_ he_ es_ er_ not ot_ _fi _fo for is_ ect fil nd_ in_ ent te_ _se _of _is of_ ate and ter nt_ _a_ _pa se_ ati re_ _de _un _pr _us ted _an _ex it_ _st _ca val _di _li con ge_ me_ st_ ame th_ rea _op use ble com id_ ut_ ry_ _wi _ma res ess _ar ali _be al_ nam ver an_ rec cti et_ abl _ch ist sta ith lin ead all ve_ tin _on wit can _al at_ ns_ ts_ ly_ ail age ch_ _su en_ cat ire tor lid ce_ err int as_ out ack _or _en _do pec ad_ ll_ ers ons _si _lo ine ne_ led _na ste ort ld_ mat pti pre no_ ive _fa ign men pro inv omm sio str de_ _me ins _er loc cha _sy be_ opt nte rro nva ran ror _ke dir _va rin _sp exp key set _sh pac dat ory cte por fai han ann red ssi _mo orm _gi ont rt_ ss_ ser nst ang _wa nno _as ct_ _ha _tr thi nge sin put _by ica are che _ou _fr les _wh ifi ck_ ore sec his emo spe arg per man om_ ren _ne ind rs_ end ope ode rma rom ult ow_ ase ove _ta eci era tri _so _ad rat _nu par rem _ve rit _ba nde ere def rd_ ize ces _he fie cou enc tch ume ue_ act cto ey_ pat ure add cre num _cr ic_ low sup fro upp _da pe_ you tur ite ref ber oca lis war _t_ oun uld oul _bu _yo din rsi _mu git omp _at mod eat _mi sig ass dis chi ay_ own rac llo mbe nin ara _s_ ty_ one lic wor nal mit alu reg sym equ ain mma unk ext ds_ mes pri lue ple iti har cif typ ype her _ge tat ord lt_ rge nly onl _bi tes arc our sed nab ppo est tra _po by_ ust und ata _le umb up_ sho tem ele tru _ty qui tab ol_ rch cal atc nat rel _up eco nce pen _la sh_ tpu utp atu ze_ der ntr mov rep exi ach nta mbo _it onf tar bol req ymb ert ten hen us_",
+    "est": "ne_ _ka _võ ise ud_ uta ail fai mis ta_ le_ iga on_ ga_ se_ _fa da_ sta _ei ei_ _on tud _vi kas ili us_ atu asu _se sut st_ _ko id_ _vä end ine ti_ min est ata vig imi ja_ _va ole _ku väl ist te_ võt tus ami ast _sa li_ älj või _si eri el_ nim stu ava eer _re _ni sel tam ada ide lis ime ali _sü _ja ed_ ks_ kui _ol _ar de_ tat ane nda ui_ il_ _te aja ust si_ ald lja loo _pa nne is_ õi_ _lo _mi eta _su _nu ita tu_ kir lt_ gan lik use _al ab_ _li _po es_ nes ega _mä ndi lda ümb eks tme irj ste sis num it_ õnn _pr emi saa kon äär jas mi_ er_ und õtm _ki ent ik_ _lu süm ad_ _ta kat val _jä aks bol ead ma_ mbo et_ mat sea ära ite õti _kä tad eid dat ema and tav vii di_ men me_ tal umb aad rit sen rea ing itu oog sed _tü ade tee ida ont al_ eem _st _tu dis ama sti ri_ _mu pol _an ele lin gi_ ase jär ess oll _ve tak as_ _in alo lid ile oon tan lem nul sio jut see ahe ge_ inu pro _ig arg ate kse lõp ver käs kor oli _ba _lõ ima _to suu tei aa_ ete isi ogi vai eba mit uud iiv lit mal at_ ood uur aal ndm _pi rje aat ber _la ign ati lju mää rgu tsi vad ioo mbe rju iku rid ra_ uut na_ _ee all tab sit nd_ ult _ho _n_ muu ume _eb lok kus mas ral des _pe dus lii sõn _pu res _õn sek ärg ain isa sam _ma era gum ses ssi _tä tte iki kim ter _sõ nte tun nti üst aga bai ea_ taj iks jun itt orm aõn baõ esi ng_ ree süs hen pea sal uba ivi tor _üh ika oet tse vah _le tek _ai lli met oni rmi rol kaa _av ol_ ser fik nt_ _as aik iid sse _ke an_ eme eva iat tim _es ara dme tri _er oma _de ikk ldi tro ub_ ntr _vo blo uge vas _u_ orr rim ute _so arv tüh ühe _et mär par rin _nä hoi _bl koo ksi äit dam eis",
+    "fas": "ده_ _در ست_ ای_ در_ _نا نام _بر ان_ _خط ار_ از_ نده وند ام_ رون _پر رای خطا می_ نی_ پرو _پی طا_ _نم _از رد_ وان _با انی است ند_ _نش _اس شده دار _شد نمی ود_ _نو برا _را به_ دن_ _دا _ها _یک توا _ای را_ بر_ ید_ یک_ تبر اده کرد تن_ شان یست _به _یا عتب معت _خو _فر نشا _نی _کر _تو ته_ نه_ های _شک شکس کست سه_ _مق بان نیس ری_ مه_ ال_ شود این نگا کار یر_ پیش _پا نتظ تیب شتی فت_ نوی امع یبا یان _رو _شا _مش اخت ارد اند پای _پش _کل ها_ ویس پشت ین_ امه خوا قدا لی_ مشخ مقد یا_ یسه _شو _هن _گر وجو یش_ _مو _می با_ جود داد نشد وی_ شد_ هنگ گام _غی غیر پیا یت_ _ان لید ورد کلی یه_ _بی _کن اد_ بای خه_ دی_ نوش وشت _خا اخه برن خته رنا شاخ شنا رفت روی ون_ ات_ ایا ور_ _بس _کا ره_ فرا نما افت خور ردن سیر ندا یاف _بد _دس _عن انت ساخ یند _سی منت نات ندن اه_ اید تظر دست شخص _تن _مس _گو اری بست تظا تنظ ظار ظره ظیم نظی ودی یاد یم_ _سا _مح _مع ریا شکا عنص مسی نصر که_ ینه _so _ند _نس اتو رزن زند فتن فرز ناس یشک یی_ _حا _وج ock soc اشن ایج بود تی_ جاد مان مای ونه گزی یجا _بو _شن _طو _مت _هی ادی ارج صر_ موج نسا _ات _جا _گذ _گز cks ایی بل_ دون صال ناش هیچ گذر یچ_ _شم _ص_ _ور ksv sv_ الی امت بدو رس_ رمن شخ_ شما صه_ طور فاد له_ ودن گون یرم _سو _وا _که ایت باش تفا جزی خصه رسی رود زین ستف مت_ ورو گاه یل_ _ار _دو _شی _لا bus اس_ بار بری بی_ دود رگا ساز ستن شتن علا نش_ واس ول_ کند گرف یام _ب_ _تج _جر _رف _عل _قا _نق _گش us_ اخل تار تجز جری داخ دری راه ردا ریخ زیه سته سیا شتا وده وع_ وه_ گشو یخت _s_ ct_ ارس اشد امب ایش بال تغی تما حدو خار خت_ دا_ درس دین ذرگ ستر شنب صد_ قصد لام ماد مبر محد مقص میز ناخ نبه نوع پید پیو کنش کی_ گیر یدا یون _اج _تب _زم _صا _مج on_ th_ ارا اسط اسه اشت اط_ انه بدی تبد خال دیل رج_ رده شت_",
+    "fin": "en_ ist on_ ta_ nen ine _ei ei_ _va ett in_ sto ell ost le_ tie _kä _ko oit sta _vi lin lli tet sa_ _ti edo ied ssa dos _tu äyt itt an_ vir rhe lle irh tta _ta tä_ _ol ste _si ttu ole käy _on een ton tu_ lit ite eel tus ali tee taa itu ja_ ain tti _li us_ ise to_ tel ent men ttä aa_ val _ar nni tte _sy hee _lo nis tun la_ ia_ et_ lla ess mat aan mis ksi _lu sti mer rit all ava ime stu koh lis kis _mu hte _pa imi its ytt enn set käs mää sen _sa sym tsi äär tää si_ nim ato joi vai än_ utt ään tii eri tav ivi oli soi voi oso _as _la _ku _re bol mbo ymb etu min ää_ hko loh luk ohk _vo kki ita isä _x_ _su tai rek oll ter sky äsk eta ill ois ake ala _ja _ka kir oht ti_ aus irj eki int est lä_ ase lai uut erk _se iin sä_ va_ ume tul onn per tam te_ _al ust _po ema koo ssä var sis nta ote uku nte _tä arv nne epä _ep _jo att kse _ha _me rkk sin stä ark he_ ty_ ees uet _en uot _nä iä_ aik ai_ ata ko_ ais äri _ni tui dot sii lue ran ui_ ytä ri_ rvo ope ama _pi oi_ ses tin era sek rki elm _ty odo sim nti oa_ ami _op _ki tue at_ ulo uks ood tyy ot_ ijo _jä unt iss _ve ila ver ros net vaa llä tty päo äon _ri isi til ori _to oko uva toi kti _ma sij los na_ it_ odi vat kem _yh lii mi_ _oh alu sia _mä suo un_ ndi li_ eks use and iir ast tio ity rja unn _os poi _vä lau ota iet kok päi ut_ _ke jen kan ude aat _ot sit tem _bi kai _no ien tuu kom met kon ian oss hde _pu sal yyp del itä _od ass ika äin ero ttö tuk _av rjo täm kit den sio ers ikk iit muo ohj see ink ypp emi oon uor ome tar aks roi äis rsi ulk ntt dat ppi omi di_ num _in tau _pr ulu ati riv tys pi_ yte aki iiv ämä aut muu ekt nto",
+    "fra": "_de de_ es_ le_ ion er_ on_ _le tio re_ ur_ _co ent _pa nt_ _in _la ne_ la_ ns_ les fic _un _d_ te_ our _no _l_ eur _re ich que ble _en ier ati _po _fi chi men pas con _dé as_ est _es res lis cti st_ tre che ect hie des un_ pou ue_ et_ _li _su ssi ans dan com _se _ré ire du_ _pr en_ ge_ rs_ ibl _à_ _da uti ant ess _im par ts_ pos onn _du ée_ age ons eme _au _n_ ili til se_ val ver mpo it_ ign nte _ch imp ist _so _ut ter _ma rre ce_ une ont _op iqu ali ers sib _ne cha nom _ex ise ec_ us_ oss sio ten omm _av str _mo ut_ me_ nde and ide lle ser ifi _tr ort ert _ou _va _ar ave is_ ar_ non tte err _sy _a_ _pe ure aut _qu _et _ve _si rée _do _éc act _lo rti _fo sse ran ive sec ntr _ce inc _er sta nti man rec per ale nco _di pti té_ cor int cat for pro ou_ vec end ite ir_ ins opt ées nce tur omp déf abl _ca _ta reu sup ie_ ode ffi isa att ill at_ om_ ica arg ind ez_ ouv ren êtr anc orm lid oir _êt pre au_ fin ous mat upp ate mod _af ini por tif teu nst aff dre her _st rou sym ssa _at air lig pe_ tie orr gne éch ces pri tro al_ mme _ét ien reg he_ mbo és_ tai tes ymb bol tra rma enc ére _ap tan ara leu nne _pl ais peu ule ve_ son aqu sat _al egi rép ett in_ inv sur _cl gis tiv _ac rer cte uet tou épe iti ste ail min adr rai cod urs pér ass _ob _te _to ère _bi ole sag éfi sou ors nnu _vo nts rch ell ux_ née tat ctu uve _sa out don qui éra nva rem rsi nu_ cal éci tré el_ eut _s_ ace pré _gr tru typ erm app ype toi ets uct loc nné _b_ _sp bre all rat _cr éri dif ine isé _ty cri san rto mma ina nda sig arc nat jou _gi ruc paq hec lie emp mpl rge _me _vi rac exp lus oit ndu _ad onf si_",
+    "heb": "ית_ ים_ ות_ _של של_ נית _מק _מס ון_ _קו וני מקש מה_ ור_ מך_ מסמ סמך לא_ קשי נה_ לית שים מונ _מת _אר _מו מני _או נת_ עם_ _עם _שמ _תמ יה_ _רו את_ גלי יות יני _יו ביל תמו _אי קוב _הו _לא יון קוד בץ_ ובץ נים רית _פו _ב_ חבי _בר לה_ תים נגל _אנ _את _הר מות _המ בית אנג ילי ני_ _תו מית _לה טית מתי רמה _ma ין_ ונט ונת דית רה_ וד_ _בי רבי שמע _wi _םי ימו לי_ _הח מקו _גו _מי win ומי _לט _לש וג_ וז_ מע_ ert _הש _חב גרי ילו כיו _al _נו אק_ לות פרי _אק _מח _מש קור רכי _גר _הת ספר er_ wer ארכ ימנ כונ _lo _su _שו _תי alt int ype אלי סוג רת_ _דב _למ לטי ניי עדכ רמנ _ca _סי loc ock פונ קה_ קית _הא _ספ ck_ pe_ typ בוז דבו ול_ וסי מת_ _ל_ _נת sun דה_ ישי מאל _לל rty ty_ un_ יל_ סית תונ _ty _אל mac ps_ די_ ילה ללא נטי נתו רוס שית _צר ברמ שמא _qw _מא in_ qwe rl_ או_ גרמ דכו ונה טור טינ יד_ כת_ קש_ רות תית _הי lt_ גיל וח_ _הל ורי יש_ לת_ תכנ _הנ ארה _ct _בו _כו _ני _תק cap ctr ft_ sh_ trl ולמ ופי נות _וי _מכ _נד aps le_ וא_ וי_ וש_ תקנ _אפ אימ בינ רפת _גי _סו _על _ער _פר _רש nto osh tos אות דרש חדש יים ליו נדר צרפ שימ _sh _קי _תכ aci cin גש_ ום_ ונג ורד יונ ינו מסו עיל פתי קת_ _הס בני התק ליט מכו _הז _י_ rea גול ודי וק_ יטו סמה ערב פינ _דו _ימ הוד ודה חשב ינל יפו לאו נגר ערכ פול פית צים רדי רוו ריט _ע_ _עד _פי on_ אומ בר_ וגר ויד יא_ יט_ יק_ יקה כנה לש_ מער נלא סה_ על_ צה_ רכת רש_ רשי _בל _בת _חל _מע _מפ ndo om_ דאו ידא ירו כשל משת שלי שתמ תמש _ןי _ץב _שי hif ift ip_ ml_ shi אור בוק וך_ ימת ץבו קבל שב_ _ap _op _הק _פע _קב _תב אינ ברי החב וגש וץ_ יוג כוו ליש למק מור מש_ נכש סימ קלי שוו _pa _אס _יש _מר ng_ אחר בור חר_ ייה מן_ פן_ ריי שה_ שר_ תבנ _co _ro _חד _נכ _צי _שג dow ind rom ws_ גופ ווץ חה_",
+    "hin": "_क_ _र_ _स_ _त_ _म_ _ह_ _न_ _प_ _ल_ _य_ _ट_ _व_ _कर _नह नह_ _द_ _श_ _ग_ _ज_ _फ_ _थ_ _ए_ _ड_ कर_ _ब_ _इल _च_ इल_ _ध_ _सम पर_ _ष_ _पर _ख_ रत_ _वर रन_ वर_ करन रह_ _एक _भ_ _सक एक_ _रह _अन _ण_ फल_ अन_ रक_ सम_ _रक मर_ _अव समर _ई_ _रत कत_ सकत _अ_ _अस _तर रण_ रय_ _रय अव_ _अप _फल _उप _गय गय_ पत_ _पत जर_ _जर कल_ _कल अप_ सक_ _इस _कन कन_ तन_ करत _पथ _हर _पह तर_ पथ_ _आर _इन तत_ पन_ पय_ हर_ _तत लन_ सफल _टर टर_ _धन _शन इस_ धन_ शन_ हल_ _और _पढ _बन पढ_ बन_ और_ नक_ _अद _आप _षर अद_ असफ नल_ षर_ _so _ढ_ _पन _सर ock soc असम उपय कम_ यतन _आ_ _इट _कम _यत इट_ वस_ सर_ हस_ _जन _ञ_ _वस _pa _हस cks ksv sv_ करण लक_ _बस पहल बस_ _अज _उन _छ_ _तक _दर _नक _रद _रम _षण _षत _सत अज_ जन_ तक_ दर_ षण_ षत_ सत_ _कड _मत _लन on_ कड_ दस_ मत_ वरण _दस _यह bus आर_ उनल यह_ रद_ रम_ _ठ_ _बद _यक _षक us_ आपक खन_ पक_ षक_ _अध _खन अध_ अवय फलक यव_ रस_ वयव _ऐस _तव _रण आई_ आउट आरआ ऐस_ तम_ तरफ तव_ रआई रफल _तन _बर _रव _हट थन_ बदल बर_ लत_ हट_ _आउ _आत _एन _थन _बड _मद _यर hem th_ आत_ इन_ कट_ बड_ यक_ यर_ _se _u_ _इड _ओव _गल _यम _रस _वल _सह che dbu ema id_ ile ion nt_ sch tio अस_ इड_ इनप ओवर दद_ नप_ मदद मय_ यम_ रर_ लब_ वरर वल_ शब_ समय _g_ _gs _आई _उत _उद _कट _चन _टव _मन con cre उत_ उद_ उपल एम_ गर_ चन_ पलब पह_ सह_ हत_ _bu _co _db _un _अक _अग _अभ _अम _आह _कत _खल _जब _तच _नय _नर _भव _यद _हल am_ ce_ com ed_ emb ico red अक_ अपर अभ_ अम_ आईड आह_ इनक ईड_ उटप उप_ एन_ एस_ खल_ जब_ टप_ तच_ नद_ नर_ पस_ भव_ मन_ यद_ रव_ _d_ _ge _id _re _st _wi _आव _इप _कई _गत _गर _चल _नल _पय _पस _सभ al_ ati ede es_ fil ial lin me_ ria ser sta इप_ इसक कई_ कतम गत_ चल_ दलन नय_ सभ_ _fr _or _s_ _sc _ut _आश _उ_ _एस _गए _डर _तम _दक _बह _लक _शब _शर _षम ass ble des ect er_ gem ing",
+    "hrv": "je_ _pr _po ije na_ _za ka_ _ne _na ja_ _da dat ni_ anj _je ato ne_ ti_ tek ote sta tot cij _ko nje za_ rij _iz ke_ _ni _u_ ija ori pre no_ ost ira _se _st nij pro ran se_ men ma_ _mo _re li_ pri red om_ ki_ zna va_ ako _s_ ta_ _op iti _od lja _i_ _sa ra_ eka jed jen _is ent _ra nja ski _do _vr mog ogu ju_ ika ili tav tor ati van ist nak jan te_ _su sti pis pos ko_ _di ak_ guć _gr aci _il _im _si ena _br ani pod pci _ka nos roj _in opc ime će_ raz _ar ren bro an_ dir edn ema laz eke ina nem tan are me_ ava ima tre isp rek gre ris ret iva og_ sto alj dan kom oj_ _ak ume ova ire ve_ _sv nic str eni jel ku_ _zn ekt kor usp uće ešk ih_ dno reš ora vi_ ana nu_ eva oda nar ao_ lje val pra eno _sp ano lik _ov lju to_ od_ st_ poz sa_ kto ali _ti im_ la_ mje eme _de aka ji_ _bi iše _us da_ _ve enj eli nt_ kao rav vor avi gra ara ula vrš edb nev era še_ rem ri_ for ata _ba ška orm izv pot kon ada sni ozn spi _ma _me _up _sl koj rat vri ove vlj arg avl var ce_ az_ drž eta zad _tr pje por spj su_ ore ita jer ici čit isa sig rma ica _ta odr nik oje tak nte res _al čin aj_ opi že_ _ob ca_ eda pon er_ est tri nog en_ tip eci ene kov zni adr _fo _no nav tra vje mat _lo ini lič lo_ ite mo_ spr azi nov ede vez izl ovi eku reb klj emo đen azn jev juč amo ba_ sam upo ver ave oji le_ nač ogr omp enu nat ont pok ust zla _pa nal ajt aln edi gum rgu ona nih on_ dre sad _va bit rad raj otr _li int one epo iju _ul den elo nim tvo pov sim dar ifi nom tal ign ičk rin ter _uk nep rža is_ ved _n_ and tir _to ari ice nut oli spo ama ane fik ipk stv ing rst at_ zav rši piš vrs stu dni ovo _a_ isn oka or_",
+    "hun": "_a_ _ne em_ _me _az az_ en_ nem ele _sz _ki len fáj ájl tt_ tel meg ása és_ _fá sa_ cso tás gy_ _ha et_ _el _le _be _ka egy ara asz nál ek_ _ér ok_ men _va tés _eg _hi ncs ak_ has es_ agy _kö _cs ás_ sze szn ssz ény jl_ hat an_ ése zná sít lt_ ent ítá ett fel _fe se_ ter ért sol _al ott at_ lít _fo tal rás kap tó_ _ta for áll cs_ _pa hoz vén al_ apc pcs jel ene tum _mi _és _re ató ere ran par szá _ke hib or_ _z_ het ker sza ja_ zet zés net tár rvé oló vag int érv eze kez rak el_ min ált anc _ad kor nt_ lat ála íté akt llí zám gye re_ lha si_ sor ba_ mez zás szt _ar rte kar yte va_ ely lás let írá er_ nyt ik_ elm ló_ iba ező os_ nak ány vál ni_ zer um_ _he hel lis ség lme lle ra_ _ho ren us_ _so _vá alá eg_ _si lye tar is_ _tö nek kte _ni ind orm név ez_ end tet ala inc ato nyv kön sik nin szi öny _te art rt_ _bi les _li oz_ _né eál dat _je ete vtá yvt ti_ ume _ké sak ve_ ban mag on_ ntu rmá rté sok esz ezé ta_ öve _fi tot oma ték csa ell ár_ _pr iss ike _in ver ada gad ha_ beá ega áso ége eti atá _lé év_ elő ozá alm vet ert öss _vi nde som _ál ész val ző_ elt ont rül ben lap _ma nye ot_ tre ül_ ehe áló ára arg lva res át_ _ös elh leh erü eme lét yel köz _is ók_ _ve lcs osí ret eje ási lok ető tő_ lma pro st_ ill nyo _ut nev olá tat ásá _ol ll_ fej köv nos rta ció iír kií _de maz _ku olv els eté ime yez ges _tá ite _ez ist ort tke rés vis lép kel _má lto _ko vas _id sz_ toz ulc fig kat bb_ ési eve kul ata lem etk elé szo lés mer lta rek dsz kén hez _es leg _új vég ámo lin ult _ír nds reh mód zó_ van tör mat ól_ _vé esí zik _n_ igy tle le_ tok oly ket oro etl fol iku kus nte",
+    "ind": "an_ kan _da ak_ _di _me _ti ida dak tid ng_ ang si_ men _pe at_ eng _be ah_ _se ber ala kas per _ke ter nga ri_ ika ari uk_ asi _in al_ _re _te as_ _un ntu ata gan _ta unt tuk da_ pat rka apa ada _ba erk yan dal lam _ya dap ali am_ ama _ko dar _de mem ran er_ aka uka era it_ tan _pa ung eri ar_ ma_ nya ing pen ara seb lan han nam una gun ai_ bua emb _si ngg _ad ngk ya_ den lah and is_ nda id_ gal aga _va _ga _sa nta ini nak _ha _bu _ma ena dan mba val ke_ rin ila lid _na ebu _st ent int eks ela _at et_ bar _op bol gka _ar tak _su _ja _bi iha ol_ ni_ us_ pil or_ isi str di_ ili en_ ta_ mas elu ka_ kom set lih ist erl ers mat tau tor sta ste mbo au_ lik dir kun uah in_ lua dia bag tar ipe ket gag ori _co aru _an bah ik_ lok sim uar uku ode lai _la oka on_ de_ tik kon _pr dik rsi ris _no el_ rek _ka jan uat ver ura atu git _gi _pi ban aba nal end esi ekt bel ind esa ire tam tu_ _al ggu har emu _ca ek_ san le_ rma ti_ ati for any hka ruk imb alu akt uan reg _lo ksi mbu dit eta nde _le buk did asa ert tem tah amb _po _ak rel orm lka _x_ aik es_ aha ens ite ope aan erb tif dis ole eba pa_ kel arg ut_ pad ks_ sik eti nst sal nti te_ pan nsi rak ant pe_ lis tas idu pre ike pro tip rus ian leh asu _ni egi dip tka aca isa pak duk jal ren suk gis ere kto igu mod mpa res uru nil ume sa_ pem bac tel amp ref rah _li bun _fo ins but ur_ ula ilk na_ rik _ve mit nte tru dib gga _ob pes elo agi dat tri bje _mo obj ra_ fik kar tat _gu bai pus ses dek apu dae _fi ele lin man spe ifi eru ih_ _sp _ap eh_ ia_ ap_ kat lat omi ile uks eny jek aer enu _ek ema ga_ ete lu_ um_ eme mpi omp nka gat ken",
+    "ita": "to_ le_ _di re_ _co ion _no on_ di_ ne_ _de ile zio one _in non ent ta_ _ri con la_ ato il_ del _il ti_ _fi te_ nte per pos sta ell _un are er_ fil men bil mpo _pe ssi _im _es azi ica ess un_ imp _se _è_ com ibi _la el_ _st ali chi _pr _re _ne oss est _al lo_ ett lla _da ere _l_ _so sib ore ll_ tat che no_ so_ ver in_ nti ati ome do_ all fic ter ifi me_ val _ch _va _pa _su ten _si _le ro_ ni_ na_ oni ra_ ata tto att li_ nto ese io_ _i_ sci it_ err ina ire tor seg se_ sio cor ita pre tro tte _sc cat nel ono _mo _ma _ca ma_ ura ont ost _us _a_ _op ca_ _tr _er rat str and ric izz da_ _qu ame rma ve_ zza int for ito nom eri ggi he_ ist ndi car rro rim _me mod ran _e_ za_ pro tra _ar _sp ser po_ lid _ve acc llo agg dir por ce_ rec ror man usc egu _gi tti ri_ hia _nu cit _po uto ndo una enz ius tes ia_ usa rea _el que res ale liz sto ero sa_ ort ste ind mer _fo opz anc ini ari pzi era ei_ ori ich sti iav min _o_ ry_ spe _at ris ppo ili orm ass _vi ime si_ gge sse ora ers sso ave _cr git loc olo rsi pac lle riu pri ele ume cri lit ice ut_ eci ect spo dei _lo gui ory mit _ap dal dif rit _li ene co_ odi mat rta gli _te omp gio cch cif _ta _pu nde al_ pec ues _ag ede rig fin scr ine ant lic vis dat nat ual ivi tri son nes sol de_ ido _ut sen tur upp tiv ezi ara izi put cre ch_ ssa orr ga_ ces oma isp nit ing omm nal pon sim ott nta col ors dic uti fer tar mmi den num oll ntr cto ond _pi orn ova par ute _au ive ate ert sco ttu _og dis iut oca nza lor get ien ico _du het onf rif sis _ha uov leg raz _an sun tic itt abi efi erc arc arg hie ssu app tà_ tem ge_ nzi sup vo_ taz bol rov mbo",
+    "jpn": "ません せん_ ます_ ファイ ァイル です_ した_ する_ ました ション できま ていま きませ ありま りませ しまし います します エラー れてい _ファ してい されて があり ョン_ プショ オプシ le_ イル_ クショ シンボ いませ ile されま セクシ _fi fil ラー_ 失敗し ポート _x_ ります 敗しま レクト 無効な ィレク ディレ クトリ ンボル に失敗 された を表示 ケージ ッケー パッケ _無効 さい_ ユーザ _co として でした _オプ er_ せんで んでし ない_ くださ ださい on_ _警告 データ 警告_ ジョン ージョ バージ てくだ _は_ または _この しない イルを _です _u_ _de ion _セク _re 定され _n_ サポー 示する 表示す 読み込 コマン マンド _st れまし はあり を使用 してく ている id_ コード ドレス リンク _s_ _in アドレ れます _d_ 再配置 ループ が必要 定する 要です ード_ 必要で グルー システ ステム _シン ヘッダ バイト フォル _se _から ラーが 指定さ ォルト デフォ me_ _また _を使 _ディ サイズ 見つか tio メント ではあ ること アーカ トされ ーカイ カイブ かりま nt_ が発生 イルの 発生し れませ を作成 インス ンスト _ma つかり _di _パッ ame _エラ ストー ット_ たは_ ント_ トール 証明書 ッシュ ートさ _pa _不明 es_ しませ ーが発 ョンを 生しま _アー _バイ se_ st_ lin _pr を指定 のファ ll_ str _li _ユー 対する ver _lo _op が見つ に対す 不明な 使用し nam にエラ 定でき _ex み込み 文字列 _si ce_ ていな を削除 ーショ _デフ et_ _ar dir セット いない トリ_ 場合_ _nu ing _fo モード ng_ _プロ ぎます ージ_ at_ を取得 書き込 用する イル名 すぎま を設定 ってい sta for ect なりま 指定し con _no _al ent ができ ョンが int ことが ワード _イン te_ サーバ com 新しい _に対 ロック される 存在し _バー _文字 けませ pe_ を読み 使用す _入力 _使用 ェクト ジェク _があ _出力 loc ソース ボル_ 場合は in_ および al_ にする 表示し _r_ _の_ res ter 不正な nd_ には_ _ta ve_ キュメ ドキュ ブジェ ュメン _us セージ ッセー メッセ pre プロセ タイプ _id ype tri が指定 ロード _su typ _コマ rt_ るには スワー パスワ ート_ 設定す _キー トリを _sy _名前 オブジ から_ 情報を 用でき _ch _と同 num とがで 用され _t_ ate ければ するこ arg フィー プログ ログラ 表示_ _f_ de_ rea なけれ 中にエ _デー _標準 ar_ イルが ロセス _c_ はサポ ィール グラム ールド _sh re_ rec 用して _ap _再配 opt ために ケット ix_ ser th_ き込み エント ck_ pti オフセ フラグ ントリ ートし _he _na ア語_ バック ードを _ro exp ive のため _un _wi _これ するに アップ ine に設定 フセッ ンポー and deb ed_ nte pt_ 削除し い場合 キスト テキス ョンの リック 得でき 証が必 認証が _i_ _ドキ man mat",
+    "kor": "니다_ 습니다 합니다 _수_ _파일 _없습 없습니 _옵션 _사용 파일_ 하지_ 에서_ _이름 _지정 으로_ _문자 _이_ _출력 _실패 _오류 않습니 _않습 _설정 it_ _명령 _을_ 있습니 _있습 일을_ _를_ 파일을 입니다 _gi _디렉 디렉터 렉터리 _표시 오류_ git 시오_ 십시오 했습니 _잘못 _re _없음 없음_ 하는_ _에_ _프로 또는_ _또는 _실행 _커밋 _입력 _패키 _형식 _의_ 패키지 하십시 _상태 실패_ _중_ _다음 이름_ _필요 못된_ 잘못된 _co 시합니 려면_ 문자_ 션을_ _작업 없는_ _정보 옵션을 _없는 _합니 _기본 적절한 절한_ _인자 옵션_ 출력_ _부적 부적절 _제거 거나_ 사용하 _로_ 실패했 _않았 었습니 용합니 패했습 _추가 는데_ 사용자 _브랜 _버전 _현재 브랜치 _인증 _목록 현재_ 션은_ _no _시스 표시합 옵션은 _하위 시스템 _u_ _지원 _만들 _저장 았습니 _he 작업_ _가_ 하위_ er_ 설정_ _경로 _처리 _항목 _st _바이 _s_ _가져 _모든 모든_ 자가_ _병합 하려면 요합니 _표준 필요합 _n_ 자를_ 이트_ _d_ le_ _무시 트를_ _알_ _링크 다음_ 있는_ _때_ _메시 _위치 se_ 데이터 메시지 바이트 _는_ _있는 id_ 터리_ _동작 _키_ 일이_ 표준_ 용할_ _pa _오브 브젝트 오브젝 _내용 되었습 름을_ 이름을 리를_ _은_ 력합니 않았습 출력합 es_ 프로세 _in _시작 ead 대한_ 지만_ 파일이 _그룹 _대한 _대해 _일치 _변수 상태_ 프로그 _업데 데이트 로세스 업데이 _c_ _de 지정하 _di _에서 _fi ck_ con 명령_ 지를_ _변경 _부분 _않음 지원하 ile 않음_ ce_ 로그램 _데이 하고_ _모드 대해_ 보를_ 정보를 _경우 _문서 값이_ 사용_ _각_ _값_ _하나 _아닙 스템_ 용자_ 정합니 파일에 _인덱 닙니다 아닙니 인덱스 치를_ _들어 으면_ _시간 번째_ 형식_ 원하지 _너무 너무_ _f_ _경고 _동일 _값이 되지_ 일의_ 하면_ _반환 sta 해야_ _이미 ver 값을_ 입력_ 키지_ 파일의 _al _pr _기록 _쓸_ _않은 않은_ 저장소 _레퍼 ll_ 레퍼런 문서_ 퍼런스 _se _t_ _숫자 et_ fil 문자열 _a_ _다시 _설치 _않는 _허용 수를_ _id _시그 _심볼 스를_ 일치하 _l_ _연결 _대신 _및_ _압축 te_ 다시_ _크기 터리를 _p_ _나타 _다른 경고_ 스트_ 않는_ 커밋_ _값을 다른_ 아어_ _암호 _읽을 기본_ 읽을_ _선택 _해당 ect _종료 dir 용하십 _아카 아카이 지정_ _sh rea _사항 _서버 카이브 hea nt_ 시그널 _삭제 _태그 환합니 _올바 기본값 _적용 _필드 령을_ 명령을 버전_ 표시_ _대상 정하지 _lo _si _번호 심볼릭 _폴더 on_ 볼릭_ 사용합 st_ _따라 _열_ _요소 lin 변경_ 이름이 _x_ _로컬 일에_ _구분 _li no_ str 가져오 만들_ 종료_ 사용할 all loc ref 경우_ 름이_ 텍스트 _pi _읽기 _활용 res 인자_ 코드_ _ur _으_ _주소 _패치 다면_ ack 냅니다 됩니다 에는_ _m_ _nu _fo _r_ _모듈 me_ 대신_ _과_ _리모",
+    "lav": "as_ _ne _at _da ts_ es_ dat _no atn _pa _iz _sa tne ta_ ar_ kst sta kum ās_ ai_ da_ iet ent nes ms_ ot_ _na av_ nav aks _ie _ko ir_ ne_ _ar rak _ir ja_ men pie jum šan ums _li dīt eva _va var tu_ ija vie kļū ļūd _do _kļ _vi sau ūda nev _pi ma_ cij auk pār ats īt_ _pā eto nos nts par _ti ume _re rād us_ lie nor ait iek is_ tot osa slē vai _uz tra atr uku izv oku _ga dok lēg inā jas ti_ ies rīg erī tīt _ma ni_ der ien ls_ ska st_ vēr tsl _un et_ att gai _pr _ve otn _in eid ju_ tni ana atu eiz ērt ēt_ ība lai _se _st atb stī ver aid zīm res vad _ra ara mu_ _ap _la ist ka_ am_ lst na_ umu vei _vē bal nei āci ādī ais pak ras un_ kai ram tie als sts _ja gs_ orā ned _be dot ede izm kot rin pro ttē tēl ika ast est for ind orm tba vās idī oju sas tīb īta iju man tar tik _de _di tri tur tzī _ka _si rtī ām_ ēja ēls ako būt des jau ont ēju _sh dar dev nu_ zde īgs izd mas str tip _op eks isk nda uz_ zma ēma īts evā las mai ēga ga_ hēm kod shē _fo līd aut ign sat urs īme me_ nas uma īdz _tr eno kas kop stz tor ekt em_ mat to_ zin and iem rmā _ri ekš vis gra gu_ kom ri_ tus īga _zi ds_ ido kā_ mēr no_ tat _ba _bi eat iev nea ba_ bai bas nep ra_ rēt bei bu_ ceļ iel int lis oša pa_ ser ziņ _ce _me _ta dzī tā_ vs_ zva īvs ce_ gno rāk rēj tal ību _ad _gr _ig das esu ņu_ _jā _sk du_ irm iņo ogr pir rib _pē tas ņem ala arē erv ibū lem map nie nst nāt oma ru_ tāj uni apa eme ikt jot kur rog amm anā arb arh asī hīv ins kš_ on_ rhī rsi sai _el _mi alī ant aun bet dre rra stu ārr ārā ņoj _mo adr anu arp gas iņa mon opc pal pci rie stē sur āk_ _sl ers ieg ifi kon mā_ nti nās pri rs_ sav sēj tēt āda",
+    "lit": "as_ ti_ _ne _pa is_ tas os_ ini mas _pr kla lai _kl pav _su _nu ai_ sta nep ail _fa fai _iš int eik tin epa us_ ko_ ima men ama vyk io_ _ko kai mo_ _at aid yti sti raš ra_ avy ių_ ta_ avi din nau ali _si ma_ ist _re da_ ant _ta _ka ės_ _ar _ti ent yko nt_ _na pri rin _ra nta per ida nim oma _ap _vi to_ tik ja_ tai aty lin net rei iam ram lav rod pak ake _pe pra viš ame imo cij ver aud pro ais asi gal ska uri kom ait je_ ija sis rti aik ust nti iki _va _sk pas ras nis eta ink ia_ vie _la dyt tra tyt pat _ga eti nus udo adi eri inė las kia tat jun es_ oja ung su_ ket uot ume ara _ve eis aus aci tie kur rak par ies ori _se gra _be lo_ ėra _tu ina ran čia _nė lau nėr lis ris ila tų_ _ma lų_ yra met _yr and mos nų_ ers jos _da _in auj pal te_ ody _di _įr tur ijo aša iet ui_ var ing mą_ ogr lyg oti _ir ir_ jam vei er_ nka arb sij _an vad tar nga ite _po ala eli iai _de ava _už ast išk _į_ bai lei ste tei uro eči kli me_ įra oro _do akt duo iks yta aut kas _ba ard lia ert kta rog šas for iko _ly ilo ys_ _no _tr ngi nur ank iti nor oli dok kel eši iju iau ami auk jim orm _st nio ria apl jo_ mac ski ba_ dar sim _bū irt _ši rba _ke gia man oku die dži nys tos čių _ku ati kit kum rsi bol eto nuo rma tem etr mbo doj ele ika imb kon ri_ so_ ius _ja lan kto nė_ ome _me ikt iša amo gas kei kir nam era et_ str est isi lim ikė lem mai nto usi do_ ieg iš_ _sa ang rai emo ilu ip_ ar_ art kam neg _al atv ave ieč pla toj uoj _bu rie sen uom mat min ner apa kst tip ėta _są das mi_ oje ota ėli _gr _li ita kod lio oto _le _te ją_ ymo _ki _sc būt ega išv kin ksl kėt idž tek tri val alt ian kti nas",
+    "msa": "an_ _di ak_ kan _ti _me ala at_ dak ida tid ang _da _pe ah_ ng_ eng _se _sa men il_ _ke ata nga gan ail _te ada _fa fai ara ai_ dal ama da_ lam ber _ba _ta am_ pen _pa ma_ apa lat tan _ra ter ri_ _un aka pat per nya lah ral tak ntu uka uk_ _be si_ ung ran sah and tuk is_ unt nam ngk ka_ dap eta al_ ela ar_ ika _de mem _at atu han nci tu_ _na ari gka bol nda ila yan _si emb aga jan mat lan pad _ma _ya sat au_ ole ra_ aks lua dan leh unc una er_ ena gun era ci_ tau kun ula den en_ ksa eri ong bag _ku asi _la dir gi_ _su ngg sar _ga eh_ ana rek ut_ ema lai asa uan _in _bu as_ kon ori nge tia na_ nta uar aan epa lal ti_ emu ket ta_ ant la_ alu buk dit _re elu gal rai _bo _ja dib lik mba tor ke_ mbo _ak ark kto kum pan _pr gag kel nak _an ali san eni tet _ad ers iha ing seb sem rka _pi ik_ sok _ko aha ekt ent nis pem pro _je bar din ire oko dik iad jen mpa agi sam int nar ya_ _ni mas um_ _ha bah dis ume ura lum mes tap tar ggu ili nil tel kas dat ibe on_ erl mbu od_ ui_ _al ap_ lih _le sa_ tri eba ike uju _ka ris yat _st eka enu mul tem emp end mbe tah _no dar kod pil dij ej_ kem mak bai sen _ar aca amb ile lak le_ mpu ndu awa ert in_ _do ban ngh sim _ju dun eru nti _sk bac fil iny iso mel _so any aut ua_ _op bun man or_ _ca dah nja tin eku esa et_ ian lin nal _fo aba dok gai ini oku sum _ap ahu dia set umb enc ir_ kek lis ngi put sti ih_ ite ni_ rla sep tal tik ver ca_ ija ind ion it_ ren uba amp eks ese ghu lu_ pa_ ibu ken nte pi_ rma cip imb ist rsi ump ur_ est eti ima ina rik uta _mu but erk ib_ ipt kar sel ske _fi _hu aya kap li_ ndi par ram rin str us_ _bi api atr ele hui",
+    "nld": "en_ et_ de_ an_ _ge _de sta ver and _be _va een _in van _op est nde _ve er_ nie _ni tan bes _he iet ing aar ken is_ tie _is ie_ ere oor _on nd_ te_ den ege _ee gel _vo sch der het _te nge aan rde gen or_ _al in_ ste ten ren erd uit ng_ ord ers eld _to eer rd_ voo _ma naa _me eke men cht _re geb _st eve gev ls_ dig ven ent rui ebr _wo es_ wor ar_ el_ ter lle _aa _ka _co _ui ati bru uik kan met _en _pa gee voe _na len _wa ard ige ond ge_ end al_ ach opt nt_ st_ tek eli ele als _di _bi _do waa kt_ ldi pti nen at_ _ar oer lij le_ erw it_ tal _of of_ ens kke con out all ijd ont ong reg ind _pr am_ toe op_ ns_ wij dt_ pak _fo fou pro aam geg chi aat lin nst tel akk one nte _da rdt slu ket bij ree ut_ map ges ove _ko ijn _le re_ sie _zi ike eze _om pen wer ij_ tte on_ ap_ lee taa ig_ ijk maa ist _sy ake ume ell _mo gro zij _af rei ert _ov erk ht_ _mi ld_ ies ang jde jn_ _gr ins om_ dat gin esc ts_ ite ker _we isc daa id_ rwi kop oet ngs din arg rij hte ode tee ppe aal wac cti eel tij oeg res del _u_ tvo laa nda itv ze_ che ame tro sen com nta ik_ _li rs_ rsi mis ton erv ch_ _sc doo nds ron vol eid eri chr ke_ arc _er rt_ ukt die roo _no _se evo _zo ief luk _la rst _ta pre gum oep rgu ett rac ect isl aak mak mer rch orm _ex dit pel mma bre ede rec _wi us_ dra eme int _sl ica nvo ale rsc ene ssi ber bel ort ess hee app ef_ for uid _s_ ets euw roe rte _br ant get bro erg mme _el _ti ieu ser kel oon eks rin typ mat str ft_ hie cha ope idi _si dez ein ern ijz lui nbe sys eis cat ndi omm opd ats _au zen ype nti ute epa _ho erb opp ete ll_ eek _nu pdr cod yst em_ era _ac ger num eem els",
+    "nor": "er_ kke en_ et_ ke_ il_ ikk for ing _ik te_ _fo _er ter ler til _ti or_ fil _fi _av ng_ _in _en re_ _st _me ver ent lle _de bru de_ ruk _br av_ _ut _i_ _ko ed_ es_ tte rte ig_ om_ _va alg _ve ere ste val _sk opp ett _å_ all ert ell sta and dig _so _op nde end inn art tt_ nge nne ker der ne_ men og_ skr rt_ ldi _si som nte med lin _og _kl lar kla eil fei _på ll_ nt_ dat på_ se_ ser _fe rin _ma vis yld el_ kri avn det gyl rer den _el nav tal _se _li uke mme kel sjo _et gen jon _le _re nøk ata is_ le_ _pa ppe tet var _pr _ug kom ugy _nø len man vn_ ger økk _ka riv _hv lde res ign ren ge_ _vi an_ kan on_ dre jen _du pe_ ner utt egn _ar ist ar_ eks at_ app _un ers gt_ iv_ pro str nda teg lg_ are uk_ _fr _te omm mer lge _la _mi lgt lag und ndr ngs ta_ du_ ern lig eri sig ile _al fra _an ten ede ene inj ang mma id_ ele ant al_ jer map kon st_ nje orm ndo _he ont eng gn_ ill _na els atu rma tre før _ta ort _be ret ume ut_ kal ska hvi lse ra_ rd_ ove _sl ord nta arg lut enn ive _bl fik les _ha ved met ass ess tat rdi gna slu _sa nin set _ad tes sel ate _gr nst ven _n_ sti erd del gje rti ram sse _ov _da tid _fø _sy _to ens tan age ard kst mel us_ gra ore sen stø vel asj lt_ eve amm per kk_ lis ode het ifi _ny elt let old eli ild att rse nn_ akk pre tar mat sam hol _ba dar get pak net ble _gj kje sor eld fin tor kat ika ykk avs jør ull gru ide one ør_ pas min itt _kj red kre nen esi har ige nes _må ses sva rgu _by gum me_ est _ek bar tur ttr ogr vsl _di _u_ tab nat ytt _om byt fje ier nke nfo _fj bli enk rog år_ _id _fu ils lik _no kte las _ne eme lat tin sk_ tiv ese kes oll ref la_",
+    "pol": "nie ie_ _ni _po ani na_ _pr _wy ia_ _za _na wan nia _do eni owa sta lik ch_ pli _pl _je rze ny_ prz ne_ go_ _mo ego ów_ moż st_ _w_ ści est pod pis ych _ko jes any wie awi żna ożn ji_ zna ać_ ku_ ej_ do_ rzy _od _li ki_ raw ost uży _st _z_ _op cze ane czy cji _si _uż dan pra nyc _pa ien cie je_ _bł cza ier _us ent no_ _re la_ _in ika kat ię_ tu_ iku się owy pro _i_ zen kon wy_ _ro ja_ naz azw wa_ em_ ik_ nik owe yć_ kie kow ka_ neg _se oda cja acj czn _zn za_ zmi _ty zy_ ci_ ami pow bra _ka pcj opc _ma mie _kl owi dzi era _ob ym_ ale tal ywa mia zyt dło su_ men orz ty_ _wi for ucz war alo bie luc klu icz ole iet _ar zas ak_ _sy yst _sk ło_ jąc ko_ _zm ini pol _cz ony aln _te _dl dla roz ist _we le_ api tan ust taw zap ków ion log dow _al tor ume zon łow str lic orm ąd_ row błą ośc łąd wor jśc art ano ić_ ez_ ata _lu rma two ian _sp ocz it_ ść_ lub ub_ rto szy res aki one ran _gi ers to_ ako rak zan acz tów kcj cen ra_ li_ lec poz ana nal wym odc _wa gra wyk git nak isa fik wid ącz łąc iep dcz ość _br _ta yfi _ja by_ ece dni mi_ wer pak ięc toś trz lin obi _co sek _to ze_ _ws _no ram tow uni _da ące iej błę jak łęd ast _zo yma nej idł ski wej sze ste ter wni zos ce_ iel ają zys uje ona wyp now we_ ono zie zyć iwa zek ędn bez ogr eks ach stę nię ług że_ nym _o_ zwa ktu odp ikó lne _be iem ta_ usu nan eśl mac _fo wać żyt arg ież ont _de ekt epr tyl aga mat ypi tko _tr tni _u_ omi ęci er_ cje _bi tęp adn lny own zer oka _by ali wsz wyj rac pie _ba ekc nt_ oże zwy kom at_ dom arc iu_ san ują ii_ ład lko ma_ zez dpi tem zak _ze zaw um_ cia iek sun ało lok lon isu od_ yjś weg sow",
+    "por": "_de de_ ão_ do_ _co os_ _pa da_ ra_ ado _se ent ção _in ar_ as_ _a_ es_ _o_ com _re par não _nã ara ro_ _es em_ te_ nte to_ con fic _no er_ or_ _po _um _do _ar _fo ada men _fi _pr ica _li ido ter ta_ açã tra _ca um_ sta eir est qui ma_ ivo pos _ex el_ rad dos iro ont vel vo_ res che for _em ndo _en ist des al_ por _é_ rqu arq ver _da ich que _di and íve nto no_ esp ou_ uiv hei ome _te io_ ess eci me_ _e_ _fa _us _op _ma ntr ida ia_ _qu om_ ões se_ oss lid mpo _ta _ou nom so_ rio _si spe man err pro são _su era esc _im sív pre ina ssí ser cad _er lin ha_ ifi alh çõe ir_ rro _ve po_ per iza fin _ao áli liz mo_ vál ini uma _al rma ao_ efi ali car ura _mo _me imp int orm tad inv ste loc is_ dad tes _va str fal omp ue_ na_ opç rec def lo_ tem ere nvá ria ort cia tar ho_ nha ve_ ces inh _ne _pe cri _ap dor _as tiv dir ion _sa re_ ame _lo ári oca ume val ode end oi_ foi tam ade alo ten usa nde pec ama pri act arg lho ema upo ote lha pac ers ran óri nta das alt nal ros ora ire co_ ito _so ita _os aco ca_ ant tos ero lis nci ais ili sem ual scr lic _na oma til sso tip cid _ch nho ret rem _st ati cha rgu _gr pon _ti _at enc _b_ mer rta erm reg cot mit ect tro cio pçã roc _tr rar ico omo cif pod ecu lor la_ ext cal ece rmi eve caç min nti ona sco tór ída _le _nú _to age mat aíd tal _ac núm sin saí _x_ cor ici hec tua _cr sa_ le_ egu tri ass ime exp nco _an ine olo açõ _ba pad gra rim nor ite eri atu adr seg tic anh ipo mbo sup der fer ins mes pas tur eta úme nen ore sec enh _s_ nfo ula rão inf emo ost raç gum abe mas sti id_ nec spo inc nhe _ob ce_ ela exi gem onh ref ign elo qua pen",
+    "ron": "_de de_ te_ re_ are _nu ul_ ea_ _se ent _în rea tă_ nu_ le_ _co _fi iun _in ntr ste ate est _a_ _pe fiș ier _re at_ tru se_ ză_ _es _ne _di une rul în_ ie_ iși țiu șie ru_ oar ui_ pen _pr num ază men car _po la_ lui eaz _la _ca nea ile ele ume ulu nte ter ere _un ire int _cu val ist nt_ or_ ne_ tat _ex ect ali ați con sta _ar tor che _ac _su cți _li ată com un_ _op ver liz ii_ er_ _fo cu_ ica ră_ ri_ _st fic _si ero că_ iza rec ili ces loc ște _ma _o_ pre ifi sec eru _da să_ oat uni _er tul it_ _al al_ ți_ _și til uri _pa pro alo roa ut_ uti _va _ut ecu str poa au_ _s_ me_ ecț ori tar ini imb și_ pți ta_ ia_ bil oca in_ id_ _ti tre ar_ act _sa tur for opț rma siu din res ara lid orm imp tra _ve lă_ rar ici lor lic cat ei_ ace nec des st_ _mo cit eri lul sim _me dat sau ers per pri _să _b_ _sc ce_ cte nă_ ine mbo zat bol ept ina _pu ato ime _sp _af par omp _tr _no pta cut ca_ abi _im chi ite eșt rat tri _ch ări ril șir tiv _ci _ad _ta înc _au ion dir lin por tip țin mul oru scu ive cri put hei mat ită ert rie tab ție ică _do eva rsi and cun dă_ utu ții esa esc scr min ort _ni reg olu eci ast nev pli ale uno cep imi eși iți nal rel stă spe tea het _lo afi cre mpl _ie erm mai _lu ebu ins ai_ _ce _x_ eal ra_ et_ rti mod inf nfo nos pec eta ind iti bui cif cce ide nd_ ni_ măr ost _ap ieș mel sch nic ach loa osc tim cal cor _an rim ita pul ten tel cto pe_ rmi pac _el inc _bi pot umă ult unt man sun roc ctu ont lis sem exp mit cti ext unc sit era ute _cr _ur ona nți sup fos nde ens ip_ tal lim ătu înt ant tif _te _câ ece _fu one nsi arh fie rhi acc ete ct_ egi fi_ nst fer _ob fin",
+    "rus": "_не ть_ ени _по _пр не_ ие_ ние пол _в_ ать ия_ _за ый_ _ко ова оль ся_ мен ля_ но_ _ра стр айл фай _фа ет_ ка_ _вы _дл ния ный тся пер ить _со про _на для ани раз ая_ ват етс го_ пре ров нны на_ вер ой_ льз _па ало _ис уда дал _об спо _пе ере ов_ _уд _от ии_ _до _си льн ого ред дел ста анн ест сь_ ом_ ком ост тро ки_ ые_ ое_ ств ван _ст ли_ исп _ка ает зов нов _ре ла_ ент чен уст под _с_ сти _из лен при пис _ин сим ует еме ых_ мет дан иро тел ий_ ель ось _им лос енн клю люч нач лов рам ист та_ зна ера ьзо нев _и_ вол пар ект оши кат ите _ош шиб ные жен тор имв каз мво рав мож _оп те_ ска дер ива щен зап аме ибк нен рем ерж аци тан пус ных анд ное йл_ ран или ден ног зме ти_ ара бра нно _ве аза бка рок ен_ ата име жно аче сли ции _сл ход _то _но ате ная ок_ ока мер _ил ию_ ано етр обр ржи пра тны воз зде _ар ра_ сто _кл азд реж ей_ ика ной ожн олн ави мещ то_ вае ьны орм фор _ус _зн вле сле фик тно опу _ук оди кон ука чит _бы ево еще кци ерн рма _да йла ми_ _сп _мо аль рек тал пос одн _се _эт змо ьно озм ри_ да_ вод ер_ ене по_ тов нст оло ыть ле_ оже _b_ мя_ тву тек лог кая рег _чт ома _x_ од_ из_ пак ада доп тр_ ко_ еги опе ифи иче ман ны_ гис еде это ори кет выв неп ак_ чес едо ном ото имо _ди инс льк раб ем_ ово ьзу ты_ тру еск зан вес ры_ апи ым_ або лок одд дде рук ыва жив оде авл ожи ько код _ме аке рас тим ежд изв рир еве зда екс ина нит дол тат ено сте вит айт еду олж отк озд быт вре овк яет _ба изм его ена кор мат соз уме еко зад ида рес еле ове вля _вн дат азо имя емы нос it_ ую_ лит осл тол нт_ тре тиф тип _re жид упр _ти оме _та ний укц дно вет нео оки ку_ тст",
+    "slk": "_pr ie_ _po _ne je_ nie _na _sú ova ný_ né_ _je pre súb bor úbo sa_ _sa van na_ ov_ iť_ _vy ať_ _ni eni ia_ pri ba_ _ch or_ men lo_ rov sta uje nep _za _v_ re_ _ná pod kon _od ná_ zna chy ani hyb ho_ ver _do te_ _ak _al pou ouž ožn res ent ch_ _re _in ost stu bol _ko _ve áci _ba _zo _sp om_ _mo aný iad ne_ mož ru_ _sy ka_ oru ebo _st ale lat zov prí ky_ atn ast pla sti _ob str kaz _se cie to_ náz vať tor yba ri_ _a_ nam tav pro _ad ého _s_ _vo ázo bal ený žné den ní_ tov _sk adr ané odp _zá áva íka tup hod alí epo alo lík dre teľ _vý ako nen _ar for ta_ _ho ist oro uži ate raz bo_ orm epl leb odn _čí dno slo ých nov tvo kci por nas dar čas _to ove nia obr ria voľ ozn ti_ vor ny_ _ro rmá cia prá šta aní ari kov ou_ _zn íva _zl ené dpo ku_ len _pa ko_ lov not ový čít vý_ oľb pis íta ok_ žív er_ uží _no arc olo _de nt_ nos tný tu_ az_ kľú ľúč _ma _me _kľ sť_ by_ ej_ ilo oda rzi typ vat red am_ la_ bra rík est erz spr _ty ril ned tal ak_ nak ume ada esá oča sym ali sah _ri le_ ick kto ori tan sár rch et_ pís ren lož žia avi néh ráv zly lyh poz sek vyp mie yha _bo inf no_ ce_ _he hal nfo ore ame mi_ pra roz odk mu_ tie áln čen dok va_ ite pos ové ram žit dá_ aká dka nez ods _te vyt _fo _ča nšt ry_ tre kom nač _o_ sku ymb _op _so iu_ mbo obs _ex tuj ra_ riť met ten adn inš akt ami iká ytv dst ísa čak júc čís že_ _ži do_ _kt ies nýc oku ol_ ajú _z_ aná iac _by _zm oli ter ven veľ roj vol dia edá ekc bsa nem nut pov upn _ce _u_ ujú _zd dro ľa_ dov ec_ _x_ zob daj jú_ ísl led sle tri zor osť oto ave chí hív li_ pol rán ty_ _be eno _ur al_ ete kup trá zoz ifi orn ede ota áto dan ovn",
+    "slv": "_pr _na ka_ ni_ na_ _po je_ _iz pre _za dat _da _ni tek ato ote tot anj ti_ no_ ne_ _ne nje _je men pri sta _do _mo ke_ če_ _ko tev ost red za_ zna ime _v_ sti _se ogo pod por oče ja_ en_ raz nos mog lja _im goč ga_ eka pak _st ora ran jen _vr nik ov_ lo_ ska _ra se_ ki_ ega ih_ kov eni vel _in jav eve ta_ _od _z_ pis oda li_ _al ite nak in_ ira _up _ob upo _sp avn em_ elj nap ilo šte ali ena vil rab ko_ van _ve _pa iti _ar ave apa to_ te_ aka ri_ ika izb eke _si ent ve_ nja oči _vs edn nam eno bir zbi va_ _zn avi lik _s_ me_ rav _us la_ _št dol izp nev ot_ tav _ma ra_ evi kaz pro nas loč neg st_ sto ake ova str rst ati lje _me _sk jem vrs ume zpi čen _br ako ev_ eva _op pos ame pra _ti _uk lju ek_ ove mo_ _de iko ist vna jan hod dno nih uka _bi ani ed_ ik_ est ezn kot olo var ast izv nt_ rem da_ jo_ klj ma_ juč an_ _en aj_ odp _če tip vni ede olj kon ak_ od_ _re tra ene uje enj tre isa arg gra ven om_ del piš lni med pov tan ajt den eme spr vez zap ana ica bra er_ ust bit led ovn ved rez tic ce_ eto vse az_ eli tov ina ket vno ca_ nav _ta ema vre rat _no več _te _ba _ki mi_ ram _sl eti _so am_ eza čil naj pol zor spe ano _tr le_ ovo ava ter mes rej elo vor _kl ila amo vit ice ipk et_ rek ste met nem pin _la dan dar tve bre nov rit ši_ ret so_ tor ine spo baj nal pon seb či_ _ka tem upi vi_ _lo iz_ stn api gum dni izr iča ren rgu tva aja lji ogr rog man eje res ji_ sle usp ez_ vlj _n_ rip lov re_ zav _is iši nda nep stv arh edi ore pom rhi dnj sez ete sku čak hiv nsk avl ju_ and de_ itv nic odn ari jiv ode _u_ bil iln ičn zra ba_ asl dob odo san ver abi ar_ eta il_ rev tni",
+    "spa": "_de de_ do_ _no _se el_ _co no_ os_ es_ ón_ ión _el _es _en _la se_ _re ar_ la_ ent con ció en_ ado ra_ _in _pa or_ _un te_ as_ to_ est par da_ nte ro_ al_ fic ara ica tra aci ero com ta_ _pu que _fi ido er_ des str ion sta _ca era un_ ada per _pr rec men _di cio _si _al _lo na_ on_ cci ede ist ida lid res che _ar ndo ien ntr re_ esp nto pue _op ued and ect lo_ del por _a_ los rad nes ivo her one ich ter esc _po arc io_ ont cad _qu ue_ enc ali car den ecc rio ble bre _ex ene ten mit vo_ una pro err tro dir dos spe _us áli rch _so vál _ha omb mbr rma ma_ _fa le_ tos ifi nci nom ori _ti it_ ina ver _er pre _ma chi reg _y_ sec _va ire hiv las ran tor all sió cto ce_ ir_ po_ act omp cia ste pci rro for fal tar ura _mo iza ror cac _su _o_ _ta stá int opc tad tiv rea rar orm abl so_ tes liz ato ere olo qui _ac ia_ mo_ ser _ve ama cer _ob cla _fu ona dor ant lic ite inv _me _pe ari nst cid in_ ins ca_ egi _li les ea_ arg mie nta val nal eci _te ndi bol ctu ici ece nvá _lí rta tie mer ne_ sin eta ual tá_ mpo nea ces ers end emp usa ete git _bi rac ema min ve_ pos nti inc ope nco _tr tip _sa _fo ort ace tab ecu ave ini _ad lec amb _cl cam erm _le gis uet _cr ono scr cri cre alo deb lor ros iva fin pec rmi _ra noc def mbo ami lav go_ dad ras mbi ner ubi sol ume odo tam sal bic tru til _gi cti ase ili mod mpl co_ _sí igu rsi ibl ref oci esi ert jet das oca ipo onf _x_ ico ram dat ren _da obj uta sím ímb ad_ aba bje sco an_ dic omo orr ple _au cif tua _mu gen exp lín aqu cor íne nde tal udo dis _gr _nú _st _im reu _an ext tan ier rab jo_ uer nar sca rib equ efe va_ ord _cu ing ore imi",
+    "srp": "је_ _пр _по _не _да ка_ _на на_ _за не_ дат _из да_ _је тек ње_ ато _ни пре оте ња_ _од тот _са ста _ко за_ но_ ори ке_ ије ред _у_ ва_ ост ава пра ти_ та_ под про _мо ни_ ма_ ања ање оде ује им_ рав ист _оп са_ исп _до мен пис те_ _ре ом_ при циј ли_ _си _ст ива _вр ан_ _гр зна сти ниј _ис зив ра_ ја_ дељ спр рем нос кор ази ак_ ам_ или _ве мог огу поз ван лаз реш ако _и_ ова ека ку_ _би еме гу_ едн гре ија вањ иса сим _се рис се_ наз ска одр ешк ве_ _уп ода ављ раз ење држ ла_ пос има нис тањ ог_ ика _ка _бр _та вре еке сам дно шка тав _ра _b_ ина адр уме ели ем_ бол ема имб мбо _ил ено нов опц шта _ар пци рој ент бро ко_ риј ове неи еис _ме _ди ена гра рај ну_ ој_ _об сте ени ара ата _x_ ора рек спи ера тор ект дре ита лич сто их_ ај_ _ос авн иск неп оме озн изв епо чит нак _ус ржа ао_ вел тра ити лик ран спе ави кљу ључ азн оре ив_ аре од_ упо усп изл су_ _су вез нем зла чин еку ију ису _св то_ ју_ ник ака ула дир ичи ст_ ите вар ви_ ире _сп рењ ешт вља пот сно еља нат бит ани сад вор стр меш так рам ен_ ног као ком рад _ак _ун љак тре рст љен ци_ нав врс ља_ пом ају огр _де нар аје ано едб аци _ин осн ним ира ово _ов ише кто пок тај едо вер сни ељк вно мер тва вна зор _зн кра ене _ви ења озо шав кој _сл ств рен аз_ врш азу _ма али оче амо реб рес ји_ _ук _ба _чи јед арг јум ати аст зво мор ео_ оје рик суј еки ичк рим ће_ ета ајт еде ше_ дни апи каз овн пор ниц зап ме_ ки_ ини ест ола окр аве ама мо_ ана во_ гла _u_ дос _бе _ул зуј ден изд екс аја рет ба_ кон ле_ ређ вед ане нут нт_ бај иве зда ишћ жан пон ћен отр рук них оји _ад еће пов сту агл мож гум дањ ном ргу чек",
+    "swe": "_in en_ er_ nte ing för te_ _fö int era ter ör_ et_ ar_ de_ _an _st ra_ nde ng_ tt_ _de ion ll_ änd nin ill fil an_ _ti ta_ ler _fi til _en _me and vän _i_ ade ver _ko om_ sta är_ _av tio kti _re _ka lle med att _är ste _sk on_ _ut nda gen anv rad nvä rin _at ed_ tig yck ell fel av_ ad_ nge ent eri var kan den nt_ es_ nd_ ata _so tal ist el_ _fe _vi ekt _va tan nam _om som at_ der _lä des ig_ men _på kom ile ch_ cke ett as_ und str nst ati _se _ar ser mma lag på_ amn ort all det lti na_ ngs _ta ska dat ga_ ilt _fl _oc gt_ _el mat _mi ers nga nta och il_ ara _pr _sy tta agg igt rt_ re_ gil st_ akt eck id_ _pa skr kat ela ins kri lis tar for cka _et _sa upp fla mn_ ren _fr la_ inn kon ang tor sa_ _ha one log dar pro stä riv gar ogi ner len man orm _vä mer or_ omm are _og ärd ns_ äll änt ant al_ reg _gi ons _ma ka_ rde rma _al end lig lla rat kad tad iv_ ind ive öve _be lut ran _x_ tet ut_ kun _si rer ket _ny sym tiv vär it_ isk uta ess mis kal rar _ku frå slu del _ve sto ens sek ån_ ck_ ign sk_ alo ssl _öv äng lyc mme bol _na mbo kt_ har ymb vis _gr _li tat _up iss ken rån fin _bi _än ark ndr res rd_ in_ che kän _ra gga kni _no sly _må sio _te _op ern _di _bo ge_ per gra egi gis isa sig _ok da_ typ amm bor vid _ex ere ts_ sam kod ume lok nne rsi lt_ ätt täl ali ten rna stö sök erv let _un _du ise ras läg ast _po git ate okä pos tru _to val par _by nen ake län bar avs ram dra tec arn _fo läs rki inf ard nna hål sen oka byt gor oll itt kap arg atu das nfo ger ont åll ope töd _ge nyc lak ukt tur _sp ruk _he pak _sl kel _tr ref dni apa omp ds_ rän ans ndo nat _hi ier red kna han",
+    "tha": "ไม_ _ไม การ แฟ_ _ม_ กเก ของ เกจ พกเ แพก ารถ ามา _ต_ สาม มาร ใช_ _สา _อง ได_ _อม หร_ เก_ _าง _น_ เป_ อม_ _ได อย_ _ดพ ลาด ดพล พลา _อ_ _ท_ _บ_ อง_ _ง_ _ใช _อก _อผ อผ_ _ด_ เล_ _เก _อย _ก_ กจ_ _ค_ อร_ _กา _ดข _ร_ กต_ ขณะ ดต_ _ยน ควา วาม _ดต _แฟ ดข_ นต_ สำห ำหร _าน _ถ_ _ล_ _จ_ _ว_ _สำ ราย _วเ _จะ นท_ เร_ _เป าดข แบบ งแพ องแ เข_ _ช_ ระบ _ใน _กำ หนด ำหน _ขอ าร_ กำห _แล ดขณ จาก _กต ทอร _ข_ สดง แสด งกา _วย _า_ _พบ เรก ารเ _แพ _อแ _วน งร_ ไดเ อก_ องก องร _อน ดเร กทอ รกท หน_ _หร _อค เพ_ _แส งค_ แล_ าน_ หล_ ให_ _กข _ย_ ปล_ เปล รถเ สร_ แต_ ปร_ รอง วเล และ _เพ โดย _งไ _รอ _งแ หม_ _นต งแฟ รท_ จท_ _อไ บรร างเ กจท บแฟ าย_ สำเ _นไ ทาง นแฟ ะบ_ _ส_ _แต งก_ บกา าต_ _ซ_ ำเร ใหม กขร ขระ _งเ _บร คร_ งาน _งค _เข ยกา กำล ารส ำล_ _าต _งก _าย นย_ รรท เช_ นข_ เมน _ปแ _มค กล_ เน_ _ดแ บค_ ปแบ ยช_ มนต ายก เลข ำส_ _บก คำส ดท_ มต_ ไว_ สถา อคว าด_ ลาย ายช _st _ดเ _นท sta งท_ บบ_ งไม มท_ ยาย อน_ เขต _ญห _มเ _ระ ญหา _ป_ ตข_ ถอน ใน_ ขตข นไป าก_ ชน_ ตร_ ะก_ _มข งข_ บร_ สะก _บแ มค_ งเล ถอด ทร_ นกา รวจ นขอ รแก ะบบ _co _าม รสะ ารก _re _ดท งต_ นช_ บอ_ มข_ อแฟ เท_ _คว _คำ _ผ_ con าง_ _de _ยก _ยว pkg ดถอ อดถ tat ตรว นด_ หมด านข _บค _เล kg_ ver ออก _dp dpk ทำง นได ประ หาย ำงา che ปรแ โปร กร_ กรม งรา วเม อาร างแ แกร _เม ดแฟ เซ_ ในแ สอบ เคร _งข _ดก _นข _ปร hem งอ_ บต_ หมา าม_ _นแ _รา ile sch งหม ถเป พาธ รถ_ ารต ารอ ไป_ _พ_ ดขอ นค_ นแพ มาย โพร _าส ema งเป ณะเ บข_ มด_ วน_ เหล _ap _sc _บอ _มพ fil ควบ ฐาน นห_ วบค ากร แทน _งห _งอ _นเ _มท _ออ _เส ขาด ปย_ มพ_ รถต วนห อแพ ไปย _ธ_ _โห at_ วจส อไป านะ ายเ _ตร งม_ จสอ ถาน ระท วนย หลด เต_ โหล _pa _งท _อเ _เน ดกา ดงร ยน_ ละเ องใ อมต ะเป าขอ าท_ เด_ _กร _นก _โด le_ ma_ กระ วก_ ะไม _ดร",
+    "tur": "_bi lan eri ir_ in_ en_ _de lar ama _do _ya bir ler anı _ge _ve _iç an_ ile er_ yor arı dos sya osy içi _ba or_ _ol ası len ya_ _ka ara lam çin eçe dı_ ak_ _ku değ _se sı_ eği _sa kle ini le_ ar_ ıla lla ri_ lem ull ili ene ste ma_ alı kul de_ ekl _ha çer nde bil adı eme _ye şle _be nda ind si_ ını ni_ geç ır_ _di _ta _pa da_ ala esi ayı _al _gi iz_ rı_ _ko eti _bu _ar rin rak iyo eni den lir lı_ _il mad ata di_ tir ın_ nı_ tır dır eli yen li_ ola me_ iri ana _iş baş ek_ ter _ad işl _so yaz siz ne_ ik_ rsi ve_ ers hat _ay _yo uru aya ınd tar _gö izi ıyo sın sin ki_ bel _da ist ırı seç ere la_ tan it_ ver lma say _i_ ine _he edi ril ok_ ğiş and _si _an yar yal diz lik ılı yas şti rın dan çık son nam ket leş rla rıl ele ısı rma ula atı emi _ça nım amı dir nın çen ta_ zin rle ldı bu_ _ön isi ürü _çı yok mi_ eye kar _ki mey man yer _bo _in al_ ış_ et_ nme olu erl ğer rul eya vey ger par _sı eğe _re kte ken ndı yap ği_ _uy _sü enm lin rme onu _te lle unu nek ndi mas il_ nin ilm _li git bağ azı end num _ek _tü ake nce na_ mak çal ıml pak nıl ulu sat iği ce_ lış el_ miy abi yan ca_ ız_ iş_ _ne ell ird olm iml tek aşa sür ştı nla ağl tur cı_ eks arl alt gir tem _st üm_ may kay üze med mış mıy una aht ut_ apı hta rek nah _et ına ede akt irt des ğil miş işi rti _is im_ nız aki eki kal dek ölü re_ içe sız ırm luş ıcı şar _fa lis ğla irm tal _no imi se_ ışt irl mbo bol _bö ikl est mut nes mle gör dur uşt ştu un_ rdi kom til em_ emb omu du_ yı_ ktı nu_ ılm kla bul sem ıkt ayn rli res on_ az_ tür mal te_ böl pıl _gü am_ işt sta mla tik rde _va _co eşt rum ada ığı lme var kon lgi lun mel",
+    "ukr": "_не ти_ ння ня_ _по _ви не_ _за ува ий_ енн _пр анн пер ати но_ ван ере кор ів_ _ко _на ка_ ся_ від _до _ро _у_ ори зна роз на_ ля_ ист ого _пе ний ста ано про айл фай _фа го_ вик рис ити чен ало для _дл ико ні_ их_ тан оми ено аче нач іст пом _си _ст ват _па _ві пов мил _пі илк пис них три _з_ ть_ ект оре рам ки_ під стр ови вда ми_ при до_ ани дал рек сим каз сти тов _як _зн _ре ося вол лос дан діл пар _бу _вд _ма ає_ им_ ред ком _об опе льн ент имв мво зді _вк озд _мо вка ії_ ктн мож сто _да ом_ ост нов _ін змі ног вер ара рес мет лен зап _сп жен лка аза еко кат ку_ _ти ова рим аме анд ід_ ові ову мен нек зан ути тьс ься роб наз азв _та ою_ ряд вив або що_ тип етр вор ок_ ков апи _є_ тни _аб ла_ ри_ сув тор сту лів рит _кл йл_ ера бут ідо _що має кон ден час бо_ есу дом _ар іль тво ції ово _оп за_ клю люч ома изн ва_ рів ним фік код _чи ті_ му_ мін аль еві нев ман _ря _вс міс зав та_ ами пор ані ожн кці рег тув лу_ _ча ств чит вий су_ мат ра_ _ді _се _ка ідп нен дже ідн ядк дов вув ої_ _b_ єть ло_ ій_ пра орм тру айт фор гіс йла _ве ран тал аці отр иво ому егі ном вле _і_ иве ифі вст трі _зм рук тр_ іка _мі поп _бі ідт сть ше_ _ба обр ька ну_ ато оро ерш рма нем пос нст але пот рен інс _u_ кри виз дтр ону тек _фо кщо якщ озм _сл нал ата укц ас_ оду нта уме _x_ оди раз _но сер без вил юва тат адр тів неп ьни нос мір над _ад док ли_ ени оло овн гра ідк лог ика екс дре ава лиш дно нут жна поз кла едж има дат діа _ли лов мал ими ує_ іл_ заг тиф то_ ськ имк лі_ огр слі азо вед ія_ _бе аве рав ише ча_ ача вир ить олі лив ву_ нт_ ви_ йлі сте во_ овл ту_ _ме івн арг ока _re ису",
+    "vie": "ng_ _th _kh _ch ông hôn khô _tr nh_ _ti _ph _nh in_ ên_ ập_ tin _gi ác_ _cá _tậ tập _đư các hi_ ỗi_ ch_ ược hể_ thể ợc_ ần_ _ng ho_ đượ _có có_ _hi _đị ục_ _lỗ _và ới_ lỗi _là _số số_ ết_ ùng ối_ ong ột_ cho ại_ _qu tro ron ịnh địn _củ của ủa_ chu _lệ ển_ _mộ một khi hiệ _dù dùn tha chỉ là_ hỉ_ _li mục iệu ệu_ _mụ thư _tê tên iên _tạ iến ay_ _sa hư_ _đã đã_ _ký ọn_ ký_ ra_ ầu_ họn chọ với _vớ ặp_ ào_ _bả phầ hần ất_ tiế ải_ hay _ra ặc_ _đầ _ki _kế _vi _gặ gặp iểu ểu_ ến_ _đố kết bản nhậ và_ _bi _đặ _tù tùy ùy_ đầu đối ạng ếu_ it_ _lạ _bỏ bỏ_ _nà _hợ hợp ợp_ ích ài_ ình ao_ lại ản_ _co ườn ờng ện_ iện ghi ang ời_ _để để_ ưa_ ai_ _độ _gh huy ặt_ _bị bị_ hiể uyể yển vào _cả _từ _ho _tự tự_ đặt òng _tư ày_ ạn_ ách _đổ chư ệnh lện _đa kho git kiể từ_ hiế ổi_ _dò lệ_ _bộ đổi bộ_ gia _re chi dòn phả ọc_ _đi hải hàn ấu_ _cầ ành liệ ếng _ha hị_ _x_ này ảnh ống ấy_ iển việ au_ ượn ạo_ tạo ợng hưa ều_ on_ _in ật_ ung thứ _xu iều ánh ân_ àm_ đan thô thị ộng anh _đọ đọc hân áo_ ẫn_ trư con _dạ dạn óa_ _dụ _sử qua _cấ như ái_ trì eo_ oặc ây_ ức_ the ụng dụn ệc_ iệc thi _tí ơng ươn _tì iếu ảng heo rìn úc_ ói_ sai _bạ rợ_ trợ _lư hoặ thà _gó gói cần _bá giá _lầ lần tìm ìm_ trị rị_ ận_ am_ bạn hiê iá_ _vị vị_ an_ báo iao tượ _di ắt_ phi iết te_ _mã phâ ua_ ngư át_ dẫn hỗ_ mã_ _dẫ làm cản hế_ uất rộn hận sau xuấ ực_ _st tại _hỗ liê ngu _đế ính chứ _nế nếu ước ằng ớc_ _gỡ gỡ_ ham quy êu_ _da _dữ dữ_ hức thự ép_ hực _dấ hời thờ dấu êm_ _về về_ _ở_ hán le_ trê _to rên _d_ hiề _cu ưu_ _u_ chạ tra độn húc hập ởi_ àn_ ệt_ _mở mở_ thê hêm ội_ _s_ đườ er_ hạy ạy_ _he hệ_ _câ ười _mà _n_ tín _bằ bằn",
+    "zho": "_无法 _無法 文件_ it_ _gi git 使用_ 檔案_ _使用 _re _co _n_ _不能 le_ ll_ 选项_ _文件 _如果 id_ _正在 错误_ _sh er_ 錯誤_ 失败_ _选项 ile 无效的 hel _无效 _s_ 選項_ _st _de _u_ 警告_ _或_ fil _pa _d_ _選項 _檔案 se_ _警告 _fi 失敗_ _和_ es_ _he _in _no _無效 on_ con 目录_ _x_ 软件包 無效的 _se 提交_ sta _di _pr et_ rl_ 参数_ ck_ 名稱_ _ma ver me_ 目錄_ te_ _c_ 模式_ lin ce_ _al ead 使用者 _需要 ell _id in_ she 分支_ ion re_ _未知 _沒有 ect _a_ 版本_ 的文件 信息_ _在_ all nt_ _ex _没有 _f_ ame _si 格式_ ack sh_ 字符_ dir _li rea _fo ed_ che _显示 rt_ ent ad_ or_ res _不是 st_ ch_ 命令_ at_ no_ _不支 for _t_ 的檔案 _ur ref str _忽略 用法_ 指定_ _p_ ate _lo _顯示 ase ter 存在_ _用法 _un _字符 _ta ve_ 名称_ _l_ _pi _y_ _me _命令 不支持 列表_ 指定的 com nam 大小_ loc pac tat _格式 引用_ 状态_ ge_ hea _指定 _設定 出错_ _设置 al_ int _cr _nu _r_ _错误 指令_ _i_ 設定_ _版本 类型_ 未知的 _ch bas ock pe_ ser _ap _m_ ont de_ elp ng_ ry_ 執行_ _e_ _su _v_ _失败 对象_ url 密钥_ _po tor ing tre _ba _失敗 ff_ ix_ _q_ nd_ lp_ ore ign ne_ ip_ 物件_ _指令 _的_ 件包_ 參數_ 字符串 無效_ ct_ _默认 pat tar _tr pre 文件名 _ca ype _ve _不要 输出_ _中的 typ 一个_ 狀態_ _ad tio 标准输 不存在 生錯誤 發生錯 dat _na tes 更新_ _或者 ty_ _参数 _o_ ers mer ort th_ 效的_ set 表达式 字元_ 找不到 ert ind 索引_ 是一个 有效的 _so ine _b_ rec rge 忽略_ 设置_ pt_ ut_ 時發生 ist _預設 _列出 ow_ pro 不支援 ote 路径_ emo 位元組 _op _wi 的提交 資訊_ 金鑰_ add ts_ inu omm tch 類型_ out 无效_ par 服务器 ss_ _h_ _us 不是一 文件的 標準輸 _sy 版本庫 用者_ deb use 配置_ _ty ime ls_ 签名_ ive onf 删除_ exp get ema pen 的版本 _bi eli _au _sp am_ _mi _退出 mat sio 操作_ 链接_ _ar ar_ tp_ _en _k_ ess nte 执行_ _錯誤 區塊_ ext 时出错 退出_ _位元 rem wor _to _wa end les 程序_ 輸出_ _建立 一個_ 工作區 _创建 tra age ef_ up_ _读取 lt_ rsi 工作区 程式_ _ht pos _g_ ere rce tim 子模组 _da _提交 app ec_ fo_ tri 位置_ 子模組 訊息_ 路徑_ _te _密钥 _配置 mod us_ 伺服器 _软件 地址_ _找不",
+}
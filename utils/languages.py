@@ -0,0 +1,155 @@
+"""
+Language codes, names and filename-based language detection shared by all tabs.
+
+Codes are normalized to ISO 639-2/T ("deu", "fra", "zho"); mkvmerge and ffmpeg
+accept those as well as the bibliographic forms ("ger", "fre", "chi") that
+mkvmerge -J reports for existing tracks. Menu entries look like "eng (English)".
+"""
+import os
+import re
+from utils.iso639_data import ISO_639
+
+# Languages offered first in the language menus
+COMMON_LANGUAGES = ["eng", "spa", "por", "fra", "deu", "ita", "jpn", "zho", "rus", "kor", "ara", "hin"]
+
+UNDEFINED = "und"
+
+# Short display names where the ISO name is a list of variants or historical
+_DISPLAY_NAMES = {
+    "und": "Undefined",
+    "ell": "Greek",
+    "spa": "Spanish",
+    "nld": "Dutch",
+    "cat": "Catalan",
+}
+
+# Tags seen in subtitle filenames that are not ISO 639 codes or English names
+_EXTRA_ALIASES = {
+    "eng": ["en-us", "en-gb", "english"],
+    "por": ["pob", "pt-br", "ptbr", "brazilian", "portugues", "português", "brasil"],
+    "spa": ["esp", "es-419", "es-la", "latino", "castellano", "espanol", "español"],
+    "fra": ["francais", "français", "vf", "vff"],
+    "deu": ["deutsch"],
+    "ita": ["italiano"],
+    "jpn": ["jp"],
+    "zho": ["chn", "chs", "cht", "zh-hans", "zh-hant", "zh-cn", "zh-tw", "zh-hk", "mandarin"],
+    "ces": ["cz", "cesky", "čeština", "cestina"],
+    "dan": ["dansk", "dk"],
+    "ell": ["gr", "greek"],
+    "fas": ["farsi"],
+    "fry": ["frisian"],
+    "khm": ["khmer"],
+    "nob": ["bokmal", "bokmål"],
+    "nno": ["nynorsk"],
+    "heb": ["iw"],
+    "ind": ["in"],
+    "nld": ["nederlands", "flemish"],
+    "nor": ["norsk", "nb-no"],
+    "pol": ["polski"],
+    "swe": ["svenska"],
+    "fin": ["suomi"],
+    "hun": ["magyar"],
+    "tur": ["turkce", "türkçe"],
+    "ukr": ["ua"],
+    "vie": ["vn"],
+    "yid": ["ji"],
+}
+
+# Codes that are also common English words or release tags; they only count as
+# a language when they are the last tag of the name ("Movie.it.srt", not "It.Follows.srt")
+_AMBIGUOUS = {
+    "an", "am", "as", "be", "bo", "ha", "he", "hi", "id", "in", "is", "it", "la", "me", "my", "na",
+    "no", "or", "sd", "so", "to", "ts", "art", "bat", "car", "cat", "day", "del", "den", "fan",
+    "fat", "gay", "her", "hit", "kin", "lat", "lit", "mad", "man", "map", "mas", "new", "nor", "pal",
+    "pan", "per", "sad", "sam", "sin", "son", "sun", "tem", "war", "was", "vf",
+}
+
+# One pass over the name: a short code with its region or script subtag ("pt-br", "zh_hant",
+# "es-419"), or else a run of letters in any script
+_TOKEN_RE = re.compile(r"(?<![^\W\d_])[a-z]{2,3}[-_](?:[a-z]{2}|\d{3}|hans|hant|latn|cyrl)(?![^\W\d_])|[^\W\d_]+")
+
+def _display_name(t_code, name):
+    if t_code in _DISPLAY_NAMES:
+        return _DISPLAY_NAMES[t_code]
+    name = re.sub(r"\s*\([^)]*\)", "", name.split(";")[0]).strip()
+    if ", " in name:
+        head, tail = name.split(", ", 1)
+        name = f"{tail} {head}"
+    return name
+
+def _build_tables():
+    names = {}
+    lookup = {}
+    # Entries with an ISO 639-1 code are the widely spoken languages; they win alias clashes
+    entries = sorted((line.split("|") for line in ISO_639.splitlines()), key=lambda e: not e[2])
+    for t_code, b_code, alpha2, name in entries:
+        names[t_code] = _display_name(t_code, name)
+        for alias in (t_code, b_code, alpha2):
+            if alias:
+                lookup[alias] = t_code
+    for t_code, b_code, alpha2, name in entries:
+        for variant in name.split(";"):
+            variant = variant.strip().lower()
+            if variant.isalpha(): # Single-word names only; filenames are matched token by token
+                lookup.setdefault(variant, t_code)
+    for t_code, aliases in _EXTRA_ALIASES.items():
+        for alias in aliases:
+            lookup[alias] = t_code
+    return names, lookup
+
+_NAMES, _LOOKUP = _build_tables()
+
+def normalize(code):
+    """
+    Returns the ISO 639-2/T code for a language code, name or region tag
+    ("pt-BR", "ger", "English", "zh_Hant"), or None if it is not one.
+    """
+    if not code:
+        return None
+    key = code.strip().lower().replace("_", "-")
+    found = _LOOKUP.get(key)
+    if found is None and "-" in key:
+        found = _LOOKUP.get(key.split("-", 1)[0])
+    return found
+
+def language_name(code):
+    """English name for a language code, e.g. "por" -> "Portuguese"."""
+    t_code = normalize(code)
+    return _NAMES.get(t_code, code) if t_code else code
+
+def menu_entry(code):
+    """Language menu value for a code: "por" -> "por (Portuguese)"."""
+    t_code = normalize(code) or UNDEFINED
+    return f"{t_code} ({_NAMES[t_code]})"
+
+def menu_entries(codes=None, include_undefined=False):
+    """Menu values for codes (default COMMON_LANGUAGES), optionally followed by "und (Undefined)"."""
+    entries = [menu_entry(c) for c in (codes or COMMON_LANGUAGES)]
+    if include_undefined:
+        entries.append(menu_entry(UNDEFINED))
+    return entries
+
+def detect_language_code(filename):
+    """
+    ISO 639-2/T code of the language tagged in a file name, or None.
+    Tags are searched from the end: "Show.S01E01.pt-BR.forced.srt" -> "por".
+    """
+    segments = os.path.basename(filename).lower().split(".")
+    if len(segments) > 1:
+        segments.pop() # Extension
+    last = True
+    # Tags sit at the end, so dot-separated segments are tokenized lazily from the right
+    for segment in reversed(segments):
+        for token in reversed(_TOKEN_RE.findall(segment)):
+            code = _LOOKUP.get(token)
+            if code is None and ("-" in token or "_" in token):
+                code = normalize(token)
+            if code is not None and code != UNDEFINED and (last or token not in _AMBIGUOUS):
+                return code
+            last = False
+    return None
+
+def detect_language(filename):
+    """Language menu value ("eng (English)") tagged in a file name, or None."""
+    code = detect_language_code(filename)
+    return menu_entry(code) if code else None
@@ -0,0 +1,116 @@
+"""
+Directory listing and probe prefetch behind the built-in media browser pane.
+
+A folder is read with one os.scandir pass; sorting and filtering work on that
+list in memory. ProbePrefetcher probes the files around the view on the
+scheduler's probe pool, so picking one shows its tracks without waiting.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from utils.batch_extract import VIDEO_EXTENSIONS
+from utils.probe import probe_file_async, file_key
+
+# size is 0 for directories; mtime in seconds
+Entry = namedtuple("Entry", ["name", "path", "is_dir", "size", "mtime"])
+
+SORT_NAME = "name"
+SORT_SIZE = "size"
+SORT_DATE = "date"
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+def natural_key(name):
+    """Sort key putting "Episode 2" before "Episode 10"."""
+    # re.split with a group alternates text and digits, so the types line up between keys
+    return [int(part) if i % 2 else part.lower() for i, part in enumerate(_DIGITS_RE.split(name))]
+
+def list_directory(path, show_hidden=False):
+    """Sub-directories and video files of path as Entry tuples, unsorted."""
+    entries = []
+    with os.scandir(path) as it:
+        for e in it:
+            if not show_hidden and e.name.startswith("."):
+                continue
+            try:
+                is_dir = e.is_dir()
+                if not is_dir and not e.name.lower().endswith(VIDEO_EXTENSIONS):
+                    continue
+                st = e.stat() # Cached by scandir on Windows, one stat elsewhere
+            except OSError:
+                continue # Broken link or removed meanwhile
+            entries.append(Entry(e.name, e.path, is_dir, 0 if is_dir else st.st_size, st.st_mtime))
+    return entries
+
+def filter_and_sort(entries, text="", sort=SORT_NAME, reverse=False):
+    """
+    Entries whose name contains text (case-insensitive), directories first,
+    each group ordered by sort (natural name order breaks ties).
+    """
+    text = text.strip().lower()
+    if text:
+        entries = [e for e in entries if text in e.name.lower()]
+    entries = sorted(entries, key=lambda e: natural_key(e.name))
+    if sort == SORT_SIZE:
+        entries.sort(key=lambda e: e.size, reverse=reverse)
+    elif sort == SORT_DATE:
+        entries.sort(key=lambda e: e.mtime, reverse=reverse)
+    elif reverse:
+        entries.reverse()
+    # Stable: keeps the order above within each group
+    entries.sort(key=lambda e: not e.is_dir)
+    return entries
+
+class ProbePrefetcher:
+    """
+    Keeps probe futures for the files around the browser's view.
+
+    prefetch() starts probes for the files given (most urgent first) and drops
+    queued ones for files that left the view; get() hands out the future for a
+    file, prefetched or new. Finished results are kept for the most recent
+    MAX_RESULTS files. Safe to call from any thread.
+    """
+    MAX_RESULTS = 256
+
+    def __init__(self, probe=probe_file_async):
+        self._probe = probe
+        self._lock = threading.Lock()
+        self._futures = OrderedDict() # (path, size, mtime_ns) -> Future, most recently wanted last
+
+    def get(self, path):
+        """Future resolving to the track info of path."""
+        with self._lock:
+            return self._want(file_key(path))
+
+    def prefetch(self, paths):
+        keys = [file_key(path) for path in paths]
+        wanted = set(keys)
+        with self._lock:
+            for key, future in list(self._futures.items()):
+                # cancel() only succeeds for probes still waiting for the pool
+                if key not in wanted and future.cancel():
+                    del self._futures[key]
+            for key in keys:
+                self._want(key)
+
+    def cached(self, path):
+        """The finished info for path if it is already known, else None."""
+        with self._lock:
+            future = self._futures.get(file_key(path))
+        if future is None or not future.done() or future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def _want(self, key):
+        # Called with self._lock held
+        future = self._futures.get(key)
+        if future is None or future.cancelled() or (future.done() and future.exception() is not None):
+            future = self._probe(key[0]) # Failed probes are retried, the file may be complete now
+            self._futures[key] = future
+        self._futures.move_to_end(key)
+
+        excess = len(self._futures) - self.MAX_RESULTS
+        for old_key in list(self._futures)[:max(0, excess)]:
+            self._futures.pop(old_key).cancel()
+        return future
@@ -0,0 +1,120 @@
+"""
+The file open in the single-file tabs (Extract, Add Subtitles, Edit, Create).
+
+One store holds its path, its probe and the per-track edits made in any tab,
+so switching tabs on the same file neither probes it again nor loses changes.
+"""
+import threading
+from utils.probe import probe_file_async, file_key
+
+# Listener events
+EVENT_FILE = "file" # Another file (or a new probe of the same one) is current
+EVENT_EDITS = "edits" # A track edit changed
+
+class MediaSession:
+    """
+    Singleton session shared by the tabs.
+
+    open() makes a file current; opening it again reuses its probe unless
+    the file was rewritten since (size or mtime changed) or the probe failed
+    or was cancelled. Edits are per track id:
+    {"keep": bool, "language": ISO 639-2 code, "name": str, "default": bool},
+    each key only once set, and are dropped when another file is opened or
+    this one was rewritten.
+    Listeners are called with (event, source) on the thread making the change,
+    the Tk thread for the tabs; source is whatever the caller passed, so a tab
+    can skip its own changes.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(MediaSession, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self._lock = threading.Lock()
+        self._probe = probe_file_async
+        self.path = None
+        self.probe = None # Future resolving to the track info of path
+        self._probed_key = None # file_key() of path when probe was started
+        self._edits = {} # track id -> {property: value}
+        self._listeners = []
+        self._initialized = True
+
+    def open(self, path, probe=None, source=None):
+        """
+        Makes path the current file and returns its probe Future.
+        probe: a probe already under way for path (e.g. the browser's), used
+        unless the session has a usable one.
+        """
+        key = file_key(path)
+        with self._lock:
+            if key == self._probed_key and self.probe is not None and not self._probe_failed(self.probe):
+                return self.probe
+            if key != self._probed_key:
+                self._edits = {} # Another file, or this one rewritten since: its tracks may differ
+            self.path = path
+            self._probed_key = key
+            self.probe = probe if probe is not None and not self._probe_failed(probe) else self._probe(path)
+            future = self.probe
+        self._notify(EVENT_FILE, source)
+        return future
+
+    def reload(self, source=None):
+        """Probes the current file again (it was changed on disk) and drops the edits it now has."""
+        with self._lock:
+            if self.path is None:
+                return None
+            self._edits = {}
+            self._probed_key = file_key(self.path)
+            self.probe = self._probe(self.path)
+            future = self.probe
+        self._notify(EVENT_FILE, source)
+        return future
+
+    def clear(self):
+        with self._lock:
+            self.path = None
+            self.probe = None
+            self._probed_key = None
+            self._edits = {}
+        self._notify(EVENT_FILE, None)
+
+    def track_edits(self, track_id):
+        with self._lock:
+            return dict(self._edits.get(track_id, {}))
+
+    def set_edits(self, track_id, source=None, **changes):
+        """Records changes for one track; listeners only hear of actual changes."""
+        with self._lock:
+            edits = self._edits.setdefault(track_id, {})
+            changed = {key: value for key, value in changes.items() if edits.get(key, object()) != value}
+            edits.update(changed)
+        if changed:
+            self._notify(EVENT_EDITS, source)
+
+    def add_listener(self, callback):
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, source):
+        for callback in list(self._listeners):
+            try:
+                callback(event, source)
+            except Exception as e:
+                print(f"Warning: session listener failed: {e}")
+
+    @staticmethod
+    def _probe_failed(future):
+        return future.cancelled() or (future.done() and future.exception() is not None)
@@ -3,6 +3,12 @@ import json
 import shutil
 import os
 from utils.dependency_manager import DependencyManager
+from utils.probe_cache import ProbeCache
+from utils import ebml_reader
+from utils.process_runner import run_streaming, PROBE_TIMEOUT
+from utils.atomic_output import AtomicOutput
+
+ProbeCache().register_builtin_tool("ebml", ebml_reader.READER_VERSION)
 
 def check_dependencies():
     """Check if mkvmerge and mkvextract are available."""
@@ -11,70 +17,159 @@ def check_dependencies():
     mkvextract = dm.get_binary_path("mkvextract")
     return mkvmerge, mkvextract
 
-def get_mkv_info(mkv_path):
+def get_mkv_info(mkv_path, chapters=False, attachments=False):
     """
-    Run mkvmerge -J to get JSON info about the file.
-    Returns the parsed JSON object.
-    Raises FileNotFoundError if mkvmerge is missing.
+    Get JSON info about the file in `mkvmerge -J` structure.
+    Matroska files are read in-process by utils.ebml_reader; anything it
+    does not handle falls back to running mkvmerge -J.
+    Results are served from the probe cache when the file and the prober
+    are unchanged since the last probe.
+    chapters/attachments: also report chapter and attachment summaries.
+    Raises FileNotFoundError if mkvmerge is missing (and needed).
     Raises RuntimeError if mkvmerge fails (e.g. invalid file).
     """
-    mkvmerge_exe = DependencyManager().get_binary_path("mkvmerge")
+    cache = ProbeCache()
+    extras = [k for k, wanted in (("chapters", chapters), ("attachments", attachments)) if wanted]
+
+    if ebml_reader.is_matroska_path(mkv_path):
+        cached = cache.get(mkv_path, "ebml")
+        if cached is not None and all(k in cached for k in extras):
+            return cached
+        try:
+            info = ebml_reader.read_mkv_info(mkv_path, chapters=chapters, attachments=attachments)
+            cache.put(mkv_path, "ebml", info)
+            return info
+        except (ebml_reader.EBMLError, OSError):
+            pass # Let mkvmerge deal with (or report) anything unusual
+
+    dm = DependencyManager()
+    mkvmerge_exe = dm.get_binary_path("mkvmerge")
     if not mkvmerge_exe:
         raise FileNotFoundError("mkvmerge not found. Please ensure MKVToolNix is installed.")
 
+    cached = cache.get(mkv_path, "mkvmerge")
+    if cached is not None:
+        return cached
+
+    if not dm.has_capability("mkvmerge", "identify_json"):
+        raise RuntimeError(f"{dm.tool_version('mkvmerge')} cannot report JSON (mkvmerge -J); "
+                           f"MKVToolNix 9.0 or newer is needed.")
+
     cmd = [mkvmerge_exe, "-J", mkv_path]
     try:
         # Check=False allows us to handle the error code manually
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False, timeout=PROBE_TIMEOUT)
         if result.returncode != 0:
             error_msg = result.stderr.strip() if result.stderr else "Unknown error"
             raise RuntimeError(f"mkvmerge failed (code {result.returncode}): {error_msg}")
 
-        return json.loads(result.stdout)
+        info = json.loads(result.stdout)
+        cache.put(mkv_path, "mkvmerge", info)
+        return info
     except FileNotFoundError:
         # This handles if subprocess fails to find the executable even if we thought we had the path
         raise FileNotFoundError(f"Could not execute mkvmerge at: {mkvmerge_exe}")
     except json.JSONDecodeError as e:
         raise RuntimeError(f"Failed to parse mkvmerge output: {e}")
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"mkvmerge did not answer within {PROBE_TIMEOUT} s")
     except Exception as e:
         # Re-raise known exceptions, wrap others
         if isinstance(e, (RuntimeError, FileNotFoundError)):
             raise e
         raise RuntimeError(f"Error analyzing file: {e}")
 
-def extract_tracks(mkv_path, track_id_path_map):
+def extract_tracks(mkv_path, track_id_path_map, on_progress=None, limits=None):
     """
     Extract tracks using mkvextract.
     track_id_path_map: dict mapping track_id (int) -> output_path (str)
+    on_progress: optional callback receiving process_runner.Progress events
+    limits: optional process_runner.Limits (cancel, timeout, stall watchdog)
+    The tracks are written to temp files and only renamed into place if mkvextract succeeds (exit code 0 or 1).
     """
     mkvextract_exe = DependencyManager().get_binary_path("mkvextract")
     if not mkvextract_exe:
         raise FileNotFoundError("mkvextract not found")
 
+    outputs = {tid: AtomicOutput(path) for tid, path in track_id_path_map.items()}
     cmd = [mkvextract_exe, mkv_path, "tracks"]
-    for tid, path in track_id_path_map.items():
-        cmd.append(f"{tid}:{path}")
+    for tid, out in outputs.items():
+        cmd.append(f"{tid}:{out.path}")
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        return result.returncode == 0, result.stderr or result.stdout
+        result = run_streaming(cmd, on_progress=on_progress, limits=limits)
+        # Exit code 1 means warnings; the tracks are still written
+        success = result.returncode in (0, 1)
+        if success:
+            for out in outputs.values():
+                out.commit()
+        return success, result.stderr or result.stdout
     except Exception as e:
         return False, str(e)
+    finally:
+        for out in outputs.values():
+            if not out.committed:
+                out.discard()
 
-def mux_mkv(output_path, input_files, options=None):
+def mux_mkv(output_path, input_files, options=None, on_progress=None, limits=None):
     """
     Run mkvmerge to create/mux a file.
+    on_progress: optional callback receiving process_runner.Progress events
+    limits: optional process_runner.Limits (cancel, timeout, stall watchdog)
+    mkvmerge writes to a temp file that replaces output_path only on success (exit code 0 or 1, warnings).
     """
     mkvmerge_exe = DependencyManager().get_binary_path("mkvmerge")
     if not mkvmerge_exe:
         raise FileNotFoundError("mkvmerge not found")
 
-    cmd = [mkvmerge_exe, "-o", output_path]
-    if options:
-        cmd.extend(options)
-    
-    if input_files:
-        cmd.extend(input_files)
+    with AtomicOutput(output_path) as out:
+        cmd = [mkvmerge_exe, "-o", out.path]
+        if options:
+            cmd.extend(options)
+
+        if input_files:
+            cmd.extend(input_files)
+
+        try:
+            result = run_streaming(cmd, on_progress=on_progress, output_path=out.path, limits=limits)
+            # Exit code 1 means warnings; the file is still written
+            success = result.returncode in (0, 1)
+            if success:
+                out.commit()
+            return success, result.stderr or result.stdout
+        except Exception as e:
+            return False, str(e)
+
+def edit_properties(mkv_path, track_edits, info=None):
+    """
+    Apply header-only track changes in place with mkvpropedit (no remux).
+    track_edits: dict mapping track_id (int, mkvmerge ID) -> dict of
+    mkvpropedit property -> value, e.g. {1: {"language": "jpn", "flag-default": "1"}}.
+    An empty string value deletes the property (e.g. clears the track name).
+    info: probe result of mkv_path (probed here if not given), for the track UIDs.
+    """
+    mkvpropedit_exe = DependencyManager().get_binary_path("mkvpropedit")
+    if not mkvpropedit_exe:
+        raise FileNotFoundError("mkvpropedit not found")
+
+    if not track_edits:
+        return True, "No changes to apply."
+
+    if info is None:
+        info = get_mkv_info(mkv_path)
+    uids = {t.get("id"): t.get("properties", {}).get("uid") for t in info.get("tracks", [])}
+
+    cmd = [mkvpropedit_exe, mkv_path]
+    for tid, props in sorted(track_edits.items()):
+        # Selected by UID: track:n counts tracks in file order, which need not match the mkvmerge IDs
+        if not uids.get(tid):
+            return False, f"Track {tid} has no UID; it cannot be edited in place."
+        cmd.extend(["--edit", f"track:={uids[tid]}"])
+        for prop, value in props.items():
+            if value == "":
+                cmd.extend(["--delete", prop])
+            else:
+                cmd.extend(["--set", f"{prop}={value}"])
 
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, check=False)
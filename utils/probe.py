@@ -0,0 +1,37 @@
+import os
+from utils.mkv_wrapper import get_mkv_info
+from utils.ffmpeg_wrapper import get_ffmpeg_info
+from utils.job_scheduler import JobScheduler, POOL_PROBE
+
+def probe_file(file_path):
+    """
+    Probe a media file with the right tool for its container.
+    Returns the track info dict (mkvmerge -J structure).
+    Raises FileNotFoundError/RuntimeError on failure.
+    """
+    if file_path.lower().endswith('.mkv'):
+        return get_mkv_info(file_path)
+
+    info = get_ffmpeg_info(file_path)
+    # ffmpeg_wrapper returns None on failure instead of raising
+    if info is None:
+        raise RuntimeError("Could not read file info (FFmpeg).")
+    return info
+
+def file_key(path):
+    """(path, size, mtime_ns) of a file, so a probe result is not reused once it is rewritten."""
+    try:
+        st = os.stat(path)
+        return path, st.st_size, st.st_mtime_ns
+    except OSError:
+        return path, None, None
+
+def probe_file_async(file_path):
+    """
+    Submit probe_file to the scheduler's probe pool, a small pool of its own so a
+    burst of selections neither hammers a slow share nor waits behind long jobs.
+    Returns a concurrent.futures.Future; cancel() drops it if it has not started yet.
+    """
+    job = JobScheduler().submit(f"Probe {os.path.basename(file_path)}", lambda job: probe_file(file_path),
+                                pool=POOL_PROBE, kind="probe", listed=False)
+    return job.future
@@ -0,0 +1,216 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import threading
+from utils.dependency_manager import DependencyManager
+
+
+def get_cache_dir():
+    """Returns the per-user cache directory for the suite (created on demand)."""
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'mkv-tool-suite')
+
+
+class ProbeCache:
+    """
+    Persistent cache for probe results (mkvmerge -J / ffprobe).
+
+    Entries are keyed on the file path and validated against the file's
+    (inode, size, mtime_ns) and the identity of the tool that produced them,
+    so a modified file or an upgraded tool is a miss and the stale row is dropped.
+    Least recently used entries are evicted once the entry or byte cap is exceeded.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    MAX_ENTRIES = 5000
+    MAX_BYTES = 64 * 1024 * 1024
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ProbeCache, cls).__new__(cls)
+                cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.db_path = os.path.join(get_cache_dir(), 'probe_cache.sqlite')
+        self.max_entries = self.MAX_ENTRIES
+        self.max_bytes = self.MAX_BYTES
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled = False
+        self._tool_stamps = {}
+        self._builtin_stamps = {}
+        self._initialized = True
+
+    def _connect(self):
+        # Called with self._lock held
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                " path TEXT NOT NULL,"
+                " tool TEXT NOT NULL,"
+                " inode INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " tool_stamp TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " nbytes INTEGER NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " PRIMARY KEY (path, tool))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS probes_last_used ON probes (last_used)")
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            # A broken cache must never break probing; run uncached instead
+            print(f"Warning: probe cache unavailable ({e}), continuing without it.")
+            self._disabled = True
+
+        return self._conn
+
+    def register_builtin_tool(self, tool_name, version):
+        """Registers an in-process prober (no binary to stat) under a fixed version stamp."""
+        self._builtin_stamps[tool_name] = f"builtin:{tool_name}:{version}"
+
+    def _tool_stamp(self, tool_name):
+        """Identity of the binary that produced a result: path + size + mtime."""
+        if tool_name in self._builtin_stamps:
+            return self._builtin_stamps[tool_name]
+        if tool_name in self._tool_stamps:
+            return self._tool_stamps[tool_name]
+
+        path = DependencyManager().get_binary_path(tool_name)
+        try:
+            st = os.stat(path)
+            stamp = f"{path}:{st.st_size}:{st.st_mtime_ns}"
+        except (OSError, TypeError):
+            stamp = None
+
+        if stamp:
+            self._tool_stamps[tool_name] = stamp
+        return stamp
+
+    @staticmethod
+    def _file_key(file_path):
+        st = os.stat(file_path)
+        return os.path.realpath(file_path), st.st_ino, st.st_size, st.st_mtime_ns
+
+    def get(self, file_path, tool_name):
+        """Returns the cached probe result for file_path, or None on a miss."""
+        try:
+            path, inode, size, mtime_ns = self._file_key(file_path)
+        except OSError:
+            return None
+        stamp = self._tool_stamp(tool_name)
+        if not stamp:
+            return None
+
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT inode, size, mtime_ns, tool_stamp, data FROM probes WHERE path = ? AND tool = ?",
+                    (path, tool_name)).fetchone()
+                if row is None:
+                    return None
+
+                if tuple(row[:4]) != (inode, size, mtime_ns, stamp):
+                    # File changed or tool upgraded since the entry was written
+                    conn.execute("DELETE FROM probes WHERE path = ? AND tool = ?", (path, tool_name))
+                    conn.commit()
+                    return None
+
+                conn.execute("UPDATE probes SET last_used = ? WHERE path = ? AND tool = ?",
+                             (time.time(), path, tool_name))
+                conn.commit()
+                return json.loads(row[4])
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Warning: probe cache read failed: {e}")
+                return None
+
+    def put(self, file_path, tool_name, info):
+        """Stores a probe result for file_path, evicting old entries if over the cap."""
+        if info is None:
+            return
+        try:
+            path, inode, size, mtime_ns = self._file_key(file_path)
+        except OSError:
+            return
+        stamp = self._tool_stamp(tool_name)
+        if not stamp:
+            return
+
+        data = json.dumps(info, separators=(',', ':'))
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO probes"
+                    " (path, tool, inode, size, mtime_ns, tool_stamp, data, nbytes, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, tool_name, inode, size, mtime_ns, stamp, data, len(data), time.time()))
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: probe cache write failed: {e}")
+
+    def _evict(self, conn):
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM probes").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # Walk from least recently used until both caps are satisfied
+        doomed = []
+        for path, tool, nbytes in conn.execute("SELECT path, tool, nbytes FROM probes ORDER BY last_used ASC"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((path, tool))
+            count -= 1
+            total -= nbytes
+        conn.executemany("DELETE FROM probes WHERE path = ? AND tool = ?", doomed)
+
+    def invalidate(self, file_path):
+        """Drops every cached result for file_path (e.g. after writing to it)."""
+        path = os.path.realpath(file_path)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM probes WHERE path = ?", (path,))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: probe cache invalidation failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.execute("DELETE FROM probes")
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: probe cache clear failed: {e}")
+            self._tool_stamps.clear()
@@ -0,0 +1,282 @@
+import os
+import re
+import sys
+import time
+import threading
+import subprocess
+from collections import namedtuple
+
+# percent: 0-100 (or None if unknown), bytes: output bytes written so far (or None),
+# eta: estimated seconds remaining (or None)
+Progress = namedtuple("Progress", ["percent", "bytes", "eta"])
+
+# Resources used by one tool run: cpu_seconds (user + system) and max_rss (peak
+# resident memory in bytes); None where the platform cannot tell (Windows)
+ToolUsage = namedtuple("ToolUsage", ["cpu_seconds", "max_rss"])
+
+# Stops a running tool: cancel_event (threading.Event, set to cancel), timeout (wall-clock
+# seconds) and stall_timeout (seconds without progress); None disables each
+Limits = namedtuple("Limits", ["cancel_event", "timeout", "stall_timeout"])
+
+# Default for stall_timeout: no progress for this long means the tool hangs
+DEFAULT_STALL_TIMEOUT = 300
+# Probes (mkvmerge -J, ffprobe) read headers only; longer means a hung tool
+PROBE_TIMEOUT = 60
+# How often the watchdog looks at the limits
+WATCHDOG_INTERVAL = 0.1
+# Seconds between asking a tool to stop and killing it
+KILL_GRACE = 3
+
+_GUI_PROGRESS_RE = re.compile(r"#GUI#progress\s+(\d+)%")
+
+class ProcessAborted(RuntimeError):
+    """The tool was stopped by its Limits; reason is "cancelled", "timeout" or "stalled"."""
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+def _tool_kind(cmd):
+    name = os.path.basename(cmd[0]).lower()
+    if name.endswith(".exe"):
+        name = name[:-4]
+    if name in ("mkvmerge", "mkvextract", "mkvpropedit"):
+        return "mkvtoolnix"
+    if name == "ffmpeg":
+        return "ffmpeg"
+    return None
+
+def _startupinfo():
+    """Hide the console window for child processes on Windows."""
+    if os.name != 'nt':
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return startupinfo
+
+def progress_cmd(cmd):
+    """
+    Return a copy of cmd with the flags that make the tool report progress on stdout:
+    --gui-mode for MKVToolNix tools, -progress pipe:1 for ffmpeg.
+    """
+    kind = _tool_kind(cmd)
+    if kind == "mkvtoolnix":
+        return [cmd[0], "--gui-mode"] + list(cmd[1:])
+    if kind == "ffmpeg":
+        return [cmd[0], "-progress", "pipe:1", "-nostats"] + list(cmd[1:])
+    return list(cmd)
+
+class _ProgressEmitter:
+    """Turns raw percent/bytes samples into rate limited Progress events with an ETA."""
+    def __init__(self, callback, output_path=None, min_interval=0.25):
+        self.callback = callback
+        self.output_path = output_path
+        self.min_interval = min_interval
+        self.started = time.monotonic()
+        self.last_emit = 0.0
+        self.last_percent = None
+
+    def sample(self, percent=None, nbytes=None, final=False):
+        now = time.monotonic()
+        if not final and percent != 100.0 and now - self.last_emit < self.min_interval:
+            return
+        if not final and percent is not None and percent == self.last_percent:
+            return
+
+        if nbytes is None and self.output_path:
+            try:
+                nbytes = os.path.getsize(self.output_path)
+            except OSError:
+                nbytes = None
+
+        eta = None
+        if percent is not None and 0 < percent < 100:
+            elapsed = now - self.started
+            eta = elapsed * (100 - percent) / percent
+        elif percent == 100:
+            eta = 0.0
+
+        self.last_emit = now
+        self.last_percent = percent
+        self.callback(Progress(percent, nbytes, eta))
+
+_usage_local = threading.local()
+
+def set_usage_sink(sink):
+    """
+    Tools run by run_streaming on the calling thread append their ToolUsage to
+    sink (a list) from now on; None stops. The job scheduler sets one per job.
+    """
+    _usage_local.sink = sink
+
+def _wait(proc):
+    """
+    proc.wait(), reaping the child with os.wait4 where available so its own
+    CPU time and peak memory are known (RUSAGE_CHILDREN would mix in every
+    other tool running at the same time). Returns a ToolUsage.
+    """
+    if hasattr(os, "wait4") and proc.returncode is None:
+        try:
+            _, status, rusage = os.wait4(proc.pid, 0)
+        except ChildProcessError:
+            pass # Reaped by the watchdog's proc.wait()
+        else:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is in kilobytes on Linux, bytes on macOS
+            max_rss = rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            return ToolUsage(rusage.ru_utime + rusage.ru_stime, max_rss)
+    proc.wait()
+    return ToolUsage(None, None)
+
+def _stop(proc):
+    """Ask the tool to exit, kill it if it has not within KILL_GRACE seconds."""
+    try:
+        proc.terminate()
+        proc.wait(KILL_GRACE)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    except OSError:
+        pass # Already gone
+
+class _Watchdog:
+    """
+    Background thread enforcing Limits on a running tool. Stops the tool once
+    cancel_event is set, the timeout passes or no progress was seen for
+    stall_timeout seconds; the reason is kept in self.aborted.
+    """
+    def __init__(self, proc, limits):
+        self.proc = proc
+        self.limits = limits
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.aborted = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def activity(self):
+        self.last_activity = time.monotonic()
+
+    def stop(self):
+        self._done.set()
+        self._thread.join()
+
+    def _check(self):
+        now = time.monotonic()
+        cancel_event, timeout, stall_timeout = self.limits
+        if cancel_event is not None and cancel_event.is_set():
+            return ProcessAborted("cancelled", "Cancelled")
+        if timeout and now - self.started > timeout:
+            return ProcessAborted("timeout", f"Timed out after {timeout:g} s")
+        if stall_timeout and now - self.last_activity > stall_timeout:
+            return ProcessAborted("stalled", f"No progress for {stall_timeout:g} s")
+        return None
+
+    def _watch(self):
+        while not self._done.wait(WATCHDOG_INTERVAL):
+            self.aborted = self._check()
+            if self.aborted is not None:
+                _stop(self.proc)
+                return
+
+def run_streaming(cmd, on_progress=None, duration_ns=None, output_path=None, min_interval=0.25, limits=None):
+    """
+    Run an external tool, streaming its progress instead of waiting blindly.
+
+    on_progress: called with Progress(percent, bytes, eta) at most every
+    min_interval seconds (plus a final event). Called from the calling thread.
+    duration_ns: media duration, needed to turn ffmpeg's out_time into a percent.
+    output_path: stat'ed for the bytes figure when the tool does not report it.
+    limits: Limits to stop the tool early; it is then killed and ProcessAborted
+    raised. A KeyboardInterrupt also kills the tool before propagating.
+
+    Returns a subprocess.CompletedProcess like subprocess.run(capture_output=True, text=True);
+    the progress lines themselves are filtered out of stdout. Its extra usage
+    attribute is the tool's ToolUsage (also appended to the set_usage_sink list).
+    """
+    if on_progress is None and limits is None:
+        return subprocess.run(cmd, capture_output=True, text=True, startupinfo=_startupinfo())
+
+    kind = _tool_kind(cmd)
+    full_cmd = progress_cmd(cmd)
+    emitter = _ProgressEmitter(on_progress or (lambda progress: None), output_path, min_interval)
+
+    proc = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            text=True, errors="replace", bufsize=1, startupinfo=_startupinfo())
+    watchdog = _Watchdog(proc, limits) if limits is not None else None
+
+    # Drain stderr on the side so a chatty tool can never block on a full pipe
+    stderr_lines = []
+    stderr_thread = threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+    stderr_thread.start()
+
+    stdout_lines = []
+    ff_block = {}
+    last_sample = None
+    try:
+        for line in proc.stdout:
+            sample = None
+            if kind == "mkvtoolnix":
+                m = _GUI_PROGRESS_RE.match(line)
+                if m:
+                    sample = (float(m.group(1)), None)
+            elif kind == "ffmpeg":
+                key, sep, value = line.strip().partition("=")
+                if sep and key.replace("_", "").isalnum():
+                    ff_block[key] = value
+                    if key == "progress":
+                        sample = _ffmpeg_sample(ff_block, duration_ns)
+                        ff_block = {}
+                    else:
+                        continue
+            if sample is None:
+                stdout_lines.append(line)
+                if kind is None and watchdog:
+                    watchdog.activity() # No progress protocol: any output counts
+                continue
+            # Only an advancing sample counts as progress; a hung ffmpeg may keep repeating itself
+            if watchdog and sample != last_sample:
+                watchdog.activity()
+            last_sample = sample
+            emitter.sample(*sample)
+        usage = _wait(proc)
+    except BaseException:
+        _stop(proc)
+        raise
+    finally:
+        if watchdog:
+            watchdog.stop()
+        stderr_thread.join()
+
+    sink = getattr(_usage_local, "sink", None)
+    if sink is not None:
+        sink.append(usage)
+
+    if watchdog and watchdog.aborted is not None:
+        raise watchdog.aborted
+
+    if proc.returncode == 0 and emitter.last_percent != 100.0:
+        emitter.sample(percent=100.0, final=True)
+
+    completed = subprocess.CompletedProcess(full_cmd, proc.returncode, "".join(stdout_lines), "".join(stderr_lines))
+    completed.usage = usage
+    return completed
+
+def _ffmpeg_sample(block, duration_ns):
+    """(percent, bytes) from one ffmpeg -progress key=value block."""
+    nbytes = None
+    try:
+        nbytes = int(block.get("total_size", ""))
+    except ValueError:
+        pass
+
+    percent = None
+    if block.get("progress") == "end":
+        percent = 100.0
+    elif duration_ns:
+        # out_time_ms is (despite its name) in microseconds, like out_time_us
+        out_us = block.get("out_time_us") or block.get("out_time_ms")
+        try:
+            percent = max(0.0, min(100.0, int(out_us) * 1000 * 100 / duration_ns))
+        except (TypeError, ValueError):
+            pass
+    return percent, nbytes
@@ -0,0 +1,132 @@
+import os
+import threading
+from concurrent.futures import CancelledError, TimeoutError
+from utils.batch_extract import (STATUS_QUEUED, STATUS_DONE, STATUS_SKIPPED,
+                                 STATUS_FAILED, STATUS_CANCELLED)
+from utils.job_scheduler import JobScheduler, FINISHED_STATES, pool_for_tool
+from utils.process_runner import run_streaming, ProcessAborted
+from utils.dependency_manager import DependencyManager
+from utils.atomic_output import AtomicOutput, check_free_space, estimate_output_size
+from utils.languages import normalize, language_name, detect_language_code, UNDEFINED
+from utils.subtitle_language import detect_subtitle_language
+
+STATUS_MUXING = "muxing"
+
+def episode_output_path(video_path, output_dir=None, suffix="_muxed"):
+    """Output .mkv path for one episode: <output_dir or source dir>/<name><suffix>.mkv"""
+    out_dir = output_dir or os.path.dirname(video_path)
+    basename = os.path.splitext(os.path.basename(video_path))[0]
+    return os.path.join(out_dir, f"{basename}{suffix}.mkv")
+
+def subtitle_options(sub_paths, default_code=None, detect_content=True, fallback_code=UNDEFINED):
+    """
+    Language, track name and default flag for each subtitle, as in MixerFrame.add_sub_row:
+    the language tagged in the file name, else the one read from the text
+    (detect_content), else fallback_code. The first subtitle in default_code is
+    the default track. Reading subtitle text is slow, keep this off the Tk thread.
+    """
+    subs = []
+    default_taken = False
+    for path in sub_paths:
+        code = detect_language_code(path)
+        if code is None and detect_content:
+            code = detect_subtitle_language(path)
+        code = normalize(code) or fallback_code
+        is_default = code == default_code and not default_taken
+        default_taken = default_taken or is_default
+        subs.append({"path": path, "language": code, "name": language_name(code), "default": is_default})
+    return subs
+
+def mux_episode_cmd(mkvmerge, video_path, subs, output_path):
+    """
+    mkvmerge command adding subs to video_path, with the per-subtitle options of
+    MixerFrame._process_mkv; every track of the episode itself is kept.
+    subs: list of {"path", "language", "name", "default"}
+    """
+    cmd = [mkvmerge, "-o", output_path, video_path]
+    for sub in subs:
+        cmd.extend(["--language", f"0:{sub['language']}"])
+        if sub.get("name"):
+            cmd.extend(["--track-name", f"0:{sub['name']}"])
+        cmd.extend(["--default-track-flag", f"0:{'1' if sub.get('default') else '0'}"])
+        cmd.extend(["--forced-display-flag", "0:0"])
+        cmd.append(sub["path"])
+    return cmd
+
+def mux_episode(job, mkvmerge, episode, output_dir, suffix, on_status):
+    """Scheduler job body muxing one episode; returns (status, detail)."""
+    video_path = episode["video"]
+    output_path = episode_output_path(video_path, output_dir, suffix)
+    if on_status:
+        on_status(video_path, STATUS_MUXING, f"{len(episode['subs'])} subtitle(s)")
+
+    check_free_space(output_path, estimate_output_size(video_path, extra_paths=[s["path"] for s in episode["subs"]]))
+    with AtomicOutput(output_path) as out:
+        cmd = mux_episode_cmd(mkvmerge, video_path, episode["subs"], out.path)
+        try:
+            result = run_streaming(cmd, on_progress=job.report_progress, output_path=out.path, limits=job.limits)
+        except ProcessAborted as e:
+            if e.reason == "cancelled":
+                return STATUS_CANCELLED, ""
+            raise
+        # mkvmerge exits with 1 on warnings; the file is still written
+        if result.returncode not in (0, 1):
+            raise RuntimeError((result.stderr or result.stdout).strip() or f"mkvmerge exited with {result.returncode}")
+        out.commit()
+
+    detail = os.path.basename(output_path) + (" (with warnings)" if result.returncode == 1 else "")
+    return STATUS_DONE, detail
+
+def batch_mux(episodes, output_dir=None, suffix="_muxed", on_status=None, cancel_event=None):
+    """
+    Add subtitles to many episodes, one scheduler job per episode.
+    mkvmerge is I/O bound, so the I/O pool size bounds how many run at once.
+
+    episodes: list of {"video": path, "subs": [{"path", "language", "name", "default"}]}
+    on_status: callback(video_path, status, detail), called from worker threads
+    cancel_event: threading.Event; once set, waiting episodes are dropped and running mkvmerge killed
+    Returns {video_path: (status, detail)}.
+    """
+    mkvmerge = DependencyManager().get_binary_path("mkvmerge")
+    if not mkvmerge:
+        raise FileNotFoundError("mkvmerge not found")
+
+    cancel_event = cancel_event or threading.Event()
+    scheduler = JobScheduler()
+    results = {}
+
+    jobs = {}
+    for episode in episodes:
+        path = episode["video"]
+        if not episode["subs"]:
+            results[path] = (STATUS_SKIPPED, "No subtitles matched")
+            if on_status:
+                on_status(path, *results[path])
+            continue
+        if on_status:
+            on_status(path, STATUS_QUEUED, "")
+        jobs[path] = scheduler.submit(f"mkvmerge: {os.path.basename(path)}",
+                                      lambda job, e=episode: mux_episode(job, mkvmerge, e, output_dir, suffix, on_status),
+                                      pool=pool_for_tool("mkvmerge"), kind="mux",
+                                      inputs=[path] + [sub["path"] for sub in episode["subs"]],
+                                      outputs=[episode_output_path(path, output_dir, suffix)])
+
+    for path, job in jobs.items():
+        while True:
+            if cancel_event.is_set():
+                for pending in jobs.values():
+                    if pending.state not in FINISHED_STATES:
+                        pending.cancel()
+            try:
+                results[path] = job.future.result(timeout=0.25)
+            except TimeoutError:
+                continue
+            except CancelledError:
+                results[path] = (STATUS_CANCELLED, "")
+            except Exception as e:
+                results[path] = (STATUS_CANCELLED, "") if job.cancel_event.is_set() else (STATUS_FAILED, str(e))
+            if on_status:
+                on_status(path, *results[path])
+            break
+
+    return results
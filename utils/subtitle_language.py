@@ -0,0 +1,231 @@
+"""
+Content-based subtitle language detection, the second tier after the filename
+tags of utils.languages.
+
+Reads at most the first MAX_READ_BYTES of an SRT/ASS/SSA/VTT/SUB file, strips
+timings, numbering and markup, and scores the dialogue against compact
+character-trigram profiles (utils/lang_profiles.py) that ship with the app,
+so it works offline. Letters that only some languages use (e.g. ы, і, ј)
+rule out the others first. Profiles are only loaded on first use.
+"""
+import os
+import re
+import math
+import codecs
+import threading
+from utils.job_scheduler import JobScheduler, POOL_PROBE
+
+MAX_READ_BYTES = 16 * 1024
+# Tried in turn for files that are not UTF-8/UTF-16: Western, Cyrillic, Central European, Greek, Arabic, Hebrew
+LEGACY_ENCODINGS = ("cp1252", "cp1251", "cp1250", "cp1253", "cp1256", "cp1255")
+# Enough dialogue for a stable guess; more only costs time
+MAX_SAMPLE_CHARS = 3000
+# Below this many trigrams (a few short lines) the guess is not trusted
+MIN_TRIGRAMS = 40
+# Minimum lead of the best language over the runner-up, in mean log-probability per trigram
+MIN_MARGIN = 0.02
+# Minimum share of the text's trigrams found in the winning profile; mis-decoded text scores ~0.1
+MIN_COVERAGE = 0.2
+# Share of kana among the letters above which Han-script text is Japanese rather than Chinese
+MIN_KANA_SHARE = 0.1
+# Letters of languages outside its alphabet (see _MARKER_LETTERS) that rule a language out:
+# at least this many, and this share of the letters (a foreign name is tolerated)
+MIN_FOREIGN_LETTERS = 2
+MIN_FOREIGN_SHARE = 0.01
+
+_SCRIPT_RES = {
+    "latin": re.compile(r"[a-zA-Z\u00c0-\u024f]"),
+    "cyrillic": re.compile(r"[\u0400-\u04ff]"),
+    "greek": re.compile(r"[\u0370-\u03ff]"),
+    "hebrew": re.compile(r"[\u05d0-\u05ea]"),
+    "arabic": re.compile(r"[\u0620-\u064a\u066e-\u06d3]"),
+    "devanagari": re.compile(r"[\u0900-\u097f]"),
+    "thai": re.compile(r"[\u0e00-\u0e7f]"),
+    "hangul": re.compile(r"[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]"),
+    "kana": re.compile(r"[\u3040-\u30ff]"),
+    "han": re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]"),
+}
+# CJK text has no word boundaries and far too many distinct trigrams for small
+# profiles, but its script alone tells the languages of the profile set apart
+_CJK_LANGUAGES = {"hangul": "kor", "kana": "jpn", "han": "zho"}
+
+# Letters used by only some of the profile languages of a script. The profiles
+# come from UI text, which is too close between related languages (Russian and
+# Ukrainian, Bulgarian or Serbian) for short dialogue; their alphabets are not.
+_MARKER_LETTERS = {
+    "ы": "rus", "э": "rus", "ё": "rus",
+    "і": "ukr", "ї": "ukr", "є": "ukr", "ґ": "ukr",
+    "ъ": "rus bul", "щ": "rus ukr bul", "й": "rus ukr bul", "ь": "rus ukr bul", "ю": "rus ukr bul",
+    "я": "rus ukr bul",
+    "ђ": "srp", "ј": "srp", "љ": "srp", "њ": "srp", "ћ": "srp", "џ": "srp",
+    "ł": "pol", "ś": "pol", "ź": "pol", "ż": "pol", "ń": "pol",
+    "ñ": "spa", "ß": "deu", "ő": "hun", "ű": "hun", "ř": "ces", "ů": "ces", "ğ": "tur", "ı": "tur",
+}
+
+_TIMING_RE = re.compile(r"^\s*\d+\s*$|-->|^\s*(?:WEBVTT|NOTE|STYLE|REGION)\b")
+_ASS_DIALOGUE_RE = re.compile(r"^Dialogue:(?:[^,]*,){9}(.*)$")
+_MARKUP_RE = re.compile(r"\{[^}]*\}|<[^>]*>|\\[Nnh]|\|")
+_NON_LETTER_RE = re.compile(r"[\W\d_]+")
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+def _script_counts(text):
+    """{script: number of letters in it} for the scripts present in text."""
+    counts = {}
+    for script, regex in _SCRIPT_RES.items():
+        n = len(regex.findall(text))
+        if n:
+            counts[script] = n
+    return counts
+
+def _load_profiles():
+    """
+    (language codes, their scripts, {trigram: [(language index, log-probability gain over unseen)]}).
+    Indexed by trigram so scoring touches only the languages that contain each trigram.
+    """
+    global _profiles
+    with _profiles_lock:
+        if _profiles is None:
+            from utils.lang_profiles import PROFILES, PROFILE_SIZE
+            # Zipf estimate from rank: p(rank r) ~ 1/(r+1), scaled so the profile holds most of the mass;
+            # trigrams outside a profile get a fixed small probability
+            norm = sum(1.0 / (r + 1) for r in range(PROFILE_SIZE))
+            scale = 0.8 / norm
+            unseen = math.log(scale / (PROFILE_SIZE * 8))
+            codes = list(PROFILES)
+            scripts = []
+            for code in codes:
+                counts = _script_counts(PROFILES[code])
+                scripts.append(max(counts, key=counts.get))
+            index = {}
+            for i, code in enumerate(codes):
+                for r, tri in enumerate(PROFILES[code].split(" ")):
+                    index.setdefault(tri.replace("_", " "), []).append((i, math.log(scale / (r + 1)) - unseen))
+            _profiles = (codes, scripts, index)
+    return _profiles
+
+def _read_head(path, max_bytes):
+    try:
+        with open(path, "rb") as f:
+            return f.read(max_bytes)
+    except OSError:
+        return b""
+
+def _decodings(data):
+    """Candidate decodings of the start of a subtitle file, most likely first."""
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return [data.decode("utf-16", errors="ignore")]
+    try:
+        # Incremental decoding tolerates a character cut in half by the read limit
+        return [codecs.getincrementaldecoder("utf-8-sig")().decode(data, final=False)]
+    except UnicodeDecodeError:
+        # Legacy 8-bit subtitles; the code page that reads as a known language wins
+        return [data.decode(encoding, errors="replace") for encoding in LEGACY_ENCODINGS]
+
+def _dialogue(text):
+    """Subtitle text without timings, numbering, ASS fields or markup."""
+    is_ass = "[Events]" in text or "Dialogue:" in text
+    lines = []
+    for line in text.splitlines():
+        if is_ass:
+            m = _ASS_DIALOGUE_RE.match(line)
+            if not m:
+                continue
+            line = m.group(1)
+        elif not line.strip() or _TIMING_RE.search(line):
+            continue
+        lines.append(_MARKUP_RE.sub(" ", line))
+    return "\n".join(lines)
+
+def read_subtitle_text(path, max_bytes=MAX_READ_BYTES):
+    """The dialogue in the first max_bytes of a subtitle file; "" if it cannot be read."""
+    return _dialogue(_decodings(_read_head(path, max_bytes))[0])
+
+def trigram_counts(text, max_chars=MAX_SAMPLE_CHARS):
+    """Character trigrams of the words in text (lower-cased, letters only, space-padded)."""
+    words = _NON_LETTER_RE.sub(" ", text[:max_chars].lower()).split()
+    counts = {}
+    for word in words:
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            tri = padded[i:i + 3]
+            counts[tri] = counts.get(tri, 0) + 1
+    return counts
+
+def classify_text(text):
+    """
+    Returns (ISO 639-2/T code, confidence) for the language of text, or
+    (None, confidence) when there is too little text or no clear winner.
+    Confidence is the share of the text's trigrams found in the winner's profile
+    (the script's share of the letters for CJK text).
+    """
+    sample = text[:MAX_SAMPLE_CHARS]
+    script_counts = _script_counts(sample)
+    letters = sum(script_counts.values())
+    if not letters:
+        return None, 0.0
+    script = max(script_counts, key=script_counts.get)
+
+    if script in _CJK_LANGUAGES:
+        if letters < MIN_TRIGRAMS:
+            return None, 0.0
+        if script_counts.get("kana", 0) >= MIN_KANA_SHARE * letters:
+            return "jpn", (script_counts.get("kana", 0) + script_counts.get("han", 0)) / letters
+        return _CJK_LANGUAGES[script], script_counts[script] / letters
+
+    counts = trigram_counts(sample)
+    total = sum(counts.values())
+    if total < MIN_TRIGRAMS:
+        return None, 0.0
+
+    codes, scripts, index = _load_profiles()
+    gains = [0.0] * len(codes)
+    hits = [0] * len(codes)
+    for tri, n in counts.items():
+        for i, gain in index.get(tri, ()):
+            gains[i] += n * gain
+            hits[i] += n
+
+    # Only languages written in the text's script, and whose alphabet has the text's letters, compete
+    candidates = [i for i in range(len(codes)) if scripts[i] == script]
+    candidates = _filter_by_alphabet(sample, letters, codes, candidates)
+    ranked = sorted(candidates, key=gains.__getitem__, reverse=True)
+    if not ranked:
+        return None, 0.0
+    best = ranked[0]
+    coverage = hits[best] / total
+    margin = (gains[best] - gains[ranked[1]]) / total if len(ranked) > 1 else float("inf")
+    if coverage < MIN_COVERAGE or margin < MIN_MARGIN:
+        return None, coverage
+    return codes[best], coverage
+
+def _filter_by_alphabet(sample, letters, codes, candidates):
+    """The candidates not ruled out by marker letters of other languages (all of them if none is left)."""
+    text = sample.lower()
+    marker_counts = [(text.count(letter), users.split()) for letter, users in _MARKER_LETTERS.items()]
+    kept = []
+    for i in candidates:
+        foreign = sum(n for n, users in marker_counts if codes[i] not in users)
+        if foreign < MIN_FOREIGN_LETTERS or foreign < MIN_FOREIGN_SHARE * letters:
+            kept.append(i)
+    return kept or candidates
+
+def detect_subtitle_language(path, max_bytes=MAX_READ_BYTES):
+    """ISO 639-2/T code of the dialogue in a subtitle file, or None if unsure."""
+    best_code, best_confidence = None, 0.0
+    for text in _decodings(_read_head(path, max_bytes)):
+        code, confidence = classify_text(_dialogue(text))
+        if code is not None and confidence > best_confidence:
+            best_code, best_confidence = code, confidence
+    return best_code
+
+def detect_subtitle_language_async(path, max_bytes=MAX_READ_BYTES):
+    """
+    Submit detect_subtitle_language to the scheduler's probe pool (like probe_file_async).
+    Returns a concurrent.futures.Future resolving to a code or None.
+    """
+    job = JobScheduler().submit(f"Detect language of {os.path.basename(path)}",
+                                lambda job: detect_subtitle_language(path, max_bytes),
+                                pool=POOL_PROBE, kind="probe", listed=False)
+    return job.future
@@ -0,0 +1,46 @@
+def track_extension(codec):
+    """File extension for a raw extracted track, from its codec ID (mkvmerge or ffprobe)."""
+    codec = codec.upper()
+    if "SSA" in codec or "ASS" in codec: return ".ass"
+    if "SRT" in codec or "UTF8" in codec or "SUBRIP" in codec: return ".srt"
+    if "PGS" in codec: return ".sup"
+    if "VOBSUB" in codec: return ".sub"
+    if "AAC" in codec: return ".aac"
+    if "AC3" in codec: return ".ac3"
+    if "AVC" in codec or "H264" in codec: return ".h264"
+    if "HEVC" in codec or "H265" in codec: return ".h265"
+    return ".dat"
+
+def track_output_filename(source_name, track, taken):
+    """
+    Default output filename for an extracted track: <source>.<lang>.<name><ext>.
+    taken: set of names already handed out; the result is made unique and added to it.
+    """
+    props = track.get("properties", {})
+    codec = props.get("codec_id", "")
+    lang = props.get("language", "und")
+    name = props.get("track_name", "")
+
+    ext = track_extension(codec)
+
+    parts = [source_name]
+
+    if lang and lang != "und":
+        parts.append(lang)
+
+    if name:
+        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '.', '_', '-')).strip()
+        if safe_name:
+            parts.append(safe_name)
+
+    base_name = ".".join(parts)
+    out_name = base_name + ext
+
+    # Unique handling
+    counter = 1
+    while out_name in taken:
+        out_name = f"{base_name}_{counter}{ext}"
+        counter += 1
+
+    taken.add(out_name)
+    return out_name
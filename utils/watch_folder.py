@@ -0,0 +1,384 @@
+"""
+Watch-folder mode: a hot folder paired with a saved operation.
+
+Files landing in the folder are noticed through inotify on Linux (ctypes, no
+extra package) or a cheap os.scandir poll elsewhere, left alone until their
+size and mtime have stopped changing (a copy still in progress is never
+touched) and then handed to the scheduler through a bounded queue.
+The operations are the GUI's: "extract" picks tracks like the batch extractor,
+"add-subs" muxes in the matching subtitles like the (season) mixer.
+"""
+import os
+import json
+import time
+import select
+import struct
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, wait
+from utils.batch_extract import (TrackRule, extract_file, VIDEO_EXTENSIONS, STATUS_QUEUED,
+                                 STATUS_SKIPPED, STATUS_FAILED, STATUS_CANCELLED)
+from utils.episode_match import SUBTITLE_EXTENSIONS, SubtitleIndex
+from utils.season_mux import subtitle_options, mux_episode, episode_output_path
+from utils.job_scheduler import JobScheduler, POOL_IO, pool_for_tool
+from utils.dependency_manager import DependencyManager
+from utils.languages import normalize
+
+OP_EXTRACT = "extract"
+OP_ADD_SUBS = "add-subs"
+OPERATIONS = (OP_EXTRACT, OP_ADD_SUBS)
+
+# Reported while a new file is still being written
+STATUS_WAITING = "waiting"
+
+SETTLE_SECONDS = 5.0 # Size and mtime unchanged for this long: the writer is done
+POLL_INTERVAL = 2.0
+MAX_QUEUED = 4 # Jobs handed to the scheduler at once
+
+# inotify(7)
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_Q_OVERFLOW = 0x4000
+_EVENT_HEADER = struct.Struct("iIII") # wd, mask, cookie, len; then len bytes of name
+
+class WatchOperation:
+    """
+    What a watch folder does with each new video; saved and loaded as JSON.
+    extract: types/languages/codecs select tracks as in TrackRule.
+    add-subs: the subtitles matched to the video (same rules as the season
+        mixer) are muxed in; the first one in default_language is the default
+        track. The result is <name><suffix>.mkv.
+    output_dir: where results go (default: next to the source).
+    """
+    FIELDS = ("operation", "output_dir", "types", "languages", "codecs", "default_language",
+              "detect_content", "suffix")
+
+    def __init__(self, operation, output_dir=None, types=None, languages=None, codecs=None,
+                 default_language=None, detect_content=True, suffix="_muxed"):
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{operation}', expected one of: {', '.join(OPERATIONS)}")
+        self.operation = operation
+        self.output_dir = output_dir
+        self.types = list(types or [])
+        self.languages = list(languages or [])
+        self.codecs = list(codecs or [])
+        self.default_language = normalize(default_language) or default_language
+        self.detect_content = detect_content
+        self.suffix = suffix
+
+    def rule(self):
+        return TrackRule(types=self.types, languages=self.languages, codecs=self.codecs)
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown operation setting(s): {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+class StabilityTracker:
+    """
+    Debounce for files still being written: a file is ready once its size
+    and mtime have not changed for settle seconds (empty files included, the
+    caller decides what to do with them).
+    """
+    def __init__(self, settle=SETTLE_SECONDS, clock=time.monotonic):
+        self.settle = settle
+        self._clock = clock
+        self._files = {} # path -> (size, mtime_ns, unchanged since)
+
+    def observe(self, path, size, mtime_ns):
+        current = self._files.get(path)
+        if current is None or current[:2] != (size, mtime_ns):
+            self._files[path] = (size, mtime_ns, self._clock())
+
+    def forget(self, path):
+        self._files.pop(path, None)
+
+    def pending(self):
+        return list(self._files)
+
+    def __contains__(self, path):
+        return path in self._files
+
+    def pop_ready(self):
+        """Returns [(path, size, mtime_ns)] of the files that settled and stops tracking them."""
+        now = self._clock()
+        ready = [(path, size, mtime_ns) for path, (size, mtime_ns, since) in self._files.items()
+                 if now - since >= self.settle]
+        for path, _, _ in ready:
+            del self._files[path]
+        return ready
+
+class _InotifySource:
+    """Names created, moved in or closed after writing in one directory, from Linux inotify."""
+    MASK = _IN_CREATE | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_ATTRIB
+
+    def __init__(self, fd):
+        self.fd = fd
+
+    @classmethod
+    def open(cls, folder):
+        """The source for folder, or None where inotify is not available."""
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            init1, add_watch = libc.inotify_init1, libc.inotify_add_watch
+        except (ImportError, OSError, AttributeError):
+            return None # Not Linux (or no libc to talk to)
+        add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        fd = init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None # Out of inotify instances
+        if add_watch(fd, os.fsencode(folder), cls.MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def read(self, timeout):
+        """
+        Waits up to timeout seconds. Returns the set of names seen, or None when
+        the kernel queue overflowed and events were lost (the folder must be rescanned).
+        """
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            if length:
+                names.add(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+def _extract_job(job, video_path, operation, on_status):
+    status, detail = extract_file(video_path, operation.rule(), operation.output_dir, on_status,
+                                  job.report_progress, job.limits, job.output_paths)
+    if status == STATUS_FAILED:
+        raise RuntimeError(detail) # Marks the job failed in the queue
+    return status, detail
+
+def _add_subs_job(job, mkvmerge, video_path, sub_paths, operation, on_status):
+    episode = {"video": video_path,
+               "subs": subtitle_options(sub_paths, operation.default_language, operation.detect_content)}
+    return mux_episode(job, mkvmerge, episode, operation.output_dir, operation.suffix, on_status)
+
+class FolderWatcher:
+    """
+    Runs an operation on each video that lands in folder (top level only).
+
+    run() blocks until stop(). on_status(path, status, detail) gets the batch
+    statuses of utils.batch_extract plus STATUS_WAITING while a file settles;
+    it is called from the watcher and pool threads.
+    At most max_queued jobs are on the scheduler at once; further ready files
+    wait here, so a burst of arrivals never floods the queue. A file is
+    processed once per (size, mtime): a rewritten file is processed again.
+    use_inotify=False forces polling (inotify misses writes made by other
+    machines to a network share).
+    """
+    def __init__(self, folder, operation, on_status=None, settle=SETTLE_SECONDS, interval=POLL_INTERVAL,
+                 max_queued=MAX_QUEUED, process_existing=True, use_inotify=True, timeout=None):
+        self.folder = os.path.abspath(folder)
+        self.operation = operation
+        self.on_status = on_status
+        self.interval = interval
+        self.max_queued = max(1, max_queued)
+        self.process_existing = process_existing
+        self.use_inotify = use_inotify
+        self.timeout = timeout
+        self.mode = None # "inotify" or "polling" once running
+
+        self._tracker = StabilityTracker(settle)
+        self._stop = threading.Event()
+        self._done = {} # path -> (size, mtime_ns) already queued or handled
+        self._produced = set() # Our own outputs, never picked up as input
+        self._subtitles = set() # Settled subtitle files (add-subs)
+        self._waiting_subs = set() # Videos with no matching subtitle yet (add-subs)
+        self._ready = deque()
+        self._jobs = {} # path -> Job on the scheduler
+
+        if operation.output_dir:
+            os.makedirs(operation.output_dir, exist_ok=True)
+
+    def run(self):
+        source = _InotifySource.open(self.folder) if self.use_inotify else None
+        self.mode = "inotify" if source else "polling"
+        try:
+            self._scan(initial=True)
+            while not self._stop.is_set():
+                if source is None:
+                    self._stop.wait(self.interval)
+                    self._scan()
+                else:
+                    names = source.read(self.interval)
+                    if names is None:
+                        self._scan()
+                    else:
+                        for name in names:
+                            self._observe(os.path.join(self.folder, name))
+                    # Files still being written send no event per write; their stat is checked here
+                    for path in self._tracker.pending():
+                        self._observe(path)
+                self._advance()
+        finally:
+            if source is not None:
+                source.close()
+
+    def stop(self):
+        self._stop.set()
+
+    def cancel_jobs(self, timeout=10):
+        """Cancels the jobs handed to the scheduler and waits for their tools to exit."""
+        jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        wait([job.future for job in jobs], timeout=timeout)
+
+    def _report(self, path, status, detail=""):
+        if self.on_status:
+            self.on_status(path, status, detail)
+
+    def _wanted(self, name):
+        lower = name.lower()
+        if name.startswith("."):
+            return False # Hidden, including AtomicOutput temp files
+        if lower.endswith(VIDEO_EXTENSIONS):
+            # add-subs results written next to the sources are not sources themselves
+            return not (self.operation.operation == OP_ADD_SUBS and
+                        os.path.splitext(lower)[0].endswith(self.operation.suffix.lower()))
+        return self.operation.operation == OP_ADD_SUBS and lower.endswith(SUBTITLE_EXTENSIONS)
+
+    def _scan(self, initial=False):
+        try:
+            with os.scandir(self.folder) as it:
+                # The name filter comes first: other files cost no stat
+                paths = [e.path for e in it if self._wanted(e.name) and e.is_file()]
+        except OSError as e:
+            print(f"Warning: cannot read watch folder {self.folder}: {e}")
+            return
+        for path in paths:
+            self._observe(path, initial)
+
+    def _observe(self, path, initial=False):
+        if path in self._produced or not self._wanted(os.path.basename(path)):
+            return
+        if any(path in job.output_paths for job in self._jobs.values()):
+            return # Written by a running job
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._tracker.forget(path) # Removed or renamed away
+            return
+        key = (st.st_size, st.st_mtime_ns)
+        if self._done.get(path) == key:
+            return
+        if initial and not self.process_existing:
+            self._done[path] = key
+            return
+        if path not in self._tracker and path.lower().endswith(VIDEO_EXTENSIONS):
+            self._report(path, STATUS_WAITING)
+        self._tracker.observe(path, *key)
+
+    def _advance(self):
+        # Subtitles first: a video settling in the same round may need them
+        ready = sorted(self._tracker.pop_ready(), key=lambda r: not r[0].lower().endswith(SUBTITLE_EXTENSIONS))
+        for path, size, mtime_ns in ready:
+            self._done[path] = (size, mtime_ns)
+            if size == 0:
+                # Nothing to process; seen again if it is written to later
+                if path.lower().endswith(VIDEO_EXTENSIONS):
+                    self._report(path, STATUS_SKIPPED, "Empty file")
+                continue
+            if path.lower().endswith(SUBTITLE_EXTENSIONS):
+                self._subtitles.add(path)
+                self._ready.extend(sorted(self._waiting_subs)) # The new subtitle may be the one they lack
+                self._waiting_subs.clear()
+            else:
+                self._ready.append(path)
+
+        self._reap()
+        subs_settling = any(p.lower().endswith(SUBTITLE_EXTENSIONS) for p in self._tracker.pending())
+        while self._ready and len(self._jobs) < self.max_queued:
+            if self.operation.operation == OP_ADD_SUBS and subs_settling:
+                break # Likely this video's subtitles, still being copied
+            path = self._ready.popleft()
+            if path not in self._jobs:
+                self._submit(path)
+
+    def _submit(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        if (st.st_size, st.st_mtime_ns) != self._done.get(path):
+            # Written to again since it settled
+            self._done.pop(path, None)
+            self._tracker.observe(path, st.st_size, st.st_mtime_ns)
+            return
+
+        op = self.operation
+        name = os.path.basename(path)
+        if op.operation == OP_EXTRACT:
+            title, pool, kind = f"Watch: extract from {name}", POOL_IO, "extract"
+            fn = lambda job: _extract_job(job, path, op, self.on_status)
+            inputs, outputs = [path], [] # extract_file adds the planned outputs
+        else:
+            subs, _ = SubtitleIndex(sorted(self._subtitles)).lookup(path)
+            subs = [s for s in subs if os.path.exists(s)]
+            if not subs:
+                self._waiting_subs.add(path)
+                self._report(path, STATUS_SKIPPED, "No subtitles matched yet")
+                return
+            mkvmerge = DependencyManager().get_binary_path("mkvmerge")
+            if not mkvmerge:
+                self._report(path, STATUS_FAILED, "mkvmerge not found")
+                return
+            title, pool, kind = f"Watch: mkvmerge {name}", pool_for_tool("mkvmerge"), "mux"
+            fn = lambda job: _add_subs_job(job, mkvmerge, path, subs, op, self.on_status)
+            inputs, outputs = [path] + subs, [episode_output_path(path, op.output_dir, op.suffix)]
+
+        self._produced.update(outputs)
+        self._report(path, STATUS_QUEUED)
+        self._jobs[path] = JobScheduler().submit(title, fn, pool=pool, kind=kind, timeout=self.timeout,
+                                                 inputs=inputs, outputs=outputs)
+
+    def _reap(self):
+        for path, job in list(self._jobs.items()):
+            if not job.future.done():
+                continue
+            del self._jobs[path]
+            self._produced.update(job.output_paths)
+            try:
+                result = job.future.result()
+            except CancelledError:
+                result = (STATUS_CANCELLED, "")
+            except Exception as e:
+                result = (STATUS_CANCELLED, "") if job.cancel_event.is_set() else (STATUS_FAILED, str(e))
+            self._report(path, *result)